@@ -0,0 +1,116 @@
+"""Time to poll the changes of a growing table, comparing keyset polls with
+and without an index on (timestamp, primary key) and re-reading the table
+
+Creates a ChangesBenchmark table in the database in SQLALCHEMY_DATABASE_URI,
+grows it to each of --sizes rows, polls the last --batch rows after a
+watermark, and drops the table at the end.
+
+    python benchmarks/changes.py [--sizes 10000,100000,1000000] [--batch 1000]
+"""
+
+import argparse
+import datetime
+import os
+import time
+
+import sqlalchemy
+from sqlalchemy import TIMESTAMP, Column, Index, Integer, MetaData, String, Table
+from sqlalchemy.orm import Session, registry
+
+from ispyb.models import changes
+
+metadata = MetaData()
+table = Table(
+    "ChangesBenchmark",
+    metadata,
+    Column("changesBenchmarkId", Integer, primary_key=True),
+    Column("recordTimeStamp", TIMESTAMP, nullable=False),
+    Column("payload", String(45)),
+)
+index = Index("ChangesBenchmark_changes", table.c.recordTimeStamp, table.c[0])
+
+
+class ChangesBenchmark:
+    pass
+
+
+registry().map_imperatively(ChangesBenchmark, table)
+
+START = datetime.datetime(2023, 1, 1)
+
+
+def grow(session, first: int, last: int):
+    # Ten rows per second, so that rows share their timestamp
+    for start in range(first, last, 10_000):
+        session.execute(
+            table.insert(),
+            [
+                {
+                    "changesBenchmarkId": i + 1,
+                    "recordTimeStamp": START + datetime.timedelta(seconds=i // 10),
+                    "payload": "payload",
+                }
+                for i in range(start, min(start + 10_000, last))
+            ],
+        )
+    session.commit()
+
+
+def timed(function, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    index.drop(engine)
+    print(f"{'rows':>10} {'no index':>10} {'index':>10} {'full read':>10}")
+    try:
+        size = 0
+        with Session(engine) as session:
+            for new_size in map(int, args.sizes.split(",")):
+                grow(session, size, new_size)
+                size = new_size
+                # Watermark of the row before the last batch
+                since = changes.Watermark(
+                    START + datetime.timedelta(seconds=(size - args.batch) // 10),
+                    size - args.batch,
+                )
+
+                def poll():
+                    rows, _ = changes.poll(
+                        session, ChangesBenchmark, since=since, batch=args.batch
+                    )
+                    assert len(rows) == args.batch
+                    session.expunge_all()
+
+                def full_read():
+                    session.scalars(sqlalchemy.select(ChangesBenchmark)).all()
+                    session.expunge_all()
+
+                no_index = timed(poll)
+                index.create(session.connection())
+                session.commit()
+                with_index = timed(poll)
+                index.drop(session.connection())
+                session.commit()
+                full = timed(full_read, repeat=1)
+                print(
+                    f"{size:>10,} {no_index * 1000:>8.1f}ms {with_index * 1000:>8.1f}ms"
+                    f" {full * 1000:>8.1f}ms"
+                )
+    finally:
+        metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Mapper configuration time of ispyb.models, per model
+
+Configures the mappers of every model, or only of those reachable from
+--subset, and reports how long each of them took.
+
+    python benchmarks/configure_time.py [--subset DataCollection ...] [--json out.json]
+"""
+
+import argparse
+import json
+import time
+import warnings
+
+from sqlalchemy import event
+
+from ispyb import models
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subset", nargs="*", help="root models to configure")
+    parser.add_argument("--top", type=int, default=20, help="slowest models to list")
+    parser.add_argument("--json", help="write the per model timings to this file")
+    args = parser.parse_args()
+
+    started, timings = {}, {}
+
+    @event.listens_for(models.Base, "before_mapper_configured", propagate=True)
+    def before(mapper, cls):
+        started[mapper] = time.perf_counter()
+
+    @event.listens_for(models.Base, "mapper_configured", propagate=True)
+    def after(mapper, cls):
+        timings[cls.__name__] = time.perf_counter() - started[mapper]
+
+    warnings.simplefilter("ignore")
+    start = time.perf_counter()
+    models.configure(subset=args.subset)
+    total = time.perf_counter() - start
+
+    for name, seconds in sorted(timings.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"{name:40} {seconds * 1000:8.2f} ms")
+    print(
+        f"{len(timings)} of {len(models.Base.registry.mappers)} mappers"
+        f" configured in {total * 1000:.1f} ms"
+    )
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump({"total": total, "models": timings}, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
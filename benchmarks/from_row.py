@@ -0,0 +1,48 @@
+"""Time to create model instances, comparing the declarative constructor with
+CustomBase.from_row
+
+Creates --objects transient instances of --model from a dict with --columns
+of its column values, without a database.
+
+    python benchmarks/from_row.py [--objects 200000] [--model DataCollection]
+"""
+
+import argparse
+import time
+
+from sqlalchemy import inspect
+
+from ispyb import models
+
+
+def timed(label, count, function):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>12}: {elapsed:.3f}s, {count / elapsed:,.0f} objects/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=200_000)
+    parser.add_argument("--model", default="DataCollection")
+    parser.add_argument("--columns", type=int, default=30)
+    args = parser.parse_args()
+
+    model = getattr(models, args.model)
+    keys = [prop.key for prop in inspect(model).column_attrs][: args.columns]
+    row = {key: None for key in keys}
+    print(f"{args.objects} {args.model} objects, {len(keys)} columns")
+
+    timed(
+        "constructor", args.objects, lambda: [model(**row) for _ in range(args.objects)]
+    )
+    timed(
+        "from_row",
+        args.objects,
+        lambda: [model.from_row(row) for _ in range(args.objects)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Throughput of inserting ImageQualityIndicators rows with session.add_all
+and with bulk.insert_image_quality, and of reading them back as ORM objects
+and with bulk.read_image_quality
+
+Inserts --rows rows into the database in SQLALCHEMY_DATABASE_URI inside a
+transaction which is rolled back at the end.
+
+    python benchmarks/image_quality.py [--rows 100000]
+"""
+
+import argparse
+import os
+import random
+import time
+
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from ispyb import models
+from ispyb.models import bulk
+
+
+def columns(rows: int) -> dict:
+    return {
+        "imageNumber": list(range(1, rows + 1)),
+        "spotTotal": [random.randint(0, 2000) for _ in range(rows)],
+        "goodBraggCandidates": [random.randint(0, 1000) for _ in range(rows)],
+        "method1Res": [random.uniform(1, 5) for _ in range(rows)],
+        "dozor_score": [random.uniform(0, 100) for _ in range(rows)],
+        "totalIntegratedSignal": [random.uniform(0, 1e6) for _ in range(rows)],
+    }
+
+
+def add_all(session: Session, autoProcProgramId: int, dataCollectionId: int, arrays):
+    names = list(arrays)
+    session.add_all(
+        models.ImageQualityIndicators(
+            autoProcProgramId=autoProcProgramId,
+            dataCollectionId=dataCollectionId,
+            **dict(zip(names, row)),
+        )
+        for row in zip(*arrays.values())
+    )
+    session.flush()
+
+
+def read_orm(session: Session, dataCollectionId: int) -> dict:
+    """Load the rows as ORM objects and copy them into lists"""
+    rows = (
+        session.query(models.ImageQualityIndicators)
+        .filter(models.ImageQualityIndicators.dataCollectionId == dataCollectionId)
+        .order_by(models.ImageQualityIndicators.imageNumber)
+        .all()
+    )
+    return {
+        name: [getattr(row, name) for row in rows]
+        for name in bulk.IMAGE_QUALITY_COLUMNS
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    with Session(engine) as session:
+        sessionId = session.query(models.BLSession.sessionId).limit(1).scalar()
+        group = models.DataCollectionGroup(sessionId=sessionId)
+        datacollection = models.DataCollection(DataCollectionGroup=group)
+        program = models.AutoProcProgram()
+        session.add_all([datacollection, program])
+        session.flush()
+        dataCollectionId = datacollection.dataCollectionId
+        arrays = columns(args.rows)
+
+        for name, insert in (
+            ("session.add_all", add_all),
+            ("insert_image_quality", bulk.insert_image_quality),
+        ):
+            start = time.perf_counter()
+            insert(session, program.autoProcProgramId, dataCollectionId, arrays)
+            elapsed = time.perf_counter() - start
+            session.expunge_all()
+            print(f"{name:22} {elapsed:8.3f} s {args.rows / elapsed:10.0f} rows/s")
+
+        for name, read in (
+            ("ORM query", read_orm),
+            ("read_image_quality", bulk.read_image_quality),
+        ):
+            start = time.perf_counter()
+            read(session, dataCollectionId)
+            elapsed = time.perf_counter() - start
+            session.expunge_all()
+            print(f"{name:22} {elapsed:8.3f} s {2 * args.rows / elapsed:10.0f} rows/s")
+        session.rollback()
+
+
+if __name__ == "__main__":
+    main()
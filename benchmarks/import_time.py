@@ -0,0 +1,64 @@
+"""Cold import time of ispyb.models, eager vs lazy (ISPYB_MODELS_LAZY=1)
+
+Every measurement runs in a fresh interpreter, the reported time excludes
+the interpreter start up and the import of sqlalchemy itself.
+
+    python benchmarks/import_time.py [--repeat 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import": "from ispyb import models",
+    "import + DataCollection": "from ispyb import models; models.DataCollection",
+    "import + DataCollection + configure": (
+        "from ispyb import models; models.DataCollection;"
+        " sqlalchemy.orm.configure_mappers()"
+    ),
+}
+
+TIMER = """
+import time, warnings
+warnings.simplefilter("ignore")
+import sqlalchemy.orm
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, lazy: bool, repeat: int) -> float:
+    env = dict(os.environ, ISPYB_MODELS_LAZY="1" if lazy else "0")
+    timings = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", TIMER.format(statement=statement)],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    ]
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'scenario':40} {'eager (ms)':>12} {'lazy (ms)':>12}")
+    for name, statement in SCENARIOS.items():
+        eager = measure(statement, False, args.repeat) * 1000
+        lazy = measure(statement, True, args.repeat) * 1000
+        print(f"{name:40} {eager:12.1f} {lazy:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
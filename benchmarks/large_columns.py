@@ -0,0 +1,81 @@
+"""Memory and time to materialise DataCollection rows, with and without the
+large columns deferred
+
+Inserts --rows data collections into the database in SQLALCHEMY_DATABASE_URI
+inside a transaction which is rolled back at the end.
+
+    python benchmarks/large_columns.py [--rows 100000]
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from ispyb import models
+
+
+def scan(session: Session, groupId: int, *options) -> list:
+    session.expunge_all()
+    return (
+        session.query(models.DataCollection)
+        .filter(models.DataCollection.dataCollectionGroupId == groupId)
+        .options(*options)
+        .all()
+    )
+
+
+def measure(session: Session, groupId: int, *options) -> None:
+    start = time.perf_counter()
+    rows = len(scan(session, groupId, *options))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    scan(session, groupId, *options)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    name = "undefer_large" if options else "deferred (default)"
+    print(
+        f"{name:20} {rows:8d} rows {elapsed:8.3f} s"
+        f" {rows / elapsed:10.0f} rows/s {peak / 2**20:8.1f} MiB peak"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    with Session(engine) as session:
+        sessionId = session.query(models.BLSession.sessionId).limit(1).scalar()
+        group = models.DataCollectionGroup(sessionId=sessionId)
+        session.add(group)
+        session.flush()
+        session.execute(
+            sqlalchemy.insert(models.DataCollection.__table__),
+            [
+                {
+                    "dataCollectionGroupId": group.dataCollectionGroupId,
+                    "imageDirectory": f"/dls/mx/data/mx1234-5/{i}",
+                    "comments": "x" * 1024,
+                }
+                for i in range(args.rows)
+            ],
+        )
+
+        measure(session, group.dataCollectionGroupId)
+        measure(
+            session,
+            group.dataCollectionGroupId,
+            models.undefer_large(models.DataCollection),
+        )
+        session.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""SQL statements and time to walk DataCollection → AutoProcScalingStatistics,
+with lazy loading and with loaders.autoproc_tree()
+
+Inserts the data collections, each with one processing result, into the
+database in SQLALCHEMY_DATABASE_URI inside a transaction which is rolled back
+at the end.
+
+    python benchmarks/loaders.py [--sizes 1 100 10000]
+"""
+
+import argparse
+import os
+import time
+
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from ispyb import models
+from ispyb.models import loaders
+
+
+def populate(session: Session, size: int) -> int:
+    sessionId = session.query(models.BLSession.sessionId).limit(1).scalar()
+    group = models.DataCollectionGroup(sessionId=sessionId)
+    for _ in range(size):
+        dc = models.DataCollection(DataCollectionGroup=group)
+        program = models.AutoProcProgram(DataCollection=dc)
+        integration = models.AutoProcIntegration(
+            AutoProcProgram=program, DataCollection=dc
+        )
+        scaling = models.AutoProcScaling(
+            AutoProc=models.AutoProc(autoProcProgramId=0),
+            AutoProcScalingStatistics=[
+                models.AutoProcScalingStatistics(scalingStatisticsType=shell)
+                for shell in ("overall", "innerShell", "outerShell")
+            ],
+        )
+        session.add(
+            models.AutoProcScalingHasInt(
+                AutoProcIntegration=integration, AutoProcScaling=scaling
+            )
+        )
+    session.flush()
+    session.expunge_all()
+    return group.dataCollectionGroupId
+
+
+def walk(session: Session, groupId: int, size: int, *options) -> int:
+    """Touch every level of the tree, return the number of statistics rows"""
+    rows = 0
+    for dc in (
+        session.query(models.DataCollection)
+        .filter(models.DataCollection.dataCollectionGroupId == groupId)
+        .order_by(models.DataCollection.dataCollectionId)
+        .limit(size)
+        .options(*options)
+    ):
+        for program in dc.AutoProcProgram:
+            for integration in program.AutoProcIntegration:
+                for link in integration.AutoProcScalingHasInt:
+                    rows += len(link.AutoProcScaling.AutoProcScalingStatistics)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10000])
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    statements = 0
+
+    @sqlalchemy.event.listens_for(engine, "before_cursor_execute")
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    with Session(engine) as session:
+        groupId = populate(session, max(args.sizes))
+        print(f"{'collections':>12} {'loading':14} {'statements':>10} {'time (s)':>10}")
+        for size in args.sizes:
+            for name, options in (
+                ("lazy", ()),
+                ("autoproc_tree", (loaders.autoproc_tree(),)),
+            ):
+                session.expunge_all()
+                statements = 0
+                start = time.perf_counter()
+                walk(session, groupId, size, *options)
+                elapsed = time.perf_counter() - start
+                print(f"{size:12d} {name:14} {statements:10d} {elapsed:10.3f}")
+        session.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Time to select the data collections a person may see, comparing joins on
+the membership tables with member_filter and MembershipIndex.filter
+
+Inserts a person who is a member of --sessions sessions, half through their
+proposals and half through SessionHasPerson, as many sessions of other
+proposals, and a data collection per session, into the database in
+SQLALCHEMY_DATABASE_URI inside a transaction which is rolled back at the end.
+
+    python benchmarks/membership.py [--sessions 5000] [--proposals 50]
+"""
+
+import argparse
+import datetime
+import os
+import time
+
+import sqlalchemy
+from sqlalchemy.orm import Session, sessionmaker
+
+from ispyb import models
+from ispyb.models.membership import MembershipIndex, member_filter
+
+
+def joins(personId: int):
+    """Join the membership tables to the data collections"""
+    return (
+        sqlalchemy.select(models.DataCollection.dataCollectionId)
+        .join(models.DataCollectionGroup)
+        .join(
+            models.BLSession,
+            models.BLSession.sessionId == models.DataCollectionGroup.sessionId,
+        )
+        .join(
+            models.Proposal, models.Proposal.proposalId == models.BLSession.proposalId
+        )
+        .outerjoin(
+            models.ProposalHasPerson,
+            sqlalchemy.and_(
+                models.ProposalHasPerson.proposalId == models.Proposal.proposalId,
+                models.ProposalHasPerson.personId == personId,
+            ),
+        )
+        .outerjoin(
+            models.SessionHasPerson,
+            sqlalchemy.and_(
+                models.SessionHasPerson.sessionId == models.BLSession.sessionId,
+                models.SessionHasPerson.personId == personId,
+            ),
+        )
+        .where(
+            sqlalchemy.or_(
+                models.Proposal.personId == personId,
+                models.ProposalHasPerson.personId.is_not(None),
+                models.SessionHasPerson.personId.is_not(None),
+            )
+        )
+        .distinct()
+    )
+
+
+def insert(session: Session, args) -> int:
+    def next_id(column):
+        return (session.query(sqlalchemy.func.max(column)).scalar() or 0) + 1
+
+    personId = next_id(models.Person.personId)
+    session.execute(
+        sqlalchemy.insert(models.Person.__table__),
+        [{"personId": personId, "login": "membership"}],
+    )
+    first = next_id(models.Proposal.proposalId)
+    # Twice as many proposals, the person is a member of the first half
+    proposalIds = range(first, first + 2 * args.proposals)
+    session.execute(
+        sqlalchemy.insert(models.Proposal.__table__),
+        [
+            {"proposalId": proposalId, "proposalCode": "zz", "personId": 0}
+            for proposalId in proposalIds
+        ],
+    )
+    session.execute(
+        sqlalchemy.insert(models.ProposalHasPerson.__table__),
+        [
+            {"proposalId": proposalId, "personId": personId}
+            for proposalId in proposalIds[: args.proposals]
+        ],
+    )
+    # Half the sessions of the person on their proposals, then the other
+    # half and as many sessions of other persons on the other proposals
+    count = 2 * args.sessions
+    half = args.sessions // 2
+    first = next_id(models.BLSession.sessionId)
+    sessionIds = range(first, first + count)
+    session.execute(
+        sqlalchemy.insert(models.BLSession.__table__),
+        [
+            {
+                "sessionId": sessionId,
+                "proposalId": proposalIds[
+                    i % args.proposals + (args.proposals if i >= half else 0)
+                ],
+                "visit_number": i,
+                "lastUpdate": datetime.datetime(2023, 1, 1),
+            }
+            for i, sessionId in enumerate(sessionIds)
+        ],
+    )
+    session.execute(
+        sqlalchemy.insert(models.SessionHasPerson.__table__),
+        [
+            {"sessionId": sessionId, "personId": personId}
+            for sessionId in sessionIds[half : args.sessions]
+        ],
+    )
+    first = next_id(models.DataCollectionGroup.dataCollectionGroupId)
+    session.execute(
+        sqlalchemy.insert(models.DataCollectionGroup.__table__),
+        [
+            {"dataCollectionGroupId": first + i, "sessionId": sessionId}
+            for i, sessionId in enumerate(sessionIds)
+        ],
+    )
+    session.execute(
+        sqlalchemy.insert(models.DataCollection.__table__),
+        [{"dataCollectionGroupId": first + i} for i in range(count)],
+    )
+    return personId
+
+
+def timed(label: str, function, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = function()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:>18}: {elapsed * 1000:8.2f}ms, {rows} data collections")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--proposals", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        # Sessions in the transaction, for the index to see the inserted rows
+        Session = sessionmaker(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
+        with Session() as session:
+            personId = insert(session, args)
+
+            def count(criterion):
+                return len(
+                    session.execute(
+                        sqlalchemy.select(models.DataCollection.dataCollectionId).where(
+                            criterion
+                        )
+                    ).all()
+                )
+
+            timed(
+                "joins",
+                lambda: len(session.execute(joins(personId)).all()),
+                args.repeat,
+            )
+            timed(
+                "member_filter",
+                lambda: count(member_filter(models.DataCollection, personId)),
+                args.repeat,
+            )
+            index = MembershipIndex(Session)
+            start = time.perf_counter()
+            index.load([personId])
+            print(
+                f"{'index load':>18}: {(time.perf_counter() - start) * 1000:8.2f}ms,"
+                f" {len(index.sessionIds(personId))} sessions"
+            )
+            timed(
+                "index.filter",
+                lambda: count(index.filter(models.DataCollection, personId)),
+                args.repeat,
+            )
+            start = time.perf_counter()
+            for sessionId in range(100_000):
+                index.has_session(personId, sessionId)
+            print(
+                f"{'has_session':>18}:"
+                f" {(time.perf_counter() - start) / 100_000 * 1e6:8.2f}µs"
+            )
+        transaction.rollback()
+
+
+if __name__ == "__main__":
+    main()
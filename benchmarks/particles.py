@@ -0,0 +1,94 @@
+"""Throughput of writing and reading Particle coordinates with ORM objects
+(session.add_all, query) and with bulk.insert_particles/read_particles
+
+Inserts --rows particles into the database in SQLALCHEMY_DATABASE_URI inside
+a transaction which is rolled back at the end.
+
+    python benchmarks/particles.py [--rows 100000]
+"""
+
+import argparse
+import os
+import time
+
+import numpy
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from ispyb import models
+from ispyb.models import bulk
+
+
+def add_all(session: Session, dataCollectionId: int, coordinates) -> None:
+    session.add_all(
+        models.Particle(dataCollectionId=dataCollectionId, x=x, y=y)
+        for x, y in coordinates.tolist()
+    )
+    session.flush()
+
+
+def read_orm(session: Session, dataCollectionId: int):
+    particles = (
+        session.query(models.Particle)
+        .filter(models.Particle.dataCollectionId == dataCollectionId)
+        .order_by(models.Particle.particleId)
+        .all()
+    )
+    return numpy.array([(particle.x, particle.y) for particle in particles])
+
+
+def timed(name: str, rows: int, function, *args) -> None:
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{name:18} {elapsed:8.3f} s {rows / elapsed:10.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    with Session(engine) as session:
+        sessionId = session.query(models.BLSession.sessionId).limit(1).scalar()
+        orm, array = (
+            models.DataCollection(
+                DataCollectionGroup=models.DataCollectionGroup(sessionId=sessionId)
+            )
+            for _ in range(2)
+        )
+        session.add_all([orm, array])
+        session.flush()
+        coordinates = numpy.random.default_rng().uniform(0, 4096, (args.rows, 2))
+
+        timed(
+            "session.add_all",
+            args.rows,
+            add_all,
+            session,
+            orm.dataCollectionId,
+            coordinates,
+        )
+        timed(
+            "insert_particles",
+            args.rows,
+            bulk.insert_particles,
+            session,
+            array.dataCollectionId,
+            coordinates,
+        )
+        session.expunge_all()
+        timed("ORM query", args.rows, read_orm, session, orm.dataCollectionId)
+        timed(
+            "read_particles",
+            args.rows,
+            bulk.read_particles,
+            session,
+            array.dataCollectionId,
+        )
+        session.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Queries and time per API request loading data collections and their
+detectors, with and without a ReferenceCache
+
+Commits --datacollections data collections spread over --detectors detectors
+in the database in SQLALCHEMY_DATABASE_URI under a new data collection group,
+and deletes them at the end. Each request opens a session, selects the data
+collections and reads their Detector relationship.
+
+    python benchmarks/reference_cache.py [--requests 200] [--datacollections 100]
+"""
+
+import argparse
+import os
+import time
+
+import sqlalchemy
+from sqlalchemy.orm import sessionmaker
+
+from ispyb import models
+from ispyb.models.cache import ReferenceCache
+
+
+def request(Session: sessionmaker, dataCollectionGroupId: int) -> None:
+    with Session() as session:
+        for datacollection in session.scalars(
+            sqlalchemy.select(models.DataCollection).where(
+                models.DataCollection.dataCollectionGroupId == dataCollectionGroupId
+            )
+        ):
+            datacollection.Detector.detectorType
+
+
+def run(label: str, Session: sessionmaker, group: int, requests: int, statements):
+    statements.clear()
+    start = time.perf_counter()
+    for _ in range(requests):
+        request(Session, group)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:>14}: {len(statements) / requests:.1f} queries/request,"
+        f" {elapsed / requests * 1000:.2f}ms/request"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--datacollections", type=int, default=100)
+    parser.add_argument("--detectors", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    statements = []
+    sqlalchemy.event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    Session = sessionmaker(engine)
+    with Session() as session:
+        sessionId = session.query(models.BLSession.sessionId).limit(1).scalar()
+        group = models.DataCollectionGroup(sessionId=sessionId)
+        detectors = [
+            models.Detector(detectorSerialNumber=f"reference_cache{i}")
+            for i in range(args.detectors)
+        ]
+        session.add_all(
+            models.DataCollection(
+                DataCollectionGroup=group, Detector=detectors[i % args.detectors]
+            )
+            for i in range(args.datacollections)
+        )
+        session.commit()
+        dataCollectionGroupId = group.dataCollectionGroupId
+        detectorIds = [detector.detectorId for detector in detectors]
+
+    try:
+        run("no cache", Session, dataCollectionGroupId, args.requests, statements)
+        cache = ReferenceCache(Session, models={"Detector": "detectorSerialNumber"})
+        cache.refresh()
+        cache.install(Session)
+        run("ReferenceCache", Session, dataCollectionGroupId, args.requests, statements)
+        cache.remove()
+    finally:
+        with Session() as session:
+            for model, column, values in (
+                (
+                    models.DataCollection,
+                    models.DataCollection.dataCollectionGroupId,
+                    [dataCollectionGroupId],
+                ),
+                (
+                    models.DataCollectionGroup,
+                    models.DataCollectionGroup.dataCollectionGroupId,
+                    [dataCollectionGroupId],
+                ),
+                (models.Detector, models.Detector.detectorId, detectorIds),
+            ):
+                session.execute(sqlalchemy.delete(model).where(column.in_(values)))
+            session.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Time to look up sessions by visit string ("mx1234-5"), comparing the
+CONCAT(...) filter with the decomposed BLSession.session filter
+
+Inserts --sessions sessions spread over --proposals proposals into the
+database in SQLALCHEMY_DATABASE_URI inside a transaction which is rolled back
+at the end.
+
+    python benchmarks/session_filter.py [--sessions 100000] [--lookups 100]
+"""
+
+import argparse
+import datetime
+import os
+import random
+import time
+
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from ispyb import models
+
+
+def concat_filter(visit: str):
+    """The previous expression of BLSession.session, joined on proposalId"""
+    return (
+        sqlalchemy.select(models.BLSession.sessionId)
+        .join(models.Proposal)
+        .where(
+            sqlalchemy.func.concat(
+                models.Proposal.proposalCode,
+                models.Proposal.proposalNumber,
+                "-",
+                models.BLSession.visit_number,
+            )
+            == visit
+        )
+    )
+
+
+def decomposed_filter(visit: str):
+    return sqlalchemy.select(models.BLSession.sessionId).where(
+        models.BLSession.session == visit
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--proposals", type=int, default=1000)
+    parser.add_argument("--lookups", type=int, default=100)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    with Session(engine) as session:
+        first = (
+            session.query(sqlalchemy.func.max(models.Proposal.proposalId)).scalar() or 0
+        ) + 1
+        proposalIds = range(first, first + args.proposals)
+        session.execute(
+            sqlalchemy.insert(models.Proposal.__table__),
+            [
+                {"proposalId": i, "proposalCode": "bm", "proposalNumber": str(i)}
+                for i in proposalIds
+            ],
+        )
+        visits = args.sessions // args.proposals
+        session.execute(
+            sqlalchemy.insert(models.BLSession.__table__),
+            [
+                {
+                    "proposalId": i,
+                    "visit_number": n,
+                    "lastUpdate": datetime.datetime(2023, 1, 1),
+                }
+                for i in proposalIds
+                for n in range(1, visits + 1)
+            ],
+        )
+        lookups = [
+            f"bm{random.choice(proposalIds)}-{random.randint(1, visits)}"
+            for _ in range(args.lookups)
+        ]
+
+        print(f"{args.proposals * visits} sessions, {args.lookups} lookups")
+        for name, build in (
+            ("concat", concat_filter),
+            ("decomposed", decomposed_filter),
+        ):
+            start = time.perf_counter()
+            found = sum(
+                session.execute(build(visit)).scalar() is not None for visit in lookups
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name:12} {elapsed:8.3f} s {elapsed / args.lookups * 1000:8.3f} ms/lookup"
+                f" {found:6d} found"
+            )
+        session.rollback()
+
+
+if __name__ == "__main__":
+    main()
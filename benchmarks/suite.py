@@ -0,0 +1,203 @@
+"""Time the standard query patterns on a synthetic database, as JSON
+
+Creates the schema on SQLite (in memory by default), fills it at --scale
+with benchmarks/synthetic.py, and times each case
+--repeat times. The results, with the versions and row counts, are written
+as JSON to --output (stdout by default) and compared with the results of a
+previous run given as --compare.
+
+    python benchmarks/suite.py [--scale 1] [--output results.json]
+        [--compare previous.json] [--url sqlite:///ispyb.db]
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+import synthetic
+from ispyb import models
+from ispyb.models import loaders
+
+
+def insert_datacollections(session: Session, rng: random.Random) -> None:
+    """Insert 100 data collections with a processing program, rolled back"""
+    groupId = session.query(
+        sqlalchemy.func.max(models.DataCollectionGroup.dataCollectionGroupId)
+    ).scalar()
+    session.add_all(
+        models.AutoProcProgram(
+            DataCollection=models.DataCollection(dataCollectionGroupId=groupId),
+            processingPrograms="xia2 dials",
+        )
+        for _ in range(100)
+    )
+    session.flush()
+    session.rollback()
+
+
+def get_by_id(session: Session, rng: random.Random) -> None:
+    """Get 100 random data collections by primary key"""
+    last = session.query(
+        sqlalchemy.func.max(models.DataCollection.dataCollectionId)
+    ).scalar()
+    for _ in range(100):
+        session.get(models.DataCollection, rng.randint(1, last))
+        session.expunge_all()
+
+
+def tree_load(session: Session, rng: random.Random) -> None:
+    """Load the data collections of 10 random sessions with their session
+    and processing trees"""
+    last = session.query(sqlalchemy.func.max(models.BLSession.sessionId)).scalar()
+    for _ in range(10):
+        datacollections = session.scalars(
+            sqlalchemy.select(models.DataCollection)
+            .join(models.DataCollectionGroup)
+            .where(models.DataCollectionGroup.sessionId == rng.randint(1, last))
+            .options(loaders.session_tree(), loaders.autoproc_tree())
+        ).all()
+        for datacollection in datacollections:
+            for program in datacollection.AutoProcProgram:
+                for integration in program.AutoProcIntegration:
+                    for has_int in integration.AutoProcScalingHasInt:
+                        has_int.AutoProcScaling.AutoProcScalingStatistics
+        session.expunge_all()
+
+
+def summary_scan(session: Session, rng: random.Random) -> None:
+    """Per session: number of data collections and images, and the best
+    overall resolution"""
+    overall = models.AutoProcScalingStatistics
+    session.execute(
+        sqlalchemy.select(
+            models.DataCollectionGroup.sessionId,
+            sqlalchemy.func.count(models.DataCollection.dataCollectionId.distinct()),
+            sqlalchemy.func.sum(models.DataCollection.numberOfImages),
+            sqlalchemy.func.min(overall.resolutionLimitHigh),
+        )
+        .join(models.DataCollection.DataCollectionGroup)
+        .outerjoin(
+            models.AutoProcIntegration,
+            models.AutoProcIntegration.dataCollectionId
+            == models.DataCollection.dataCollectionId,
+        )
+        .outerjoin(models.AutoProcIntegration.AutoProcScalingHasInt)
+        .outerjoin(
+            overall,
+            sqlalchemy.and_(
+                overall.autoProcScalingId
+                == models.AutoProcScalingHasInt.autoProcScalingId,
+                overall.scalingStatisticsType == "overall",
+            ),
+        )
+        .group_by(models.DataCollectionGroup.sessionId)
+    ).all()
+
+
+def image_scan(session: Session, rng: random.Random) -> None:
+    """Mean measured intensity of the images of each data collection"""
+    session.execute(
+        sqlalchemy.select(
+            models.Image.dataCollectionId,
+            sqlalchemy.func.avg(models.Image.measuredIntensity),
+        ).group_by(models.Image.dataCollectionId)
+    ).all()
+
+
+CASES: Dict[str, Callable[[Session, random.Random], None]] = {
+    "insert_datacollections": insert_datacollections,
+    "get_by_id": get_by_id,
+    "tree_load": tree_load,
+    "summary_scan": summary_scan,
+    "image_scan": image_scan,
+}
+
+
+def run(engine, repeat: int, seed: int) -> Dict[str, dict]:
+    results = {}
+    for name, case in CASES.items():
+        rng = random.Random(seed)
+        times: List[float] = []
+        with Session(engine) as session:
+            # Configuring the mappers and compiling the statements, untimed
+            case(session, random.Random(seed))
+            for _ in range(repeat):
+                start = time.perf_counter()
+                case(session, rng)
+                times.append(time.perf_counter() - start)
+        results[name] = {
+            "description": " ".join(case.__doc__.split()),
+            "repeat": repeat,
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.mean(times),
+            "max": max(times),
+        }
+    return results
+
+
+def compare(results: Dict[str, dict], previous: Dict[str, dict]) -> None:
+    print(
+        f"{'case':>24} {'previous':>10} {'current':>10} {'ratio':>7}", file=sys.stderr
+    )
+    for name, result in results.items():
+        if name not in previous:
+            continue
+        before, after = previous[name]["median"], result["median"]
+        print(
+            f"{name:>24} {before * 1000:>8.2f}ms {after * 1000:>8.2f}ms"
+            f" {after / before:>6.2f}x",
+            file=sys.stderr,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="sqlite://")
+    parser.add_argument("--scale", type=float, default=1)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=argparse.FileType("w"), default=sys.stdout)
+    parser.add_argument("--compare", type=argparse.FileType())
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(args.url)
+    models.metadata.create_all(engine)
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        rows = synthetic.generate(connection, args.scale, args.seed)
+    generate_time = time.perf_counter() - start
+
+    results = run(engine, args.repeat, args.seed)
+    json.dump(
+        {
+            "versions": {
+                "ispyb.models": models.__version__,
+                "sqlalchemy": sqlalchemy.__version__,
+                "python": platform.python_version(),
+            },
+            "database": engine.dialect.name,
+            "scale": args.scale,
+            "seed": args.seed,
+            "rows": rows,
+            "generate_time": generate_time,
+            "results": results,
+        },
+        args.output,
+        indent=2,
+    )
+    args.output.write("\n")
+    if args.compare:
+        compare(results, json.load(args.compare)["results"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Create the schema on SQLite and fill it with synthetic data
+
+Proposals → sessions → data collection groups → data collections →
+processing (AutoProcProgram → AutoProcIntegration ↔ AutoProcScaling →
+AutoProcScalingStatistics) and images, with the number of children per
+parent in FAN_OUT and --scale times 10 proposals.
+
+    python benchmarks/synthetic.py sqlite:///ispyb.db [--scale 1] [--seed 0]
+
+Used by benchmarks/suite.py.
+"""
+
+import argparse
+import datetime
+import random
+import time
+from typing import Dict, Iterator, List
+
+import sqlalchemy
+
+from ispyb import models
+
+# Proposals at scale 1, then the children per parent
+PROPOSALS = 10
+FAN_OUT = {
+    "sessions": 10,
+    "groups": 5,
+    "datacollections": 2,
+    "images": 10,
+}
+SHELLS = ("overall", "innerShell", "outerShell")
+BATCH_SIZE = 10_000
+
+START = datetime.datetime(2023, 1, 1)
+
+
+def _batches(rows: Iterator[dict]) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def generate(connection, scale: float = 1, seed: int = 0) -> Dict[str, int]:
+    """Insert the synthetic data, return the number of rows per table"""
+    rng = random.Random(seed)
+    counts: Dict[str, int] = {}
+
+    def insert(model, rows: Iterator[dict]) -> None:
+        for batch in _batches(rows):
+            connection.execute(sqlalchemy.insert(model.__table__), batch)
+            counts[model.__tablename__] = counts.get(model.__tablename__, 0) + len(
+                batch
+            )
+
+    proposals = max(1, round(PROPOSALS * scale))
+    sessions = proposals * FAN_OUT["sessions"]
+    groups = sessions * FAN_OUT["groups"]
+    datacollections = groups * FAN_OUT["datacollections"]
+    images = FAN_OUT["images"]
+
+    insert(
+        models.Person,
+        (
+            {"personId": i, "login": f"user{i}", "familyName": f"Family{i}"}
+            for i in range(1, proposals + 1)
+        ),
+    )
+    insert(
+        models.Proposal,
+        (
+            {
+                "proposalId": i,
+                "personId": i,
+                "proposalCode": rng.choice(("mx", "cm", "em", "bi")),
+                "proposalNumber": str(10000 + i),
+                "title": f"Proposal {i}",
+            }
+            for i in range(1, proposals + 1)
+        ),
+    )
+    insert(
+        models.BLSession,
+        (
+            {
+                "sessionId": i,
+                "proposalId": (i - 1) // FAN_OUT["sessions"] + 1,
+                "visit_number": (i - 1) % FAN_OUT["sessions"] + 1,
+                "beamLineName": rng.choice(("i03", "i04", "i24", "m02")),
+                "startDate": START + datetime.timedelta(days=i),
+                "endDate": START + datetime.timedelta(days=i, hours=8),
+                "lastUpdate": START + datetime.timedelta(days=i),
+            }
+            for i in range(1, sessions + 1)
+        ),
+    )
+    insert(
+        models.DataCollectionGroup,
+        (
+            {
+                "dataCollectionGroupId": i,
+                "sessionId": (i - 1) // FAN_OUT["groups"] + 1,
+                "experimentType": rng.choice(("OSC", "Mesh", "SAD")),
+                "startTime": START + datetime.timedelta(minutes=i),
+            }
+            for i in range(1, groups + 1)
+        ),
+    )
+    insert(
+        models.DataCollection,
+        (
+            {
+                "dataCollectionId": i,
+                "dataCollectionGroupId": (i - 1) // FAN_OUT["datacollections"] + 1,
+                "dataCollectionNumber": (i - 1) % FAN_OUT["datacollections"] + 1,
+                "startTime": START + datetime.timedelta(minutes=i),
+                "numberOfImages": images,
+                "wavelength": rng.uniform(0.7, 1.5),
+                "exposureTime": rng.choice((0.01, 0.02, 0.1)),
+                "resolution": rng.uniform(1.0, 3.0),
+                "imageDirectory": f"/data/2023/visit{i // 100}/",
+                "fileTemplate": f"dc{i}_####.cbf",
+                "runStatus": "DataCollection Successful",
+            }
+            for i in range(1, datacollections + 1)
+        ),
+    )
+    # One processing chain per data collection, sharing the ids
+    insert(
+        models.AutoProcProgram,
+        (
+            {
+                "autoProcProgramId": i,
+                "dataCollectionId": i,
+                "processingPrograms": rng.choice(("xia2 dials", "fast_dp", "autoPROC")),
+                "processingStatus": "SUCCESS",
+                "recordTimeStamp": START + datetime.timedelta(minutes=i),
+            }
+            for i in range(1, datacollections + 1)
+        ),
+    )
+    insert(
+        models.AutoProcIntegration,
+        (
+            {"autoProcIntegrationId": i, "autoProcProgramId": i, "dataCollectionId": i}
+            for i in range(1, datacollections + 1)
+        ),
+    )
+    insert(
+        models.AutoProc,
+        (
+            {
+                "autoProcId": i,
+                "autoProcProgramId": i,
+                "spaceGroup": rng.choice(("P 21 21 21", "P 1", "C 2")),
+            }
+            for i in range(1, datacollections + 1)
+        ),
+    )
+    insert(
+        models.AutoProcScaling,
+        (
+            {"autoProcScalingId": i, "autoProcId": i}
+            for i in range(1, datacollections + 1)
+        ),
+    )
+    insert(
+        models.AutoProcScalingHasInt,
+        (
+            {
+                "autoProcScaling_has_IntId": i,
+                "autoProcScalingId": i,
+                "autoProcIntegrationId": i,
+            }
+            for i in range(1, datacollections + 1)
+        ),
+    )
+    insert(
+        models.AutoProcScalingStatistics,
+        (
+            {
+                "autoProcScalingId": i,
+                "scalingStatisticsType": shell,
+                "resolutionLimitHigh": rng.uniform(1.0, 3.0),
+                "completeness": rng.uniform(80, 100),
+                "ccHalf": rng.uniform(0.5, 1.0),
+            }
+            for i in range(1, datacollections + 1)
+            for shell in SHELLS
+        ),
+    )
+    insert(
+        models.Image,
+        (
+            {
+                "dataCollectionId": i,
+                "imageNumber": number,
+                "fileName": f"dc{i}_{number:04d}.cbf",
+                "fileLocation": f"/data/2023/visit{i // 100}/",
+                "measuredIntensity": rng.uniform(0, 1000),
+            }
+            for i in range(1, datacollections + 1)
+            for number in range(1, images + 1)
+        ),
+    )
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url")
+    parser.add_argument("--scale", type=float, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(args.url)
+    models.metadata.create_all(engine)
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        counts = generate(connection, args.scale, args.seed)
+    print(f"{sum(counts.values()):,} rows in {time.perf_counter() - start:.1f}s")
+    for table, count in counts.items():
+        print(f"{table:>28}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
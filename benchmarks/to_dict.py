@@ -0,0 +1,87 @@
+"""Time to convert model instances to dicts, comparing getattr over the
+mapper columns with the compiled CustomBase.to_dict
+
+Builds --objects transient instances of --model with all their columns set,
+so that no query is involved, and optionally serialises the dicts with
+orjson when it is installed.
+
+    python benchmarks/to_dict.py [--objects 50000] [--model DataCollection]
+"""
+
+import argparse
+import datetime
+import decimal
+import time
+
+from sqlalchemy import inspect
+
+from ispyb import models
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SAMPLES = {
+    int: 1,
+    float: 1.5,
+    str: "value",
+    bool: True,
+    decimal.Decimal: decimal.Decimal("1.5"),
+    datetime.datetime: datetime.datetime(2023, 1, 1),
+    datetime.date: datetime.date(2023, 1, 1),
+    bytes: b"value",
+}
+
+
+def sample(prop):
+    try:
+        return SAMPLES.get(prop.columns[0].type.python_type)
+    except NotImplementedError:
+        return None
+
+
+def naive(obj, props):
+    return {prop.key: getattr(obj, prop.key) for prop in props}
+
+
+def timed(label, count, function):
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>24}: {elapsed:.3f}s, {count / elapsed:,.0f} objects/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=50_000)
+    parser.add_argument("--model", default="DataCollection")
+    args = parser.parse_args()
+
+    model = getattr(models, args.model)
+    props = inspect(model).column_attrs
+    values = {prop.key: sample(prop) for prop in props}
+    objects = [model(**values) for _ in range(args.objects)]
+    print(f"{args.objects} {args.model} objects, {len(props)} columns")
+
+    expected = timed(
+        "getattr", args.objects, lambda: [naive(o, props) for o in objects]
+    )
+    result = timed("to_dict", args.objects, lambda: [o.to_dict() for o in objects])
+    assert result == expected
+    if orjson:
+        timed(
+            "getattr + orjson",
+            args.objects,
+            lambda: orjson.dumps([naive(o, props) for o in objects], default=float),
+        )
+        timed(
+            "to_dict(json) + orjson",
+            args.objects,
+            lambda: orjson.dumps([o.to_dict(json=True) for o in objects]),
+        )
+
+
+if __name__ == "__main__":
+    main()
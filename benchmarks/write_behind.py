@@ -0,0 +1,105 @@
+"""Rate of Movie → MotionCorrection → CTF inserts with one commit per object
+and through a WriteBehindBuffer
+
+Commits --movies movies with their results in the database in
+SQLALCHEMY_DATABASE_URI under a new data collection, and deletes them at the
+end.
+
+    python benchmarks/write_behind.py [--movies 1000] [--max-size 100]
+"""
+
+import argparse
+import os
+import time
+
+import sqlalchemy
+from sqlalchemy.orm import Session, sessionmaker
+
+from ispyb import models
+from ispyb.models.write_behind import WriteBehindBuffer
+
+
+def commit_each(Session: sessionmaker, dataCollectionId: int, movies: int) -> None:
+    for number in range(movies):
+        with Session() as session:
+            movie = models.Movie(dataCollectionId=dataCollectionId, movieNumber=number)
+            session.add(movie)
+            session.commit()
+            motion = models.MotionCorrection(movieId=movie.movieId)
+            session.add(motion)
+            session.commit()
+            session.add(models.CTF(motionCorrectionId=motion.motionCorrectionId))
+            session.commit()
+
+
+def write_behind(
+    Session: sessionmaker, dataCollectionId: int, movies: int, max_size: int
+) -> None:
+    with WriteBehindBuffer(Session, max_size=max_size) as buffer:
+        for number in range(movies):
+            movie = buffer.add(
+                models.Movie(dataCollectionId=dataCollectionId, movieNumber=number)
+            )
+            motion = buffer.add(models.MotionCorrection(Movie=movie))
+            buffer.add(models.CTF(), motionCorrectionId=motion)
+
+
+def delete(session: Session, dataCollectionId: int) -> None:
+    movies = sqlalchemy.select(models.Movie.movieId).where(
+        models.Movie.dataCollectionId == dataCollectionId
+    )
+    motions = sqlalchemy.select(models.MotionCorrection.motionCorrectionId).where(
+        models.MotionCorrection.movieId.in_(movies)
+    )
+    for statement in (
+        sqlalchemy.delete(models.CTF).where(models.CTF.motionCorrectionId.in_(motions)),
+        sqlalchemy.delete(models.MotionCorrection).where(
+            models.MotionCorrection.movieId.in_(movies)
+        ),
+        sqlalchemy.delete(models.Movie).where(
+            models.Movie.dataCollectionId == dataCollectionId
+        ),
+    ):
+        session.execute(statement)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--movies", type=int, default=1000)
+    parser.add_argument("--max-size", type=int, default=100)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    Session = sessionmaker(engine)
+    with Session() as session:
+        sessionId = session.query(models.BLSession.sessionId).limit(1).scalar()
+        group = models.DataCollectionGroup(sessionId=sessionId)
+        datacollection = models.DataCollection(DataCollectionGroup=group)
+        session.add(datacollection)
+        session.commit()
+        dataCollectionId = datacollection.dataCollectionId
+        dataCollectionGroupId = group.dataCollectionGroupId
+
+    try:
+        for name, write in (
+            ("commit per object", commit_each),
+            (
+                "WriteBehindBuffer",
+                lambda *a: write_behind(*a, max_size=args.max_size),
+            ),
+        ):
+            start = time.perf_counter()
+            write(Session, dataCollectionId, args.movies)
+            elapsed = time.perf_counter() - start
+            print(f"{name:18} {elapsed:8.3f} s {args.movies / elapsed:10.0f} movies/s")
+    finally:
+        with Session.begin() as session:
+            delete(session, dataCollectionId)
+            session.delete(session.get(models.DataCollection, dataCollectionId))
+            session.delete(
+                session.get(models.DataCollectionGroup, dataCollectionGroupId)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Time and peak memory to build the XRF map of a --size x --size grid scan
+from ORM objects and with bulk.read_xrf_map
+
+Inserts the grid and its counts into the database in SQLALCHEMY_DATABASE_URI
+inside a transaction which is rolled back at the end.
+
+    python benchmarks/xrf_map.py [--size 1000] [--chunk-size 10000]
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+import numpy
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from ispyb import models
+from ispyb.models import bulk
+
+
+def read_orm(session: Session, dataCollectionId: int, roiId: int, size: int):
+    """Load every row as an ORM object, then fill the grid"""
+    session.expunge_all()
+    grid = numpy.full((size, size), numpy.nan)
+    rows = (
+        session.query(models.XRFFluorescenceMapping)
+        .filter(
+            models.XRFFluorescenceMapping.dataCollectionId == dataCollectionId,
+            models.XRFFluorescenceMapping.xrfFluorescenceMappingROIId == roiId,
+        )
+        .all()
+    )
+    for row in rows:
+        grid.flat[row.imageNumber - 1] = row.counts
+    return grid
+
+
+def measure(name: str, read) -> None:
+    start = time.perf_counter()
+    read()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    read()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{name:14} {elapsed:8.3f} s {peak / 2**20:8.1f} MiB peak")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=bulk.CHUNK_SIZE)
+    args = parser.parse_args()
+
+    engine = sqlalchemy.create_engine(os.environ["SQLALCHEMY_DATABASE_URI"])
+    with Session(engine) as session:
+        sessionId = session.query(models.BLSession.sessionId).limit(1).scalar()
+        group = models.DataCollectionGroup(sessionId=sessionId)
+        datacollection = models.DataCollection(DataCollectionGroup=group)
+        grid = models.GridInfo(
+            DataCollectionGroup=group, steps_x=args.size, steps_y=args.size
+        )
+        roi = models.XRFFluorescenceMappingROI(startEnergy=7.0, endEnergy=7.2)
+        session.add_all([datacollection, grid, roi])
+        session.flush()
+        dataCollectionId = datacollection.dataCollectionId
+        roiId = roi.xrfFluorescenceMappingROIId
+        session.execute(
+            sqlalchemy.insert(models.XRFFluorescenceMapping.__table__),
+            [
+                {
+                    "dataCollectionId": dataCollectionId,
+                    "xrfFluorescenceMappingROIId": roiId,
+                    "imageNumber": image,
+                    "counts": image % 1000,
+                }
+                for image in range(1, args.size**2 + 1)
+            ],
+        )
+        session.expunge_all()
+
+        print(f"{args.size}x{args.size} grid")
+        measure(
+            "ORM objects",
+            lambda: read_orm(session, dataCollectionId, roiId, args.size),
+        )
+        measure(
+            "read_xrf_map",
+            lambda: bulk.read_xrf_map(
+                session, dataCollectionId, roiId, chunk_size=args.chunk_size
+            ),
+        )
+        session.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Defer loading of the large columns in the generated _auto_db_schema.py
+
+Text and blob columns, and strings of at least MIN_STRING_LENGTH characters,
+of every model are wrapped in `deferred(..., group="large")` so that they
+are only loaded on access or with `models.undefer_large()`.
+"""
+
+import ast
+from pathlib import Path
+
+SCHEMA = Path("src/ispyb/models/_auto_db_schema.py")
+
+GROUP = "large"
+
+MIN_STRING_LENGTH = 1024
+
+LARGE_TYPES = {
+    "LargeBinary",
+    "LONGBLOB",
+    "LONGTEXT",
+    "MEDIUMBLOB",
+    "MEDIUMTEXT",
+    "Text",
+}
+STRING_TYPES = {"String", "VARCHAR"}
+
+
+def _is_large(column):
+    if not column.args:
+        return False
+    type_ = column.args[0]
+    if isinstance(type_, ast.Call):
+        name = getattr(type_.func, "id", None)
+        if name in STRING_TYPES and type_.args:
+            return type_.args[0].value >= MIN_STRING_LENGTH
+        return name in LARGE_TYPES
+    return getattr(type_, "id", None) in LARGE_TYPES
+
+
+def defer_large_columns(source):
+    lines = source.splitlines()
+    columns = [
+        stmt.value
+        for node in ast.parse(source).body
+        if isinstance(node, ast.ClassDef)
+        for stmt in node.body
+        if isinstance(stmt, ast.Assign)
+        and isinstance(stmt.value, ast.Call)
+        and getattr(stmt.value.func, "id", None) == "Column"
+        and not any(k.arg == "primary_key" for k in stmt.value.keywords)
+        and _is_large(stmt.value)
+    ]
+    # Edit from the end so that the earlier offsets stay valid
+    for column in reversed(columns):
+        line, offset = column.end_lineno - 1, column.end_col_offset
+        lines[line] = f'{lines[line][:offset]}, group="{GROUP}"){lines[line][offset:]}'
+        line, offset = column.lineno - 1, column.col_offset
+        lines[line] = f"{lines[line][:offset]}deferred({lines[line][offset:]}"
+    source = "\n".join(lines) + "\n"
+    if columns:
+        source = source.replace(
+            "from sqlalchemy.orm import relationship",
+            "from sqlalchemy.orm import deferred, relationship",
+            1,
+        )
+    return source
+
+
+if __name__ == "__main__":
+    SCHEMA.write_text(defer_large_columns(SCHEMA.read_text()))
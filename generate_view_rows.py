@@ -0,0 +1,94 @@
+"""Generate a read-only row class for each view of _schema/views.py
+
+Each `t_v_*` Table gets an immutable NamedTuple with one typed field per
+column, in column order, written to _schema/view_rows.py and loaded by
+`ispyb.models.views`.
+"""
+
+import keyword
+import re
+import sys
+from pathlib import Path
+
+OUTPUT = Path("src/ispyb/models/_schema/view_rows.py")
+
+
+def class_name(table_name):
+    """v_datacollection_summary → VDatacollectionSummary"""
+    return "".join(part[:1].upper() + part[1:] for part in table_name.split("_"))
+
+
+def field_name(column_name, taken):
+    """A valid and unique field name: "Res. (corner)" → "Res_corner" """
+    name = re.sub(r"\W+", "_", column_name).strip("_") or "column"
+    if name[0].isdigit():
+        name = f"c_{name}"
+    if keyword.iskeyword(name):
+        name += "_"
+    unique, count = name, 1
+    while unique in taken:
+        count += 1
+        unique = f"{name}_{count}"
+    taken.add(unique)
+    return unique
+
+
+def annotation(column):
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return "Any"
+    module = python_type.__module__
+    name = (
+        python_type.__name__
+        if module == "builtins"
+        else f"{module}.{python_type.__name__}"
+    )
+    return f"Optional[{name}]"
+
+
+def generate(views):
+    tables = sorted(
+        (table for name, table in vars(views).items() if name.startswith("t_")),
+        key=lambda table: table.name,
+    )
+    classes = {}
+    lines = []
+    for table in tables:
+        name = class_name(table.name)
+        if name in classes.values():
+            raise ValueError(f"Duplicate row class {name} for {table.name}")
+        classes[table.name] = name
+        taken = set()
+        lines += [
+            "",
+            "",
+            f"class {name}(NamedTuple):",
+            f'    """A row of {table.name}"""',
+            "",
+        ]
+        lines += [
+            f"    {field_name(column.name, taken)}: {annotation(column)}"
+            for column in table.columns
+        ]
+    source = "\n".join(lines)
+    imports = [module for module in ("datetime", "decimal") if f"{module}." in source]
+    header = [
+        "# coding: utf-8",
+        "# Generated by generate_view_rows.py, do not edit",
+        *(f"import {module}" for module in imports),
+        "from typing import Any, NamedTuple, Optional"
+        if ": Any" in source
+        else "from typing import NamedTuple, Optional",
+    ]
+    footer = ["", "", "ROW_CLASSES = {"]
+    footer += [f'    "{table}": {name},' for table, name in classes.items()]
+    footer += ["}", ""]
+    return "\n".join(header) + source + "\n".join(footer)
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, "src")
+    from ispyb.models._schema import views
+
+    OUTPUT.write_text(generate(views))
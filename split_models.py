@@ -0,0 +1,329 @@
+"""Split the generated _auto_db_schema.py into per-domain modules
+
+sqlacodegen emits the whole database as a single module. This script moves
+every model and table into one of the domain modules in
+src/ispyb/models/_schema/ so that they can be imported on demand, and
+rewrites _auto_db_schema.py to re-export all of them.
+
+Models not listed in DOMAIN_MODELS belong to "mx", views to "views" and
+association tables to the domain of the last of their foreign key targets
+(in DOMAIN_ORDER).
+"""
+
+import ast
+import builtins
+import pprint
+import sys
+from pathlib import Path
+
+MODELS = Path("src/ispyb/models")
+
+DOMAIN_ORDER = ("admin", "shipping", "mx", "em", "saxs", "views")
+
+DOMAIN_MODELS = {
+    "admin": {
+        "AdminActivity",
+        "AdminVar",
+        "BFAutomationError",
+        "BFAutomationFault",
+        "BFComponent",
+        "BFComponentBeamline",
+        "BFFault",
+        "BFSubcomponent",
+        "BFSubcomponentBeamline",
+        "BFSystem",
+        "BFSystemBeamline",
+        "BLSession",
+        "BeamLineSetup",
+        "BeamlineAction",
+        "BeamlineStats",
+        "CalendarHash",
+        "IspybReference",
+        "Laboratory",
+        "Log4Stat",
+        "Login",
+        "PHPSession",
+        "Permission",
+        "Person",
+        "Project",
+        "ProjectHasUser",
+        "Proposal",
+        "ProposalHasPerson",
+        "SWOnceToken",
+        "Schedule",
+        "ScheduleComponent",
+        "SchemaStatus",
+        "SessionHasPerson",
+        "SessionType",
+        "UserGroup",
+    },
+    "shipping": {
+        "BLSample",
+        "BLSampleGroup",
+        "BLSampleGroupHasBLSample",
+        "BLSampleImage",
+        "BLSampleImageAnalysis",
+        "BLSampleImageScore",
+        "BLSampleTypeHasComponent",
+        "BLSessionHasSCPosition",
+        "BLSubSample",
+        "Component",
+        "ComponentSubType",
+        "ComponentType",
+        "ConcentrationType",
+        "Container",
+        "ContainerHistory",
+        "ContainerInspection",
+        "ContainerQueue",
+        "ContainerQueueSample",
+        "Crystal",
+        "CrystalComposition",
+        "CrystalHasUUID",
+        "DatamatrixInSampleChanger",
+        "Dewar",
+        "DewarLocation",
+        "DewarLocationList",
+        "DewarRegistry",
+        "DewarRegistryHasProposal",
+        "DewarTransportHistory",
+        "DiffractionPlan",
+        "DiffractionPlanHasDetector",
+        "ExperimentKindDetails",
+        "Imager",
+        "InspectionType",
+        "IspybCrystalClass",
+        "LabContact",
+        "PDB",
+        "PlateType",
+        "Position",
+        "Protein",
+        "ProteinHasLattice",
+        "ProteinHasPDB",
+        "RobotAction",
+        "SafetyLevel",
+        "SampleComposition",
+        "Screen",
+        "ScreenComponent",
+        "ScreenComponentGroup",
+        "Shipping",
+    },
+    "em": {
+        "CTF",
+        "CryoemInitialModel",
+        "EMMicroscope",
+        "MotionCorrection",
+        "Movie",
+        "Particle",
+        "ParticleClassification",
+        "ParticleClassificationGroup",
+        "ParticlePicker",
+    },
+    "saxs": {
+        "AbInitioModel",
+        "Additive",
+        "Assembly",
+        "AssemblyHasMacromolecule",
+        "AssemblyRegion",
+        "Buffer",
+        "BufferHasAdditive",
+        "DataAcquisition",
+        "Experiment",
+        "FitStructureToExperimentalData",
+        "Frame",
+        "FrameList",
+        "FrameSet",
+        "FrameToList",
+        "Instruction",
+        "InstructionSet",
+        "Macromolecule",
+        "MacromoleculeRegion",
+        "Measurement",
+        "MeasurementToDataCollection",
+        "MeasurementUnit",
+        "Merge",
+        "MixtureToStructure",
+        "Model",
+        "ModelList",
+        "ModelToList",
+        "PlateGroup",
+        "RigidBodyModeling",
+        "Run",
+        "SamplePlate",
+        "SamplePlatePosition",
+        "SaxsDataCollection",
+        "Specimen",
+        "StockSolution",
+        "Stoichiometry",
+        "Structure",
+        "Subtraction",
+        "SubtractionToAbInitioModel",
+        "Superposition",
+    },
+}
+
+
+def _call_name(node):
+    return getattr(node.func, "id", None)
+
+
+def _references(node):
+    """Tables and models referenced by a top level statement"""
+    tables, models = set(), set()
+    for child in ast.walk(node):
+        if not isinstance(child, ast.Call):
+            continue
+        if _call_name(child) == "ForeignKey":
+            tables.add(child.args[0].value.split(".")[0])
+        elif _call_name(child) == "relationship":
+            models.add(child.args[0].value)
+            for keyword in child.keywords:
+                if keyword.arg == "secondary":
+                    tables.add(keyword.value.value)
+    return tables, models
+
+
+def _names(node):
+    return {
+        child.id
+        for child in ast.walk(node)
+        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load)
+    }
+
+
+def _imports(header, used):
+    """Rebuild the generated import block keeping only the used names"""
+    lines = []
+    for node in header:
+        if not isinstance(node, ast.ImportFrom) or node.level:
+            continue
+        names = [alias.name for alias in node.names if alias.name in used]
+        if names:
+            lines.append(f"from {node.module} import ({', '.join(names)},)")
+    return "\n".join(lines)
+
+
+def split(source):
+    lines = source.splitlines()
+    tree = ast.parse(source)
+
+    header, statements = [], []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) or (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Call)
+            and _call_name(node.value) == "Table"
+        ):
+            statements.append(node)
+        else:
+            header.append(node)
+    if not statements:
+        sys.exit("No models found, has _auto_db_schema.py already been split?")
+
+    domain_of = {
+        model: domain for domain, models in DOMAIN_MODELS.items() for model in models
+    }
+    # name -> (domain, statement) in generated order
+    entries = {}
+    table_owner = {}
+    for node in statements:
+        if isinstance(node, ast.ClassDef):
+            name = node.name
+            tablename = next(
+                stmt.value.value
+                for stmt in node.body
+                if isinstance(stmt, ast.Assign)
+                and getattr(stmt.targets[0], "id", None) == "__tablename__"
+            )
+            domain = domain_of.get(name, "mx")
+        else:
+            name = node.targets[0].id
+            tablename = node.value.args[0].value
+            if name.lower().startswith("t_v_"):
+                domain = "views"
+            else:
+                targets = [
+                    domain_of.get(table_owner[table], "mx")
+                    for table in _references(node)[0]
+                ]
+                domain = max(targets, key=DOMAIN_ORDER.index)
+        table_owner[tablename] = name
+        entries[name] = (domain, node)
+
+    unknown = set(domain_of) - set(entries)
+    if unknown:
+        sys.exit(f"Unknown models in DOMAIN_MODELS: {sorted(unknown)}")
+
+    dependencies = {domain: set() for domain in DOMAIN_ORDER}
+    for name, (domain, node) in entries.items():
+        tables, models = _references(node)
+        for target in {table_owner[table] for table in tables} | models:
+            if entries[target][0] != domain:
+                dependencies[domain].add(entries[target][0])
+
+    modules = {}
+    for domain in DOMAIN_ORDER:
+        nodes = [node for d, node in entries.values() if d == domain]
+        used = set().union(*map(_names, nodes))
+        body = "\n\n\n".join(
+            "\n".join(lines[node.lineno - 1 : node.end_lineno]) for node in nodes
+        )
+        base = ", ".join(sorted({"Base", "metadata"} & used))
+        modules[domain] = (
+            "# coding: utf-8\n"
+            f"{_imports(header, used)}\n\n"
+            f"from . import {base}\n\n\n"
+            f"{body}\n"
+        )
+
+    used = set().union(*map(_names, header)) - set(dir(builtins))
+    header_imports = [
+        "\n".join(lines[node.lineno - 1 : node.end_lineno])
+        for node in header
+        if isinstance(node, ast.ImportFrom)
+        and (node.level or {alias.name for alias in node.names} & used)
+    ]
+    header_source = "\n".join(
+        [
+            imp.replace("from .base import", "from ..base import")
+            for imp in header_imports
+        ]
+        + [
+            "\n".join(lines[node.lineno - 1 : node.end_lineno])
+            for node in header
+            if not isinstance(node, (ast.Import, ast.ImportFrom, ast.Expr))
+        ]
+    )
+    modules["__init__"] = (
+        "# coding: utf-8\n"
+        '"""Generated by split_models.py, do not edit"""\n'
+        f"{header_source}\n\n"
+        "# Domains directly referenced by the models of each domain\n"
+        f"DEPENDENCIES = {pprint.pformat({d: tuple(sorted(deps)) for d, deps in dependencies.items()}, sort_dicts=False)}\n\n"
+        "# Domain of each model and table\n"
+        f"MODELS = {pprint.pformat({name: domain for name, (domain, _) in entries.items()}, sort_dicts=False)}\n"
+    )
+    return modules
+
+
+def main():
+    schema = MODELS / "_auto_db_schema.py"
+    modules = split(schema.read_text())
+
+    package = MODELS / "_schema"
+    package.mkdir(exist_ok=True)
+    for name, source in modules.items():
+        (package / f"{name}.py").write_text(source)
+
+    schema.write_text(
+        "# coding: utf-8\n"
+        '"""Generated by split_models.py, do not edit"""\n'
+        "from ._schema import Base, metadata  # noqa F401\n"
+        + "".join(
+            f"from ._schema.{domain} import *  # noqa F401,F403\n"
+            for domain in DOMAIN_ORDER
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,189 +1,59 @@
-from sqlalchemy import func
-from sqlalchemy.orm import relationship
-from sqlalchemy.ext.hybrid import hybrid_property
+import importlib
+import importlib.util
+import os
+import threading
 
-from ._auto_db_schema import *  # noqa F403
-from ._auto_db_schema import (
-    AutoProcProgram,
-    AutoProcIntegration,
-    AutoProcScaling,
-    DataCollection,
-    DataCollectionGroup,
-    GridInfo,
-    # ProcessingJob,
-    Screening,
-    ScreeningStrategy,
-    ScreeningOutput,
-    ScreeningStrategyWedge,
-    UserGroup,
-    BLSubSample,
-    BLSession,
-    Protein,
-    Proposal,
-    Workflow,
-    SSXDataCollection,
-    CrystalComposition,
-    Crystal,
-    SampleComposition,
-    BLSample,
-    Event,
-    EventChain,
-)
+from . import _portable, _schema  # noqa F401
+from ._schema import Base, metadata  # noqa F401
+from ._configure import configure  # noqa F401
+from ._large_columns import undefer_large  # noqa F401
+from ._lazy_policy import set_lazy_policy  # noqa F401
 
 __version__ = "1.1.0"
 
-DataCollection.GridInfo = relationship(
-    "GridInfo", secondary="DataCollectionGroup", back_populates="DataCollection"
-)
-DataCollectionGroup.Workflow = relationship(
-    "Workflow", back_populates="DataCollectionGroup"
-)
-Workflow.DataCollectionGroup = relationship(
-    "DataCollectionGroup", back_populates="Workflow"
-)
+# Modules injecting additional relationships into the generated models of a domain
+_EXTENSIONS = {"admin": "._admin", "shipping": "._shipping", "mx": "._mx"}
+_EXTENDED_MODELS = {"ModifiedProposal": "admin", "ModifiedBLSession": "admin"}
 
-GridInfo.DataCollection = relationship(
-    "DataCollection", secondary="DataCollectionGroup", back_populates="GridInfo"
-)
-AutoProcProgram.AutoProcIntegration = relationship(
-    "AutoProcIntegration", back_populates="AutoProcProgram"
-)
-AutoProcIntegration.AutoProcScalingHasInt = relationship(
-    "AutoProcScalingHasInt", back_populates="AutoProcIntegration"
-)
-AutoProcScaling.AutoProcScalingStatistics = relationship(
-    "AutoProcScalingStatistics", back_populates="AutoProcScaling"
-)
-AutoProcProgram.AutoProcProgramAttachments = relationship(
-    "AutoProcProgramAttachment", back_populates="AutoProcProgram"
-)
-AutoProcScaling.AutoProcScalingStatistics = relationship(
-    "AutoProcScalingStatistics", back_populates="AutoProcScaling"
-)
-# ProcessingJob.ProcessingJobParameters = relationship(
-#     "ProcessingJobParameter", back_populates="ProcessingJob"
-# )
-# ProcessingJob.ProcessingJobImageSweeps = relationship(
-#     "ProcessingJobImageSweep", back_populates="ProcessingJob"
-# )
+_loaded = set()
+_lock = threading.RLock()
 
-Screening.ScreeningOutput = relationship("ScreeningOutput", back_populates="Screening")
-ScreeningOutput.ScreeningStrategy = relationship(
-    "ScreeningStrategy", back_populates="ScreeningOutput"
-)
-ScreeningOutput.ScreeningOutputLattice = relationship(
-    "ScreeningOutputLattice", back_populates="ScreeningOutput"
-)
-ScreeningStrategy.ScreeningStrategyWedge = relationship(
-    "ScreeningStrategyWedge", back_populates="ScreeningStrategy"
-)
-ScreeningStrategyWedge.ScreeningStrategySubWedge = relationship(
-    "ScreeningStrategySubWedge", back_populates="ScreeningStrategyWedge"
-)
 
-UserGroup.Permission = relationship(
-    "Permission", secondary="UserGroup_has_Permission", back_populates="UserGroup"
-)
-UserGroup.Person = relationship(
-    "Person", secondary="UserGroup_has_Person", back_populates="UserGroup"
-)
-
-Protein.ConcentrationType = relationship(
-    "ConcentrationType",
-    foreign_keys=[Protein.concentrationTypeId],
-    primaryjoin="Protein.concentrationTypeId == ConcentrationType.concentrationTypeId",
-)
-
-BLSubSample.Position1 = relationship("Position", foreign_keys=[BLSubSample.positionId])
-
-BLSubSample.Position2 = relationship("Position", foreign_keys=[BLSubSample.position2Id])
-
-
-class ModifiedProposal(Proposal):
-    BLSession = relationship("BLSession", back_populates="Proposal")
-    ProposalHasPerson = relationship("ProposalHasPerson", back_populates="Proposal")
-
-    @hybrid_property
-    def proposal(self):
-        return self.proposalCode + self.proposalNumber
-
-
-Proposal = ModifiedProposal
-
-
-class ModifiedBLSession(BLSession):
-    SessionHasPerson = relationship("SessionHasPerson", back_populates="BLSession")
-
-    SessionType = relationship("SessionType", back_populates="BLSession")
-
-    @hybrid_property
-    def session(self):
-        if self.Proposal:
-            return (
-                self.Proposal.proposalCode
-                + self.Proposal.proposalNumber
-                + "-"
-                + str(self.visit_number)
-            )
-        else:
-            return None
-
-    @session.expression
-    def session(cls):
-        return func.concat(
-            Proposal.proposalCode, Proposal.proposalNumber, "-", cls.visit_number
+def _load(domain: str) -> None:
+    """Import the models of a domain, and of the domains they reference, into this module"""
+    with _lock:
+        if domain in _loaded:
+            return
+        _loaded.add(domain)
+        for dependency in _schema.DEPENDENCIES[domain]:
+            _load(dependency)
+        module = importlib.import_module(
+            _EXTENSIONS.get(domain, f"._schema.{domain}"), __name__
+        )
+        globals().update(
+            {name: value for name, value in vars(module).items() if name[0] != "_"}
         )
 
-    @hybrid_property
-    def proposal(self):
-        if self.Proposal:
-            return self.Proposal.proposalCode + self.Proposal.proposalNumber
-        else:
-            return None
-
-    @proposal.expression
-    def proposal(cls):
-        return func.concat(Proposal.proposalCode, Proposal.proposalNumber)
-
-
-BLSession = ModifiedBLSession
-
-SSXDataCollection.DataCollection = relationship(
-    "DataCollection", back_populates="SSXDataCollection"
-)
-DataCollection.SSXDataCollection = relationship(
-    "SSXDataCollection", back_populates="DataCollection", uselist=False
-)
-
-CrystalComposition.Crystal = relationship(
-    "Crystal",
-    back_populates="crystal_compositions",
-)
 
-Crystal.crystal_compositions = relationship(
-    "CrystalComposition",
-    back_populates="Crystal",
-    cascade="all, delete-orphan",
-)
+def __getattr__(name: str):
+    domain = _schema.MODELS.get(name) or _EXTENDED_MODELS.get(name)
+    if domain:
+        _load(domain)
+    elif importlib.util.find_spec(f"{__name__}.{name}"):
+        return importlib.import_module(f".{name}", __name__)
+    elif name[0] != "_":
+        for domain in _schema.DEPENDENCIES:
+            _load(domain)
+    if name in globals():
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-SampleComposition.BLSample = relationship(
-    "BLSample",
-    back_populates="sample_compositions",
-)
 
-BLSample.sample_compositions = relationship(
-    "SampleComposition",
-    back_populates="BLSample",
-    cascade="all, delete-orphan",
-)
+def __dir__():
+    return sorted(set(globals()) | set(_schema.MODELS) | set(_EXTENDED_MODELS))
 
-Event.EventChain = relationship(
-    "EventChain",
-    back_populates="events",
-)
 
-EventChain.events = relationship(
-    "Event",
-    back_populates="EventChain",
-    cascade="all, delete-orphan",
-)
+# Set ISPYB_MODELS_LAZY=1 to only import the models of a domain on first access
+if os.environ.get("ISPYB_MODELS_LAZY", "").lower() not in ("1", "true", "yes"):
+    for _domain in _schema.DEPENDENCIES:
+        _load(_domain)
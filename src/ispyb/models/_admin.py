@@ -0,0 +1,140 @@
+import re
+
+from sqlalchemy import and_, func, inspect, not_, select
+from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
+from sqlalchemy.sql import operators
+
+from ._schema.admin import *  # noqa F403
+from ._schema.admin import (
+    UserGroup,
+    BLSession,
+    Proposal,
+)
+
+UserGroup.Permission = relationship(
+    "Permission", secondary="UserGroup_has_Permission", back_populates="UserGroup"
+)
+UserGroup.Person = relationship(
+    "Person", secondary="UserGroup_has_Person", back_populates="UserGroup"
+)
+
+
+_VISIT = re.compile(r"([A-Za-z]+)([^-]+)(?:-(\d+))?")
+
+
+def _split(value):
+    """Split "mx1234-5" into ("mx", "1234", 5), "mx1234" into ("mx", "1234", None)"""
+    match = isinstance(value, str) and _VISIT.fullmatch(value)
+    if not match:
+        return None
+    code, number, visit_number = match.groups()
+    return code, number, visit_number and int(visit_number)
+
+
+class _VisitComparator(Comparator):
+    """Compare a concatenated proposal or visit string column by column
+
+    `== "mx1234-5"` becomes an equality on proposalCode, proposalNumber (and
+    visit_number) which can use the indexes, instead of a comparison of
+    CONCAT(...) which can not. Other operators apply to the concatenation.
+    """
+
+    def __init__(self, cls, expression, visit: bool):
+        super().__init__(expression)
+        self.cls = cls
+        self.visit = visit
+
+    def _equals(self, value):
+        parts = _split(value)
+        if parts is None or (parts[2] is None) == self.visit:
+            # Bind parameters, columns, None or strings of another form
+            return self.expression == value
+        code, number, visit_number = parts
+        if not inspect(self.cls).mapper.isa(inspect(ModifiedBLSession)):
+            return and_(
+                self.cls.proposalCode == code, self.cls.proposalNumber == number
+            )
+        # Semi-join on proposalId, no join with Proposal needed in the query
+        predicate = self.cls.proposalId.in_(
+            select(ModifiedProposal.proposalId)
+            .where(
+                ModifiedProposal.proposalCode == code,
+                ModifiedProposal.proposalNumber == number,
+            )
+            .correlate(None)
+        )
+        if self.visit:
+            predicate = and_(predicate, self.cls.visit_number == visit_number)
+        return predicate
+
+    def operate(self, op, *other, **kwargs):
+        if op is operators.eq:
+            return self._equals(*other)
+        if op is operators.ne:
+            return not_(self._equals(*other))
+        return op(self.expression, *other, **kwargs)
+
+
+class ModifiedProposal(Proposal):
+    BLSession = relationship("BLSession", back_populates="Proposal")
+    ProposalHasPerson = relationship("ProposalHasPerson", back_populates="Proposal")
+
+    @hybrid_property
+    def proposal(self):
+        return self.proposalCode + self.proposalNumber
+
+    @proposal.comparator
+    def proposal(cls):
+        return _VisitComparator(
+            cls, func.concat(cls.proposalCode, cls.proposalNumber), visit=False
+        )
+
+
+Proposal = ModifiedProposal
+
+
+class ModifiedBLSession(BLSession):
+    SessionHasPerson = relationship("SessionHasPerson", back_populates="BLSession")
+
+    SessionType = relationship("SessionType", back_populates="BLSession")
+
+    @hybrid_property
+    def session(self):
+        if self.Proposal:
+            return (
+                self.Proposal.proposalCode
+                + self.Proposal.proposalNumber
+                + "-"
+                + str(self.visit_number)
+            )
+        else:
+            return None
+
+    @session.comparator
+    def session(cls):
+        return _VisitComparator(
+            cls,
+            func.concat(
+                Proposal.proposalCode, Proposal.proposalNumber, "-", cls.visit_number
+            ),
+            visit=True,
+        )
+
+    @hybrid_property
+    def proposal(self):
+        if self.Proposal:
+            return self.Proposal.proposalCode + self.Proposal.proposalNumber
+        else:
+            return None
+
+    @proposal.comparator
+    def proposal(cls):
+        return _VisitComparator(
+            cls,
+            func.concat(Proposal.proposalCode, Proposal.proposalNumber),
+            visit=False,
+        )
+
+
+BLSession = ModifiedBLSession
@@ -0,0 +1,100 @@
+import importlib
+from typing import Iterable, Optional, Set, Union
+
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import (
+    Mapper,
+    ORMExecuteState,
+    RelationshipProperty,
+    Session,
+    configure_mappers,
+)
+from sqlalchemy.orm.interfaces import EXT_CONTINUE, EXT_SKIP
+
+from ._schema import Base
+
+# Mappers allowed to be configured, None for all of them
+_allowed: Optional[Set[Mapper]] = None
+
+
+@event.listens_for(Base, "before_mapper_configured", propagate=True, retval=True)
+def _skip_unreachable(mapper: Mapper, cls: type):
+    if _allowed is not None and mapper not in _allowed:
+        return EXT_SKIP
+    return EXT_CONTINUE
+
+
+def _check_configured(mapper: Mapper) -> None:
+    if _allowed is not None and mapper not in _allowed:
+        raise InvalidRequestError(
+            f"{mapper.class_.__name__} is outside of the models given to "
+            "configure(subset=...), call configure() to configure every model"
+        )
+
+
+# Skipped mappers would otherwise fail deep inside SQLAlchemy
+
+
+@event.listens_for(Base, "init", propagate=True)
+def _check_init(target, args, kwargs) -> None:
+    if _allowed is not None:
+        _check_configured(inspect(target).mapper)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _check_execute(orm_execute_state: ORMExecuteState) -> None:
+    if _allowed is not None:
+        for mapper in orm_execute_state.all_mappers:
+            _check_configured(mapper)
+
+
+def _targets(mapper: Mapper, by_name: dict) -> Iterable[Mapper]:
+    """Mappers referenced by the (possibly not yet configured) relationships of a mapper"""
+    yield from mapper.iterate_to_root()
+    yield from mapper.self_and_descendants
+    for prop in mapper._props.values():
+        if not isinstance(prop, RelationshipProperty):
+            continue
+        argument = prop.argument
+        if callable(argument) and not isinstance(argument, type):
+            argument = argument()
+        if isinstance(argument, str):
+            yield by_name[argument]
+        else:
+            yield inspect(argument).mapper
+
+
+def reachable(models: Iterable[type]) -> Set[Mapper]:
+    """Mappers of the given models and of every model reachable through their relationships"""
+    by_name = {mapper.class_.__name__: mapper for mapper in Base.registry.mappers}
+    seen: Set[Mapper] = set()
+    pending = [inspect(model).mapper for model in models]
+    while pending:
+        mapper = pending.pop()
+        if mapper not in seen:
+            seen.add(mapper)
+            pending.extend(_targets(mapper, by_name))
+    return seen
+
+
+def configure(subset: Optional[Iterable[Union[type, str]]] = None) -> None:
+    """Configure the mappers of the models ahead of the first query
+
+    With a subset of models (classes or names), only the mappers reachable
+    from those models through their relationships are configured, all others
+    are skipped until a later call to `configure` includes them. Using a model
+    outside of the configured subsets is an error, call `configure()` without
+    subset to configure every remaining mapper.
+    """
+    global _allowed
+    if subset is None:
+        _allowed = None
+    else:
+        package = importlib.import_module(__package__)
+        models = [
+            getattr(package, model) if isinstance(model, str) else model
+            for model in subset
+        ]
+        _allowed = (_allowed or set()) | reachable(models)
+    configure_mappers()
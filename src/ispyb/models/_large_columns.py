@@ -0,0 +1,12 @@
+from sqlalchemy.orm import Load
+
+# Deferral group of the large columns, see defer_large_columns.py
+GROUP = "large"
+
+
+def undefer_large(model: type) -> Load:
+    """Loader option loading the deferred large columns of a model with the query
+
+    session.query(DataCollection).options(undefer_large(DataCollection))
+    """
+    return Load(model).undefer_group(GROUP)
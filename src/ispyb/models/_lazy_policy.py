@@ -0,0 +1,67 @@
+import logging
+import os
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ._schema import Base
+
+logger = logging.getLogger("ispyb.models")
+
+POLICIES = ("select", "warn", "raise")
+
+_policy = "select"
+
+
+def set_lazy_policy(policy: str) -> None:
+    """Set what happens when a relationship of a model is lazy loaded
+
+    "select": emit the SELECT (default)
+    "warn": emit the SELECT and log a warning
+    "raise": raise an InvalidRequestError instead, as with lazy="raise_on_sql"
+
+    Only lazy loads emitting SQL are affected, many-to-one relationships
+    found in the identity map are still returned. The initial policy is read
+    from the ISPYB_MODELS_LAZY_POLICY environment variable. A Session can
+    override it with its `info["lazy_policy"]`, and answer lazy loads before
+    the policy applies with the functions in its `info["lazy_loaders"]`,
+    called like a do_orm_execute listener.
+    """
+    global _policy
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown lazy policy {policy!r}, expected one of {POLICIES}")
+    _policy = policy
+
+
+def lazy_loaded_relationship(orm_execute_state: ORMExecuteState) -> Optional[str]:
+    """Name of the relationship of a model lazy loaded by an execution, if any"""
+    state = orm_execute_state.lazy_loaded_from
+    if state is None or state.mapper.registry is not Base.registry:
+        return None
+    return str(orm_execute_state.loader_strategy_path.prop)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _check_lazy_load(orm_execute_state: ORMExecuteState):
+    info = orm_execute_state.session.info
+    # Listeners of a Session instance run after this class listener
+    for loader in info.get("lazy_loaders", ()):
+        result = loader(orm_execute_state)
+        if result is not None:
+            return result
+    policy = info.get("lazy_policy", _policy)
+    if policy == "select":
+        return
+    relationship = lazy_loaded_relationship(orm_execute_state)
+    if relationship is None:
+        return
+    if policy == "raise":
+        raise InvalidRequestError(
+            f"'{relationship}' is not available due to lazy policy 'raise'"
+        )
+    logger.warning("Lazy load of '%s'", relationship, stack_info=True)
+
+
+set_lazy_policy(os.environ.get("ISPYB_MODELS_LAZY_POLICY", "select"))
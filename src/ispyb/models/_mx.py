@@ -0,0 +1,90 @@
+from sqlalchemy.orm import relationship
+
+from ._schema.mx import *  # noqa F403
+from ._schema.mx import (
+    AutoProcProgram,
+    AutoProcIntegration,
+    AutoProcScaling,
+    DataCollection,
+    DataCollectionGroup,
+    GridInfo,
+    # ProcessingJob,
+    Screening,
+    ScreeningStrategy,
+    ScreeningOutput,
+    ScreeningStrategyWedge,
+    Workflow,
+    SSXDataCollection,
+    Event,
+    EventChain,
+)
+
+DataCollection.GridInfo = relationship(
+    "GridInfo", secondary="DataCollectionGroup", back_populates="DataCollection"
+)
+DataCollectionGroup.Workflow = relationship(
+    "Workflow", back_populates="DataCollectionGroup"
+)
+Workflow.DataCollectionGroup = relationship(
+    "DataCollectionGroup", back_populates="Workflow"
+)
+
+GridInfo.DataCollection = relationship(
+    "DataCollection", secondary="DataCollectionGroup", back_populates="GridInfo"
+)
+DataCollection.AutoProcProgram = relationship(
+    "AutoProcProgram", back_populates="DataCollection"
+)
+AutoProcProgram.AutoProcIntegration = relationship(
+    "AutoProcIntegration", back_populates="AutoProcProgram"
+)
+AutoProcIntegration.AutoProcScalingHasInt = relationship(
+    "AutoProcScalingHasInt", back_populates="AutoProcIntegration"
+)
+AutoProcScaling.AutoProcScalingStatistics = relationship(
+    "AutoProcScalingStatistics", back_populates="AutoProcScaling"
+)
+AutoProcProgram.AutoProcProgramAttachments = relationship(
+    "AutoProcProgramAttachment", back_populates="AutoProcProgram"
+)
+AutoProcScaling.AutoProcScalingStatistics = relationship(
+    "AutoProcScalingStatistics", back_populates="AutoProcScaling"
+)
+# ProcessingJob.ProcessingJobParameters = relationship(
+#     "ProcessingJobParameter", back_populates="ProcessingJob"
+# )
+# ProcessingJob.ProcessingJobImageSweeps = relationship(
+#     "ProcessingJobImageSweep", back_populates="ProcessingJob"
+# )
+
+Screening.ScreeningOutput = relationship("ScreeningOutput", back_populates="Screening")
+ScreeningOutput.ScreeningStrategy = relationship(
+    "ScreeningStrategy", back_populates="ScreeningOutput"
+)
+ScreeningOutput.ScreeningOutputLattice = relationship(
+    "ScreeningOutputLattice", back_populates="ScreeningOutput"
+)
+ScreeningStrategy.ScreeningStrategyWedge = relationship(
+    "ScreeningStrategyWedge", back_populates="ScreeningStrategy"
+)
+ScreeningStrategyWedge.ScreeningStrategySubWedge = relationship(
+    "ScreeningStrategySubWedge", back_populates="ScreeningStrategyWedge"
+)
+
+SSXDataCollection.DataCollection = relationship(
+    "DataCollection", back_populates="SSXDataCollection"
+)
+DataCollection.SSXDataCollection = relationship(
+    "SSXDataCollection", back_populates="DataCollection", uselist=False
+)
+
+Event.EventChain = relationship(
+    "EventChain",
+    back_populates="events",
+)
+
+EventChain.events = relationship(
+    "Event",
+    back_populates="EventChain",
+    cascade="all, delete-orphan",
+)
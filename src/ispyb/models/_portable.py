@@ -0,0 +1,52 @@
+"""DDL of the generated MySQL schema on SQLite, so that metadata.create_all
+builds all the tables in a local or in-memory database
+
+The MySQL column types are compiled to their SQLite equivalents, integer
+primary keys to INTEGER so that they are auto-incremented. The
+current_timestamp() server defaults become CURRENT_TIMESTAMP, without the
+ON UPDATE, and zero dates, which cannot be read back into a datetime,
+become 1970-01-01 00:00:00. The compiled DDL for MySQL is unchanged.
+"""
+
+import re
+
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateColumn
+
+_CURRENT_TIMESTAMP = re.compile(
+    r"DEFAULT \(?'?current_timestamp\(\)'?( ON UPDATE current_timestamp\(\))?\)?",
+    re.IGNORECASE,
+)
+_ZERO_DATE = re.compile(r"DEFAULT \(?'0000-00-00[^']*'\)?")
+
+
+@compiles(mysql.TINYINT, "sqlite")
+@compiles(mysql.SMALLINT, "sqlite")
+@compiles(mysql.MEDIUMINT, "sqlite")
+@compiles(mysql.BIGINT, "sqlite")
+def _integer(element, compiler, **kw):
+    return "INTEGER"
+
+
+@compiles(mysql.TINYTEXT, "sqlite")
+@compiles(mysql.MEDIUMTEXT, "sqlite")
+@compiles(mysql.LONGTEXT, "sqlite")
+def _text(element, compiler, **kw):
+    return "TEXT"
+
+
+@compiles(mysql.TINYBLOB, "sqlite")
+@compiles(mysql.MEDIUMBLOB, "sqlite")
+@compiles(mysql.LONGBLOB, "sqlite")
+def _blob(element, compiler, **kw):
+    return "BLOB"
+
+
+@compiles(CreateColumn, "sqlite")
+def _create_column(element, compiler, **kw):
+    text = compiler.visit_create_column(element, **kw)
+    if text is None:
+        return text
+    text = _CURRENT_TIMESTAMP.sub("DEFAULT CURRENT_TIMESTAMP", text)
+    return _ZERO_DATE.sub("DEFAULT '1970-01-01 00:00:00'", text)
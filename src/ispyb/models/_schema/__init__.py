@@ -0,0 +1,274 @@
+# coding: utf-8
+"""Generated by split_models.py, do not edit"""
+from sqlalchemy.ext.declarative import declarative_base
+from ..base import CustomBase
+
+Base = declarative_base(cls=CustomBase)
+metadata = Base.metadata
+
+# Domains directly referenced by the models of each domain
+DEPENDENCIES = {
+    "admin": ("mx", "shipping"),
+    "shipping": ("admin", "mx"),
+    "mx": ("admin", "shipping"),
+    "em": ("mx",),
+    "saxs": ("admin", "mx", "shipping"),
+    "views": (),
+}
+
+# Domain of each model and table
+MODELS = {
+    "Additive": "saxs",
+    "AdminActivity": "admin",
+    "AdminVar": "admin",
+    "Aperture": "mx",
+    "AutoProc": "mx",
+    "BFAutomationError": "admin",
+    "BFSystem": "admin",
+    "BLSampleGroup": "shipping",
+    "BLSampleImageScore": "shipping",
+    "BeamLineSetup": "admin",
+    "BeamlineStats": "admin",
+    "CTF": "em",
+    "CalendarHash": "admin",
+    "ComponentSubType": "shipping",
+    "ComponentType": "shipping",
+    "ConcentrationType": "shipping",
+    "CryoemInitialModel": "em",
+    "DataAcquisition": "saxs",
+    "DataReductionStatus": "mx",
+    "DatamatrixInSampleChanger": "shipping",
+    "Detector": "mx",
+    "DewarLocation": "shipping",
+    "DewarLocationList": "shipping",
+    "DiffractionPlan": "shipping",
+    "EMMicroscope": "em",
+    "EventType": "mx",
+    "Frame": "saxs",
+    "FrameList": "saxs",
+    "GeometryClassname": "mx",
+    "Imager": "shipping",
+    "InitialModel": "mx",
+    "InputParameterWorkflow": "mx",
+    "InspectionType": "shipping",
+    "InstructionSet": "saxs",
+    "IspybAutoProcAttachment": "mx",
+    "IspybCrystalClass": "shipping",
+    "IspybReference": "admin",
+    "Laboratory": "admin",
+    "Log4Stat": "admin",
+    "Login": "admin",
+    "MeasurementUnit": "saxs",
+    "Model": "saxs",
+    "ModelList": "saxs",
+    "MotorPosition": "mx",
+    "PDB": "shipping",
+    "PHPSession": "admin",
+    "Permission": "admin",
+    "PhasingAnalysis": "mx",
+    "PhasingProgramRun": "mx",
+    "PlateGroup": "saxs",
+    "PlateType": "shipping",
+    "Position": "shipping",
+    "RigidBodyModeling": "saxs",
+    "Run": "saxs",
+    "SafetyLevel": "shipping",
+    "ScanParametersService": "mx",
+    "Schedule": "admin",
+    "SchemaStatus": "admin",
+    "ScreeningRankSet": "mx",
+    "Superposition": "saxs",
+    "UserGroup": "admin",
+    "t_V_AnalysisInfo": "views",
+    "Workflow": "mx",
+    "WorkflowType": "mx",
+    "XRFFluorescenceMappingROI": "mx",
+    "t_v_Log4Stat": "views",
+    "t_v_datacollection": "views",
+    "t_v_datacollection_autoprocintegration": "views",
+    "t_v_datacollection_phasing": "views",
+    "t_v_datacollection_phasing_program_run": "views",
+    "t_v_datacollection_summary": "views",
+    "t_v_datacollection_summary_autoprocintegration": "views",
+    "t_v_datacollection_summary_datacollectiongroup": "views",
+    "t_v_datacollection_summary_phasing": "views",
+    "t_v_datacollection_summary_screening": "views",
+    "t_v_dewar": "views",
+    "t_v_dewarBeamline": "views",
+    "t_v_dewarBeamlineByWeek": "views",
+    "t_v_dewarByWeek": "views",
+    "t_v_dewarByWeekTotal": "views",
+    "t_v_dewarList": "views",
+    "t_v_dewarProposalCode": "views",
+    "t_v_dewarProposalCodeByWeek": "views",
+    "t_v_dewar_summary": "views",
+    "t_v_em_2dclassification": "views",
+    "t_v_em_classification": "views",
+    "t_v_em_movie": "views",
+    "t_v_em_stats": "views",
+    "t_v_energyScan": "views",
+    "t_v_hour": "views",
+    "t_v_logonByHour": "views",
+    "t_v_logonByMonthDay": "views",
+    "t_v_logonByWeek": "views",
+    "t_v_logonByWeekDay": "views",
+    "t_v_monthDay": "views",
+    "t_v_mx_autoprocessing_stats": "views",
+    "t_v_mx_experiment_stats": "views",
+    "t_v_mx_sample": "views",
+    "t_v_phasing": "views",
+    "t_v_sample": "views",
+    "t_v_sampleByWeek": "views",
+    "t_v_saxs_datacollection": "views",
+    "t_v_session": "views",
+    "t_v_tracking_shipment_history": "views",
+    "t_v_week": "views",
+    "t_v_weekDay": "views",
+    "t_v_xfeFluorescenceSpectrum": "views",
+    "AbInitioModel": "saxs",
+    "AutoProcScaling": "mx",
+    "BFComponent": "admin",
+    "BFSystemBeamline": "admin",
+    "BeamApertures": "mx",
+    "BeamCentres": "mx",
+    "Buffer": "saxs",
+    "DiffractionPlanHasDetector": "shipping",
+    "ExperimentKindDetails": "shipping",
+    "FrameSet": "saxs",
+    "FrameToList": "saxs",
+    "Instruction": "saxs",
+    "Macromolecule": "saxs",
+    "ModelToList": "saxs",
+    "Person": "admin",
+    "PhasingProgramAttachment": "mx",
+    "ScanParametersModel": "mx",
+    "ScheduleComponent": "admin",
+    "SpaceGroup": "mx",
+    "UntrustedRegion": "mx",
+    "t_UserGroup_has_Permission": "admin",
+    "WorkflowDehydration": "mx",
+    "WorkflowStep": "mx",
+    "Assembly": "saxs",
+    "AutoProcScalingStatistics": "mx",
+    "BFComponentBeamline": "admin",
+    "BFSubcomponent": "admin",
+    "BufferHasAdditive": "saxs",
+    "MXMRRun": "mx",
+    "MacromoleculeRegion": "saxs",
+    "ModelBuilding": "mx",
+    "Phasing": "mx",
+    "PhasingStep": "mx",
+    "PhasingHasScaling": "mx",
+    "PreparePhasingData": "mx",
+    "Project": "admin",
+    "Proposal": "admin",
+    "StockSolution": "saxs",
+    "Stoichiometry": "saxs",
+    "SubstructureDetermination": "mx",
+    "t_UserGroup_has_Person": "admin",
+    "AssemblyHasMacromolecule": "saxs",
+    "BFSubcomponentBeamline": "admin",
+    "BLSession": "admin",
+    "Component": "shipping",
+    "LabContact": "shipping",
+    "MXMRRunBlob": "mx",
+    "PhasingStatistics": "mx",
+    "t_Project_has_Person": "admin",
+    "ProjectHasUser": "admin",
+    "ProposalHasPerson": "admin",
+    "Protein": "shipping",
+    "SWOnceToken": "admin",
+    "Screen": "shipping",
+    "AssemblyRegion": "saxs",
+    "BFFault": "admin",
+    "BLSessionHasSCPosition": "shipping",
+    "BeamlineAction": "admin",
+    "t_Component_has_SubType": "shipping",
+    "Crystal": "shipping",
+    "DewarRegistry": "shipping",
+    "Experiment": "saxs",
+    "t_Project_has_Protein": "shipping",
+    "t_Project_has_Session": "admin",
+    "ProteinHasLattice": "shipping",
+    "ProteinHasPDB": "shipping",
+    "ScreenComponentGroup": "shipping",
+    "SessionType": "admin",
+    "SessionHasPerson": "admin",
+    "Shipping": "shipping",
+    "BLSampleTypeHasComponent": "shipping",
+    "CrystalComposition": "shipping",
+    "CrystalHasUUID": "shipping",
+    "Dewar": "shipping",
+    "DewarRegistryHasProposal": "shipping",
+    "t_Project_has_Shipping": "shipping",
+    "SamplePlate": "saxs",
+    "SaxsDataCollection": "saxs",
+    "ScreenComponent": "shipping",
+    "t_ShippingHasSession": "shipping",
+    "Container": "shipping",
+    "DewarTransportHistory": "shipping",
+    "SamplePlatePosition": "saxs",
+    "Subtraction": "saxs",
+    "BFAutomationFault": "admin",
+    "BLSample": "shipping",
+    "ContainerHistory": "shipping",
+    "ContainerInspection": "shipping",
+    "ContainerQueue": "shipping",
+    "Specimen": "saxs",
+    "SubtractionToAbInitioModel": "saxs",
+    "BLSampleGroupHasBLSample": "shipping",
+    "BLSampleImage": "shipping",
+    "t_BLSample_has_DiffractionPlan": "shipping",
+    "BLSubSample": "shipping",
+    "DataCollectionGroup": "mx",
+    "DataCollectionPlanGroup": "mx",
+    "Measurement": "saxs",
+    "t_Project_has_BLSample": "shipping",
+    "RobotAction": "shipping",
+    "SampleComposition": "shipping",
+    "Structure": "saxs",
+    "BLSampleImageAnalysis": "shipping",
+    "ContainerQueueSample": "shipping",
+    "EnergyScan": "mx",
+    "FitStructureToExperimentalData": "saxs",
+    "MeasurementToDataCollection": "saxs",
+    "Merge": "saxs",
+    "t_Project_has_DCGroup": "mx",
+    "Screening": "mx",
+    "XFEFluorescenceSpectrum": "mx",
+    "BLSampleHasEnergyScan": "mx",
+    "MixtureToStructure": "saxs",
+    "t_Project_has_EnergyScan": "mx",
+    "t_Project_has_XFEFSpectrum": "mx",
+    "ScreeningInput": "mx",
+    "ScreeningOutput": "mx",
+    "ScreeningRank": "mx",
+    "ScreeningOutputLattice": "mx",
+    "ScreeningStrategy": "mx",
+    "ScreeningStrategyWedge": "mx",
+    "ScreeningStrategySubWedge": "mx",
+    "DataCollection": "mx",
+    "AutoProcProgram": "mx",
+    "DataCollectionFileAttachment": "mx",
+    "EventChain": "mx",
+    "Image": "mx",
+    "Movie": "em",
+    "Particle": "em",
+    "SSXDataCollection": "mx",
+    "XRFFluorescenceMapping": "mx",
+    "AutoProcIntegration": "mx",
+    "AutoProcProgramAttachment": "mx",
+    "Event": "mx",
+    "ImageQualityIndicators": "mx",
+    "MotionCorrection": "em",
+    "PDBEntry": "mx",
+    "WorkflowMesh": "mx",
+    "AutoProcScalingHasInt": "mx",
+    "AutoProcStatus": "mx",
+    "GridInfo": "mx",
+    "PDBEntryHasAutoProcProgram": "mx",
+    "ParticlePicker": "em",
+    "ParticleClassificationGroup": "em",
+    "ParticleClassification": "em",
+    "t_ParticleClassification_has_CryoemInitialModel": "em",
+}
@@ -0,0 +1,702 @@
+# coding: utf-8
+from sqlalchemy import (
+    BINARY,
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    TIMESTAMP,
+    Table,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.mysql import (
+    INTEGER,
+    TINYINT,
+    VARCHAR,
+)
+from sqlalchemy.orm import (
+    deferred,
+    relationship,
+)
+
+from . import Base, metadata
+
+
+class AdminActivity(Base):
+    __tablename__ = "AdminActivity"
+
+    adminActivityId = Column(INTEGER(11), primary_key=True)
+    username = Column(
+        String(45), nullable=False, unique=True, server_default=text("''")
+    )
+    action = Column(String(45), index=True)
+    comments = Column(String(100))
+    dateTime = Column(DateTime)
+
+
+class AdminVar(Base):
+    __tablename__ = "AdminVar"
+    __table_args__ = {"comment": "ISPyB administration values"}
+
+    varId = Column(INTEGER(11), primary_key=True)
+    name = Column(String(32), index=True)
+    value = deferred(Column(String(1024), index=True), group="large")
+
+
+class BFAutomationError(Base):
+    __tablename__ = "BF_automationError"
+
+    automationErrorId = Column(INTEGER(10), primary_key=True)
+    errorType = Column(String(40), nullable=False)
+    solution = deferred(Column(Text), group="large")
+
+
+class BFSystem(Base):
+    __tablename__ = "BF_system"
+
+    systemId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(100))
+    description = Column(String(200))
+
+
+class BeamLineSetup(Base):
+    __tablename__ = "BeamLineSetup"
+
+    beamLineSetupId = Column(INTEGER(10), primary_key=True)
+    synchrotronMode = Column(String(255))
+    undulatorType1 = Column(String(45))
+    undulatorType2 = Column(String(45))
+    undulatorType3 = Column(String(45))
+    focalSpotSizeAtSample = Column(Float)
+    focusingOptic = Column(String(255))
+    beamDivergenceHorizontal = Column(Float)
+    beamDivergenceVertical = Column(Float)
+    polarisation = Column(Float)
+    monochromatorType = Column(String(255))
+    setupDate = Column(DateTime)
+    synchrotronName = Column(String(255))
+    maxExpTimePerDataCollection = Column(Float(asdecimal=True))
+    minExposureTimePerImage = Column(Float(asdecimal=True))
+    goniostatMaxOscillationSpeed = Column(Float(asdecimal=True))
+    goniostatMinOscillationWidth = Column(Float(asdecimal=True))
+    minTransmission = Column(Float(asdecimal=True))
+    CS = Column(Float)
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+
+
+class BeamlineStats(Base):
+    __tablename__ = "BeamlineStats"
+
+    beamlineStatsId = Column(INTEGER(10), primary_key=True)
+    beamline = Column(String(10))
+    recordTimeStamp = Column(DateTime)
+    ringCurrent = Column(Float)
+    energy = Column(Float)
+    gony = Column(Float)
+    beamW = Column(Float)
+    beamH = Column(Float)
+    flux = Column(Float(asdecimal=True))
+    scanFileW = Column(String(255))
+    scanFileH = Column(String(255))
+
+
+class CalendarHash(Base):
+    __tablename__ = "CalendarHash"
+    __table_args__ = {
+        "comment": "Lets people get to their calendars without logging in using a private (hash) url"
+    }
+
+    calendarHashId = Column(INTEGER(10), primary_key=True)
+    ckey = Column(String(50))
+    hash = Column(String(128))
+    beamline = Column(TINYINT(1))
+
+
+class IspybReference(Base):
+    __tablename__ = "IspybReference"
+
+    referenceId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    referenceName = Column(String(255), comment="reference name")
+    referenceUrl = deferred(
+        Column(String(1024), comment="url of the reference"), group="large"
+    )
+    referenceBibtext = deferred(
+        Column(LargeBinary, comment="bibtext value of the reference"), group="large"
+    )
+    beamline = Column(
+        Enum(
+            "All",
+            "ID14-4",
+            "ID23-1",
+            "ID23-2",
+            "ID29",
+            "ID30A-1",
+            "ID30A-2",
+            "XRF",
+            "AllXRF",
+            "Mesh",
+        ),
+        comment="beamline involved",
+    )
+
+
+class Laboratory(Base):
+    __tablename__ = "Laboratory"
+
+    laboratoryId = Column(INTEGER(10), primary_key=True)
+    laboratoryUUID = Column(String(45))
+    name = Column(String(45))
+    address = Column(String(255))
+    city = Column(String(45))
+    country = Column(String(45))
+    url = Column(String(255))
+    organization = Column(String(45))
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+    laboratoryExtPk = Column(INTEGER(11))
+
+
+class Log4Stat(Base):
+    __tablename__ = "Log4Stat"
+
+    id = Column(INTEGER(11), primary_key=True)
+    priority = Column(String(15))
+    timestamp = Column(DateTime)
+    msg = Column(String(255))
+    detail = Column(String(255))
+    value = Column(String(255))
+
+
+class Login(Base):
+    __tablename__ = "Login"
+
+    loginId = Column(INTEGER(11), primary_key=True)
+    token = Column(String(45), nullable=False, index=True)
+    username = Column(String(45), nullable=False)
+    roles = deferred(Column(String(1024), nullable=False), group="large")
+    siteId = Column(String(45))
+    authorized = deferred(Column(String(1024)), group="large")
+    expirationTime = Column(DateTime, nullable=False)
+
+
+class PHPSession(Base):
+    __tablename__ = "PHPSession"
+
+    id = Column(String(50), primary_key=True)
+    accessDate = Column(DateTime)
+    data = deferred(Column(String(4000)), group="large")
+
+
+class Permission(Base):
+    __tablename__ = "Permission"
+
+    permissionId = Column(INTEGER(10), primary_key=True)
+    type = Column(String(15), nullable=False)
+    description = Column(String(100))
+
+    UserGroup = relationship("UserGroup", secondary="UserGroup_has_Permission")
+
+
+class Schedule(Base):
+    __tablename__ = "Schedule"
+
+    scheduleId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(45))
+
+
+class SchemaStatus(Base):
+    __tablename__ = "SchemaStatus"
+
+    schemaStatusId = Column(INTEGER(11), primary_key=True)
+    scriptName = Column(String(100), nullable=False, unique=True)
+    schemaStatus = Column(String(10))
+    recordTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+
+class UserGroup(Base):
+    __tablename__ = "UserGroup"
+
+    userGroupId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(31), nullable=False, unique=True)
+
+
+class BFComponent(Base):
+    __tablename__ = "BF_component"
+
+    componentId = Column(INTEGER(10), primary_key=True)
+    systemId = Column(ForeignKey("BF_system.systemId", ondelete="CASCADE"), index=True)
+    name = Column(String(100))
+    description = Column(String(200))
+
+    BF_system = relationship("BFSystem")
+
+
+class BFSystemBeamline(Base):
+    __tablename__ = "BF_system_beamline"
+
+    system_beamlineId = Column(INTEGER(10), primary_key=True)
+    systemId = Column(ForeignKey("BF_system.systemId", ondelete="CASCADE"), index=True)
+    beamlineName = Column(String(20))
+
+    BF_system = relationship("BFSystem")
+
+
+class Person(Base):
+    __tablename__ = "Person"
+
+    personId = Column(INTEGER(10), primary_key=True)
+    laboratoryId = Column(
+        ForeignKey("Laboratory.laboratoryId", ondelete="CASCADE"), index=True
+    )
+    siteId = Column(INTEGER(11), index=True)
+    personUUID = Column(String(45))
+    familyName = Column(String(100), index=True)
+    givenName = Column(String(45))
+    title = Column(String(45))
+    emailAddress = Column(String(60))
+    phoneNumber = Column(VARCHAR(45))
+    login = Column(String(45), index=True)
+    passwd = Column(String(45))
+    faxNumber = Column(String(45))
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+    externalId = Column(BINARY(16))
+    cache = deferred(Column(Text), group="large")
+
+    Laboratory = relationship("Laboratory")
+    Project = relationship("Project", secondary="Project_has_Person")
+    UserGroup = relationship("UserGroup", secondary="UserGroup_has_Person")
+
+
+class ScheduleComponent(Base):
+    __tablename__ = "ScheduleComponent"
+
+    scheduleComponentId = Column(INTEGER(10), primary_key=True)
+    scheduleId = Column(
+        ForeignKey("Schedule.scheduleId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    inspectionTypeId = Column(
+        ForeignKey("InspectionType.inspectionTypeId", ondelete="CASCADE"), index=True
+    )
+    offset_hours = Column(INTEGER(11))
+
+    InspectionType = relationship("InspectionType")
+    Schedule = relationship("Schedule")
+
+
+t_UserGroup_has_Permission = Table(
+    "UserGroup_has_Permission",
+    metadata,
+    Column(
+        "userGroupId",
+        ForeignKey("UserGroup.userGroupId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "permissionId",
+        ForeignKey("Permission.permissionId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class BFComponentBeamline(Base):
+    __tablename__ = "BF_component_beamline"
+
+    component_beamlineId = Column(INTEGER(10), primary_key=True)
+    componentId = Column(
+        ForeignKey("BF_component.componentId", ondelete="CASCADE"), index=True
+    )
+    beamlinename = Column(String(20))
+
+    BF_component = relationship("BFComponent")
+
+
+class BFSubcomponent(Base):
+    __tablename__ = "BF_subcomponent"
+
+    subcomponentId = Column(INTEGER(10), primary_key=True)
+    componentId = Column(
+        ForeignKey("BF_component.componentId", ondelete="CASCADE"), index=True
+    )
+    name = Column(String(100))
+    description = Column(String(200))
+
+    BF_component = relationship("BFComponent")
+
+
+class Project(Base):
+    __tablename__ = "Project"
+
+    projectId = Column(INTEGER(10), primary_key=True)
+    personId = Column(ForeignKey("Person.personId", ondelete="CASCADE"), index=True)
+    title = Column(String(200))
+    acronym = Column(String(100))
+    owner = Column(String(50))
+
+    Person = relationship("Person")
+    Protein = relationship("Protein", secondary="Project_has_Protein")
+    BLSession = relationship("BLSession", secondary="Project_has_Session")
+    Shipping = relationship("Shipping", secondary="Project_has_Shipping")
+    XFEFluorescenceSpectrum = relationship(
+        "XFEFluorescenceSpectrum", secondary="Project_has_XFEFSpectrum"
+    )
+
+
+class Proposal(Base):
+    __tablename__ = "Proposal"
+    __table_args__ = (
+        Index("Proposal_FKIndexCodeNumber", "proposalCode", "proposalNumber"),
+    )
+
+    proposalId = Column(INTEGER(10), primary_key=True)
+    personId = Column(
+        ForeignKey("Person.personId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    title = Column(VARCHAR(200))
+    proposalCode = Column(String(45))
+    proposalNumber = Column(String(45))
+    proposalType = Column(String(2), comment="Proposal type: MX, BX")
+    bltimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+    externalId = Column(BINARY(16))
+    state = Column(Enum("Open", "Closed", "Cancelled"), server_default=text("'Open'"))
+
+    Person = relationship("Person")
+
+
+t_UserGroup_has_Person = Table(
+    "UserGroup_has_Person",
+    metadata,
+    Column(
+        "userGroupId",
+        ForeignKey("UserGroup.userGroupId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "personId",
+        ForeignKey("Person.personId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class BFSubcomponentBeamline(Base):
+    __tablename__ = "BF_subcomponent_beamline"
+
+    subcomponent_beamlineId = Column(INTEGER(10), primary_key=True)
+    subcomponentId = Column(
+        ForeignKey("BF_subcomponent.subcomponentId", ondelete="CASCADE"), index=True
+    )
+    beamlinename = Column(String(20))
+
+    BF_subcomponent = relationship("BFSubcomponent")
+
+
+class BLSession(Base):
+    __tablename__ = "BLSession"
+
+    sessionId = Column(INTEGER(10), primary_key=True)
+    expSessionPk = Column(INTEGER(10), comment="smis session Pk ")
+    beamLineSetupId = Column(
+        ForeignKey(
+            "BeamLineSetup.beamLineSetupId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    projectCode = Column(String(45))
+    startDate = Column(DateTime, index=True)
+    endDate = Column(DateTime, index=True)
+    beamLineName = Column(String(45), index=True)
+    scheduled = Column(TINYINT(1))
+    nbShifts = Column(INTEGER(10), index=True)
+    comments = deferred(Column(String(2000)), group="large")
+    beamLineOperator = Column(String(255))
+    visit_number = Column(INTEGER(10), server_default=text("0"))
+    bltimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+    usedFlag = Column(
+        TINYINT(1),
+        comment="indicates if session has Datacollections or XFE or EnergyScans attached",
+    )
+    sessionTitle = Column(String(255), comment="fx accounts only")
+    structureDeterminations = Column(Float)
+    dewarTransport = Column(Float)
+    databackupFrance = Column(Float, comment="data backup and express delivery France")
+    databackupEurope = Column(Float, comment="data backup and express delivery Europe")
+    operatorSiteNumber = Column(String(10), index=True, comment="matricule site")
+    lastUpdate = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("'0000-00-00 00:00:00'"),
+        comment="last update timestamp: by default the end of the session, the last collect...",
+    )
+    protectedData = deferred(
+        Column(String(1024), comment="indicates if the data are protected or not"),
+        group="large",
+    )
+    externalId = Column(BINARY(16))
+    nbReimbDewars = Column(INTEGER(11))
+
+    BeamLineSetup = relationship("BeamLineSetup")
+    Proposal = relationship("Proposal")
+    Shipping = relationship("Shipping", secondary="ShippingHasSession")
+
+
+t_Project_has_Person = Table(
+    "Project_has_Person",
+    metadata,
+    Column(
+        "projectId",
+        ForeignKey("Project.projectId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "personId",
+        ForeignKey("Person.personId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class ProjectHasUser(Base):
+    __tablename__ = "Project_has_User"
+
+    projecthasuserid = Column(INTEGER(10), primary_key=True)
+    projectid = Column(
+        ForeignKey("Project.projectId", ondelete="CASCADE"), nullable=False, index=True
+    )
+    username = Column(String(15))
+
+    Project = relationship("Project")
+
+
+class ProposalHasPerson(Base):
+    __tablename__ = "ProposalHasPerson"
+
+    proposalHasPersonId = Column(INTEGER(10), primary_key=True)
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    personId = Column(
+        ForeignKey("Person.personId", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    Person = relationship("Person")
+    Proposal = relationship("Proposal")
+
+
+class SWOnceToken(Base):
+    __tablename__ = "SW_onceToken"
+    __table_args__ = {
+        "comment": "One-time use tokens needed for token auth in order to grant access to file downloads and webcams (and some images)"
+    }
+
+    onceTokenId = Column(INTEGER(10), primary_key=True)
+    token = Column(String(128))
+    personId = Column(ForeignKey("Person.personId", ondelete="CASCADE"), index=True)
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE"), index=True
+    )
+    validity = Column(String(200))
+    recordTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    Person = relationship("Person")
+    Proposal = relationship("Proposal")
+
+
+class BFFault(Base):
+    __tablename__ = "BF_fault"
+
+    faultId = Column(INTEGER(10), primary_key=True)
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    owner = Column(String(50))
+    subcomponentId = Column(
+        ForeignKey("BF_subcomponent.subcomponentId", ondelete="CASCADE"), index=True
+    )
+    starttime = Column(DateTime)
+    endtime = Column(DateTime)
+    beamtimelost = Column(TINYINT(1))
+    beamtimelost_starttime = Column(DateTime)
+    beamtimelost_endtime = Column(DateTime)
+    title = Column(String(200))
+    description = deferred(Column(Text), group="large")
+    resolved = Column(TINYINT(1))
+    resolution = deferred(Column(Text), group="large")
+    assignee = Column(String(50))
+    attachment = Column(String(200))
+    eLogId = Column(INTEGER(11))
+    personId = Column(ForeignKey("Person.personId", ondelete="CASCADE"), index=True)
+    assigneeId = Column(ForeignKey("Person.personId", ondelete="CASCADE"), index=True)
+
+    Person = relationship("Person", primaryjoin="BFFault.assigneeId == Person.personId")
+    Person1 = relationship("Person", primaryjoin="BFFault.personId == Person.personId")
+    BLSession = relationship("BLSession")
+    BF_subcomponent = relationship("BFSubcomponent")
+
+
+class BeamlineAction(Base):
+    __tablename__ = "BeamlineAction"
+
+    beamlineActionId = Column(INTEGER(10), primary_key=True)
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE"), index=True
+    )
+    startTimestamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp() ON UPDATE current_timestamp()"),
+    )
+    endTimestamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("'0000-00-00 00:00:00'")
+    )
+    message = Column(String(255))
+    parameter = Column(String(50))
+    value = Column(String(30))
+    loglevel = Column(Enum("DEBUG", "CRITICAL", "INFO"))
+    status = Column(
+        Enum("PAUSED", "RUNNING", "TERMINATED", "COMPLETE", "ERROR", "EPICSFAIL")
+    )
+
+    BLSession = relationship("BLSession")
+
+
+t_Project_has_Session = Table(
+    "Project_has_Session",
+    metadata,
+    Column(
+        "projectId",
+        ForeignKey("Project.projectId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "sessionId",
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class SessionType(Base):
+    __tablename__ = "SessionType"
+
+    sessionTypeId = Column(INTEGER(10), primary_key=True)
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    typeName = Column(String(31), nullable=False)
+
+    BLSession = relationship("BLSession")
+
+
+class SessionHasPerson(Base):
+    __tablename__ = "Session_has_Person"
+
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    personId = Column(
+        ForeignKey("Person.personId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    role = Column(
+        Enum(
+            "Local Contact",
+            "Local Contact 2",
+            "Staff",
+            "Team Leader",
+            "Co-Investigator",
+            "Principal Investigator",
+            "Alternate Contact",
+        )
+    )
+    remote = Column(TINYINT(1), server_default=text("0"))
+
+    Person = relationship("Person")
+    BLSession = relationship("BLSession")
+
+
+class BFAutomationFault(Base):
+    __tablename__ = "BF_automationFault"
+
+    automationFaultId = Column(INTEGER(10), primary_key=True)
+    automationErrorId = Column(
+        ForeignKey("BF_automationError.automationErrorId", ondelete="CASCADE"),
+        index=True,
+    )
+    containerId = Column(
+        ForeignKey("Container.containerId", ondelete="CASCADE"), index=True
+    )
+    severity = Column(Enum("1", "2", "3"))
+    stacktrace = deferred(Column(Text), group="large")
+    resolved = Column(TINYINT(1))
+    faultTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    BF_automationError = relationship("BFAutomationError")
+    Container = relationship("Container")
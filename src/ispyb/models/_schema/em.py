@@ -0,0 +1,248 @@
+# coding: utf-8
+from sqlalchemy import (
+    Column,
+    Enum,
+    Float,
+    ForeignKey,
+    String,
+    TIMESTAMP,
+    Table,
+    text,
+)
+from sqlalchemy.dialects.mysql import (
+    INTEGER,
+)
+from sqlalchemy.orm import (
+    relationship,
+)
+
+from . import Base, metadata
+
+
+class CTF(Base):
+    __tablename__ = "CTF"
+
+    CTFid = Column(INTEGER(11), primary_key=True)
+    motionCorrectionId = Column(INTEGER(11), nullable=False, index=True)
+    spectraImageThumbnailFullPath = Column(String(512))
+    spectraImageFullPath = Column(String(512))
+    defocusU = Column(String(45))
+    defocusV = Column(String(45))
+    angle = Column(String(45))
+    crossCorrelationCoefficient = Column(String(45))
+    resolutionLimit = Column(String(45))
+    estimatedBfactor = Column(String(45))
+    logFilePath = Column(String(512))
+    createdTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+
+class CryoemInitialModel(Base):
+    __tablename__ = "CryoemInitialModel"
+    __table_args__ = {"comment": "Initial cryo-EM model generation results"}
+
+    cryoemInitialModelId = Column(INTEGER(10), primary_key=True)
+    resolution = Column(Float, comment="Unit: Angstroms")
+    numberOfParticles = Column(INTEGER(10))
+
+    ParticleClassification = relationship(
+        "ParticleClassification",
+        secondary="ParticleClassification_has_CryoemInitialModel",
+    )
+
+
+class EMMicroscope(Base):
+    __tablename__ = "EMMicroscope"
+
+    emMicroscopeId = Column(INTEGER(10), primary_key=True)
+    instrumentName = Column(String(100), nullable=False)
+    voltage = Column(Float)
+    CS = Column(Float, comment="Unit: mm")
+    detectorPixelSize = Column(Float)
+    C2aperture = Column(Float)
+    ObjAperture = Column(Float)
+    C2lens = Column(Float)
+
+
+class Movie(Base):
+    __tablename__ = "Movie"
+
+    movieId = Column(INTEGER(11), primary_key=True)
+    dataCollectionId = Column(
+        ForeignKey("DataCollection.dataCollectionId", ondelete="CASCADE"), index=True
+    )
+    movieNumber = Column(INTEGER(11))
+    movieFullPath = Column(String(255), index=True)
+    positionX = Column(String(45))
+    positionY = Column(String(45))
+    micrographFullPath = Column(String(255))
+    micrographSnapshotFullPath = Column(String(255))
+    xmlMetaDataFullPath = Column(String(255))
+    dosePerImage = Column(String(45))
+    createdTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    DataCollection = relationship("DataCollection")
+
+
+class Particle(Base):
+    __tablename__ = "Particle"
+
+    particleId = Column(INTEGER(10), primary_key=True)
+    dataCollectionId = Column(
+        ForeignKey(
+            "DataCollection.dataCollectionId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+    )
+    x = Column(Float)
+    y = Column(Float)
+
+    DataCollection = relationship("DataCollection")
+
+
+class MotionCorrection(Base):
+    __tablename__ = "MotionCorrection"
+
+    motionCorrectionId = Column(INTEGER(11), primary_key=True)
+    movieId = Column(ForeignKey("Movie.movieId", ondelete="CASCADE"), index=True)
+    firstFrame = Column(String(45))
+    lastFrame = Column(String(45))
+    dosePerFrame = Column(String(45))
+    doseWeight = Column(String(45))
+    totalMotion = Column(String(45))
+    averageMotionPerFrame = Column(String(45))
+    driftPlotFullPath = Column(String(512))
+    micrographFullPath = Column(String(512))
+    micrographSnapshotFullPath = Column(String(512))
+    correctedDoseMicrographFullPath = Column(String(512))
+    patchesUsed = Column(String(45))
+    logFileFullPath = Column(String(512))
+    createdTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    Movie = relationship("Movie")
+
+
+class ParticlePicker(Base):
+    __tablename__ = "ParticlePicker"
+    __table_args__ = {
+        "comment": "An instance of a particle picker program that was run"
+    }
+
+    particlePickerId = Column(INTEGER(10), primary_key=True)
+    programId = Column(
+        ForeignKey(
+            "AutoProcProgram.autoProcProgramId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    firstMotionCorrectionId = Column(
+        ForeignKey(
+            "MotionCorrection.motionCorrectionId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        index=True,
+    )
+    particlePickingTemplate = Column(String(255), comment="Cryolo model")
+    particleDiameter = Column(Float, comment="Unit: nm")
+    numberOfParticles = Column(INTEGER(10))
+    summaryImageFullPath = Column(
+        String(255),
+        comment="Generated summary micrograph image with highlighted particles",
+    )
+
+    MotionCorrection = relationship("MotionCorrection")
+    AutoProcProgram = relationship("AutoProcProgram")
+
+
+class ParticleClassificationGroup(Base):
+    __tablename__ = "ParticleClassificationGroup"
+
+    particleClassificationGroupId = Column(INTEGER(10), primary_key=True)
+    particlePickerId = Column(
+        ForeignKey(
+            "ParticlePicker.particlePickerId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    programId = Column(
+        ForeignKey(
+            "AutoProcProgram.autoProcProgramId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    type = Column(
+        Enum("2D", "3D"), comment="Indicates the type of particle classification"
+    )
+    batchNumber = Column(INTEGER(10), comment="Corresponding to batch number")
+    numberOfParticlesPerBatch = Column(
+        INTEGER(10), comment="total number of particles per batch (a large integer)"
+    )
+    numberOfClassesPerBatch = Column(INTEGER(10))
+    symmetry = Column(String(20))
+
+    ParticlePicker = relationship("ParticlePicker")
+    AutoProcProgram = relationship("AutoProcProgram")
+
+
+class ParticleClassification(Base):
+    __tablename__ = "ParticleClassification"
+    __table_args__ = {"comment": "Results of 2D or 3D classification"}
+
+    particleClassificationId = Column(INTEGER(10), primary_key=True)
+    particleClassificationGroupId = Column(
+        ForeignKey(
+            "ParticleClassificationGroup.particleClassificationGroupId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        index=True,
+    )
+    classNumber = Column(
+        INTEGER(10), comment="Identified of the class. A unique ID given by Relion"
+    )
+    classImageFullPath = Column(String(255), comment="The PNG of the class")
+    particlesPerClass = Column(
+        INTEGER(10),
+        comment="Number of particles within the selected class, can then be used together with the total number above to calculate the percentage",
+    )
+    classDistribution = Column(Float)
+    rotationAccuracy = Column(Float)
+    translationAccuracy = Column(Float, comment="Unit: Angstroms")
+    estimatedResolution = Column(Float, comment="Unit: Angstroms")
+    overallFourierCompleteness = Column(Float)
+
+    ParticleClassificationGroup = relationship("ParticleClassificationGroup")
+
+
+t_ParticleClassification_has_CryoemInitialModel = Table(
+    "ParticleClassification_has_CryoemInitialModel",
+    metadata,
+    Column(
+        "particleClassificationId",
+        ForeignKey(
+            "ParticleClassification.particleClassificationId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "cryoemInitialModelId",
+        ForeignKey(
+            "CryoemInitialModel.cryoemInitialModelId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
@@ -0,0 +1,2133 @@
+# coding: utf-8
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    TIMESTAMP,
+    Table,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.mysql import (
+    INTEGER,
+    LONGBLOB,
+    MEDIUMINT,
+    SMALLINT,
+    TINYINT,
+)
+from sqlalchemy.orm import (
+    deferred,
+    relationship,
+)
+
+from . import Base, metadata
+
+
+class Aperture(Base):
+    __tablename__ = "Aperture"
+
+    apertureId = Column(INTEGER(10), primary_key=True)
+    sizeX = Column(Float)
+
+
+class AutoProc(Base):
+    __tablename__ = "AutoProc"
+
+    autoProcId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    autoProcProgramId = Column(INTEGER(10), index=True, comment="Related program item")
+    spaceGroup = Column(String(45), comment="Space group")
+    refinedCell_a = Column(Float, comment="Refined cell")
+    refinedCell_b = Column(Float, comment="Refined cell")
+    refinedCell_c = Column(Float, comment="Refined cell")
+    refinedCell_alpha = Column(Float, comment="Refined cell")
+    refinedCell_beta = Column(Float, comment="Refined cell")
+    refinedCell_gamma = Column(Float, comment="Refined cell")
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+
+class DataReductionStatus(Base):
+    __tablename__ = "DataReductionStatus"
+
+    dataReductionStatusId = Column(INTEGER(10), primary_key=True)
+    dataCollectionId = Column(INTEGER(10), nullable=False)
+    status = Column(String(15))
+    filename = Column(String(255))
+    message = Column(String(255))
+
+
+class Detector(Base):
+    __tablename__ = "Detector"
+    __table_args__ = (
+        Index(
+            "Detector_FKIndex1",
+            "detectorType",
+            "detectorManufacturer",
+            "detectorModel",
+            "detectorPixelSizeHorizontal",
+            "detectorPixelSizeVertical",
+        ),
+        {"comment": "Detector table is linked to a dataCollection"},
+    )
+
+    detectorId = Column(
+        INTEGER(11), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    detectorType = Column(String(255))
+    detectorManufacturer = Column(String(255))
+    detectorModel = Column(String(255))
+    detectorPixelSizeHorizontal = Column(Float)
+    detectorPixelSizeVertical = Column(Float)
+    detectorSerialNumber = Column(String(30), unique=True)
+    detectorDistanceMin = Column(Float(asdecimal=True))
+    detectorDistanceMax = Column(Float(asdecimal=True))
+    trustedPixelValueRangeLower = Column(Float(asdecimal=True))
+    trustedPixelValueRangeUpper = Column(Float(asdecimal=True))
+    sensorThickness = Column(Float)
+    overload = Column(Float)
+    XGeoCorr = Column(String(255))
+    YGeoCorr = Column(String(255))
+    detectorMode = Column(String(255))
+    detectorMaxResolution = Column(Float)
+    detectorMinResolution = Column(Float)
+    CS = Column(Float, comment="Unit: mm")
+    density = Column(Float)
+    composition = Column(String(16))
+    localName = Column(String(40), comment="Colloquial name for the detector")
+
+
+class EventType(Base):
+    __tablename__ = "EventType"
+    __table_args__ = {
+        "comment": "Defines the list of event types which can occur during a data collection."
+    }
+
+    eventTypeId = Column(INTEGER(11), primary_key=True)
+    name = Column(String(30), nullable=False, unique=True)
+
+
+class GeometryClassname(Base):
+    __tablename__ = "GeometryClassname"
+
+    geometryClassnameId = Column(INTEGER(10), primary_key=True)
+    geometryClassname = Column(String(45))
+    geometryOrder = Column(INTEGER(11), nullable=False)
+
+
+class InitialModel(Base):
+    __tablename__ = "InitialModel"
+    __table_args__ = {"comment": "Initial model generation results"}
+
+    initialModelId = Column(INTEGER(10), primary_key=True)
+    resolution = Column(Float, comment="Unit: Angstroms")
+    numberOfParticles = Column(INTEGER(10))
+
+
+class InputParameterWorkflow(Base):
+    __tablename__ = "InputParameterWorkflow"
+
+    inputParameterId = Column(INTEGER(11), primary_key=True)
+    workflowId = Column(INTEGER(11), nullable=False)
+    parameterType = Column(String(255))
+    name = Column(String(255))
+    value = Column(String(255))
+    comments = deferred(Column(String(2048)), group="large")
+
+
+class IspybAutoProcAttachment(Base):
+    __tablename__ = "IspybAutoProcAttachment"
+    __table_args__ = {"comment": "ISPyB autoProcAttachment files values"}
+
+    autoProcAttachmentId = Column(INTEGER(11), primary_key=True)
+    fileName = Column(String(255), nullable=False)
+    description = Column(String(255), nullable=False)
+    step = Column(
+        Enum("XDS", "XSCALE", "SCALA", "SCALEPACK", "TRUNCATE", "DIMPLE"),
+        server_default=text("'XDS'"),
+        comment="step where the file is generated",
+    )
+    fileCategory = Column(
+        Enum("input", "output", "log", "correction"), server_default=text("'output'")
+    )
+    hasGraph = Column(TINYINT(1), nullable=False, server_default=text("0"))
+
+
+class MotorPosition(Base):
+    __tablename__ = "MotorPosition"
+
+    motorPositionId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    phiX = Column(Float(asdecimal=True))
+    phiY = Column(Float(asdecimal=True))
+    phiZ = Column(Float(asdecimal=True))
+    sampX = Column(Float(asdecimal=True))
+    sampY = Column(Float(asdecimal=True))
+    omega = Column(Float(asdecimal=True))
+    kappa = Column(Float(asdecimal=True))
+    phi = Column(Float(asdecimal=True))
+    chi = Column(Float(asdecimal=True))
+    gridIndexY = Column(INTEGER(11))
+    gridIndexZ = Column(INTEGER(11))
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+
+
+class PhasingAnalysis(Base):
+    __tablename__ = "PhasingAnalysis"
+
+    phasingAnalysisId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+
+class PhasingProgramRun(Base):
+    __tablename__ = "PhasingProgramRun"
+
+    phasingProgramRunId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    phasingCommandLine = Column(String(255), comment="Command line for phasing")
+    phasingPrograms = Column(String(255), comment="Phasing programs (comma separated)")
+    phasingStatus = Column(TINYINT(1), comment="success (1) / fail (0)")
+    phasingMessage = Column(String(255), comment="warning, error,...")
+    phasingStartTime = Column(DateTime, comment="Processing start time")
+    phasingEndTime = Column(DateTime, comment="Processing end time")
+    phasingEnvironment = Column(String(255), comment="Cpus, Nodes,...")
+    phasingDirectory = Column(String(255), comment="Directory of execution")
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+
+
+class ScanParametersService(Base):
+    __tablename__ = "ScanParametersService"
+
+    scanParametersServiceId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(45))
+    description = Column(String(45))
+
+
+class ScreeningRankSet(Base):
+    __tablename__ = "ScreeningRankSet"
+
+    screeningRankSetId = Column(INTEGER(10), primary_key=True)
+    rankEngine = Column(String(255))
+    rankingProjectFileName = Column(String(255))
+    rankingSummaryFileName = Column(String(255))
+
+
+class Workflow(Base):
+    __tablename__ = "Workflow"
+
+    workflowId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    workflowTitle = Column(String(255))
+    workflowType = Column(
+        Enum(
+            "Characterisation",
+            "Undefined",
+            "BioSAXS Post Processing",
+            "EnhancedCharacterisation",
+            "LineScan",
+            "MeshScan",
+            "Dehydration",
+            "KappaReorientation",
+            "BurnStrategy",
+            "XrayCentering",
+            "DiffractionTomography",
+            "TroubleShooting",
+            "VisualReorientation",
+            "HelicalCharacterisation",
+            "GroupedProcessing",
+            "MXPressE",
+            "MXPressO",
+            "MXPressL",
+            "MXScore",
+            "MXPressI",
+            "MXPressM",
+            "MXPressA",
+            "CollectAndSpectra",
+            "LowDoseDC",
+            "EnergyInterleavedMAD",
+            "MXPressF",
+            "MXPressH",
+            "MXPressP",
+            "MXPressP_SAD",
+            "MXPressR",
+            "MXPressR_180",
+            "MXPressR_dehydration",
+            "MeshAndCollect",
+            "MeshAndCollectFromFile",
+        )
+    )
+    workflowTypeId = Column(INTEGER(11))
+    comments = deferred(Column(String(1024)), group="large")
+    status = Column(String(255))
+    resultFilePath = Column(String(255))
+    logFilePath = Column(String(255))
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+
+class WorkflowType(Base):
+    __tablename__ = "WorkflowType"
+
+    workflowTypeId = Column(INTEGER(11), primary_key=True)
+    workflowTypeName = Column(String(45))
+    comments = deferred(Column(String(2048)), group="large")
+    recordTimeStamp = Column(TIMESTAMP)
+
+
+class XRFFluorescenceMappingROI(Base):
+    __tablename__ = "XRFFluorescenceMappingROI"
+
+    xrfFluorescenceMappingROIId = Column(INTEGER(10), primary_key=True)
+    startEnergy = Column(Float, nullable=False)
+    endEnergy = Column(Float, nullable=False)
+    element = Column(String(2))
+    edge = Column(String(2), comment="In future may be changed to enum(K, L)")
+    r = Column(TINYINT(3), comment="R colour component")
+    g = Column(TINYINT(3), comment="G colour component")
+    b = Column(TINYINT(3), comment="B colour component")
+
+
+class AutoProcScaling(Base):
+    __tablename__ = "AutoProcScaling"
+    __table_args__ = (Index("AutoProcScalingIdx1", "autoProcScalingId", "autoProcId"),)
+
+    autoProcScalingId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    autoProcId = Column(
+        ForeignKey("AutoProc.autoProcId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="Related autoProc item (used by foreign key)",
+    )
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+    resolutionEllipsoidAxis11 = Column(
+        Float, comment="Eigenvector for first diffraction limit, coord 1"
+    )
+    resolutionEllipsoidAxis12 = Column(
+        Float, comment="Eigenvector for first diffraction limit, coord 2"
+    )
+    resolutionEllipsoidAxis13 = Column(
+        Float, comment="Eigenvector for first diffraction limit, coord 3"
+    )
+    resolutionEllipsoidAxis21 = Column(
+        Float, comment="Eigenvector for second diffraction limit, coord 1"
+    )
+    resolutionEllipsoidAxis22 = Column(
+        Float, comment="Eigenvector for second diffraction limit, coord 2"
+    )
+    resolutionEllipsoidAxis23 = Column(
+        Float, comment="Eigenvector for second diffraction limit, coord 3"
+    )
+    resolutionEllipsoidAxis31 = Column(
+        Float, comment="Eigenvector for third diffraction limit, coord 1"
+    )
+    resolutionEllipsoidAxis32 = Column(
+        Float, comment="Eigenvector for third diffraction limit, coord 2"
+    )
+    resolutionEllipsoidAxis33 = Column(
+        Float, comment="Eigenvector for third diffraction limit, coord 3"
+    )
+    resolutionEllipsoidValue1 = Column(
+        Float, comment="First (anisotropic) diffraction limit"
+    )
+    resolutionEllipsoidValue2 = Column(
+        Float, comment="Second (anisotropic) diffraction limit"
+    )
+    resolutionEllipsoidValue3 = Column(
+        Float, comment="Third (anisotropic) diffraction limit"
+    )
+
+    AutoProc = relationship("AutoProc")
+
+
+class BeamApertures(Base):
+    __tablename__ = "BeamApertures"
+
+    beamAperturesid = Column(INTEGER(10), primary_key=True)
+    beamlineStatsId = Column(
+        ForeignKey("BeamlineStats.beamlineStatsId", ondelete="CASCADE"), index=True
+    )
+    flux = Column(Float(asdecimal=True))
+    x = Column(Float)
+    y = Column(Float)
+    apertureSize = Column(SMALLINT(5))
+
+    BeamlineStats = relationship("BeamlineStats")
+
+
+class BeamCentres(Base):
+    __tablename__ = "BeamCentres"
+
+    beamCentresid = Column(INTEGER(10), primary_key=True)
+    beamlineStatsId = Column(
+        ForeignKey("BeamlineStats.beamlineStatsId", ondelete="CASCADE"), index=True
+    )
+    x = Column(Float)
+    y = Column(Float)
+    zoom = Column(TINYINT(3))
+
+    BeamlineStats = relationship("BeamlineStats")
+
+
+class PhasingProgramAttachment(Base):
+    __tablename__ = "PhasingProgramAttachment"
+
+    phasingProgramAttachmentId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    phasingProgramRunId = Column(
+        ForeignKey(
+            "PhasingProgramRun.phasingProgramRunId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+        comment="Related program item",
+    )
+    fileType = Column(
+        Enum(
+            "DSIGMA_RESOLUTION",
+            "OCCUPANCY_SITENUMBER",
+            "CONTRAST_CYCLE",
+            "CCALL_CCWEAK",
+            "IMAGE",
+            "Map",
+            "Logfile",
+            "PDB",
+            "CSV",
+            "INS",
+            "RES",
+            "TXT",
+        ),
+        comment="file type",
+    )
+    fileName = Column(String(45), comment="file name")
+    filePath = Column(String(255), comment="file path")
+    input = Column(TINYINT(1))
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+
+    PhasingProgramRun = relationship("PhasingProgramRun")
+
+
+class ScanParametersModel(Base):
+    __tablename__ = "ScanParametersModel"
+
+    scanParametersModelId = Column(INTEGER(10), primary_key=True)
+    scanParametersServiceId = Column(
+        ForeignKey(
+            "ScanParametersService.scanParametersServiceId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        index=True,
+    )
+    dataCollectionPlanId = Column(
+        ForeignKey(
+            "DiffractionPlan.diffractionPlanId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    modelNumber = Column(TINYINT(3))
+    start = Column(Float(asdecimal=True))
+    stop = Column(Float(asdecimal=True))
+    step = Column(Float(asdecimal=True))
+    array = deferred(Column(Text), group="large")
+
+    DiffractionPlan = relationship("DiffractionPlan")
+    ScanParametersService = relationship("ScanParametersService")
+
+
+class SpaceGroup(Base):
+    __tablename__ = "SpaceGroup"
+
+    spaceGroupId = Column(INTEGER(10), primary_key=True, comment="Primary key")
+    geometryClassnameId = Column(
+        ForeignKey(
+            "GeometryClassname.geometryClassnameId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        index=True,
+    )
+    spaceGroupNumber = Column(INTEGER(10), comment="ccp4 number pr IUCR")
+    spaceGroupShortName = Column(
+        String(45), index=True, comment="short name without blank"
+    )
+    spaceGroupName = Column(String(45), comment="verbose name")
+    bravaisLattice = Column(String(45), comment="short name")
+    bravaisLatticeName = Column(String(45), comment="verbose name")
+    pointGroup = Column(String(45), comment="point group")
+    MX_used = Column(
+        TINYINT(1),
+        nullable=False,
+        server_default=text("0"),
+        comment="1 if used in the crystal form",
+    )
+
+    GeometryClassname = relationship("GeometryClassname")
+
+
+class UntrustedRegion(Base):
+    __tablename__ = "UntrustedRegion"
+    __table_args__ = {"comment": "Untrsuted region linked to a detector"}
+
+    untrustedRegionId = Column(
+        INTEGER(11), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    detectorId = Column(
+        ForeignKey("Detector.detectorId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    x1 = Column(INTEGER(11), nullable=False)
+    x2 = Column(INTEGER(11), nullable=False)
+    y1 = Column(INTEGER(11), nullable=False)
+    y2 = Column(INTEGER(11), nullable=False)
+
+    Detector = relationship("Detector")
+
+
+class WorkflowDehydration(Base):
+    __tablename__ = "WorkflowDehydration"
+
+    workflowDehydrationId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    workflowId = Column(
+        ForeignKey("Workflow.workflowId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Related workflow",
+    )
+    dataFilePath = Column(String(255))
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+
+    Workflow = relationship("Workflow")
+
+
+class WorkflowStep(Base):
+    __tablename__ = "WorkflowStep"
+
+    workflowStepId = Column(INTEGER(11), primary_key=True)
+    workflowId = Column(
+        ForeignKey("Workflow.workflowId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    workflowStepType = Column(String(45))
+    status = Column(String(45))
+    folderPath = deferred(Column(String(1024)), group="large")
+    imageResultFilePath = deferred(Column(String(1024)), group="large")
+    htmlResultFilePath = deferred(Column(String(1024)), group="large")
+    resultFilePath = deferred(Column(String(1024)), group="large")
+    comments = deferred(Column(String(2048)), group="large")
+    crystalSizeX = Column(String(45))
+    crystalSizeY = Column(String(45))
+    crystalSizeZ = Column(String(45))
+    maxDozorScore = Column(String(45))
+    recordTimeStamp = Column(TIMESTAMP)
+
+    Workflow = relationship("Workflow")
+
+
+class AutoProcScalingStatistics(Base):
+    __tablename__ = "AutoProcScalingStatistics"
+
+    autoProcScalingStatisticsId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    autoProcScalingId = Column(
+        ForeignKey(
+            "AutoProcScaling.autoProcScalingId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+        comment="Related autoProcScaling item (used by foreign key)",
+    )
+    scalingStatisticsType = Column(
+        Enum("overall", "innerShell", "outerShell"),
+        nullable=False,
+        index=True,
+        server_default=text("'overall'"),
+        comment="Scaling statistics type",
+    )
+    comments = Column(String(255), comment="Comments...")
+    resolutionLimitLow = Column(Float, comment="Low resolution limit")
+    resolutionLimitHigh = Column(Float, comment="High resolution limit")
+    rMerge = Column(Float, comment="Rmerge")
+    rMeasWithinIPlusIMinus = Column(Float, comment="Rmeas (within I+/I-)")
+    rMeasAllIPlusIMinus = Column(Float, comment="Rmeas (all I+ & I-)")
+    rPimWithinIPlusIMinus = Column(Float, comment="Rpim (within I+/I-) ")
+    rPimAllIPlusIMinus = Column(Float, comment="Rpim (all I+ & I-)")
+    fractionalPartialBias = Column(Float, comment="Fractional partial bias")
+    nTotalObservations = Column(INTEGER(11), comment="Total number of observations")
+    nTotalUniqueObservations = Column(INTEGER(11), comment="Total number unique")
+    meanIOverSigI = Column(Float, comment="Mean((I)/sd(I))")
+    completeness = Column(Float, comment="Completeness")
+    multiplicity = Column(Float, comment="Multiplicity")
+    anomalousCompleteness = Column(Float, comment="Anomalous completeness")
+    anomalousMultiplicity = Column(Float, comment="Anomalous multiplicity")
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+    anomalous = Column(
+        TINYINT(1), server_default=text("0"), comment="boolean type:0 noanoum - 1 anoum"
+    )
+    ccHalf = Column(Float, comment="information from XDS")
+    ccAno = Column(Float)
+    sigAno = Column(String(45))
+    isa = Column(String(45))
+    completenessSpherical = Column(
+        Float, comment="Completeness calculated assuming isotropic diffraction"
+    )
+    completenessEllipsoidal = Column(
+        Float, comment="Completeness calculated allowing for anisotropic diffraction"
+    )
+    anomalousCompletenessSpherical = Column(
+        Float,
+        comment="Anomalous completeness calculated assuming isotropic diffraction",
+    )
+    anomalousCompletenessEllipsoidal = Column(
+        Float,
+        comment="Anisotropic completeness calculated allowing for anisotropic diffraction",
+    )
+
+    AutoProcScaling = relationship("AutoProcScaling")
+
+
+class MXMRRun(Base):
+    __tablename__ = "MXMRRun"
+
+    mxMRRunId = Column(INTEGER(10), primary_key=True)
+    autoProcScalingId = Column(
+        ForeignKey("AutoProcScaling.autoProcScalingId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    success = Column(
+        TINYINT(1),
+        server_default=text("0"),
+        comment="Indicates whether the program completed. 1 for success, 0 for failure.",
+    )
+    message = Column(
+        String(255), comment="A short summary of the findings, success or failure."
+    )
+    pipeline = Column(String(50))
+    inputCoordFile = Column(String(255))
+    outputCoordFile = Column(String(255))
+    inputMTZFile = Column(String(255))
+    outputMTZFile = Column(String(255))
+    runDirectory = Column(String(255))
+    logFile = Column(String(255))
+    commandLine = Column(String(255))
+    rValueStart = Column(Float)
+    rValueEnd = Column(Float)
+    rFreeValueStart = Column(Float)
+    rFreeValueEnd = Column(Float)
+    starttime = Column(DateTime)
+    endtime = Column(DateTime)
+
+    AutoProcScaling = relationship("AutoProcScaling")
+
+
+class ModelBuilding(Base):
+    __tablename__ = "ModelBuilding"
+
+    modelBuildingId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    phasingAnalysisId = Column(
+        ForeignKey(
+            "PhasingAnalysis.phasingAnalysisId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        comment="Related phasing analysis item",
+    )
+    phasingProgramRunId = Column(
+        ForeignKey(
+            "PhasingProgramRun.phasingProgramRunId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+        comment="Related program item",
+    )
+    spaceGroupId = Column(
+        ForeignKey("SpaceGroup.spaceGroupId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="Related spaceGroup",
+    )
+    lowRes = Column(Float(asdecimal=True))
+    highRes = Column(Float(asdecimal=True))
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+    PhasingAnalysis = relationship("PhasingAnalysis")
+    PhasingProgramRun = relationship("PhasingProgramRun")
+    SpaceGroup = relationship("SpaceGroup")
+
+
+class Phasing(Base):
+    __tablename__ = "Phasing"
+
+    phasingId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    phasingAnalysisId = Column(
+        ForeignKey(
+            "PhasingAnalysis.phasingAnalysisId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        comment="Related phasing analysis item",
+    )
+    phasingProgramRunId = Column(
+        ForeignKey(
+            "PhasingProgramRun.phasingProgramRunId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+        comment="Related program item",
+    )
+    spaceGroupId = Column(
+        ForeignKey("SpaceGroup.spaceGroupId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="Related spaceGroup",
+    )
+    method = Column(
+        Enum("solvent flattening", "solvent flipping"), comment="phasing method"
+    )
+    solventContent = Column(Float(asdecimal=True))
+    enantiomorph = Column(TINYINT(1), comment="0 or 1")
+    lowRes = Column(Float(asdecimal=True))
+    highRes = Column(Float(asdecimal=True))
+    recordTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    PhasingAnalysis = relationship("PhasingAnalysis")
+    PhasingProgramRun = relationship("PhasingProgramRun")
+    SpaceGroup = relationship("SpaceGroup")
+
+
+class PhasingStep(Base):
+    __tablename__ = "PhasingStep"
+
+    phasingStepId = Column(INTEGER(10), primary_key=True)
+    previousPhasingStepId = Column(INTEGER(10))
+    programRunId = Column(
+        ForeignKey("PhasingProgramRun.phasingProgramRunId", ondelete="CASCADE"),
+        index=True,
+    )
+    spaceGroupId = Column(
+        ForeignKey("SpaceGroup.spaceGroupId", ondelete="CASCADE"), index=True
+    )
+    autoProcScalingId = Column(
+        ForeignKey("AutoProcScaling.autoProcScalingId", ondelete="CASCADE"), index=True
+    )
+    phasingAnalysisId = Column(INTEGER(10), index=True)
+    phasingStepType = Column(
+        Enum(
+            "PREPARE",
+            "SUBSTRUCTUREDETERMINATION",
+            "PHASING",
+            "MODELBUILDING",
+            "REFINEMENT",
+            "LIGAND_FIT",
+        )
+    )
+    method = Column(String(45))
+    solventContent = Column(String(45))
+    enantiomorph = Column(String(45))
+    lowRes = Column(String(45))
+    highRes = Column(String(45))
+    groupName = Column(String(45))
+    recordTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    AutoProcScaling = relationship("AutoProcScaling")
+    PhasingProgramRun = relationship("PhasingProgramRun")
+    SpaceGroup = relationship("SpaceGroup")
+
+
+class PhasingHasScaling(Base):
+    __tablename__ = "Phasing_has_Scaling"
+
+    phasingHasScalingId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    phasingAnalysisId = Column(
+        ForeignKey(
+            "PhasingAnalysis.phasingAnalysisId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        comment="Related phasing analysis item",
+    )
+    autoProcScalingId = Column(
+        ForeignKey(
+            "AutoProcScaling.autoProcScalingId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        comment="Related autoProcScaling item",
+    )
+    datasetNumber = Column(
+        INTEGER(11),
+        comment="serial number of the dataset and always reserve 0 for the reference",
+    )
+    recordTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    AutoProcScaling = relationship("AutoProcScaling")
+    PhasingAnalysis = relationship("PhasingAnalysis")
+
+
+class PreparePhasingData(Base):
+    __tablename__ = "PreparePhasingData"
+
+    preparePhasingDataId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    phasingAnalysisId = Column(
+        ForeignKey(
+            "PhasingAnalysis.phasingAnalysisId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        comment="Related phasing analysis item",
+    )
+    phasingProgramRunId = Column(
+        ForeignKey(
+            "PhasingProgramRun.phasingProgramRunId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+        comment="Related program item",
+    )
+    spaceGroupId = Column(
+        ForeignKey("SpaceGroup.spaceGroupId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="Related spaceGroup",
+    )
+    lowRes = Column(Float(asdecimal=True))
+    highRes = Column(Float(asdecimal=True))
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+    PhasingAnalysis = relationship("PhasingAnalysis")
+    PhasingProgramRun = relationship("PhasingProgramRun")
+    SpaceGroup = relationship("SpaceGroup")
+
+
+class SubstructureDetermination(Base):
+    __tablename__ = "SubstructureDetermination"
+
+    substructureDeterminationId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    phasingAnalysisId = Column(
+        ForeignKey(
+            "PhasingAnalysis.phasingAnalysisId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        comment="Related phasing analysis item",
+    )
+    phasingProgramRunId = Column(
+        ForeignKey(
+            "PhasingProgramRun.phasingProgramRunId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+        comment="Related program item",
+    )
+    spaceGroupId = Column(
+        ForeignKey("SpaceGroup.spaceGroupId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="Related spaceGroup",
+    )
+    method = Column(
+        Enum("SAD", "MAD", "SIR", "SIRAS", "MR", "MIR", "MIRAS", "RIP", "RIPAS"),
+        comment="phasing method",
+    )
+    lowRes = Column(Float(asdecimal=True))
+    highRes = Column(Float(asdecimal=True))
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+    PhasingAnalysis = relationship("PhasingAnalysis")
+    PhasingProgramRun = relationship("PhasingProgramRun")
+    SpaceGroup = relationship("SpaceGroup")
+
+
+class MXMRRunBlob(Base):
+    __tablename__ = "MXMRRunBlob"
+
+    mxMRRunBlobId = Column(INTEGER(10), primary_key=True)
+    mxMRRunId = Column(
+        ForeignKey("MXMRRun.mxMRRunId", ondelete="CASCADE"), nullable=False, index=True
+    )
+    view1 = Column(String(255))
+    view2 = Column(String(255))
+    view3 = Column(String(255))
+
+    MXMRRun = relationship("MXMRRun")
+
+
+class PhasingStatistics(Base):
+    __tablename__ = "PhasingStatistics"
+
+    phasingStatisticsId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    phasingHasScalingId1 = Column(
+        ForeignKey(
+            "Phasing_has_Scaling.phasingHasScalingId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        index=True,
+        comment="the dataset in question",
+    )
+    phasingHasScalingId2 = Column(
+        ForeignKey(
+            "Phasing_has_Scaling.phasingHasScalingId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        index=True,
+        comment="if this is MIT or MAD, which scaling are being compared, null otherwise",
+    )
+    phasingStepId = Column(
+        ForeignKey("PhasingStep.phasingStepId", ondelete="CASCADE"), index=True
+    )
+    numberOfBins = Column(INTEGER(11), comment="the total number of bins")
+    binNumber = Column(INTEGER(11), comment="binNumber, 999 for overall")
+    lowRes = Column(
+        Float(asdecimal=True), comment="low resolution cutoff of this binfloat"
+    )
+    highRes = Column(
+        Float(asdecimal=True), comment="high resolution cutoff of this binfloat"
+    )
+    metric = Column(
+        Enum(
+            "Rcullis",
+            "Average Fragment Length",
+            "Chain Count",
+            "Residues Count",
+            "CC",
+            "PhasingPower",
+            "FOM",
+            '<d"/sig>',
+            "Best CC",
+            "CC(1/2)",
+            "Weak CC",
+            "CFOM",
+            "Pseudo_free_CC",
+            "CC of partial model",
+            "Start R-work",
+            "Start R-free",
+            "Final R-work",
+            "Final R-free",
+        ),
+        comment="metric",
+    )
+    statisticsValue = Column(Float(asdecimal=True), comment="the statistics value")
+    nReflections = Column(INTEGER(11))
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+
+    Phasing_has_Scaling = relationship(
+        "PhasingHasScaling",
+        primaryjoin="PhasingStatistics.phasingHasScalingId1 == PhasingHasScaling.phasingHasScalingId",
+    )
+    Phasing_has_Scaling1 = relationship(
+        "PhasingHasScaling",
+        primaryjoin="PhasingStatistics.phasingHasScalingId2 == PhasingHasScaling.phasingHasScalingId",
+    )
+    PhasingStep = relationship("PhasingStep")
+
+
+class DataCollectionGroup(Base):
+    __tablename__ = "DataCollectionGroup"
+    __table_args__ = {
+        "comment": "a dataCollectionGroup is a group of dataCollection for a spe"
+    }
+
+    dataCollectionGroupId = Column(
+        INTEGER(11), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    blSampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="references BLSample table",
+    )
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="references Session table",
+    )
+    workflowId = Column(
+        ForeignKey("Workflow.workflowId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    experimentType = Column(
+        Enum(
+            "EM",
+            "SAD",
+            "SAD - Inverse Beam",
+            "OSC",
+            "Collect - Multiwedge",
+            "MAD",
+            "Helical",
+            "Multi-positional",
+            "Mesh",
+            "Burn",
+            "MAD - Inverse Beam",
+            "Characterization",
+            "Dehydration",
+            "Still",
+            "SSX-Chip",
+            "SSX-Jet",
+        )
+    )
+    startTime = Column(DateTime, comment="Start time of the dataCollectionGroup")
+    endTime = Column(DateTime, comment="end time of the dataCollectionGroup")
+    crystalClass = Column(String(20), comment="Crystal Class for industrials users")
+    comments = deferred(Column(String(1024), comment="comments"), group="large")
+    detectorMode = Column(String(255), comment="Detector mode")
+    actualSampleBarcode = Column(String(45), comment="Actual sample barcode")
+    actualSampleSlotInContainer = Column(
+        INTEGER(10), comment="Actual sample slot number in container"
+    )
+    actualContainerBarcode = Column(String(45), comment="Actual container barcode")
+    actualContainerSlotInSC = Column(
+        INTEGER(10), comment="Actual container slot number in sample changer"
+    )
+    xtalSnapshotFullPath = Column(String(255))
+
+    BLSample = relationship("BLSample")
+    BLSession = relationship("BLSession")
+    Workflow = relationship("Workflow")
+    Project = relationship("Project", secondary="Project_has_DCGroup")
+
+
+class DataCollectionPlanGroup(Base):
+    __tablename__ = "DataCollectionPlanGroup"
+
+    dataCollectionPlanGroupId = Column(INTEGER(10), primary_key=True)
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    blSampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+
+    BLSample = relationship("BLSample")
+    BLSession = relationship("BLSession")
+
+
+class EnergyScan(Base):
+    __tablename__ = "EnergyScan"
+
+    energyScanId = Column(INTEGER(10), primary_key=True)
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    blSampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE"), index=True
+    )
+    fluorescenceDetector = Column(String(255))
+    scanFileFullPath = Column(String(255))
+    choochFileFullPath = Column(String(255))
+    jpegChoochFileFullPath = Column(String(255))
+    element = Column(String(45))
+    startEnergy = Column(Float)
+    endEnergy = Column(Float)
+    transmissionFactor = Column(Float)
+    exposureTime = Column(Float)
+    axisPosition = Column(Float)
+    synchrotronCurrent = Column(Float)
+    temperature = Column(Float)
+    peakEnergy = Column(Float)
+    peakFPrime = Column(Float)
+    peakFDoublePrime = Column(Float)
+    inflectionEnergy = Column(Float)
+    inflectionFPrime = Column(Float)
+    inflectionFDoublePrime = Column(Float)
+    xrayDose = Column(Float)
+    startTime = Column(DateTime)
+    endTime = Column(DateTime)
+    edgeEnergy = Column(String(255))
+    filename = Column(String(255))
+    beamSizeVertical = Column(Float)
+    beamSizeHorizontal = Column(Float)
+    crystalClass = Column(String(20))
+    comments = deferred(Column(String(1024)), group="large")
+    flux = Column(Float(asdecimal=True), comment="flux measured before the energyScan")
+    flux_end = Column(
+        Float(asdecimal=True), comment="flux measured after the energyScan"
+    )
+    workingDirectory = Column(String(45))
+    blSubSampleId = Column(
+        ForeignKey("BLSubSample.blSubSampleId", ondelete="CASCADE"), index=True
+    )
+    remoteEnergy = Column(Float)
+    remoteFPrime = Column(Float)
+    remoteFDoublePrime = Column(Float)
+
+    BLSample = relationship("BLSample")
+    BLSubSample = relationship("BLSubSample")
+    BLSession = relationship("BLSession")
+    Project = relationship("Project", secondary="Project_has_EnergyScan")
+
+
+t_Project_has_DCGroup = Table(
+    "Project_has_DCGroup",
+    metadata,
+    Column(
+        "projectId",
+        ForeignKey("Project.projectId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "dataCollectionGroupId",
+        ForeignKey(
+            "DataCollectionGroup.dataCollectionGroupId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class Screening(Base):
+    __tablename__ = "Screening"
+
+    screeningId = Column(INTEGER(10), primary_key=True)
+    diffractionPlanId = Column(
+        INTEGER(10), index=True, comment="references DiffractionPlan"
+    )
+    dataCollectionGroupId = Column(
+        ForeignKey("DataCollectionGroup.dataCollectionGroupId", ondelete="CASCADE"),
+        index=True,
+    )
+    dataCollectionId = Column(INTEGER(10))
+    bltimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+    programVersion = Column(String(45))
+    comments = Column(String(255))
+    shortComments = Column(String(20))
+    xmlSampleInformation = deferred(Column(LONGBLOB), group="large")
+
+    DataCollectionGroup = relationship("DataCollectionGroup")
+
+
+class XFEFluorescenceSpectrum(Base):
+    __tablename__ = "XFEFluorescenceSpectrum"
+
+    xfeFluorescenceSpectrumId = Column(INTEGER(10), primary_key=True)
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    blSampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    fittedDataFileFullPath = Column(String(255))
+    scanFileFullPath = Column(String(255))
+    jpegScanFileFullPath = Column(String(255))
+    startTime = Column(DateTime)
+    endTime = Column(DateTime)
+    filename = Column(String(255))
+    energy = Column(Float)
+    exposureTime = Column(Float)
+    axisPosition = Column(Float)
+    beamTransmission = Column(Float)
+    annotatedPymcaXfeSpectrum = Column(String(255))
+    beamSizeVertical = Column(Float)
+    beamSizeHorizontal = Column(Float)
+    crystalClass = Column(String(20))
+    comments = deferred(Column(String(1024)), group="large")
+    flux = Column(Float(asdecimal=True), comment="flux measured before the xrfSpectra")
+    flux_end = Column(
+        Float(asdecimal=True), comment="flux measured after the xrfSpectra"
+    )
+    workingDirectory = Column(String(512))
+    blSubSampleId = Column(
+        ForeignKey("BLSubSample.blSubSampleId", ondelete="CASCADE"), index=True
+    )
+
+    BLSample = relationship("BLSample")
+    BLSubSample = relationship("BLSubSample")
+    BLSession = relationship("BLSession")
+
+
+class BLSampleHasEnergyScan(Base):
+    __tablename__ = "BLSample_has_EnergyScan"
+
+    blSampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    energyScanId = Column(
+        ForeignKey("EnergyScan.energyScanId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    blSampleHasEnergyScanId = Column(INTEGER(11), primary_key=True)
+
+    BLSample = relationship("BLSample")
+    EnergyScan = relationship("EnergyScan")
+
+
+t_Project_has_EnergyScan = Table(
+    "Project_has_EnergyScan",
+    metadata,
+    Column(
+        "projectId",
+        ForeignKey("Project.projectId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "energyScanId",
+        ForeignKey("EnergyScan.energyScanId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+t_Project_has_XFEFSpectrum = Table(
+    "Project_has_XFEFSpectrum",
+    metadata,
+    Column(
+        "projectId",
+        ForeignKey("Project.projectId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "xfeFluorescenceSpectrumId",
+        ForeignKey(
+            "XFEFluorescenceSpectrum.xfeFluorescenceSpectrumId", ondelete="CASCADE"
+        ),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class ScreeningInput(Base):
+    __tablename__ = "ScreeningInput"
+
+    screeningInputId = Column(INTEGER(10), primary_key=True)
+    screeningId = Column(
+        ForeignKey("Screening.screeningId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    diffractionPlanId = Column(INTEGER(11), comment="references DiffractionPlan table")
+    beamX = Column(Float)
+    beamY = Column(Float)
+    rmsErrorLimits = Column(Float)
+    minimumFractionIndexed = Column(Float)
+    maximumFractionRejected = Column(Float)
+    minimumSignalToNoise = Column(Float)
+    xmlSampleInformation = deferred(Column(LONGBLOB), group="large")
+
+    Screening = relationship("Screening")
+
+
+class ScreeningOutput(Base):
+    __tablename__ = "ScreeningOutput"
+
+    screeningOutputId = Column(INTEGER(10), primary_key=True)
+    screeningId = Column(
+        ForeignKey("Screening.screeningId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    statusDescription = deferred(Column(String(1024)), group="large")
+    rejectedReflections = Column(INTEGER(10))
+    resolutionObtained = Column(Float)
+    spotDeviationR = Column(Float)
+    spotDeviationTheta = Column(Float)
+    beamShiftX = Column(Float)
+    beamShiftY = Column(Float)
+    numSpotsFound = Column(INTEGER(10))
+    numSpotsUsed = Column(INTEGER(10))
+    numSpotsRejected = Column(INTEGER(10))
+    mosaicity = Column(Float)
+    iOverSigma = Column(Float)
+    diffractionRings = Column(TINYINT(1))
+    strategySuccess = Column(TINYINT(1), nullable=False, server_default=text("0"))
+    mosaicityEstimated = Column(TINYINT(1), nullable=False, server_default=text("0"))
+    rankingResolution = Column(Float(asdecimal=True))
+    program = Column(String(45))
+    doseTotal = Column(Float(asdecimal=True))
+    totalExposureTime = Column(Float(asdecimal=True))
+    totalRotationRange = Column(Float(asdecimal=True))
+    totalNumberOfImages = Column(INTEGER(11))
+    rFriedel = Column(Float(asdecimal=True))
+    indexingSuccess = Column(TINYINT(1), nullable=False, server_default=text("0"))
+    screeningSuccess = Column(TINYINT(1), server_default=text("0"))
+
+    Screening = relationship("Screening")
+
+
+class ScreeningRank(Base):
+    __tablename__ = "ScreeningRank"
+
+    screeningRankId = Column(INTEGER(10), primary_key=True)
+    screeningRankSetId = Column(
+        ForeignKey(
+            "ScreeningRankSet.screeningRankSetId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    screeningId = Column(
+        ForeignKey("Screening.screeningId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    rankValue = Column(Float)
+    rankInformation = deferred(Column(String(1024)), group="large")
+
+    Screening = relationship("Screening")
+    ScreeningRankSet = relationship("ScreeningRankSet")
+
+
+class ScreeningOutputLattice(Base):
+    __tablename__ = "ScreeningOutputLattice"
+
+    screeningOutputLatticeId = Column(INTEGER(10), primary_key=True)
+    screeningOutputId = Column(
+        ForeignKey(
+            "ScreeningOutput.screeningOutputId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    spaceGroup = Column(String(45))
+    pointGroup = Column(String(45))
+    bravaisLattice = Column(String(45))
+    rawOrientationMatrix_a_x = Column(Float)
+    rawOrientationMatrix_a_y = Column(Float)
+    rawOrientationMatrix_a_z = Column(Float)
+    rawOrientationMatrix_b_x = Column(Float)
+    rawOrientationMatrix_b_y = Column(Float)
+    rawOrientationMatrix_b_z = Column(Float)
+    rawOrientationMatrix_c_x = Column(Float)
+    rawOrientationMatrix_c_y = Column(Float)
+    rawOrientationMatrix_c_z = Column(Float)
+    unitCell_a = Column(Float)
+    unitCell_b = Column(Float)
+    unitCell_c = Column(Float)
+    unitCell_alpha = Column(Float)
+    unitCell_beta = Column(Float)
+    unitCell_gamma = Column(Float)
+    bltimeStamp = Column(TIMESTAMP, server_default=text("current_timestamp()"))
+    labelitIndexing = Column(TINYINT(1), server_default=text("0"))
+
+    ScreeningOutput = relationship("ScreeningOutput")
+
+
+class ScreeningStrategy(Base):
+    __tablename__ = "ScreeningStrategy"
+
+    screeningStrategyId = Column(INTEGER(10), primary_key=True)
+    screeningOutputId = Column(
+        ForeignKey(
+            "ScreeningOutput.screeningOutputId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    phiStart = Column(Float)
+    phiEnd = Column(Float)
+    rotation = Column(Float)
+    exposureTime = Column(Float)
+    resolution = Column(Float)
+    completeness = Column(Float)
+    multiplicity = Column(Float)
+    anomalous = Column(TINYINT(1), nullable=False, server_default=text("0"))
+    program = Column(String(45))
+    rankingResolution = Column(Float)
+    transmission = Column(
+        Float, comment="Transmission for the strategy as given by the strategy program."
+    )
+
+    ScreeningOutput = relationship("ScreeningOutput")
+
+
+class ScreeningStrategyWedge(Base):
+    __tablename__ = "ScreeningStrategyWedge"
+
+    screeningStrategyWedgeId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key"
+    )
+    screeningStrategyId = Column(
+        ForeignKey(
+            "ScreeningStrategy.screeningStrategyId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        index=True,
+        comment="Foreign key to parent table",
+    )
+    wedgeNumber = Column(
+        INTEGER(10), comment="The number of this wedge within the strategy"
+    )
+    resolution = Column(Float)
+    completeness = Column(Float)
+    multiplicity = Column(Float)
+    doseTotal = Column(Float, comment="Total dose for this wedge")
+    numberOfImages = Column(INTEGER(10), comment="Number of images for this wedge")
+    phi = Column(Float)
+    kappa = Column(Float)
+    chi = Column(Float)
+    comments = Column(String(255))
+    wavelength = Column(Float(asdecimal=True))
+
+    ScreeningStrategy = relationship("ScreeningStrategy")
+
+
+class ScreeningStrategySubWedge(Base):
+    __tablename__ = "ScreeningStrategySubWedge"
+
+    screeningStrategySubWedgeId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key"
+    )
+    screeningStrategyWedgeId = Column(
+        ForeignKey(
+            "ScreeningStrategyWedge.screeningStrategyWedgeId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        index=True,
+        comment="Foreign key to parent table",
+    )
+    subWedgeNumber = Column(
+        INTEGER(10), comment="The number of this subwedge within the wedge"
+    )
+    rotationAxis = Column(String(45), comment="Angle where subwedge starts")
+    axisStart = Column(Float, comment="Angle where subwedge ends")
+    axisEnd = Column(Float, comment="Exposure time for subwedge")
+    exposureTime = Column(Float, comment="Transmission for subwedge")
+    transmission = Column(Float)
+    oscillationRange = Column(Float)
+    completeness = Column(Float)
+    multiplicity = Column(Float)
+    doseTotal = Column(Float, comment="Total dose for this subwedge")
+    numberOfImages = Column(INTEGER(10), comment="Number of images for this subwedge")
+    comments = Column(String(255))
+    resolution = Column(Float)
+
+    ScreeningStrategyWedge = relationship("ScreeningStrategyWedge")
+
+
+class DataCollection(Base):
+    __tablename__ = "DataCollection"
+
+    dataCollectionId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    dataCollectionGroupId = Column(
+        ForeignKey(
+            "DataCollectionGroup.dataCollectionGroupId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+        comment="references DataCollectionGroup table",
+    )
+    strategySubWedgeOrigId = Column(
+        ForeignKey(
+            "ScreeningStrategySubWedge.screeningStrategySubWedgeId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        index=True,
+        comment="references ScreeningStrategySubWedge table",
+    )
+    detectorId = Column(
+        ForeignKey("Detector.detectorId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="references Detector table",
+    )
+    blSubSampleId = Column(
+        ForeignKey("BLSubSample.blSubSampleId", ondelete="CASCADE"), index=True
+    )
+    startPositionId = Column(INTEGER(10), index=True)
+    endPositionId = Column(INTEGER(10), index=True)
+    dataCollectionNumber = Column(INTEGER(10), index=True)
+    startTime = Column(DateTime, index=True, comment="Start time of the dataCollection")
+    endTime = Column(DateTime, comment="end time of the dataCollection")
+    runStatus = Column(String(45))
+    axisStart = Column(Float)
+    axisEnd = Column(Float)
+    axisRange = Column(Float)
+    overlap = Column(Float)
+    numberOfImages = Column(INTEGER(10))
+    startImageNumber = Column(INTEGER(10))
+    numberOfPasses = Column(INTEGER(10))
+    exposureTime = Column(Float)
+    imageDirectory = Column(String(255), index=True)
+    imagePrefix = Column(String(100), index=True)
+    imageSuffix = Column(String(45))
+    imageContainerSubPath = Column(
+        String(255),
+        comment="Internal path of a HDF5 file pointing to the data for this data collection",
+    )
+    fileTemplate = Column(String(255))
+    wavelength = Column(Float)
+    resolution = Column(Float)
+    detectorDistance = Column(Float)
+    xBeam = Column(Float)
+    yBeam = Column(Float)
+    xBeamPix = Column(Float, comment="Beam size in pixels")
+    yBeamPix = Column(Float, comment="Beam size in pixels")
+    comments = deferred(Column(String(1024)), group="large")
+    printableForReport = Column(TINYINT(3), server_default=text("1"))
+    slitGapVertical = Column(Float)
+    slitGapHorizontal = Column(Float)
+    transmission = Column(Float)
+    synchrotronMode = Column(String(20))
+    xtalSnapshotFullPath1 = Column(String(255))
+    xtalSnapshotFullPath2 = Column(String(255))
+    xtalSnapshotFullPath3 = Column(String(255))
+    xtalSnapshotFullPath4 = Column(String(255))
+    rotationAxis = Column(Enum("Omega", "Kappa", "Phi"))
+    phiStart = Column(Float)
+    kappaStart = Column(Float)
+    omegaStart = Column(Float)
+    resolutionAtCorner = Column(Float)
+    detector2Theta = Column(Float)
+    undulatorGap1 = Column(Float)
+    undulatorGap2 = Column(Float)
+    undulatorGap3 = Column(Float)
+    beamSizeAtSampleX = Column(Float)
+    beamSizeAtSampleY = Column(Float)
+    centeringMethod = Column(String(255))
+    averageTemperature = Column(Float)
+    actualCenteringPosition = Column(String(255))
+    beamShape = Column(String(45))
+    flux = Column(Float(asdecimal=True))
+    flux_end = Column(Float(asdecimal=True), comment="flux measured after the collect")
+    totalAbsorbedDose = Column(
+        Float(asdecimal=True), comment="expected dose delivered to the crystal, EDNA"
+    )
+    bestWilsonPlotPath = Column(String(255))
+    imageQualityIndicatorsPlotPath = Column(String(512))
+    imageQualityIndicatorsCSVPath = Column(String(512))
+    blSampleId = Column(INTEGER(10))
+    sessionId = Column(INTEGER(10), server_default=text("0"))
+    experimentType = Column(String(24))
+    crystalClass = Column(String(20))
+    chiStart = Column(Float)
+    detectorMode = Column(String(255))
+    actualSampleBarcode = Column(String(45))
+    actualSampleSlotInContainer = Column(INTEGER(10))
+    actualContainerBarcode = Column(String(45))
+    actualContainerSlotInSC = Column(INTEGER(10))
+    positionId = Column(INTEGER(10))
+    focalSpotSizeAtSampleX = Column(Float)
+    polarisation = Column(Float)
+    focalSpotSizeAtSampleY = Column(Float)
+    apertureId = Column(INTEGER(10))
+    screeningOrigId = Column(INTEGER(10))
+    processedDataFile = Column(String(255))
+    datFullPath = Column(String(255))
+    magnification = Column(INTEGER(11), comment="Unit: X")
+    binning = Column(
+        TINYINT(1),
+        server_default=text("1"),
+        comment="1 or 2. Number of pixels to process as 1. (Use mean value.)",
+    )
+    particleDiameter = Column(Float, comment="Unit: nm")
+    boxSize_CTF = Column(Float, comment="Unit: pixels")
+    minResolution = Column(Float, comment="Unit: A")
+    minDefocus = Column(Float, comment="Unit: A")
+    maxDefocus = Column(Float, comment="Unit: A")
+    defocusStepSize = Column(Float, comment="Unit: A")
+    amountAstigmatism = Column(Float, comment="Unit: A")
+    extractSize = Column(Float, comment="Unit: pixels")
+    bgRadius = Column(Float, comment="Unit: nm")
+    voltage = Column(Float, comment="Unit: kV")
+    objAperture = Column(Float, comment="Unit: um")
+    c1aperture = Column(Float, comment="Unit: um")
+    c2aperture = Column(Float, comment="Unit: um")
+    c3aperture = Column(Float, comment="Unit: um")
+    c1lens = Column(Float, comment="Unit: %")
+    c2lens = Column(Float, comment="Unit: %")
+    c3lens = Column(Float, comment="Unit: %")
+
+    BLSubSample = relationship("BLSubSample")
+    DataCollectionGroup = relationship("DataCollectionGroup")
+    Detector = relationship("Detector")
+    ScreeningStrategySubWedge = relationship("ScreeningStrategySubWedge")
+
+
+class AutoProcProgram(Base):
+    __tablename__ = "AutoProcProgram"
+
+    autoProcProgramId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    dataCollectionId = Column(
+        ForeignKey("DataCollection.dataCollectionId", ondelete="CASCADE"), index=True
+    )
+    processingCommandLine = Column(
+        String(255), comment="Command line for running the automatic processing"
+    )
+    processingPrograms = Column(
+        String(255), comment="Processing programs (comma separated)"
+    )
+    processingStatus = Column(
+        Enum("RUNNING", "FAILED", "SUCCESS", "0", "1"), comment="success (1) / fail (0)"
+    )
+    processingMessage = Column(String(255), comment="warning, error,...")
+    processingStartTime = Column(DateTime, comment="Processing start time")
+    processingEndTime = Column(DateTime, comment="Processing end time")
+    processingEnvironment = Column(String(255), comment="Cpus, Nodes,...")
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+    DataCollection = relationship("DataCollection")
+
+
+class DataCollectionFileAttachment(Base):
+    __tablename__ = "DataCollectionFileAttachment"
+
+    dataCollectionFileAttachmentId = Column(INTEGER(10), primary_key=True)
+    dataCollectionId = Column(
+        ForeignKey(
+            "DataCollection.dataCollectionId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+    )
+    fileFullPath = Column(String(255), nullable=False)
+    fileType = Column(
+        Enum("snapshot", "log", "xy", "recip"),
+        comment="snapshot: image file, usually of the sample. \\r\\nlog: a text file with logging info. \\r\\nxy: x and y data in text format. \\r\\nrecip: a compressed csv file with reciprocal space coordinates.",
+    )
+    createTime = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    DataCollection = relationship("DataCollection")
+
+
+class EventChain(Base):
+    __tablename__ = "EventChain"
+    __table_args__ = {"comment": "Groups events together in a data collection."}
+
+    eventChainId = Column(INTEGER(11), primary_key=True)
+    dataCollectionId = Column(
+        ForeignKey(
+            "DataCollection.dataCollectionId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+    )
+    name = Column(String(255))
+
+    DataCollection = relationship("DataCollection")
+
+
+class Image(Base):
+    __tablename__ = "Image"
+    __table_args__ = (Index("Image_Index3", "fileLocation", "fileName"),)
+
+    imageId = Column(INTEGER(10), primary_key=True)
+    dataCollectionId = Column(
+        ForeignKey("DataCollection.dataCollectionId", ondelete="CASCADE"),
+        ForeignKey(
+            "DataCollection.dataCollectionId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    motorPositionId = Column(INTEGER(10), index=True)
+    imageNumber = Column(INTEGER(10), index=True)
+    fileName = Column(String(255))
+    fileLocation = Column(String(255))
+    measuredIntensity = Column(Float)
+    jpegFileFullPath = Column(String(255))
+    jpegThumbnailFileFullPath = Column(String(255))
+    temperature = Column(Float)
+    cumulativeIntensity = Column(Float)
+    synchrotronCurrent = Column(Float)
+    comments = deferred(Column(String(1024)), group="large")
+    machineMessage = deferred(Column(String(1024)), group="large")
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+
+    DataCollection = relationship(
+        "DataCollection",
+        primaryjoin="Image.dataCollectionId == DataCollection.dataCollectionId",
+    )
+
+
+class SSXDataCollection(Base):
+    __tablename__ = "SSXDataCollection"
+    __table_args__ = {"comment": "Extends DataCollection with SSX-specific fields."}
+
+    dataCollectionId = Column(
+        ForeignKey(
+            "DataCollection.dataCollectionId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        primary_key=True,
+        comment="Primary key is same as dataCollection (1 to 1).",
+    )
+    repetitionRate = Column(Float)
+    energyBandwidth = Column(Float)
+    monoStripe = Column(String(255))
+    jetSpeed = Column(Float, comment="For jet experiments.")
+    jetSize = Column(Float, comment="For jet experiments.")
+    chipPattern = Column(String(255), comment="For chip experiments.")
+    chipModel = Column(String(255), comment="For chip experiments.")
+    reactionDuration = Column(
+        Float,
+        comment="When images are taken at constant time relative to reaction start.",
+    )
+    laserEnergy = Column(Float)
+    experimentName = Column(String(255))
+
+    DataCollection = relationship("DataCollection", uselist=False)
+
+
+class XRFFluorescenceMapping(Base):
+    __tablename__ = "XRFFluorescenceMapping"
+
+    xrfFluorescenceMappingId = Column(INTEGER(10), primary_key=True)
+    xrfFluorescenceMappingROIId = Column(
+        ForeignKey(
+            "XRFFluorescenceMappingROI.xrfFluorescenceMappingROIId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+    )
+    dataCollectionId = Column(
+        ForeignKey(
+            "DataCollection.dataCollectionId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+    )
+    imageNumber = Column(INTEGER(10), nullable=False)
+    counts = Column(INTEGER(10), nullable=False)
+
+    DataCollection = relationship("DataCollection")
+    XRFFluorescenceMappingROI = relationship("XRFFluorescenceMappingROI")
+
+
+class AutoProcIntegration(Base):
+    __tablename__ = "AutoProcIntegration"
+
+    autoProcIntegrationId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    dataCollectionId = Column(
+        ForeignKey(
+            "DataCollection.dataCollectionId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        comment="DataCollection item",
+    )
+    autoProcProgramId = Column(
+        ForeignKey(
+            "AutoProcProgram.autoProcProgramId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+        comment="Related program item",
+    )
+    startImageNumber = Column(INTEGER(10), comment="start image number")
+    endImageNumber = Column(INTEGER(10), comment="end image number")
+    refinedDetectorDistance = Column(
+        Float, comment="Refined DataCollection.detectorDistance"
+    )
+    refinedXBeam = Column(Float, comment="Refined DataCollection.xBeam")
+    refinedYBeam = Column(Float, comment="Refined DataCollection.yBeam")
+    rotationAxisX = Column(Float, comment="Rotation axis")
+    rotationAxisY = Column(Float, comment="Rotation axis")
+    rotationAxisZ = Column(Float, comment="Rotation axis")
+    beamVectorX = Column(Float, comment="Beam vector")
+    beamVectorY = Column(Float, comment="Beam vector")
+    beamVectorZ = Column(Float, comment="Beam vector")
+    cell_a = Column(Float, comment="Unit cell")
+    cell_b = Column(Float, comment="Unit cell")
+    cell_c = Column(Float, comment="Unit cell")
+    cell_alpha = Column(Float, comment="Unit cell")
+    cell_beta = Column(Float, comment="Unit cell")
+    cell_gamma = Column(Float, comment="Unit cell")
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+    anomalous = Column(
+        TINYINT(1), server_default=text("0"), comment="boolean type:0 noanoum - 1 anoum"
+    )
+
+    AutoProcProgram = relationship("AutoProcProgram")
+    DataCollection = relationship("DataCollection")
+
+
+class AutoProcProgramAttachment(Base):
+    __tablename__ = "AutoProcProgramAttachment"
+
+    autoProcProgramAttachmentId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    autoProcProgramId = Column(
+        ForeignKey(
+            "AutoProcProgram.autoProcProgramId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        comment="Related autoProcProgram item",
+    )
+    fileType = Column(Enum("Log", "Result", "Graph"), comment="Type of file Attachment")
+    fileName = Column(String(255), comment="Attachment filename")
+    filePath = Column(String(255), comment="Attachment filepath to disk storage")
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+    AutoProcProgram = relationship("AutoProcProgram")
+
+
+class Event(Base):
+    __tablename__ = "Event"
+    __table_args__ = {
+        "comment": "Describes something that happend during a data collection and should be taken into account for data analysis. Can be reapeted at a specified frequency or not."
+    }
+
+    eventId = Column(INTEGER(11), primary_key=True)
+    eventChainId = Column(
+        ForeignKey("EventChain.eventChainId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    componentId = Column(ForeignKey("Component.componentId"), index=True)
+    eventTypeId = Column(
+        ForeignKey("EventType.eventTypeId"), nullable=False, index=True
+    )
+    name = Column(String(255))
+    offset = Column(
+        Float,
+        nullable=False,
+        comment="Start of the event relative to data collection start time in seconds.",
+    )
+    duration = Column(Float, comment="Duration of the event if applicable.")
+    period = Column(Float, comment="Repetition period if applicable in seconds.")
+    repetition = Column(Float, comment="Number of repetition if applicable.")
+
+    Component = relationship("Component")
+    EventChain = relationship("EventChain")
+    EventType = relationship("EventType")
+
+
+class ImageQualityIndicators(Base):
+    __tablename__ = "ImageQualityIndicators"
+
+    imageQualityIndicatorsId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    imageId = Column(INTEGER(11), index=True)
+    autoProcProgramId = Column(
+        ForeignKey(
+            "AutoProcProgram.autoProcProgramId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+        comment="Foreign key to the AutoProcProgram table",
+    )
+    spotTotal = Column(INTEGER(11), comment="Total number of spots")
+    inResTotal = Column(
+        INTEGER(11), comment="Total number of spots in resolution range"
+    )
+    goodBraggCandidates = Column(
+        INTEGER(11), comment="Total number of Bragg diffraction spots"
+    )
+    iceRings = Column(INTEGER(11), comment="Number of ice rings identified")
+    method1Res = Column(Float, comment="Resolution estimate 1 (see publication)")
+    method2Res = Column(Float, comment="Resolution estimate 2 (see publication)")
+    maxUnitCell = Column(
+        Float, comment="Estimation of the largest possible unit cell edge"
+    )
+    pctSaturationTop50Peaks = Column(
+        Float, comment="The fraction of the dynamic range being used"
+    )
+    inResolutionOvrlSpots = Column(INTEGER(11), comment="Number of spots overloaded")
+    binPopCutOffMethod2Res = Column(
+        Float, comment="Cut off used in resolution limit calculation"
+    )
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+    totalIntegratedSignal = Column(Float(asdecimal=True))
+    dozor_score = Column(Float(asdecimal=True), comment="dozor_score")
+    dataCollectionId = Column(INTEGER(10))
+    imageNumber = Column(MEDIUMINT(8))
+
+    AutoProcProgram = relationship("AutoProcProgram")
+
+
+class PDBEntry(Base):
+    __tablename__ = "PDBEntry"
+
+    pdbEntryId = Column(INTEGER(10), primary_key=True)
+    autoProcProgramId = Column(
+        ForeignKey("AutoProcProgram.autoProcProgramId", ondelete="CASCADE"), index=True
+    )
+    code = Column(String(4))
+    cell_a = Column(Float)
+    cell_b = Column(Float)
+    cell_c = Column(Float)
+    cell_alpha = Column(Float)
+    cell_beta = Column(Float)
+    cell_gamma = Column(Float)
+    resolution = Column(Float)
+    pdbTitle = Column(String(255))
+    pdbAuthors = Column(String(600))
+    pdbDate = Column(DateTime)
+    pdbBeamlineName = Column(String(50))
+    beamlines = Column(String(100))
+    distance = Column(Float)
+    autoProcCount = Column(SMALLINT(6))
+    dataCollectionCount = Column(SMALLINT(6))
+    beamlineMatch = Column(TINYINT(1))
+    authorMatch = Column(TINYINT(1))
+
+    AutoProcProgram = relationship("AutoProcProgram")
+
+
+class WorkflowMesh(Base):
+    __tablename__ = "WorkflowMesh"
+
+    workflowMeshId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    workflowId = Column(
+        ForeignKey("Workflow.workflowId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Related workflow",
+    )
+    bestPositionId = Column(INTEGER(10), index=True)
+    bestImageId = Column(
+        ForeignKey("Image.imageId", ondelete="CASCADE", onupdate="CASCADE"), index=True
+    )
+    value1 = Column(Float(asdecimal=True))
+    value2 = Column(Float(asdecimal=True))
+    value3 = Column(Float(asdecimal=True), comment="N value")
+    value4 = Column(Float(asdecimal=True))
+    cartographyPath = Column(String(255))
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+
+    Image = relationship("Image")
+    Workflow = relationship("Workflow")
+
+
+class AutoProcScalingHasInt(Base):
+    __tablename__ = "AutoProcScaling_has_Int"
+    __table_args__ = (
+        Index(
+            "AutoProcScalingHasInt_FKIndex3",
+            "autoProcScalingId",
+            "autoProcIntegrationId",
+        ),
+    )
+
+    autoProcScaling_has_IntId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    autoProcScalingId = Column(
+        ForeignKey(
+            "AutoProcScaling.autoProcScalingId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+        comment="AutoProcScaling item",
+    )
+    autoProcIntegrationId = Column(
+        ForeignKey(
+            "AutoProcIntegration.autoProcIntegrationId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+        comment="AutoProcIntegration item",
+    )
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+    AutoProcIntegration = relationship("AutoProcIntegration")
+    AutoProcScaling = relationship("AutoProcScaling")
+
+
+class AutoProcStatus(Base):
+    __tablename__ = "AutoProcStatus"
+    __table_args__ = {
+        "comment": "AutoProcStatus table is linked to AutoProcIntegration"
+    }
+
+    autoProcStatusId = Column(
+        INTEGER(11), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    autoProcIntegrationId = Column(
+        ForeignKey(
+            "AutoProcIntegration.autoProcIntegrationId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+    )
+    step = Column(
+        Enum("Indexing", "Integration", "Correction", "Scaling", "Importing"),
+        nullable=False,
+        comment="autoprocessing step",
+    )
+    status = Column(
+        Enum("Launched", "Successful", "Failed"),
+        nullable=False,
+        comment="autoprocessing status",
+    )
+    comments = deferred(Column(String(1024), comment="comments"), group="large")
+    bltimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    AutoProcIntegration = relationship("AutoProcIntegration")
+
+
+class GridInfo(Base):
+    __tablename__ = "GridInfo"
+
+    gridInfoId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    workflowMeshId = Column(
+        ForeignKey(
+            "WorkflowMesh.workflowMeshId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    xOffset = Column(Float(asdecimal=True))
+    yOffset = Column(Float(asdecimal=True))
+    dx_mm = Column(Float(asdecimal=True))
+    dy_mm = Column(Float(asdecimal=True))
+    steps_x = Column(Float(asdecimal=True))
+    steps_y = Column(Float(asdecimal=True))
+    meshAngle = Column(Float(asdecimal=True))
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+    orientation = Column(
+        Enum("vertical", "horizontal"), server_default=text("'horizontal'")
+    )
+    dataCollectionGroupId = Column(
+        ForeignKey("DataCollectionGroup.dataCollectionGroupId", ondelete="CASCADE"),
+        index=True,
+    )
+    pixelspermicronX = Column(Float)
+    pixelspermicronY = Column(Float)
+    snapshot_offsetxpixel = Column(Float)
+    snapshot_offsetypixel = Column(Float)
+
+    DataCollectionGroup = relationship("DataCollectionGroup")
+    WorkflowMesh = relationship("WorkflowMesh")
+
+
+class PDBEntryHasAutoProcProgram(Base):
+    __tablename__ = "PDBEntry_has_AutoProcProgram"
+
+    pdbEntryHasAutoProcId = Column(INTEGER(10), primary_key=True)
+    pdbEntryId = Column(
+        ForeignKey("PDBEntry.pdbEntryId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    autoProcProgramId = Column(
+        ForeignKey("AutoProcProgram.autoProcProgramId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    distance = Column(Float)
+
+    AutoProcProgram = relationship("AutoProcProgram")
+    PDBEntry = relationship("PDBEntry")
@@ -0,0 +1,774 @@
+# coding: utf-8
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    String,
+    TIMESTAMP,
+    text,
+)
+from sqlalchemy.dialects.mysql import (
+    INTEGER,
+    TINYINT,
+    VARCHAR,
+)
+from sqlalchemy.orm import (
+    deferred,
+    relationship,
+)
+
+from . import Base
+
+
+class Additive(Base):
+    __tablename__ = "Additive"
+
+    additiveId = Column(INTEGER(11), primary_key=True)
+    name = Column(String(45))
+    additiveType = Column(String(45))
+    comments = Column(String(512))
+    chemFormulaHead = Column(String(25), server_default=text("''"))
+    chemFormulaTail = Column(String(25), server_default=text("''"))
+
+
+class DataAcquisition(Base):
+    __tablename__ = "DataAcquisition"
+
+    dataAcquisitionId = Column(INTEGER(11), primary_key=True)
+    sampleCellId = Column(INTEGER(11), nullable=False)
+    framesCount = Column(String(45))
+    energy = Column(String(45))
+    waitTime = Column(String(45))
+    detectorDistance = Column(String(45))
+
+
+class Frame(Base):
+    __tablename__ = "Frame"
+
+    frameId = Column(INTEGER(11), primary_key=True)
+    filePath = Column(String(255), index=True)
+    comments = Column(String(45))
+    creationDate = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+    frameSetId = Column(INTEGER(10))
+
+
+class FrameList(Base):
+    __tablename__ = "FrameList"
+
+    frameListId = Column(INTEGER(11), primary_key=True)
+    comments = Column(INTEGER(11))
+
+
+class InstructionSet(Base):
+    __tablename__ = "InstructionSet"
+
+    instructionSetId = Column(INTEGER(11), primary_key=True)
+    type = Column(String(50))
+
+
+class MeasurementUnit(Base):
+    __tablename__ = "MeasurementUnit"
+
+    measurementUnitId = Column(INTEGER(11), primary_key=True)
+    name = Column(String(45))
+    unitType = Column(String(45))
+
+
+class Model(Base):
+    __tablename__ = "Model"
+
+    modelId = Column(INTEGER(11), primary_key=True)
+    name = Column(String(45))
+    pdbFile = Column(String(255))
+    fitFile = Column(String(255))
+    firFile = Column(String(255))
+    logFile = Column(String(255))
+    rFactor = Column(String(45))
+    chiSqrt = Column(String(45))
+    volume = Column(String(45))
+    rg = Column(String(45))
+    dMax = Column(String(45))
+
+
+class ModelList(Base):
+    __tablename__ = "ModelList"
+
+    modelListId = Column(INTEGER(11), primary_key=True)
+    nsdFilePath = Column(String(255))
+    chi2RgFilePath = Column(String(255))
+
+
+class PlateGroup(Base):
+    __tablename__ = "PlateGroup"
+
+    plateGroupId = Column(INTEGER(11), primary_key=True)
+    name = Column(String(255))
+    storageTemperature = Column(String(45))
+
+
+class RigidBodyModeling(Base):
+    __tablename__ = "RigidBodyModeling"
+
+    rigidBodyModelingId = Column(INTEGER(11), primary_key=True)
+    subtractionId = Column(INTEGER(11), nullable=False, index=True)
+    fitFilePath = Column(String(255))
+    rigidBodyModelFilePath = Column(String(255))
+    logFilePath = Column(String(255))
+    curveConfigFilePath = Column(String(255))
+    subUnitConfigFilePath = Column(String(255))
+    crossCorrConfigFilePath = Column(String(255))
+    contactDescriptionFilePath = Column(String(255))
+    symmetry = Column(String(255))
+    creationDate = Column(String(45))
+
+
+class Run(Base):
+    __tablename__ = "Run"
+
+    runId = Column(INTEGER(11), primary_key=True)
+    timePerFrame = Column(String(45))
+    timeStart = Column(String(45))
+    timeEnd = Column(String(45))
+    storageTemperature = Column(String(45))
+    exposureTemperature = Column(String(45))
+    spectrophotometer = Column(String(45))
+    energy = Column(String(45))
+    creationDate = Column(DateTime)
+    frameAverage = Column(String(45))
+    frameCount = Column(String(45))
+    transmission = Column(String(45))
+    beamCenterX = Column(String(45))
+    beamCenterY = Column(String(45))
+    pixelSizeX = Column(String(45))
+    pixelSizeY = Column(String(45))
+    radiationRelative = Column(String(45))
+    radiationAbsolute = Column(String(45))
+    normalization = Column(String(45))
+
+
+class Superposition(Base):
+    __tablename__ = "Superposition"
+
+    superpositionId = Column(INTEGER(11), primary_key=True)
+    subtractionId = Column(INTEGER(11), nullable=False, index=True)
+    abinitioModelPdbFilePath = Column(String(255))
+    aprioriPdbFilePath = Column(String(255))
+    alignedPdbFilePath = Column(String(255))
+    creationDate = Column(DateTime)
+
+
+class AbInitioModel(Base):
+    __tablename__ = "AbInitioModel"
+
+    abInitioModelId = Column(INTEGER(11), primary_key=True)
+    modelListId = Column(
+        ForeignKey("ModelList.modelListId", ondelete="CASCADE"), index=True
+    )
+    averagedModelId = Column(
+        ForeignKey("Model.modelId", ondelete="CASCADE"), index=True
+    )
+    rapidShapeDeterminationModelId = Column(
+        ForeignKey("Model.modelId", ondelete="CASCADE"), index=True
+    )
+    shapeDeterminationModelId = Column(
+        ForeignKey("Model.modelId", ondelete="CASCADE"), index=True
+    )
+    comments = Column(String(512))
+    creationTime = Column(DateTime)
+
+    AveragedModel = relationship(
+        "Model", primaryjoin="AbInitioModel.averagedModelId == Model.modelId"
+    )
+    ModelList = relationship("ModelList")
+    RapidShapeDeterminationModel = relationship(
+        "Model",
+        primaryjoin="AbInitioModel.rapidShapeDeterminationModelId == Model.modelId",
+    )
+    ShapeDeterminationModel = relationship(
+        "Model", primaryjoin="AbInitioModel.shapeDeterminationModelId == Model.modelId"
+    )
+
+
+class Buffer(Base):
+    __tablename__ = "Buffer"
+
+    bufferId = Column(INTEGER(11), primary_key=True)
+    proposalId = Column(INTEGER(11), nullable=False, server_default=text("-1"))
+    safetyLevelId = Column(
+        ForeignKey("SafetyLevel.safetyLevelId", ondelete="CASCADE"), index=True
+    )
+    name = Column(String(45))
+    acronym = Column(String(45))
+    pH = Column(String(45))
+    composition = Column(String(45))
+    comments = Column(String(512))
+    BLSessionId = Column(INTEGER(10))
+    electronDensity = Column(Float(7))
+
+    SafetyLevel = relationship("SafetyLevel")
+
+
+class FrameSet(Base):
+    __tablename__ = "FrameSet"
+
+    frameSetId = Column(INTEGER(11), primary_key=True)
+    runId = Column(
+        ForeignKey("Run.runId", ondelete="CASCADE"), nullable=False, index=True
+    )
+    frameListId = Column(
+        ForeignKey("FrameList.frameListId", ondelete="CASCADE"), index=True
+    )
+    detectorId = Column(INTEGER(11))
+    detectorDistance = Column(String(45))
+    filePath = Column(String(255))
+    internalPath = Column(String(255))
+
+    FrameList = relationship("FrameList")
+    Run = relationship("Run")
+
+
+class FrameToList(Base):
+    __tablename__ = "FrameToList"
+
+    frameToListId = Column(INTEGER(11), primary_key=True)
+    frameListId = Column(
+        ForeignKey("FrameList.frameListId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    frameId = Column(
+        ForeignKey("Frame.frameId", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    Frame = relationship("Frame")
+    FrameList = relationship("FrameList")
+
+
+class Instruction(Base):
+    __tablename__ = "Instruction"
+
+    instructionId = Column(INTEGER(11), primary_key=True)
+    instructionSetId = Column(
+        ForeignKey("InstructionSet.instructionSetId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    order = Column(INTEGER(11), nullable=False)
+    comments = Column(String(255))
+
+    InstructionSet = relationship("InstructionSet")
+
+
+class Macromolecule(Base):
+    __tablename__ = "Macromolecule"
+
+    macromoleculeId = Column(INTEGER(11), primary_key=True)
+    proposalId = Column(INTEGER(10))
+    safetyLevelId = Column(
+        ForeignKey("SafetyLevel.safetyLevelId", ondelete="CASCADE"), index=True
+    )
+    name = Column(VARCHAR(45))
+    acronym = Column(VARCHAR(45))
+    extintionCoefficient = Column(String(45))
+    molecularMass = Column(String(45))
+    sequence = Column(String(1000))
+    contactsDescriptionFilePath = Column(String(255))
+    symmetry = Column(String(45))
+    comments = deferred(Column(VARCHAR(1024)), group="large")
+    refractiveIndex = Column(String(45))
+    solventViscosity = Column(String(45))
+    creationDate = Column(DateTime)
+    electronDensity = Column(Float(7))
+
+    SafetyLevel = relationship("SafetyLevel")
+
+
+class ModelToList(Base):
+    __tablename__ = "ModelToList"
+
+    modelToListId = Column(INTEGER(11), primary_key=True)
+    modelId = Column(
+        ForeignKey("Model.modelId", ondelete="CASCADE"), nullable=False, index=True
+    )
+    modelListId = Column(
+        ForeignKey("ModelList.modelListId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    Model = relationship("Model")
+    ModelList = relationship("ModelList")
+
+
+class Assembly(Base):
+    __tablename__ = "Assembly"
+
+    assemblyId = Column(INTEGER(11), primary_key=True)
+    macromoleculeId = Column(
+        ForeignKey("Macromolecule.macromoleculeId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    creationDate = Column(DateTime)
+    comments = Column(String(255))
+
+    Macromolecule = relationship("Macromolecule")
+
+
+class BufferHasAdditive(Base):
+    __tablename__ = "BufferHasAdditive"
+
+    bufferHasAdditiveId = Column(INTEGER(11), primary_key=True)
+    bufferId = Column(
+        ForeignKey("Buffer.bufferId", ondelete="CASCADE"), nullable=False, index=True
+    )
+    additiveId = Column(
+        ForeignKey("Additive.additiveId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    measurementUnitId = Column(
+        ForeignKey("MeasurementUnit.measurementUnitId", ondelete="CASCADE"), index=True
+    )
+    quantity = Column(String(45))
+
+    Additive = relationship("Additive")
+    Buffer = relationship("Buffer")
+    MeasurementUnit = relationship("MeasurementUnit")
+
+
+class MacromoleculeRegion(Base):
+    __tablename__ = "MacromoleculeRegion"
+
+    macromoleculeRegionId = Column(INTEGER(11), primary_key=True)
+    macromoleculeId = Column(
+        ForeignKey("Macromolecule.macromoleculeId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    regionType = Column(String(45))
+    id = Column(String(45))
+    count = Column(String(45))
+    sequence = Column(String(45))
+
+    Macromolecule = relationship("Macromolecule")
+
+
+class StockSolution(Base):
+    __tablename__ = "StockSolution"
+
+    stockSolutionId = Column(INTEGER(11), primary_key=True)
+    proposalId = Column(INTEGER(11), nullable=False, server_default=text("-1"))
+    bufferId = Column(
+        ForeignKey("Buffer.bufferId", ondelete="CASCADE"), nullable=False, index=True
+    )
+    macromoleculeId = Column(
+        ForeignKey("Macromolecule.macromoleculeId", ondelete="CASCADE"), index=True
+    )
+    instructionSetId = Column(
+        ForeignKey("InstructionSet.instructionSetId", ondelete="CASCADE"), index=True
+    )
+    boxId = Column(INTEGER(10))
+    name = Column(String(45))
+    storageTemperature = Column(String(55))
+    volume = Column(String(55))
+    concentration = Column(String(55))
+    comments = Column(String(255))
+
+    Buffer = relationship("Buffer")
+    InstructionSet = relationship("InstructionSet")
+    Macromolecule = relationship("Macromolecule")
+
+
+class Stoichiometry(Base):
+    __tablename__ = "Stoichiometry"
+
+    stoichiometryId = Column(INTEGER(11), primary_key=True)
+    hostMacromoleculeId = Column(
+        ForeignKey("Macromolecule.macromoleculeId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    macromoleculeId = Column(
+        ForeignKey("Macromolecule.macromoleculeId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    ratio = Column(String(45))
+
+    Macromolecule = relationship(
+        "Macromolecule",
+        primaryjoin="Stoichiometry.hostMacromoleculeId == Macromolecule.macromoleculeId",
+    )
+    Macromolecule1 = relationship(
+        "Macromolecule",
+        primaryjoin="Stoichiometry.macromoleculeId == Macromolecule.macromoleculeId",
+    )
+
+
+class AssemblyHasMacromolecule(Base):
+    __tablename__ = "AssemblyHasMacromolecule"
+
+    AssemblyHasMacromoleculeId = Column(INTEGER(11), primary_key=True)
+    assemblyId = Column(
+        ForeignKey("Assembly.assemblyId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    macromoleculeId = Column(
+        ForeignKey("Macromolecule.macromoleculeId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    Assembly = relationship("Assembly")
+    Macromolecule = relationship("Macromolecule")
+
+
+class AssemblyRegion(Base):
+    __tablename__ = "AssemblyRegion"
+
+    assemblyRegionId = Column(INTEGER(11), primary_key=True)
+    assemblyHasMacromoleculeId = Column(
+        ForeignKey(
+            "AssemblyHasMacromolecule.AssemblyHasMacromoleculeId", ondelete="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+    )
+    assemblyRegionType = Column(String(45))
+    name = Column(String(45))
+    fromResiduesBases = Column(String(45))
+    toResiduesBases = Column(String(45))
+
+    AssemblyHasMacromolecule = relationship("AssemblyHasMacromolecule")
+
+
+class Experiment(Base):
+    __tablename__ = "Experiment"
+
+    experimentId = Column(INTEGER(11), primary_key=True)
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE"), index=True
+    )
+    proposalId = Column(INTEGER(11), nullable=False)
+    name = Column(String(255))
+    creationDate = Column(DateTime)
+    experimentType = Column(String(128))
+    sourceFilePath = Column(String(256))
+    dataAcquisitionFilePath = Column(
+        String(256),
+        comment="The file path pointing to the data acquisition. Eventually it may be a compressed file with all the files or just the folder",
+    )
+    status = Column(String(45))
+    comments = Column(String(512))
+
+    BLSession = relationship("BLSession")
+
+
+class SamplePlate(Base):
+    __tablename__ = "SamplePlate"
+
+    samplePlateId = Column(INTEGER(11), primary_key=True)
+    experimentId = Column(
+        ForeignKey("Experiment.experimentId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    plateGroupId = Column(
+        ForeignKey("PlateGroup.plateGroupId", ondelete="CASCADE"), index=True
+    )
+    plateTypeId = Column(
+        ForeignKey("PlateType.PlateTypeId", ondelete="CASCADE"), index=True
+    )
+    instructionSetId = Column(
+        ForeignKey("InstructionSet.instructionSetId", ondelete="CASCADE"), index=True
+    )
+    boxId = Column(INTEGER(10))
+    name = Column(String(45))
+    slotPositionRow = Column(String(45))
+    slotPositionColumn = Column(String(45))
+    storageTemperature = Column(String(45))
+
+    Experiment = relationship("Experiment")
+    InstructionSet = relationship("InstructionSet")
+    PlateGroup = relationship("PlateGroup")
+    PlateType = relationship("PlateType")
+
+
+class SaxsDataCollection(Base):
+    __tablename__ = "SaxsDataCollection"
+
+    dataCollectionId = Column(INTEGER(11), primary_key=True)
+    experimentId = Column(
+        ForeignKey("Experiment.experimentId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    comments = deferred(Column(String(5120)), group="large")
+
+    Experiment = relationship("Experiment")
+
+
+class SamplePlatePosition(Base):
+    __tablename__ = "SamplePlatePosition"
+
+    samplePlatePositionId = Column(INTEGER(11), primary_key=True)
+    samplePlateId = Column(
+        ForeignKey("SamplePlate.samplePlateId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    rowNumber = Column(INTEGER(11))
+    columnNumber = Column(INTEGER(11))
+    volume = Column(String(45))
+
+    SamplePlate = relationship("SamplePlate")
+
+
+class Subtraction(Base):
+    __tablename__ = "Subtraction"
+
+    subtractionId = Column(INTEGER(11), primary_key=True)
+    dataCollectionId = Column(
+        ForeignKey("SaxsDataCollection.dataCollectionId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    rg = Column(String(45))
+    rgStdev = Column(String(45))
+    I0 = Column(String(45))
+    I0Stdev = Column(String(45))
+    firstPointUsed = Column(String(45))
+    lastPointUsed = Column(String(45))
+    quality = Column(String(45))
+    isagregated = Column(String(45))
+    concentration = Column(String(45))
+    gnomFilePath = Column(String(255))
+    rgGuinier = Column(String(45))
+    rgGnom = Column(String(45))
+    dmax = Column(String(45))
+    total = Column(String(45))
+    volume = Column(String(45))
+    creationTime = Column(DateTime)
+    kratkyFilePath = Column(String(255))
+    scatteringFilePath = Column(String(255))
+    guinierFilePath = Column(String(255))
+    substractedFilePath = Column(String(255))
+    gnomFilePathOutput = Column(String(255))
+    sampleOneDimensionalFiles = Column(
+        ForeignKey("FrameList.frameListId", ondelete="CASCADE"), index=True
+    )
+    bufferOnedimensionalFiles = Column(
+        ForeignKey("FrameList.frameListId", ondelete="CASCADE"), index=True
+    )
+    sampleAverageFilePath = Column(String(255))
+    bufferAverageFilePath = Column(String(255))
+
+    FrameList = relationship(
+        "FrameList",
+        primaryjoin="Subtraction.bufferOnedimensionalFiles == FrameList.frameListId",
+    )
+    SaxsDataCollection = relationship("SaxsDataCollection")
+    FrameList1 = relationship(
+        "FrameList",
+        primaryjoin="Subtraction.sampleOneDimensionalFiles == FrameList.frameListId",
+    )
+
+
+class Specimen(Base):
+    __tablename__ = "Specimen"
+
+    specimenId = Column(INTEGER(11), primary_key=True)
+    experimentId = Column(
+        ForeignKey("Experiment.experimentId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    bufferId = Column(ForeignKey("Buffer.bufferId", ondelete="CASCADE"), index=True)
+    macromoleculeId = Column(
+        ForeignKey("Macromolecule.macromoleculeId", ondelete="CASCADE"), index=True
+    )
+    samplePlatePositionId = Column(
+        ForeignKey("SamplePlatePosition.samplePlatePositionId", ondelete="CASCADE"),
+        index=True,
+    )
+    safetyLevelId = Column(
+        ForeignKey("SafetyLevel.safetyLevelId", ondelete="CASCADE"), index=True
+    )
+    stockSolutionId = Column(
+        ForeignKey("StockSolution.stockSolutionId", ondelete="CASCADE"), index=True
+    )
+    code = Column(String(255))
+    concentration = Column(String(45))
+    volume = Column(String(45))
+    comments = deferred(Column(String(5120)), group="large")
+
+    Buffer = relationship("Buffer")
+    Experiment = relationship("Experiment")
+    Macromolecule = relationship("Macromolecule")
+    SafetyLevel = relationship("SafetyLevel")
+    SamplePlatePosition = relationship("SamplePlatePosition")
+    StockSolution = relationship("StockSolution")
+
+
+class SubtractionToAbInitioModel(Base):
+    __tablename__ = "SubtractionToAbInitioModel"
+
+    subtractionToAbInitioModelId = Column(INTEGER(11), primary_key=True)
+    abInitioId = Column(
+        ForeignKey("AbInitioModel.abInitioModelId", ondelete="CASCADE"), index=True
+    )
+    subtractionId = Column(
+        ForeignKey("Subtraction.subtractionId", ondelete="CASCADE"), index=True
+    )
+
+    AbInitioModel = relationship("AbInitioModel")
+    Subtraction = relationship("Subtraction")
+
+
+class Measurement(Base):
+    __tablename__ = "Measurement"
+
+    measurementId = Column(INTEGER(11), primary_key=True)
+    specimenId = Column(
+        ForeignKey("Specimen.specimenId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    runId = Column(ForeignKey("Run.runId", ondelete="CASCADE"), index=True)
+    code = Column(String(100))
+    imageDirectory = Column(String(512))
+    priorityLevelId = Column(INTEGER(11))
+    exposureTemperature = Column(String(45))
+    viscosity = Column(String(45))
+    flow = Column(TINYINT(1))
+    extraFlowTime = Column(String(45))
+    volumeToLoad = Column(String(45))
+    waitTime = Column(String(45))
+    transmission = Column(String(45))
+    comments = Column(String(512))
+    pathToH5 = Column(String(512))
+
+    Run = relationship("Run")
+    Specimen = relationship("Specimen")
+
+
+class Structure(Base):
+    __tablename__ = "Structure"
+
+    structureId = Column(INTEGER(11), primary_key=True)
+    macromoleculeId = Column(
+        ForeignKey("Macromolecule.macromoleculeId", ondelete="CASCADE"), index=True
+    )
+    crystalId = Column(ForeignKey("Crystal.crystalId", ondelete="CASCADE"), index=True)
+    blSampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE"), index=True
+    )
+    filePath = deferred(Column(String(2048)), group="large")
+    structureType = Column(String(45))
+    fromResiduesBases = Column(String(45))
+    toResiduesBases = Column(String(45))
+    sequence = Column(String(45))
+    creationDate = Column(DateTime)
+    name = Column(String(255))
+    symmetry = Column(String(45))
+    multiplicity = Column(String(45))
+    groupName = Column(String(45))
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE"), index=True
+    )
+    uniprotId = Column(String(45))
+
+    BLSample = relationship("BLSample")
+    Crystal = relationship("Crystal")
+    Macromolecule = relationship("Macromolecule")
+    Proposal = relationship("Proposal")
+
+
+class FitStructureToExperimentalData(Base):
+    __tablename__ = "FitStructureToExperimentalData"
+
+    fitStructureToExperimentalDataId = Column(INTEGER(11), primary_key=True)
+    structureId = Column(
+        ForeignKey("Structure.structureId", ondelete="CASCADE"), index=True
+    )
+    subtractionId = Column(
+        ForeignKey("Subtraction.subtractionId", ondelete="CASCADE"), index=True
+    )
+    workflowId = Column(
+        ForeignKey("Workflow.workflowId", ondelete="CASCADE"), index=True
+    )
+    fitFilePath = Column(String(255))
+    logFilePath = Column(String(255))
+    outputFilePath = Column(String(255))
+    creationDate = Column(DateTime)
+    comments = deferred(Column(String(2048)), group="large")
+
+    Structure = relationship("Structure")
+    Subtraction = relationship("Subtraction")
+    Workflow = relationship("Workflow")
+
+
+class MeasurementToDataCollection(Base):
+    __tablename__ = "MeasurementToDataCollection"
+
+    measurementToDataCollectionId = Column(INTEGER(11), primary_key=True)
+    dataCollectionId = Column(
+        ForeignKey("SaxsDataCollection.dataCollectionId", ondelete="CASCADE"),
+        index=True,
+    )
+    measurementId = Column(
+        ForeignKey("Measurement.measurementId", ondelete="CASCADE"), index=True
+    )
+    dataCollectionOrder = Column(INTEGER(11))
+
+    SaxsDataCollection = relationship("SaxsDataCollection")
+    Measurement = relationship("Measurement")
+
+
+class Merge(Base):
+    __tablename__ = "Merge"
+
+    mergeId = Column(INTEGER(11), primary_key=True)
+    measurementId = Column(
+        ForeignKey("Measurement.measurementId", ondelete="CASCADE"), index=True
+    )
+    frameListId = Column(
+        ForeignKey("FrameList.frameListId", ondelete="CASCADE"), index=True
+    )
+    discardedFrameNameList = deferred(Column(String(1024)), group="large")
+    averageFilePath = Column(String(255))
+    framesCount = Column(String(45))
+    framesMerge = Column(String(45))
+    creationDate = Column(DateTime)
+
+    FrameList = relationship("FrameList")
+    Measurement = relationship("Measurement")
+
+
+class MixtureToStructure(Base):
+    __tablename__ = "MixtureToStructure"
+
+    fitToStructureId = Column(INTEGER(11), primary_key=True)
+    structureId = Column(
+        ForeignKey("Structure.structureId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    mixtureId = Column(
+        ForeignKey(
+            "FitStructureToExperimentalData.fitStructureToExperimentalDataId",
+            ondelete="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+    )
+    volumeFraction = Column(String(45))
+    creationDate = Column(DateTime)
+
+    FitStructureToExperimentalData = relationship("FitStructureToExperimentalData")
+    Structure = relationship("Structure")
@@ -0,0 +1,1278 @@
+# coding: utf-8
+from sqlalchemy import (
+    BINARY,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    TIMESTAMP,
+    Table,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.mysql import (
+    INTEGER,
+    MEDIUMINT,
+    MEDIUMTEXT,
+    SMALLINT,
+    TINYINT,
+    TINYTEXT,
+    VARCHAR,
+)
+from sqlalchemy.orm import (
+    deferred,
+    relationship,
+)
+
+from . import Base, metadata
+
+
+class BLSampleGroup(Base):
+    __tablename__ = "BLSampleGroup"
+
+    blSampleGroupId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(100), comment="Human-readable name")
+
+
+class BLSampleImageScore(Base):
+    __tablename__ = "BLSampleImageScore"
+
+    blSampleImageScoreId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(45))
+    score = Column(Float)
+    colour = Column(String(15))
+
+
+class ComponentSubType(Base):
+    __tablename__ = "ComponentSubType"
+
+    componentSubTypeId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(31), nullable=False)
+    hasPh = Column(TINYINT(1), server_default=text("0"))
+
+
+class ComponentType(Base):
+    __tablename__ = "ComponentType"
+
+    componentTypeId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(31), nullable=False, unique=True)
+
+
+class ConcentrationType(Base):
+    __tablename__ = "ConcentrationType"
+
+    concentrationTypeId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(31), nullable=False)
+    symbol = Column(String(8), nullable=False)
+
+
+class DatamatrixInSampleChanger(Base):
+    __tablename__ = "DatamatrixInSampleChanger"
+
+    datamatrixInSampleChangerId = Column(INTEGER(10), primary_key=True)
+    proposalId = Column(
+        INTEGER(10), nullable=False, index=True, server_default=text("0")
+    )
+    beamLineName = Column(String(45))
+    datamatrixCode = Column(String(45))
+    locationInContainer = Column(INTEGER(11))
+    containerLocationInSC = Column(INTEGER(11))
+    containerDatamatrixCode = Column(String(45))
+    bltimeStamp = Column(TIMESTAMP)
+
+
+class DewarLocation(Base):
+    __tablename__ = "DewarLocation"
+    __table_args__ = {"comment": "ISPyB Dewar location table"}
+
+    eventId = Column(INTEGER(10), primary_key=True)
+    dewarNumber = Column(String(128), nullable=False, comment="Dewar number")
+    userId = Column(String(128), comment="User who locates the dewar")
+    dateTime = Column(DateTime, comment="Date and time of locatization")
+    locationName = Column(String(128), comment="Location of the dewar")
+    courierName = Column(
+        String(128), comment="Carrier name who's shipping back the dewar"
+    )
+    courierTrackingNumber = Column(
+        String(128), comment="Tracking number of the shippment"
+    )
+
+
+class DewarLocationList(Base):
+    __tablename__ = "DewarLocationList"
+    __table_args__ = {"comment": "List of locations for dewars"}
+
+    locationId = Column(INTEGER(10), primary_key=True)
+    locationName = Column(
+        String(128), nullable=False, server_default=text("''"), comment="Location"
+    )
+
+
+class DiffractionPlan(Base):
+    __tablename__ = "DiffractionPlan"
+
+    diffractionPlanId = Column(INTEGER(10), primary_key=True)
+    xmlDocumentId = Column(INTEGER(10))
+    experimentKind = Column(
+        Enum(
+            "Default",
+            "MXPressE",
+            "MXPressF",
+            "MXPressO",
+            "MXPressP",
+            "MXPressP_SAD",
+            "MXPressI",
+            "MXPressE_SAD",
+            "MXScore",
+            "MXPressM",
+            "MAD",
+            "SAD",
+            "Fixed",
+            "Ligand binding",
+            "Refinement",
+            "OSC",
+            "MAD - Inverse Beam",
+            "SAD - Inverse Beam",
+        )
+    )
+    observedResolution = Column(Float)
+    minimalResolution = Column(Float)
+    exposureTime = Column(Float)
+    oscillationRange = Column(Float)
+    maximalResolution = Column(Float)
+    screeningResolution = Column(Float)
+    radiationSensitivity = Column(Float)
+    anomalousScatterer = Column(String(255))
+    preferredBeamSizeX = Column(Float)
+    preferredBeamSizeY = Column(Float)
+    preferredBeamDiameter = Column(Float)
+    comments = deferred(Column(String(1024)), group="large")
+    aimedCompleteness = Column(Float(asdecimal=True))
+    aimedIOverSigmaAtHighestRes = Column(Float(asdecimal=True))
+    aimedMultiplicity = Column(Float(asdecimal=True))
+    aimedResolution = Column(Float(asdecimal=True))
+    anomalousData = Column(TINYINT(1), server_default=text("0"))
+    complexity = Column(String(45))
+    estimateRadiationDamage = Column(TINYINT(1), server_default=text("0"))
+    forcedSpaceGroup = Column(String(45))
+    requiredCompleteness = Column(Float(asdecimal=True))
+    requiredMultiplicity = Column(Float(asdecimal=True))
+    requiredResolution = Column(Float(asdecimal=True))
+    strategyOption = Column(String(45))
+    kappaStrategyOption = Column(String(45))
+    numberOfPositions = Column(INTEGER(11))
+    minDimAccrossSpindleAxis = Column(
+        Float(asdecimal=True), comment="minimum dimension accross the spindle axis"
+    )
+    maxDimAccrossSpindleAxis = Column(
+        Float(asdecimal=True), comment="maximum dimension accross the spindle axis"
+    )
+    radiationSensitivityBeta = Column(Float(asdecimal=True))
+    radiationSensitivityGamma = Column(Float(asdecimal=True))
+    minOscWidth = Column(Float)
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+    diffractionPlanUUID = Column(String(1000))
+    dataCollectionPlanGroupId = Column(INTEGER(10))
+    detectorId = Column(INTEGER(11))
+    distance = Column(Float(asdecimal=True))
+    orientation = Column(Float(asdecimal=True))
+    monoBandwidth = Column(Float(asdecimal=True))
+    monochromator = Column(String(8), comment="DMM or DCM")
+    energy = Column(Float, comment="eV")
+    transmission = Column(Float, comment="Decimal fraction in range [0,1]")
+    boxSizeX = Column(Float, comment="microns")
+    boxSizeY = Column(Float, comment="microns")
+    kappaStart = Column(Float, comment="degrees")
+    axisStart = Column(Float, comment="degrees")
+    axisRange = Column(Float, comment="degrees")
+    numberOfImages = Column(MEDIUMINT(9), comment="The number of images requested")
+    presetForProposalId = Column(
+        INTEGER(10),
+        comment="Indicates this plan is available to all sessions on given proposal",
+    )
+    beamLineName = Column(
+        String(45),
+        comment="Indicates this plan is available to all sessions on given beamline",
+    )
+    userPath = Column(
+        String(100),
+        comment='User-specified relative "root" path inside the session directory to be used for holding collected data',
+    )
+
+
+class Imager(Base):
+    __tablename__ = "Imager"
+
+    imagerId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(45), nullable=False)
+    temperature = Column(Float)
+    serial = Column(String(45))
+    capacity = Column(SMALLINT(6))
+
+
+class InspectionType(Base):
+    __tablename__ = "InspectionType"
+
+    inspectionTypeId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(45))
+
+
+class IspybCrystalClass(Base):
+    __tablename__ = "IspybCrystalClass"
+    __table_args__ = {"comment": "ISPyB crystal class values"}
+
+    crystalClassId = Column(INTEGER(11), primary_key=True)
+    crystalClass_code = Column(String(20), nullable=False)
+    crystalClass_name = Column(String(255), nullable=False)
+
+
+class PDB(Base):
+    __tablename__ = "PDB"
+
+    pdbId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(255))
+    contents = deferred(Column(MEDIUMTEXT), group="large")
+    code = Column(String(4))
+
+
+class PlateType(Base):
+    __tablename__ = "PlateType"
+
+    PlateTypeId = Column(INTEGER(11), primary_key=True)
+    experimentId = Column(INTEGER(11), index=True)
+    name = Column(String(45))
+    description = Column(String(45))
+    shape = Column(String(45))
+    rowCount = Column(INTEGER(11))
+    columnCount = Column(INTEGER(11))
+
+
+class Position(Base):
+    __tablename__ = "Position"
+
+    positionId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    relativePositionId = Column(
+        ForeignKey("Position.positionId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="relative position, null otherwise",
+    )
+    posX = Column(Float(asdecimal=True))
+    posY = Column(Float(asdecimal=True))
+    posZ = Column(Float(asdecimal=True))
+    scale = Column(Float(asdecimal=True))
+    recordTimeStamp = Column(DateTime, comment="Creation or last update date/time")
+
+    parent = relationship("Position", remote_side=[positionId])
+
+
+class SafetyLevel(Base):
+    __tablename__ = "SafetyLevel"
+
+    safetyLevelId = Column(INTEGER(11), primary_key=True)
+    code = Column(String(45))
+    description = Column(String(45))
+
+
+class DiffractionPlanHasDetector(Base):
+    __tablename__ = "DiffractionPlan_has_Detector"
+
+    diffractionPlanId = Column(
+        ForeignKey("DiffractionPlan.diffractionPlanId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    detectorId = Column(
+        ForeignKey("Detector.detectorId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    )
+    exposureTime = Column(Float(asdecimal=True))
+    distance = Column(Float(asdecimal=True))
+    orientation = Column(Float(asdecimal=True))
+
+    Detector = relationship("Detector")
+    DiffractionPlan = relationship("DiffractionPlan")
+
+
+class ExperimentKindDetails(Base):
+    __tablename__ = "ExperimentKindDetails"
+
+    experimentKindId = Column(INTEGER(10), primary_key=True)
+    diffractionPlanId = Column(
+        ForeignKey(
+            "DiffractionPlan.diffractionPlanId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        nullable=False,
+        index=True,
+    )
+    exposureIndex = Column(INTEGER(10))
+    dataCollectionType = Column(String(45))
+    dataCollectionKind = Column(String(45))
+    wedgeValue = Column(Float)
+
+    DiffractionPlan = relationship("DiffractionPlan")
+
+
+class Component(Base):
+    __tablename__ = "Component"
+    __table_args__ = {
+        "comment": "Description of a component that can be used inside a crystal or a sample."
+    }
+
+    componentId = Column(INTEGER(11), primary_key=True)
+    componentTypeId = Column(
+        ForeignKey("ComponentType.componentTypeId"), nullable=False, index=True
+    )
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    name = Column(String(255), nullable=False)
+    composition = Column(String(255))
+
+    ComponentType = relationship("ComponentType")
+    Proposal = relationship("Proposal")
+
+
+class LabContact(Base):
+    __tablename__ = "LabContact"
+    __table_args__ = (
+        Index("cardNameAndProposal", "cardName", "proposalId", unique=True),
+        Index("personAndProposal", "personId", "proposalId", unique=True),
+    )
+
+    labContactId = Column(INTEGER(10), primary_key=True)
+    personId = Column(ForeignKey("Person.personId", ondelete="CASCADE"), nullable=False)
+    cardName = Column(String(40), nullable=False)
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    defaultCourrierCompany = Column(String(45))
+    courierAccount = Column(String(45))
+    billingReference = Column(String(45))
+    dewarAvgCustomsValue = Column(INTEGER(10), nullable=False, server_default=text("0"))
+    dewarAvgTransportValue = Column(
+        INTEGER(10), nullable=False, server_default=text("0")
+    )
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+
+    Person = relationship("Person")
+    Proposal = relationship("Proposal")
+
+
+class Protein(Base):
+    __tablename__ = "Protein"
+    __table_args__ = (Index("ProteinAcronym_Index", "proposalId", "acronym"),)
+
+    proteinId = Column(INTEGER(10), primary_key=True)
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    name = Column(VARCHAR(255))
+    acronym = Column(String(45), index=True)
+    description = deferred(
+        Column(Text, comment="A description/summary using words and sentences"),
+        group="large",
+    )
+    hazardGroup = Column(
+        TINYINT(3),
+        nullable=False,
+        server_default=text("1"),
+        comment="A.k.a. risk group",
+    )
+    containmentLevel = Column(
+        TINYINT(3),
+        nullable=False,
+        server_default=text("1"),
+        comment="A.k.a. biosafety level, which indicates the level of containment required",
+    )
+    safetyLevel = Column(Enum("GREEN", "YELLOW", "RED"))
+    molecularMass = Column(Float(asdecimal=True))
+    proteinType = Column(String(45))
+    sequence = deferred(Column(Text), group="large")
+    personId = Column(INTEGER(10), index=True)
+    bltimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+    isCreatedBySampleSheet = Column(TINYINT(1), server_default=text("0"))
+    externalId = Column(BINARY(16))
+    componentTypeId = Column(
+        ForeignKey(
+            "ComponentType.componentTypeId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    modId = Column(String(20))
+    concentrationTypeId = Column(INTEGER(10))
+    _global = Column("global", TINYINT(1), server_default=text("0"))
+
+    ComponentType = relationship("ComponentType")
+    Proposal = relationship("Proposal")
+    ComponentSubType = relationship(
+        "ComponentSubType", secondary="Component_has_SubType"
+    )
+
+
+class Screen(Base):
+    __tablename__ = "Screen"
+
+    screenId = Column(INTEGER(10), primary_key=True)
+    name = Column(String(45))
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE"), index=True
+    )
+    _global = Column("global", TINYINT(1))
+
+    Proposal = relationship("Proposal")
+
+
+class BLSessionHasSCPosition(Base):
+    __tablename__ = "BLSession_has_SCPosition"
+
+    blsessionhasscpositionid = Column(INTEGER(10), primary_key=True)
+    blsessionid = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    scContainer = Column(
+        SMALLINT(5), comment="Position of container within sample changer"
+    )
+    containerPosition = Column(
+        SMALLINT(5), comment="Position of sample within container"
+    )
+
+    BLSession = relationship("BLSession")
+
+
+t_Component_has_SubType = Table(
+    "Component_has_SubType",
+    metadata,
+    Column(
+        "componentId",
+        ForeignKey("Protein.proteinId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "componentSubTypeId",
+        ForeignKey(
+            "ComponentSubType.componentSubTypeId",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class Crystal(Base):
+    __tablename__ = "Crystal"
+
+    crystalId = Column(INTEGER(10), primary_key=True)
+    diffractionPlanId = Column(
+        ForeignKey(
+            "DiffractionPlan.diffractionPlanId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    proteinId = Column(
+        ForeignKey("Protein.proteinId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    crystalUUID = Column(String(45))
+    name = Column(String(255))
+    spaceGroup = Column(String(20))
+    morphology = Column(String(255))
+    color = Column(String(45))
+    size_X = Column(Float(asdecimal=True))
+    size_Y = Column(Float(asdecimal=True))
+    size_Z = Column(Float(asdecimal=True))
+    cell_a = Column(Float(asdecimal=True))
+    cell_b = Column(Float(asdecimal=True))
+    cell_c = Column(Float(asdecimal=True))
+    cell_alpha = Column(Float(asdecimal=True))
+    cell_beta = Column(Float(asdecimal=True))
+    cell_gamma = Column(Float(asdecimal=True))
+    comments = Column(String(255))
+    pdbFileName = Column(String(255), comment="pdb file name")
+    pdbFilePath = deferred(Column(String(1024), comment="pdb file path"), group="large")
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+    abundance = Column(Float)
+    packingFraction = Column(Float)
+
+    DiffractionPlan = relationship("DiffractionPlan")
+    Protein = relationship("Protein")
+
+
+class DewarRegistry(Base):
+    __tablename__ = "DewarRegistry"
+
+    dewarRegistryId = Column(INTEGER(11), primary_key=True)
+    facilityCode = Column(String(20), nullable=False, unique=True)
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", onupdate="CASCADE"), index=True
+    )
+    labContactId = Column(
+        ForeignKey("LabContact.labContactId", ondelete="SET NULL", onupdate="CASCADE"),
+        index=True,
+    )
+    purchaseDate = Column(DateTime)
+    bltimestamp = Column(
+        DateTime, nullable=False, server_default=text("current_timestamp()")
+    )
+
+    LabContact = relationship("LabContact")
+    Proposal = relationship("Proposal")
+
+
+t_Project_has_Protein = Table(
+    "Project_has_Protein",
+    metadata,
+    Column(
+        "projectId",
+        ForeignKey("Project.projectId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "proteinId",
+        ForeignKey("Protein.proteinId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class ProteinHasLattice(Base):
+    __tablename__ = "Protein_has_Lattice"
+
+    proteinId = Column(
+        ForeignKey("Protein.proteinId", ondelete="CASCADE"), primary_key=True
+    )
+    cell_a = Column(Float(asdecimal=True))
+    cell_b = Column(Float(asdecimal=True))
+    cell_c = Column(Float(asdecimal=True))
+    cell_alpha = Column(Float(asdecimal=True))
+    cell_beta = Column(Float(asdecimal=True))
+    cell_gamma = Column(Float(asdecimal=True))
+
+    Protein = relationship("Protein", uselist=False)
+
+
+class ProteinHasPDB(Base):
+    __tablename__ = "Protein_has_PDB"
+
+    proteinhaspdbid = Column(INTEGER(10), primary_key=True)
+    proteinid = Column(
+        ForeignKey("Protein.proteinId", ondelete="CASCADE"), nullable=False, index=True
+    )
+    pdbid = Column(
+        ForeignKey("PDB.pdbId", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    PDB = relationship("PDB")
+    Protein = relationship("Protein")
+
+
+class ScreenComponentGroup(Base):
+    __tablename__ = "ScreenComponentGroup"
+
+    screenComponentGroupId = Column(INTEGER(10), primary_key=True)
+    screenId = Column(
+        ForeignKey("Screen.screenId", ondelete="CASCADE"), nullable=False, index=True
+    )
+    position = Column(SMALLINT(6))
+
+    Screen = relationship("Screen")
+
+
+class Shipping(Base):
+    __tablename__ = "Shipping"
+
+    shippingId = Column(INTEGER(10), primary_key=True)
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+        server_default=text("0"),
+    )
+    shippingName = Column(String(45), index=True)
+    deliveryAgent_agentName = Column(String(45))
+    deliveryAgent_shippingDate = Column(Date)
+    deliveryAgent_deliveryDate = Column(Date)
+    deliveryAgent_agentCode = Column(String(45))
+    deliveryAgent_flightCode = Column(String(45))
+    shippingStatus = Column(String(45), index=True)
+    bltimeStamp = Column(DateTime)
+    laboratoryId = Column(INTEGER(10), index=True)
+    isStorageShipping = Column(TINYINT(1), server_default=text("0"))
+    creationDate = Column(DateTime, index=True)
+    comments = Column(String(255))
+    sendingLabContactId = Column(
+        ForeignKey("LabContact.labContactId", ondelete="CASCADE"), index=True
+    )
+    returnLabContactId = Column(
+        ForeignKey("LabContact.labContactId", ondelete="CASCADE"), index=True
+    )
+    returnCourier = Column(String(45))
+    dateOfShippingToUser = Column(DateTime)
+    shippingType = Column(String(45))
+    safetyLevel = Column(String(8))
+
+    Proposal = relationship("Proposal")
+    LabContact = relationship(
+        "LabContact",
+        primaryjoin="Shipping.returnLabContactId == LabContact.labContactId",
+    )
+    LabContact1 = relationship(
+        "LabContact",
+        primaryjoin="Shipping.sendingLabContactId == LabContact.labContactId",
+    )
+
+
+class BLSampleTypeHasComponent(Base):
+    __tablename__ = "BLSampleType_has_Component"
+
+    blSampleTypeId = Column(
+        ForeignKey("Crystal.crystalId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    componentId = Column(
+        ForeignKey("Protein.proteinId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    )
+    abundance = Column(Float)
+
+    Crystal = relationship("Crystal")
+    Protein = relationship("Protein")
+
+
+class CrystalComposition(Base):
+    __tablename__ = "CrystalComposition"
+    __table_args__ = {
+        "comment": "Links a crystal to it's components with a specified abundance or ratio."
+    }
+
+    crystalCompositionId = Column(INTEGER(11), primary_key=True)
+    componentId = Column(
+        ForeignKey("Component.componentId"), nullable=False, index=True
+    )
+    crystalId = Column(ForeignKey("Crystal.crystalId"), nullable=False, index=True)
+    concentrationTypeId = Column(
+        ForeignKey("ConcentrationType.concentrationTypeId"), index=True
+    )
+    abundance = Column(
+        Float,
+        comment="Abundance or oncentration in the unit defined by concentrationTypeId.",
+    )
+    ratio = Column(Float)
+    ph = Column(Float)
+
+    Component = relationship("Component")
+    ConcentrationType = relationship("ConcentrationType")
+    Crystal = relationship("Crystal")
+
+
+class CrystalHasUUID(Base):
+    __tablename__ = "Crystal_has_UUID"
+
+    crystal_has_UUID_Id = Column(INTEGER(10), primary_key=True)
+    crystalId = Column(
+        ForeignKey("Crystal.crystalId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    UUID = Column(String(45), index=True)
+    imageURL = Column(String(255))
+
+    Crystal = relationship("Crystal")
+
+
+class Dewar(Base):
+    __tablename__ = "Dewar"
+
+    dewarId = Column(INTEGER(10), primary_key=True)
+    shippingId = Column(
+        ForeignKey("Shipping.shippingId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    code = Column(String(45), index=True)
+    comments = Column(TINYTEXT)
+    storageLocation = Column(String(45))
+    dewarStatus = Column(String(45), index=True)
+    bltimeStamp = Column(TIMESTAMP, server_default=text("current_timestamp()"))
+    isStorageDewar = Column(TINYINT(1), server_default=text("0"))
+    barCode = Column(String(45), unique=True)
+    firstExperimentId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    customsValue = Column(INTEGER(10))
+    transportValue = Column(INTEGER(10))
+    trackingNumberToSynchrotron = Column(String(30))
+    trackingNumberFromSynchrotron = Column(String(30))
+    facilityCode = Column(String(20), comment="Unique barcode assigned to each dewar")
+    type = Column(
+        Enum("Dewar", "Toolbox"), nullable=False, server_default=text("'Dewar'")
+    )
+    isReimbursed = Column(
+        TINYINT(1),
+        server_default=text("0"),
+        comment="set this dewar as reimbursed by the user office",
+    )
+
+    BLSession = relationship("BLSession")
+    Shipping = relationship("Shipping")
+
+
+class DewarRegistryHasProposal(Base):
+    __tablename__ = "DewarRegistry_has_Proposal"
+    __table_args__ = (
+        Index("dewarRegistryId", "dewarRegistryId", "proposalId", unique=True),
+    )
+
+    dewarRegistryHasProposalId = Column(INTEGER(10), primary_key=True)
+    dewarRegistryId = Column(
+        ForeignKey("DewarRegistry.dewarRegistryId", ondelete="CASCADE")
+    )
+    proposalId = Column(
+        ForeignKey("Proposal.proposalId", ondelete="CASCADE"), index=True
+    )
+    personId = Column(
+        ForeignKey("Person.personId", ondelete="CASCADE"),
+        index=True,
+        comment="Person registering the dewar",
+    )
+    recordTimestamp = Column(DateTime, server_default=text("current_timestamp()"))
+    labContactId = Column(
+        ForeignKey("LabContact.labContactId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="Owner of the dewar",
+    )
+
+    DewarRegistry = relationship("DewarRegistry")
+    LabContact = relationship("LabContact")
+    Person = relationship("Person")
+    Proposal = relationship("Proposal")
+
+
+t_Project_has_Shipping = Table(
+    "Project_has_Shipping",
+    metadata,
+    Column(
+        "projectId",
+        ForeignKey("Project.projectId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "shippingId",
+        ForeignKey("Shipping.shippingId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class ScreenComponent(Base):
+    __tablename__ = "ScreenComponent"
+
+    screenComponentId = Column(INTEGER(10), primary_key=True)
+    screenComponentGroupId = Column(
+        ForeignKey("ScreenComponentGroup.screenComponentGroupId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    componentId = Column(
+        ForeignKey("Protein.proteinId", ondelete="CASCADE"), index=True
+    )
+    concentration = Column(Float)
+    pH = Column(Float)
+
+    Protein = relationship("Protein")
+    ScreenComponentGroup = relationship("ScreenComponentGroup")
+
+
+t_ShippingHasSession = Table(
+    "ShippingHasSession",
+    metadata,
+    Column(
+        "shippingId",
+        ForeignKey("Shipping.shippingId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+    Column(
+        "sessionId",
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class Container(Base):
+    __tablename__ = "Container"
+
+    containerId = Column(INTEGER(10), primary_key=True)
+    dewarId = Column(
+        ForeignKey("Dewar.dewarId", ondelete="CASCADE", onupdate="CASCADE"), index=True
+    )
+    code = Column(String(45))
+    containerType = Column(String(20))
+    capacity = Column(INTEGER(10))
+    beamlineLocation = Column(String(20), index=True)
+    sampleChangerLocation = Column(String(20))
+    containerStatus = Column(String(45), index=True)
+    bltimeStamp = Column(DateTime)
+    barcode = Column(String(45), unique=True)
+    sessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE"), index=True
+    )
+    ownerId = Column(ForeignKey("Person.personId", ondelete="CASCADE"), index=True)
+    screenId = Column(INTEGER(10))
+    scheduleId = Column(INTEGER(10))
+    imagerId = Column(INTEGER(10))
+    scLocationUpdated = Column(DateTime)
+    requestedImagerId = Column(INTEGER(10))
+    requestedReturn = Column(
+        TINYINT(1),
+        server_default=text("0"),
+        comment="True for requesting return, False means container will be disposed",
+    )
+    comments = Column(String(255))
+    experimentType = Column(String(20))
+    storageTemperature = Column(Float)
+
+    Dewar = relationship("Dewar")
+    Person = relationship("Person")
+    BLSession = relationship("BLSession")
+
+
+class DewarTransportHistory(Base):
+    __tablename__ = "DewarTransportHistory"
+
+    DewarTransportHistoryId = Column(INTEGER(10), primary_key=True)
+    dewarId = Column(
+        ForeignKey("Dewar.dewarId", ondelete="CASCADE", onupdate="CASCADE"), index=True
+    )
+    dewarStatus = Column(String(45), nullable=False)
+    storageLocation = Column(String(45))
+    arrivalDate = Column(DateTime)
+
+    Dewar = relationship("Dewar")
+
+
+class BLSample(Base):
+    __tablename__ = "BLSample"
+    __table_args__ = (Index("crystalId", "crystalId", "containerId"),)
+
+    blSampleId = Column(INTEGER(10), primary_key=True)
+    diffractionPlanId = Column(
+        ForeignKey(
+            "DiffractionPlan.diffractionPlanId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    crystalId = Column(
+        ForeignKey("Crystal.crystalId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    containerId = Column(
+        ForeignKey("Container.containerId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    name = Column(String(100), index=True)
+    code = Column(String(45))
+    location = Column(String(45))
+    holderLength = Column(Float(asdecimal=True))
+    loopLength = Column(Float(asdecimal=True))
+    loopType = Column(String(45))
+    wireWidth = Column(Float(asdecimal=True))
+    comments = deferred(Column(String(1024)), group="large")
+    completionStage = Column(String(45))
+    structureStage = Column(String(45))
+    publicationStage = Column(String(45))
+    publicationComments = Column(String(255))
+    blSampleStatus = Column(String(20), index=True)
+    isInSampleChanger = Column(TINYINT(1))
+    lastKnownCenteringPosition = Column(String(255))
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+    SMILES = Column(
+        String(400),
+        comment="the symbolic description of the structure of a chemical compound",
+    )
+    lastImageURL = Column(String(255))
+    positionId = Column(INTEGER(10))
+    blSubSampleId = Column(INTEGER(10))
+    screenComponentGroupId = Column(INTEGER(10), index=True)
+    volume = Column(Float)
+    dimension1 = Column(Float(asdecimal=True))
+    dimension2 = Column(Float(asdecimal=True))
+    dimension3 = Column(Float(asdecimal=True))
+    shape = Column(String(15))
+    subLocation = Column(
+        SMALLINT(5),
+        comment="Indicates the sample's location on a multi-sample pin, where 1 is closest to the pin base",
+    )
+
+    Container = relationship("Container")
+    Crystal = relationship("Crystal")
+    DiffractionPlan = relationship("DiffractionPlan")
+    DiffractionPlan1 = relationship(
+        "DiffractionPlan", secondary="BLSample_has_DiffractionPlan"
+    )
+    Project = relationship("Project", secondary="Project_has_BLSample")
+
+
+class ContainerHistory(Base):
+    __tablename__ = "ContainerHistory"
+
+    containerHistoryId = Column(INTEGER(10), primary_key=True)
+    containerId = Column(
+        ForeignKey("Container.containerId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    location = Column(String(45))
+    blTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+    status = Column(String(45))
+
+    Container = relationship("Container")
+
+
+class ContainerInspection(Base):
+    __tablename__ = "ContainerInspection"
+
+    containerInspectionId = Column(INTEGER(10), primary_key=True)
+    containerId = Column(
+        ForeignKey("Container.containerId", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    inspectionTypeId = Column(
+        ForeignKey("InspectionType.inspectionTypeId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    imagerId = Column(ForeignKey("Imager.imagerId", ondelete="CASCADE"), index=True)
+    temperature = Column(Float)
+    blTimeStamp = Column(DateTime)
+    scheduleComponentid = Column(
+        ForeignKey("ScheduleComponent.scheduleComponentId", ondelete="CASCADE"),
+        index=True,
+    )
+    state = Column(String(20))
+    priority = Column(SMALLINT(6))
+    manual = Column(TINYINT(1))
+    scheduledTimeStamp = Column(DateTime)
+    completedTimeStamp = Column(DateTime)
+
+    Container = relationship("Container")
+    Imager = relationship("Imager")
+    InspectionType = relationship("InspectionType")
+    ScheduleComponent = relationship("ScheduleComponent")
+
+
+class ContainerQueue(Base):
+    __tablename__ = "ContainerQueue"
+
+    containerQueueId = Column(INTEGER(10), primary_key=True)
+    containerId = Column(
+        ForeignKey("Container.containerId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    personId = Column(
+        ForeignKey("Person.personId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    createdTimeStamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("current_timestamp()")
+    )
+    completedTimeStamp = Column(TIMESTAMP)
+
+    Container = relationship("Container")
+    Person = relationship("Person")
+
+
+class BLSampleGroupHasBLSample(Base):
+    __tablename__ = "BLSampleGroup_has_BLSample"
+
+    blSampleGroupId = Column(
+        ForeignKey("BLSampleGroup.blSampleGroupId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    blSampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    )
+    order = Column(MEDIUMINT(9))
+    type = Column(Enum("background", "container", "sample", "calibrant"))
+
+    BLSampleGroup = relationship("BLSampleGroup")
+    BLSample = relationship("BLSample")
+
+
+class BLSampleImage(Base):
+    __tablename__ = "BLSampleImage"
+
+    blSampleImageId = Column(INTEGER(10), primary_key=True)
+    blSampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    micronsPerPixelX = Column(Float)
+    micronsPerPixelY = Column(Float)
+    imageFullPath = Column(String(255))
+    blSampleImageScoreId = Column(INTEGER(11))
+    comments = Column(String(255))
+    blTimeStamp = Column(DateTime)
+    containerInspectionId = Column(
+        ForeignKey("ContainerInspection.containerInspectionId", ondelete="CASCADE"),
+        index=True,
+    )
+    modifiedTimeStamp = Column(DateTime)
+
+    BLSample = relationship("BLSample")
+    ContainerInspection = relationship("ContainerInspection")
+
+
+t_BLSample_has_DiffractionPlan = Table(
+    "BLSample_has_DiffractionPlan",
+    metadata,
+    Column(
+        "blSampleId",
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "diffractionPlanId",
+        ForeignKey("DiffractionPlan.diffractionPlanId", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class BLSubSample(Base):
+    __tablename__ = "BLSubSample"
+
+    blSubSampleId = Column(
+        INTEGER(10), primary_key=True, comment="Primary key (auto-incremented)"
+    )
+    blSampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="sample",
+    )
+    diffractionPlanId = Column(
+        ForeignKey(
+            "DiffractionPlan.diffractionPlanId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+        comment="eventually diffractionPlan",
+    )
+    positionId = Column(
+        ForeignKey("Position.positionId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+        comment="position of the subsample",
+    )
+    position2Id = Column(
+        ForeignKey("Position.positionId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+    blSubSampleUUID = Column(String(45), comment="uuid of the blsubsample")
+    imgFileName = Column(String(255), comment="image filename")
+    imgFilePath = deferred(Column(String(1024), comment="url image"), group="large")
+    comments = deferred(Column(String(1024), comment="comments"), group="large")
+    recordTimeStamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp()"),
+        comment="Creation or last update date/time",
+    )
+    motorPositionId = Column(
+        ForeignKey(
+            "MotorPosition.motorPositionId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+        comment="motor position",
+    )
+
+    BLSample = relationship("BLSample")
+    DiffractionPlan = relationship("DiffractionPlan")
+    MotorPosition = relationship("MotorPosition")
+    Position = relationship(
+        "Position", primaryjoin="BLSubSample.position2Id == Position.positionId"
+    )
+    Position1 = relationship(
+        "Position", primaryjoin="BLSubSample.positionId == Position.positionId"
+    )
+
+
+t_Project_has_BLSample = Table(
+    "Project_has_BLSample",
+    metadata,
+    Column(
+        "projectId",
+        ForeignKey("Project.projectId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "blSampleId",
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+)
+
+
+class RobotAction(Base):
+    __tablename__ = "RobotAction"
+    __table_args__ = {"comment": "Robot actions as reported by MXCube"}
+
+    robotActionId = Column(INTEGER(10), primary_key=True)
+    blsessionId = Column(
+        ForeignKey("BLSession.sessionId", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    blsampleId = Column(
+        ForeignKey("BLSample.blSampleId", ondelete="CASCADE"), index=True
+    )
+    actionType = Column(Enum("LOAD", "UNLOAD", "DISPOSE", "STORE", "WASH", "ANNEAL"))
+    startTimestamp = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=text("current_timestamp() ON UPDATE current_timestamp()"),
+    )
+    endTimestamp = Column(
+        TIMESTAMP, nullable=False, server_default=text("'0000-00-00 00:00:00'")
+    )
+    status = Column(Enum("SUCCESS", "ERROR", "CRITICAL", "WARNING", "COMMANDNOTSENT"))
+    message = Column(String(255))
+    containerLocation = Column(SMALLINT(6))
+    dewarLocation = Column(SMALLINT(6))
+    sampleBarcode = Column(String(45))
+    xtalSnapshotBefore = Column(String(255))
+    xtalSnapshotAfter = Column(String(255))
+
+    BLSample = relationship("BLSample")
+    BLSession = relationship("BLSession")
+
+
+class SampleComposition(Base):
+    __tablename__ = "SampleComposition"
+    __table_args__ = {
+        "comment": "Links a sample to it's components with a specified abundance or ratio."
+    }
+
+    sampleCompositionId = Column(INTEGER(11), primary_key=True)
+    componentId = Column(
+        ForeignKey("Component.componentId"), nullable=False, index=True
+    )
+    blSampleId = Column(ForeignKey("BLSample.blSampleId"), nullable=False, index=True)
+    concentrationTypeId = Column(
+        ForeignKey("ConcentrationType.concentrationTypeId"), index=True
+    )
+    abundance = Column(
+        Float,
+        comment="Abundance or oncentration in the unit defined by concentrationTypeId.",
+    )
+    ratio = Column(Float)
+    ph = Column(Float)
+
+    BLSample = relationship("BLSample")
+    Component = relationship("Component")
+    ConcentrationType = relationship("ConcentrationType")
+
+
+class BLSampleImageAnalysis(Base):
+    __tablename__ = "BLSampleImageAnalysis"
+
+    blSampleImageAnalysisId = Column(INTEGER(10), primary_key=True)
+    blSampleImageId = Column(
+        ForeignKey("BLSampleImage.blSampleImageId", ondelete="CASCADE"), index=True
+    )
+    oavSnapshotBefore = Column(String(255))
+    oavSnapshotAfter = Column(String(255))
+    deltaX = Column(INTEGER(11))
+    deltaY = Column(INTEGER(11))
+    goodnessOfFit = Column(Float)
+    scaleFactor = Column(Float)
+    resultCode = Column(String(15))
+    matchStartTimeStamp = Column(TIMESTAMP, server_default=text("current_timestamp()"))
+    matchEndTimeStamp = Column(TIMESTAMP)
+
+    BLSampleImage = relationship("BLSampleImage")
+
+
+class ContainerQueueSample(Base):
+    __tablename__ = "ContainerQueueSample"
+
+    containerQueueSampleId = Column(INTEGER(10), primary_key=True)
+    containerQueueId = Column(
+        ForeignKey(
+            "ContainerQueue.containerQueueId", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        index=True,
+    )
+    blSubSampleId = Column(
+        ForeignKey("BLSubSample.blSubSampleId", ondelete="CASCADE", onupdate="CASCADE"),
+        index=True,
+    )
+
+    BLSubSample = relationship("BLSubSample")
+    ContainerQueue = relationship("ContainerQueue")
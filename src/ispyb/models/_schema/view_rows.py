@@ -0,0 +1,1468 @@
+# coding: utf-8
+# Generated by generate_view_rows.py, do not edit
+import datetime
+import decimal
+from typing import NamedTuple, Optional
+
+
+class VAnalysisInfo(NamedTuple):
+    """A row of V_AnalysisInfo"""
+
+    experimentCreationDate: Optional[datetime.datetime]
+    timeStart: Optional[str]
+    dataCollectionId: Optional[int]
+    measurementId: Optional[int]
+    proposalId: Optional[int]
+    proposalCode: Optional[str]
+    proposalNumber: Optional[str]
+    priorityLevelId: Optional[int]
+    code: Optional[str]
+    exposureTemperature: Optional[str]
+    transmission: Optional[str]
+    measurementComments: Optional[str]
+    experimentComments: Optional[str]
+    experimentId: Optional[int]
+    experimentType: Optional[str]
+    conc: Optional[str]
+    bufferAcronym: Optional[str]
+    macromoleculeAcronym: Optional[str]
+    bufferId: Optional[int]
+    macromoleculeId: Optional[int]
+    subtractedFilePath: Optional[str]
+    rgGuinier: Optional[str]
+    firstPointUsed: Optional[str]
+    lastPointUsed: Optional[str]
+    I0: Optional[str]
+    isagregated: Optional[str]
+    subtractionId: Optional[int]
+    rgGnom: Optional[str]
+    total: Optional[str]
+    dmax: Optional[str]
+    volume: Optional[str]
+    i0stdev: Optional[str]
+    quality: Optional[str]
+    substractionCreationTime: Optional[datetime.datetime]
+    bufferBeforeMeasurementId: Optional[int]
+    bufferAfterMeasurementId: Optional[int]
+    bufferBeforeFramesMerged: Optional[str]
+    bufferBeforeMergeId: Optional[int]
+    bufferBeforeAverageFilePath: Optional[str]
+    sampleMeasurementId: Optional[int]
+    sampleMergeId: Optional[int]
+    averageFilePath: Optional[str]
+    framesMerge: Optional[str]
+    framesCount: Optional[str]
+    bufferAfterFramesMerged: Optional[str]
+    bufferAfterMergeId: Optional[int]
+    bufferAfterAverageFilePath: Optional[str]
+    modelListId1: Optional[int]
+    nsdFilePath: Optional[str]
+    modelListId2: Optional[int]
+    chi2RgFilePath: Optional[str]
+    averagedModel: Optional[str]
+    averagedModelId: Optional[int]
+    rapidShapeDeterminationModel: Optional[str]
+    rapidShapeDeterminationModelId: Optional[int]
+    shapeDeterminationModel: Optional[str]
+    shapeDeterminationModelId: Optional[int]
+    abInitioModelId: Optional[int]
+    comments: Optional[str]
+
+
+class VLog4Stat(NamedTuple):
+    """A row of v_Log4Stat"""
+
+    id: Optional[int]
+    priority: Optional[str]
+    timestamp: Optional[datetime.datetime]
+    msg: Optional[str]
+    detail: Optional[str]
+    value: Optional[str]
+
+
+class VDatacollection(NamedTuple):
+    """A row of v_datacollection"""
+
+    dataCollectionId: Optional[int]
+    dataCollectionGroupId: Optional[int]
+    strategySubWedgeOrigId: Optional[int]
+    detectorId: Optional[int]
+    blSubSampleId: Optional[int]
+    dataCollectionNumber: Optional[int]
+    startTime: Optional[datetime.datetime]
+    endTime: Optional[datetime.datetime]
+    runStatus: Optional[str]
+    axisStart: Optional[float]
+    axisEnd: Optional[float]
+    axisRange: Optional[float]
+    overlap: Optional[float]
+    numberOfImages: Optional[int]
+    startImageNumber: Optional[int]
+    numberOfPasses: Optional[int]
+    exposureTime: Optional[float]
+    imageDirectory: Optional[str]
+    imagePrefix: Optional[str]
+    imageSuffix: Optional[str]
+    fileTemplate: Optional[str]
+    wavelength: Optional[float]
+    resolution: Optional[float]
+    detectorDistance: Optional[float]
+    xBeam: Optional[float]
+    yBeam: Optional[float]
+    xBeamPix: Optional[float]
+    yBeamPix: Optional[float]
+    comments: Optional[str]
+    printableForReport: Optional[int]
+    slitGapVertical: Optional[float]
+    slitGapHorizontal: Optional[float]
+    transmission: Optional[float]
+    synchrotronMode: Optional[str]
+    xtalSnapshotFullPath1: Optional[str]
+    xtalSnapshotFullPath2: Optional[str]
+    xtalSnapshotFullPath3: Optional[str]
+    xtalSnapshotFullPath4: Optional[str]
+    rotationAxis: Optional[str]
+    phiStart: Optional[float]
+    kappaStart: Optional[float]
+    omegaStart: Optional[float]
+    resolutionAtCorner: Optional[float]
+    detector2Theta: Optional[float]
+    undulatorGap1: Optional[float]
+    undulatorGap2: Optional[float]
+    undulatorGap3: Optional[float]
+    beamSizeAtSampleX: Optional[float]
+    beamSizeAtSampleY: Optional[float]
+    centeringMethod: Optional[str]
+    averageTemperature: Optional[float]
+    actualCenteringPosition: Optional[str]
+    beamShape: Optional[str]
+    flux: Optional[decimal.Decimal]
+    flux_end: Optional[decimal.Decimal]
+    totalAbsorbedDose: Optional[decimal.Decimal]
+    bestWilsonPlotPath: Optional[str]
+    imageQualityIndicatorsPlotPath: Optional[str]
+    imageQualityIndicatorsCSVPath: Optional[str]
+    sessionId: Optional[int]
+    proposalId: Optional[int]
+    workflowId: Optional[int]
+    AutoProcIntegration_dataCollectionId: Optional[int]
+    autoProcScalingId: Optional[int]
+    cell_a: Optional[float]
+    cell_b: Optional[float]
+    cell_c: Optional[float]
+    cell_alpha: Optional[float]
+    cell_beta: Optional[float]
+    cell_gamma: Optional[float]
+    anomalous: Optional[int]
+    scalingStatisticsType: Optional[str]
+    resolutionLimitHigh: Optional[float]
+    resolutionLimitLow: Optional[float]
+    completeness: Optional[float]
+    AutoProc_spaceGroup: Optional[str]
+    autoProcId: Optional[int]
+    rMerge: Optional[float]
+    ccHalf: Optional[float]
+    meanIOverSigI: Optional[float]
+    AutoProcIntegration_autoProcIntegrationId: Optional[int]
+    AutoProcProgram_processingPrograms: Optional[str]
+    AutoProcProgram_processingStatus: Optional[str]
+    AutoProcProgram_autoProcProgramId: Optional[int]
+    ScreeningOutput_rankingResolution: Optional[decimal.Decimal]
+
+
+class VDatacollectionAutoprocintegration(NamedTuple):
+    """A row of v_datacollection_autoprocintegration"""
+
+    v_datacollection_summary_phasing_autoProcIntegrationId: Optional[int]
+    v_datacollection_summary_phasing_dataCollectionId: Optional[int]
+    v_datacollection_summary_phasing_cell_a: Optional[float]
+    v_datacollection_summary_phasing_cell_b: Optional[float]
+    v_datacollection_summary_phasing_cell_c: Optional[float]
+    v_datacollection_summary_phasing_cell_alpha: Optional[float]
+    v_datacollection_summary_phasing_cell_beta: Optional[float]
+    v_datacollection_summary_phasing_cell_gamma: Optional[float]
+    v_datacollection_summary_phasing_anomalous: Optional[int]
+    v_datacollection_summary_phasing_autoproc_space_group: Optional[str]
+    v_datacollection_summary_phasing_autoproc_autoprocId: Optional[int]
+    v_datacollection_summary_phasing_autoProcScalingId: Optional[int]
+    v_datacollection_processingPrograms: Optional[str]
+    v_datacollection_summary_phasing_autoProcProgramId: Optional[int]
+    v_datacollection_processingStatus: Optional[str]
+    v_datacollection_processingStartTime: Optional[datetime.datetime]
+    v_datacollection_processingEndTime: Optional[datetime.datetime]
+    v_datacollection_summary_session_sessionId: Optional[int]
+    v_datacollection_summary_session_proposalId: Optional[int]
+    AutoProcIntegration_dataCollectionId: Optional[int]
+    AutoProcIntegration_autoProcIntegrationId: Optional[int]
+    PhasingStep_phasing_phasingStepType: Optional[str]
+    SpaceGroup_spaceGroupShortName: Optional[str]
+    Protein_proteinId: Optional[int]
+    Protein_acronym: Optional[str]
+    BLSample_name: Optional[str]
+    DataCollection_dataCollectionNumber: Optional[int]
+    DataCollection_imagePrefix: Optional[str]
+
+
+class VDatacollectionPhasing(NamedTuple):
+    """A row of v_datacollection_phasing"""
+
+    phasingStepId: Optional[int]
+    previousPhasingStepId: Optional[int]
+    phasingAnalysisId: Optional[int]
+    autoProcIntegrationId: Optional[int]
+    dataCollectionId: Optional[int]
+    anomalous: Optional[int]
+    spaceGroup: Optional[str]
+    autoProcId: Optional[int]
+    phasingStepType: Optional[str]
+    method: Optional[str]
+    solventContent: Optional[str]
+    enantiomorph: Optional[str]
+    lowRes: Optional[str]
+    highRes: Optional[str]
+    autoProcScalingId: Optional[int]
+    spaceGroupShortName: Optional[str]
+    processingPrograms: Optional[str]
+    processingStatus: Optional[str]
+    phasingPrograms: Optional[str]
+    phasingStatus: Optional[int]
+    phasingStartTime: Optional[datetime.datetime]
+    phasingEndTime: Optional[datetime.datetime]
+    sessionId: Optional[int]
+    proposalId: Optional[int]
+    blSampleId: Optional[int]
+    name: Optional[str]
+    code: Optional[str]
+    acronym: Optional[str]
+    proteinId: Optional[int]
+
+
+class VDatacollectionPhasingProgramRun(NamedTuple):
+    """A row of v_datacollection_phasing_program_run"""
+
+    phasingStepId: Optional[int]
+    previousPhasingStepId: Optional[int]
+    phasingAnalysisId: Optional[int]
+    autoProcIntegrationId: Optional[int]
+    dataCollectionId: Optional[int]
+    autoProcId: Optional[int]
+    phasingStepType: Optional[str]
+    method: Optional[str]
+    autoProcScalingId: Optional[int]
+    spaceGroupShortName: Optional[str]
+    phasingPrograms: Optional[str]
+    phasingStatus: Optional[int]
+    sessionId: Optional[int]
+    proposalId: Optional[int]
+    blSampleId: Optional[int]
+    name: Optional[str]
+    code: Optional[str]
+    acronym: Optional[str]
+    proteinId: Optional[int]
+    phasingProgramAttachmentId: Optional[int]
+    fileType: Optional[str]
+    fileName: Optional[str]
+    filePath: Optional[str]
+
+
+class VDatacollectionSummary(NamedTuple):
+    """A row of v_datacollection_summary"""
+
+    DataCollectionGroup_dataCollectionGroupId: Optional[int]
+    DataCollectionGroup_blSampleId: Optional[int]
+    DataCollectionGroup_sessionId: Optional[int]
+    DataCollectionGroup_workflowId: Optional[int]
+    DataCollectionGroup_experimentType: Optional[str]
+    DataCollectionGroup_startTime: Optional[datetime.datetime]
+    DataCollectionGroup_endTime: Optional[datetime.datetime]
+    DataCollectionGroup_comments: Optional[str]
+    DataCollectionGroup_actualSampleBarcode: Optional[str]
+    DataCollectionGroup_xtalSnapshotFullPath: Optional[str]
+    DataCollectionGroup_crystalClass: Optional[str]
+    BLSample_blSampleId: Optional[int]
+    BLSample_crystalId: Optional[int]
+    BLSample_name: Optional[str]
+    BLSample_code: Optional[str]
+    BLSample_location: Optional[str]
+    BLSample_blSampleStatus: Optional[str]
+    BLSample_comments: Optional[str]
+    Container_containerId: Optional[int]
+    BLSession_sessionId: Optional[int]
+    BLSession_proposalId: Optional[int]
+    BLSession_protectedData: Optional[str]
+    Dewar_dewarId: Optional[int]
+    Dewar_code: Optional[str]
+    Dewar_storageLocation: Optional[str]
+    Container_containerType: Optional[str]
+    Container_code: Optional[str]
+    Container_capacity: Optional[int]
+    Container_beamlineLocation: Optional[str]
+    Container_sampleChangerLocation: Optional[str]
+    Protein_proteinId: Optional[int]
+    Protein_name: Optional[str]
+    Protein_acronym: Optional[str]
+    DataCollection_dataCollectionId: Optional[int]
+    DataCollection_dataCollectionGroupId: Optional[int]
+    DataCollection_startTime: Optional[datetime.datetime]
+    DataCollection_endTime: Optional[datetime.datetime]
+    DataCollection_runStatus: Optional[str]
+    DataCollection_numberOfImages: Optional[int]
+    DataCollection_startImageNumber: Optional[int]
+    DataCollection_numberOfPasses: Optional[int]
+    DataCollection_exposureTime: Optional[float]
+    DataCollection_imageDirectory: Optional[str]
+    DataCollection_wavelength: Optional[float]
+    DataCollection_resolution: Optional[float]
+    DataCollection_detectorDistance: Optional[float]
+    DataCollection_xBeam: Optional[float]
+    transmission: Optional[float]
+    DataCollection_yBeam: Optional[float]
+    DataCollection_imagePrefix: Optional[str]
+    DataCollection_comments: Optional[str]
+    DataCollection_xtalSnapshotFullPath1: Optional[str]
+    DataCollection_xtalSnapshotFullPath2: Optional[str]
+    DataCollection_xtalSnapshotFullPath3: Optional[str]
+    DataCollection_xtalSnapshotFullPath4: Optional[str]
+    DataCollection_phiStart: Optional[float]
+    DataCollection_kappaStart: Optional[float]
+    DataCollection_omegaStart: Optional[float]
+    DataCollection_flux: Optional[decimal.Decimal]
+    DataCollection_flux_end: Optional[decimal.Decimal]
+    DataCollection_resolutionAtCorner: Optional[float]
+    DataCollection_bestWilsonPlotPath: Optional[str]
+    DataCollection_dataCollectionNumber: Optional[int]
+    DataCollection_axisRange: Optional[float]
+    DataCollection_axisStart: Optional[float]
+    DataCollection_axisEnd: Optional[float]
+    DataCollection_rotationAxis: Optional[str]
+    DataCollection_undulatorGap1: Optional[float]
+    DataCollection_undulatorGap2: Optional[float]
+    DataCollection_undulatorGap3: Optional[float]
+    beamSizeAtSampleX: Optional[float]
+    beamSizeAtSampleY: Optional[float]
+    DataCollection_slitGapVertical: Optional[float]
+    DataCollection_slitGapHorizontal: Optional[float]
+    DataCollection_beamShape: Optional[str]
+    DataCollection_voltage: Optional[float]
+    DataCollection_xBeamPix: Optional[float]
+    Workflow_workflowTitle: Optional[str]
+    Workflow_workflowType: Optional[str]
+    Workflow_status: Optional[str]
+    Workflow_workflowId: Optional[int]
+    AutoProcIntegration_dataCollectionId: Optional[int]
+    autoProcScalingId: Optional[int]
+    cell_a: Optional[float]
+    cell_b: Optional[float]
+    cell_c: Optional[float]
+    cell_alpha: Optional[float]
+    cell_beta: Optional[float]
+    cell_gamma: Optional[float]
+    anomalous: Optional[int]
+    scalingStatisticsType: Optional[str]
+    resolutionLimitHigh: Optional[float]
+    resolutionLimitLow: Optional[float]
+    completeness: Optional[float]
+    AutoProc_spaceGroup: Optional[str]
+    autoProcId: Optional[int]
+    rMerge: Optional[float]
+    AutoProcIntegration_autoProcIntegrationId: Optional[int]
+    AutoProcProgram_processingPrograms: Optional[str]
+    AutoProcProgram_processingStatus: Optional[str]
+    AutoProcProgram_autoProcProgramId: Optional[int]
+    Screening_screeningId: Optional[int]
+    Screening_dataCollectionId: Optional[int]
+    Screening_dataCollectionGroupId: Optional[int]
+    ScreeningOutput_strategySuccess: Optional[int]
+    ScreeningOutput_indexingSuccess: Optional[int]
+    ScreeningOutput_rankingResolution: Optional[decimal.Decimal]
+    ScreeningOutput_mosaicity: Optional[float]
+    ScreeningOutputLattice_spaceGroup: Optional[str]
+    ScreeningOutputLattice_unitCell_a: Optional[float]
+    ScreeningOutputLattice_unitCell_b: Optional[float]
+    ScreeningOutputLattice_unitCell_c: Optional[float]
+    ScreeningOutputLattice_unitCell_alpha: Optional[float]
+    ScreeningOutputLattice_unitCell_beta: Optional[float]
+    ScreeningOutputLattice_unitCell_gamma: Optional[float]
+    ScreeningOutput_totalExposureTime: Optional[decimal.Decimal]
+    ScreeningOutput_totalRotationRange: Optional[decimal.Decimal]
+    ScreeningOutput_totalNumberOfImages: Optional[int]
+    ScreeningStrategySubWedge_exposureTime: Optional[float]
+    ScreeningStrategySubWedge_transmission: Optional[float]
+    ScreeningStrategySubWedge_oscillationRange: Optional[float]
+    ScreeningStrategySubWedge_numberOfImages: Optional[int]
+    ScreeningStrategySubWedge_multiplicity: Optional[float]
+    ScreeningStrategySubWedge_completeness: Optional[float]
+    ScreeningStrategySubWedge_axisStart: Optional[float]
+    Shipping_shippingId: Optional[int]
+    Shipping_shippingName: Optional[str]
+    Shipping_shippingStatus: Optional[str]
+    diffractionPlanId: Optional[int]
+    experimentKind: Optional[str]
+    observedResolution: Optional[float]
+    minimalResolution: Optional[float]
+    exposureTime: Optional[float]
+    oscillationRange: Optional[float]
+    maximalResolution: Optional[float]
+    screeningResolution: Optional[float]
+    radiationSensitivity: Optional[float]
+    anomalousScatterer: Optional[str]
+    preferredBeamSizeX: Optional[float]
+    preferredBeamSizeY: Optional[float]
+    preferredBeamDiameter: Optional[float]
+    DiffractipnPlan_comments: Optional[str]
+    aimedCompleteness: Optional[decimal.Decimal]
+    aimedIOverSigmaAtHighestRes: Optional[decimal.Decimal]
+    aimedMultiplicity: Optional[decimal.Decimal]
+    aimedResolution: Optional[decimal.Decimal]
+    anomalousData: Optional[int]
+    complexity: Optional[str]
+    estimateRadiationDamage: Optional[int]
+    forcedSpaceGroup: Optional[str]
+    requiredCompleteness: Optional[decimal.Decimal]
+    requiredMultiplicity: Optional[decimal.Decimal]
+    requiredResolution: Optional[decimal.Decimal]
+    strategyOption: Optional[str]
+    kappaStrategyOption: Optional[str]
+    numberOfPositions: Optional[int]
+    minDimAccrossSpindleAxis: Optional[decimal.Decimal]
+    maxDimAccrossSpindleAxis: Optional[decimal.Decimal]
+    radiationSensitivityBeta: Optional[decimal.Decimal]
+    radiationSensitivityGamma: Optional[decimal.Decimal]
+    minOscWidth: Optional[float]
+    Detector_detectorType: Optional[str]
+    Detector_detectorManufacturer: Optional[str]
+    Detector_detectorModel: Optional[str]
+    Detector_detectorPixelSizeHorizontal: Optional[float]
+    Detector_detectorPixelSizeVertical: Optional[float]
+    Detector_detectorSerialNumber: Optional[str]
+    Detector_detectorDistanceMin: Optional[decimal.Decimal]
+    Detector_detectorDistanceMax: Optional[decimal.Decimal]
+    Detector_trustedPixelValueRangeLower: Optional[decimal.Decimal]
+    Detector_trustedPixelValueRangeUpper: Optional[decimal.Decimal]
+    Detector_sensorThickness: Optional[float]
+    Detector_overload: Optional[float]
+    Detector_XGeoCorr: Optional[str]
+    Detector_YGeoCorr: Optional[str]
+    Detector_detectorMode: Optional[str]
+    BeamLineSetup_undulatorType1: Optional[str]
+    BeamLineSetup_undulatorType2: Optional[str]
+    BeamLineSetup_undulatorType3: Optional[str]
+    BeamLineSetup_synchrotronName: Optional[str]
+    BeamLineSetup_synchrotronMode: Optional[str]
+    BeamLineSetup_polarisation: Optional[float]
+    BeamLineSetup_focusingOptic: Optional[str]
+    BeamLineSetup_beamDivergenceHorizontal: Optional[float]
+    BeamLineSetup_beamDivergenceVertical: Optional[float]
+    BeamLineSetup_monochromatorType: Optional[str]
+
+
+class VDatacollectionSummaryAutoprocintegration(NamedTuple):
+    """A row of v_datacollection_summary_autoprocintegration"""
+
+    AutoProcIntegration_dataCollectionId: Optional[int]
+    cell_a: Optional[float]
+    cell_b: Optional[float]
+    cell_c: Optional[float]
+    cell_alpha: Optional[float]
+    cell_beta: Optional[float]
+    cell_gamma: Optional[float]
+    anomalous: Optional[int]
+    AutoProcIntegration_autoProcIntegrationId: Optional[int]
+    v_datacollection_summary_autoprocintegration_processingPrograms: Optional[str]
+    AutoProcProgram_autoProcProgramId: Optional[int]
+    v_datacollection_summary_autoprocintegration_processingStatus: Optional[str]
+    AutoProcIntegration_phasing_dataCollectionId: Optional[int]
+    PhasingStep_phasing_phasingStepType: Optional[str]
+    SpaceGroup_spaceGroupShortName: Optional[str]
+    autoProcId: Optional[int]
+    AutoProc_spaceGroup: Optional[str]
+    scalingStatisticsType: Optional[str]
+    resolutionLimitHigh: Optional[float]
+    resolutionLimitLow: Optional[float]
+    rMerge: Optional[float]
+    meanIOverSigI: Optional[float]
+    ccHalf: Optional[float]
+    completeness: Optional[float]
+    autoProcScalingId: Optional[int]
+
+
+class VDatacollectionSummaryDatacollectiongroup(NamedTuple):
+    """A row of v_datacollection_summary_datacollectiongroup"""
+
+    DataCollectionGroup_dataCollectionGroupId: Optional[int]
+    DataCollectionGroup_blSampleId: Optional[int]
+    DataCollectionGroup_sessionId: Optional[int]
+    DataCollectionGroup_workflowId: Optional[int]
+    DataCollectionGroup_experimentType: Optional[str]
+    DataCollectionGroup_startTime: Optional[datetime.datetime]
+    DataCollectionGroup_endTime: Optional[datetime.datetime]
+    DataCollectionGroup_comments: Optional[str]
+    DataCollectionGroup_actualSampleBarcode: Optional[str]
+    DataCollectionGroup_xtalSnapshotFullPath: Optional[str]
+    BLSample_blSampleId: Optional[int]
+    BLSample_crystalId: Optional[int]
+    BLSample_name: Optional[str]
+    BLSample_code: Optional[str]
+    BLSession_sessionId: Optional[int]
+    BLSession_proposalId: Optional[int]
+    BLSession_protectedData: Optional[str]
+    Protein_proteinId: Optional[int]
+    Protein_name: Optional[str]
+    Protein_acronym: Optional[str]
+    DataCollection_dataCollectionId: Optional[int]
+    DataCollection_dataCollectionGroupId: Optional[int]
+    DataCollection_startTime: Optional[datetime.datetime]
+    DataCollection_endTime: Optional[datetime.datetime]
+    DataCollection_runStatus: Optional[str]
+    DataCollection_numberOfImages: Optional[int]
+    DataCollection_startImageNumber: Optional[int]
+    DataCollection_numberOfPasses: Optional[int]
+    DataCollection_exposureTime: Optional[float]
+    DataCollection_imageDirectory: Optional[str]
+    DataCollection_wavelength: Optional[float]
+    DataCollection_resolution: Optional[float]
+    DataCollection_detectorDistance: Optional[float]
+    DataCollection_xBeam: Optional[float]
+    DataCollection_yBeam: Optional[float]
+    DataCollection_comments: Optional[str]
+    DataCollection_xtalSnapshotFullPath1: Optional[str]
+    DataCollection_xtalSnapshotFullPath2: Optional[str]
+    DataCollection_xtalSnapshotFullPath3: Optional[str]
+    DataCollection_xtalSnapshotFullPath4: Optional[str]
+    DataCollection_phiStart: Optional[float]
+    DataCollection_kappaStart: Optional[float]
+    DataCollection_omegaStart: Optional[float]
+    DataCollection_resolutionAtCorner: Optional[float]
+    DataCollection_bestWilsonPlotPath: Optional[str]
+    DataCollection_dataCollectionNumber: Optional[int]
+    DataCollection_axisRange: Optional[float]
+    DataCollection_axisStart: Optional[float]
+    DataCollection_axisEnd: Optional[float]
+    Workflow_workflowTitle: Optional[str]
+    Workflow_workflowType: Optional[str]
+    Workflow_status: Optional[str]
+
+
+class VDatacollectionSummaryPhasing(NamedTuple):
+    """A row of v_datacollection_summary_phasing"""
+
+    v_datacollection_summary_phasing_autoProcIntegrationId: Optional[int]
+    v_datacollection_summary_phasing_dataCollectionId: Optional[int]
+    v_datacollection_summary_phasing_cell_a: Optional[float]
+    v_datacollection_summary_phasing_cell_b: Optional[float]
+    v_datacollection_summary_phasing_cell_c: Optional[float]
+    v_datacollection_summary_phasing_cell_alpha: Optional[float]
+    v_datacollection_summary_phasing_cell_beta: Optional[float]
+    v_datacollection_summary_phasing_cell_gamma: Optional[float]
+    v_datacollection_summary_phasing_anomalous: Optional[int]
+    v_datacollection_summary_phasing_autoproc_space_group: Optional[str]
+    v_datacollection_summary_phasing_autoproc_autoprocId: Optional[int]
+    v_datacollection_summary_phasing_autoProcScalingId: Optional[int]
+    v_datacollection_summary_phasing_processingPrograms: Optional[str]
+    v_datacollection_summary_phasing_autoProcProgramId: Optional[int]
+    v_datacollection_summary_phasing_processingStatus: Optional[str]
+    v_datacollection_summary_session_sessionId: Optional[int]
+    v_datacollection_summary_session_proposalId: Optional[int]
+
+
+class VDatacollectionSummaryScreening(NamedTuple):
+    """A row of v_datacollection_summary_screening"""
+
+    Screening_screeningId: Optional[int]
+    Screening_dataCollectionId: Optional[int]
+    Screening_dataCollectionGroupId: Optional[int]
+    ScreeningOutput_strategySuccess: Optional[int]
+    ScreeningOutput_indexingSuccess: Optional[int]
+    ScreeningOutput_rankingResolution: Optional[decimal.Decimal]
+    ScreeningOutput_mosaicityEstimated: Optional[int]
+    ScreeningOutput_mosaicity: Optional[float]
+    ScreeningOutput_totalExposureTime: Optional[decimal.Decimal]
+    ScreeningOutput_totalRotationRange: Optional[decimal.Decimal]
+    ScreeningOutput_totalNumberOfImages: Optional[int]
+    ScreeningOutputLattice_spaceGroup: Optional[str]
+    ScreeningOutputLattice_unitCell_a: Optional[float]
+    ScreeningOutputLattice_unitCell_b: Optional[float]
+    ScreeningOutputLattice_unitCell_c: Optional[float]
+    ScreeningOutputLattice_unitCell_alpha: Optional[float]
+    ScreeningOutputLattice_unitCell_beta: Optional[float]
+    ScreeningOutputLattice_unitCell_gamma: Optional[float]
+    ScreeningStrategySubWedge_exposureTime: Optional[float]
+    ScreeningStrategySubWedge_transmission: Optional[float]
+    ScreeningStrategySubWedge_oscillationRange: Optional[float]
+    ScreeningStrategySubWedge_numberOfImages: Optional[int]
+    ScreeningStrategySubWedge_multiplicity: Optional[float]
+    ScreeningStrategySubWedge_completeness: Optional[float]
+    ScreeningStrategySubWedge_axisStart: Optional[float]
+    ScreeningStrategySubWedge_axisEnd: Optional[float]
+    ScreeningStrategySubWedge_rotationAxis: Optional[str]
+
+
+class VDewar(NamedTuple):
+    """A row of v_dewar"""
+
+    proposalId: Optional[int]
+    shippingId: Optional[int]
+    shippingName: Optional[str]
+    dewarId: Optional[int]
+    dewarName: Optional[str]
+    dewarStatus: Optional[str]
+    proposalCode: Optional[str]
+    proposalNumber: Optional[str]
+    creationDate: Optional[datetime.datetime]
+    shippingType: Optional[str]
+    barCode: Optional[str]
+    shippingStatus: Optional[str]
+    beamLineName: Optional[str]
+    nbEvents: Optional[int]
+    storesin: Optional[int]
+    nbSamples: Optional[int]
+
+
+class VDewarBeamline(NamedTuple):
+    """A row of v_dewarBeamline"""
+
+    beamLineName: Optional[str]
+    COUNT: Optional[int]
+
+
+class VDewarBeamlineByWeek(NamedTuple):
+    """A row of v_dewarBeamlineByWeek"""
+
+    Week: Optional[str]
+    ID14: Optional[int]
+    ID23: Optional[int]
+    ID29: Optional[int]
+    BM14: Optional[int]
+
+
+class VDewarByWeek(NamedTuple):
+    """A row of v_dewarByWeek"""
+
+    Week: Optional[str]
+    Dewars_Tracked: Optional[int]
+    Dewars_Non_Tracked: Optional[int]
+
+
+class VDewarByWeekTotal(NamedTuple):
+    """A row of v_dewarByWeekTotal"""
+
+    Week: Optional[str]
+    Dewars_Tracked: Optional[int]
+    Dewars_Non_Tracked: Optional[int]
+    Total: Optional[int]
+
+
+class VDewarList(NamedTuple):
+    """A row of v_dewarList"""
+
+    proposal: Optional[str]
+    shippingName: Optional[str]
+    dewarName: Optional[str]
+    barCode: Optional[str]
+    creationDate: Optional[str]
+    shippingType: Optional[str]
+    nbEvents: Optional[int]
+    dewarStatus: Optional[str]
+    shippingStatus: Optional[str]
+    nbSamples: Optional[int]
+
+
+class VDewarProposalCode(NamedTuple):
+    """A row of v_dewarProposalCode"""
+
+    proposalCode: Optional[str]
+    COUNT: Optional[int]
+
+
+class VDewarProposalCodeByWeek(NamedTuple):
+    """A row of v_dewarProposalCodeByWeek"""
+
+    Week: Optional[str]
+    MX: Optional[int]
+    FX: Optional[int]
+    BM14U: Optional[int]
+    BM161: Optional[int]
+    BM162: Optional[int]
+    Others: Optional[int]
+
+
+class VDewarSummary(NamedTuple):
+    """A row of v_dewar_summary"""
+
+    shippingName: Optional[str]
+    deliveryAgent_agentName: Optional[str]
+    deliveryAgent_shippingDate: Optional[datetime.date]
+    deliveryAgent_deliveryDate: Optional[datetime.date]
+    deliveryAgent_agentCode: Optional[str]
+    deliveryAgent_flightCode: Optional[str]
+    shippingStatus: Optional[str]
+    bltimeStamp: Optional[datetime.datetime]
+    laboratoryId: Optional[int]
+    isStorageShipping: Optional[int]
+    creationDate: Optional[datetime.datetime]
+    Shipping_comments: Optional[str]
+    sendingLabContactId: Optional[int]
+    returnLabContactId: Optional[int]
+    returnCourier: Optional[str]
+    dateOfShippingToUser: Optional[datetime.datetime]
+    shippingType: Optional[str]
+    dewarId: Optional[int]
+    shippingId: Optional[int]
+    dewarCode: Optional[str]
+    comments: Optional[str]
+    storageLocation: Optional[str]
+    dewarStatus: Optional[str]
+    isStorageDewar: Optional[int]
+    barCode: Optional[str]
+    firstExperimentId: Optional[int]
+    customsValue: Optional[int]
+    transportValue: Optional[int]
+    trackingNumberToSynchrotron: Optional[str]
+    trackingNumberFromSynchrotron: Optional[str]
+    type: Optional[str]
+    isReimbursed: Optional[int]
+    sessionId: Optional[int]
+    beamlineName: Optional[str]
+    sessionStartDate: Optional[datetime.datetime]
+    sessionEndDate: Optional[datetime.datetime]
+    beamLineOperator: Optional[str]
+    nbReimbDewars: Optional[int]
+    proposalId: Optional[int]
+    containerId: Optional[int]
+    containerType: Optional[str]
+    capacity: Optional[int]
+    beamlineLocation: Optional[str]
+    sampleChangerLocation: Optional[str]
+    containerStatus: Optional[str]
+    containerCode: Optional[str]
+
+
+class VEm2dclassification(NamedTuple):
+    """A row of v_em_2dclassification"""
+
+    proposalId: Optional[int]
+    sessionId: Optional[int]
+    imageDirectory: Optional[str]
+    particlePickerId: Optional[int]
+    particleClassificationGroupId: Optional[int]
+    particleClassificationId: Optional[int]
+    classNumber: Optional[int]
+    classImageFullPath: Optional[str]
+
+
+class VEmClassification(NamedTuple):
+    """A row of v_em_classification"""
+
+    proposalId: Optional[int]
+    sessionId: Optional[int]
+    imageDirectory: Optional[str]
+    particlePickerId: Optional[int]
+    numberOfParticles: Optional[int]
+    particleClassificationGroupId: Optional[int]
+    particleClassificationId: Optional[int]
+    classNumber: Optional[int]
+    classImageFullPath: Optional[str]
+    particlesPerClass: Optional[int]
+    classDistribution: Optional[float]
+    rotationAccuracy: Optional[float]
+    translationAccuracy: Optional[float]
+    estimatedResolution: Optional[float]
+    overallFourierCompleteness: Optional[float]
+
+
+class VEmMovie(NamedTuple):
+    """A row of v_em_movie"""
+
+    Movie_movieId: Optional[int]
+    Movie_dataCollectionId: Optional[int]
+    Movie_movieNumber: Optional[int]
+    Movie_movieFullPath: Optional[str]
+    Movie_positionX: Optional[str]
+    Movie_positionY: Optional[str]
+    Movie_micrographFullPath: Optional[str]
+    Movie_micrographSnapshotFullPath: Optional[str]
+    Movie_xmlMetaDataFullPath: Optional[str]
+    Movie_dosePerImage: Optional[str]
+    Movie_createdTimeStamp: Optional[datetime.datetime]
+    MotionCorrection_motionCorrectionId: Optional[int]
+    MotionCorrection_movieId: Optional[int]
+    MotionCorrection_firstFrame: Optional[str]
+    MotionCorrection_lastFrame: Optional[str]
+    MotionCorrection_dosePerFrame: Optional[str]
+    MotionCorrection_doseWeight: Optional[str]
+    MotionCorrection_totalMotion: Optional[str]
+    MotionCorrection_averageMotionPerFrame: Optional[str]
+    MotionCorrection_driftPlotFullPath: Optional[str]
+    MotionCorrection_micrographFullPath: Optional[str]
+    MotionCorrection_micrographSnapshotFullPath: Optional[str]
+    MotionCorrection_correctedDoseMicrographFullPath: Optional[str]
+    MotionCorrection_patchesUsed: Optional[str]
+    MotionCorrection_logFileFullPath: Optional[str]
+    CTF_CTFid: Optional[int]
+    CTF_motionCorrectionId: Optional[int]
+    CTF_spectraImageThumbnailFullPath: Optional[str]
+    CTF_spectraImageFullPath: Optional[str]
+    CTF_defocusU: Optional[str]
+    CTF_defocusV: Optional[str]
+    CTF_angle: Optional[str]
+    CTF_crossCorrelationCoefficient: Optional[str]
+    CTF_resolutionLimit: Optional[str]
+    CTF_estimatedBfactor: Optional[str]
+    CTF_logFilePath: Optional[str]
+    CTF_createdTimeStamp: Optional[datetime.datetime]
+    Proposal_proposalId: Optional[int]
+    BLSession_sessionId: Optional[int]
+
+
+class VEmStats(NamedTuple):
+    """A row of v_em_stats"""
+
+    proposalId: Optional[int]
+    sessionId: Optional[int]
+    imageDirectory: Optional[str]
+    movieId: Optional[int]
+    movieNumber: Optional[int]
+    createdTimeStamp: Optional[datetime.datetime]
+    motionCorrectionId: Optional[int]
+    dataCollectionId: Optional[int]
+    totalMotion: Optional[str]
+    averageMotionPerFrame: Optional[str]
+    lastFrame: Optional[str]
+    dosePerFrame: Optional[str]
+    defocusU: Optional[str]
+    defocusV: Optional[str]
+    resolutionLimit: Optional[str]
+    estimatedBfactor: Optional[str]
+    angle: Optional[str]
+
+
+class VEnergyScan(NamedTuple):
+    """A row of v_energyScan"""
+
+    energyScanId: Optional[int]
+    sessionId: Optional[int]
+    blSampleId: Optional[int]
+    fluorescenceDetector: Optional[str]
+    scanFileFullPath: Optional[str]
+    choochFileFullPath: Optional[str]
+    jpegChoochFileFullPath: Optional[str]
+    element: Optional[str]
+    startEnergy: Optional[float]
+    endEnergy: Optional[float]
+    transmissionFactor: Optional[float]
+    exposureTime: Optional[float]
+    synchrotronCurrent: Optional[float]
+    temperature: Optional[float]
+    peakEnergy: Optional[float]
+    peakFPrime: Optional[float]
+    peakFDoublePrime: Optional[float]
+    inflectionEnergy: Optional[float]
+    inflectionFPrime: Optional[float]
+    inflectionFDoublePrime: Optional[float]
+    xrayDose: Optional[float]
+    startTime: Optional[datetime.datetime]
+    endTime: Optional[datetime.datetime]
+    edgeEnergy: Optional[str]
+    filename: Optional[str]
+    beamSizeVertical: Optional[float]
+    beamSizeHorizontal: Optional[float]
+    crystalClass: Optional[str]
+    comments: Optional[str]
+    flux: Optional[decimal.Decimal]
+    flux_end: Optional[decimal.Decimal]
+    remoteEnergy: Optional[float]
+    remoteFPrime: Optional[float]
+    remoteFDoublePrime: Optional[float]
+    BLSample_sampleId: Optional[int]
+    name: Optional[str]
+    code: Optional[str]
+    acronym: Optional[str]
+    BLSession_proposalId: Optional[int]
+
+
+class VHour(NamedTuple):
+    """A row of v_hour"""
+
+    num: Optional[str]
+
+
+class VLogonByHour(NamedTuple):
+    """A row of v_logonByHour"""
+
+    Hour: Optional[str]
+    Distinct_logins: Optional[int]
+    Total_logins: Optional[int]
+
+
+class VLogonByMonthDay(NamedTuple):
+    """A row of v_logonByMonthDay"""
+
+    Day: Optional[str]
+    Distinct_logins: Optional[int]
+    Total_logins: Optional[int]
+
+
+class VLogonByWeek(NamedTuple):
+    """A row of v_logonByWeek"""
+
+    Week: Optional[str]
+    Distinct_logins: Optional[int]
+    Total_logins: Optional[int]
+
+
+class VLogonByWeekDay(NamedTuple):
+    """A row of v_logonByWeekDay"""
+
+    Day: Optional[str]
+    Distinct_logins: Optional[int]
+    Total_logins: Optional[int]
+
+
+class VMonthDay(NamedTuple):
+    """A row of v_monthDay"""
+
+    num: Optional[str]
+
+
+class VMxAutoprocessingStats(NamedTuple):
+    """A row of v_mx_autoprocessing_stats"""
+
+    autoProcScalingStatisticsId: Optional[int]
+    autoProcScalingId: Optional[int]
+    scalingStatisticsType: Optional[str]
+    resolutionLimitLow: Optional[float]
+    resolutionLimitHigh: Optional[float]
+    rMerge: Optional[float]
+    rMeasWithinIPlusIMinus: Optional[float]
+    rMeasAllIPlusIMinus: Optional[float]
+    rPimWithinIPlusIMinus: Optional[float]
+    rPimAllIPlusIMinus: Optional[float]
+    fractionalPartialBias: Optional[float]
+    nTotalObservations: Optional[int]
+    nTotalUniqueObservations: Optional[int]
+    meanIOverSigI: Optional[float]
+    completeness: Optional[float]
+    multiplicity: Optional[float]
+    anomalousCompleteness: Optional[float]
+    anomalousMultiplicity: Optional[float]
+    recordTimeStamp: Optional[datetime.datetime]
+    anomalous: Optional[int]
+    ccHalf: Optional[float]
+    ccAno: Optional[float]
+    sigAno: Optional[str]
+    ISA: Optional[str]
+    dataCollectionId: Optional[int]
+    strategySubWedgeOrigId: Optional[int]
+    detectorId: Optional[int]
+    blSubSampleId: Optional[int]
+    dataCollectionNumber: Optional[int]
+    startTime: Optional[datetime.datetime]
+    endTime: Optional[datetime.datetime]
+    sessionId: Optional[int]
+    proposalId: Optional[int]
+    beamLineName: Optional[str]
+
+
+class VMxExperimentStats(NamedTuple):
+    """A row of v_mx_experiment_stats"""
+
+    startTime: Optional[datetime.datetime]
+    Images: Optional[int]
+    Transmission: Optional[float]
+    Res_corner: Optional[float]
+    En_Wave: Optional[float]
+    Omega_start_total: Optional[float]
+    Exposure_Time: Optional[float]
+    Flux: Optional[decimal.Decimal]
+    Flux_End: Optional[decimal.Decimal]
+    Detector_Distance: Optional[float]
+    X_Beam: Optional[float]
+    Y_Beam: Optional[float]
+    Kappa: Optional[float]
+    Phi: Optional[float]
+    Axis_Start: Optional[float]
+    Axis_End: Optional[float]
+    Axis_Range: Optional[float]
+    Beam_Size_X: Optional[float]
+    Beam_Size_Y: Optional[float]
+    beamLineName: Optional[str]
+    comments: Optional[str]
+    proposalNumber: Optional[str]
+
+
+class VMxSample(NamedTuple):
+    """A row of v_mx_sample"""
+
+    BLSample_blSampleId: Optional[int]
+    BLSample_diffractionPlanId: Optional[int]
+    BLSample_crystalId: Optional[int]
+    BLSample_containerId: Optional[int]
+    BLSample_name: Optional[str]
+    BLSample_code: Optional[str]
+    BLSample_location: Optional[str]
+    BLSample_holderLength: Optional[decimal.Decimal]
+    BLSample_loopLength: Optional[decimal.Decimal]
+    BLSample_loopType: Optional[str]
+    BLSample_wireWidth: Optional[decimal.Decimal]
+    BLSample_comments: Optional[str]
+    BLSample_completionStage: Optional[str]
+    BLSample_structureStage: Optional[str]
+    BLSample_publicationStage: Optional[str]
+    BLSample_publicationComments: Optional[str]
+    BLSample_blSampleStatus: Optional[str]
+    BLSample_isInSampleChanger: Optional[int]
+    BLSample_lastKnownCenteringPosition: Optional[str]
+    BLSample_recordTimeStamp: Optional[datetime.datetime]
+    BLSample_SMILES: Optional[str]
+    Protein_proteinId: Optional[int]
+    Protein_name: Optional[str]
+    Protein_acronym: Optional[str]
+    Protein_proteinType: Optional[str]
+    Protein_proposalId: Optional[int]
+    Person_personId: Optional[int]
+    Person_familyName: Optional[str]
+    Person_givenName: Optional[str]
+    Person_emailAddress: Optional[str]
+    Container_containerId: Optional[int]
+    Container_code: Optional[str]
+    Container_containerType: Optional[str]
+    Container_containerStatus: Optional[str]
+    Container_beamlineLocation: Optional[str]
+    Container_sampleChangerLocation: Optional[str]
+    Dewar_code: Optional[str]
+    Dewar_dewarId: Optional[int]
+    Dewar_storageLocation: Optional[str]
+    Dewar_dewarStatus: Optional[str]
+    Dewar_barCode: Optional[str]
+    Shipping_shippingId: Optional[int]
+    sessionId: Optional[int]
+    BLSession_startDate: Optional[datetime.datetime]
+    BLSession_beamLineName: Optional[str]
+
+
+class VPhasing(NamedTuple):
+    """A row of v_phasing"""
+
+    BLSample_blSampleId: Optional[int]
+    AutoProcIntegration_autoProcIntegrationId: Optional[int]
+    AutoProcIntegration_dataCollectionId: Optional[int]
+    AutoProcIntegration_autoProcProgramId: Optional[int]
+    AutoProcIntegration_startImageNumber: Optional[int]
+    AutoProcIntegration_endImageNumber: Optional[int]
+    AutoProcIntegration_refinedDetectorDistance: Optional[float]
+    AutoProcIntegration_refinedXBeam: Optional[float]
+    AutoProcIntegration_refinedYBeam: Optional[float]
+    AutoProcIntegration_rotationAxisX: Optional[float]
+    AutoProcIntegration_rotationAxisY: Optional[float]
+    AutoProcIntegration_rotationAxisZ: Optional[float]
+    AutoProcIntegration_beamVectorX: Optional[float]
+    AutoProcIntegration_beamVectorY: Optional[float]
+    AutoProcIntegration_beamVectorZ: Optional[float]
+    AutoProcIntegration_cell_a: Optional[float]
+    AutoProcIntegration_cell_b: Optional[float]
+    AutoProcIntegration_cell_c: Optional[float]
+    AutoProcIntegration_cell_alpha: Optional[float]
+    AutoProcIntegration_cell_beta: Optional[float]
+    AutoProcIntegration_cell_gamma: Optional[float]
+    AutoProcIntegration_recordTimeStamp: Optional[datetime.datetime]
+    AutoProcIntegration_anomalous: Optional[int]
+    SpaceGroup_spaceGroupId: Optional[int]
+    SpaceGroup_geometryClassnameId: Optional[int]
+    SpaceGroup_spaceGroupNumber: Optional[int]
+    SpaceGroup_spaceGroupShortName: Optional[str]
+    SpaceGroup_spaceGroupName: Optional[str]
+    SpaceGroup_bravaisLattice: Optional[str]
+    SpaceGroup_bravaisLatticeName: Optional[str]
+    SpaceGroup_pointGroup: Optional[str]
+    SpaceGroup_MX_used: Optional[int]
+    PhasingStep_phasingStepId: Optional[int]
+    PhasingStep_previousPhasingStepId: Optional[int]
+    PhasingStep_programRunId: Optional[int]
+    PhasingStep_spaceGroupId: Optional[int]
+    PhasingStep_autoProcScalingId: Optional[int]
+    PhasingStep_phasingAnalysisId: Optional[int]
+    PhasingStep_phasingStepType: Optional[str]
+    PhasingStep_method: Optional[str]
+    PhasingStep_solventContent: Optional[str]
+    PhasingStep_enantiomorph: Optional[str]
+    PhasingStep_lowRes: Optional[str]
+    PhasingStep_highRes: Optional[str]
+    PhasingStep_recordTimeStamp: Optional[datetime.datetime]
+    DataCollection_dataCollectionId: Optional[int]
+    DataCollection_dataCollectionGroupId: Optional[int]
+    DataCollection_strategySubWedgeOrigId: Optional[int]
+    DataCollection_detectorId: Optional[int]
+    DataCollection_blSubSampleId: Optional[int]
+    DataCollection_dataCollectionNumber: Optional[int]
+    DataCollection_startTime: Optional[datetime.datetime]
+    DataCollection_endTime: Optional[datetime.datetime]
+    DataCollection_runStatus: Optional[str]
+    DataCollection_axisStart: Optional[float]
+    DataCollection_axisEnd: Optional[float]
+    DataCollection_axisRange: Optional[float]
+    DataCollection_overlap: Optional[float]
+    DataCollection_numberOfImages: Optional[int]
+    DataCollection_startImageNumber: Optional[int]
+    DataCollection_numberOfPasses: Optional[int]
+    DataCollection_exposureTime: Optional[float]
+    DataCollection_imageDirectory: Optional[str]
+    DataCollection_imagePrefix: Optional[str]
+    DataCollection_imageSuffix: Optional[str]
+    DataCollection_fileTemplate: Optional[str]
+    DataCollection_wavelength: Optional[float]
+    DataCollection_resolution: Optional[float]
+    DataCollection_detectorDistance: Optional[float]
+    DataCollection_xBeam: Optional[float]
+    DataCollection_yBeam: Optional[float]
+    DataCollection_xBeamPix: Optional[float]
+    DataCollection_yBeamPix: Optional[float]
+    DataCollection_comments: Optional[str]
+    DataCollection_printableForReport: Optional[int]
+    DataCollection_slitGapVertical: Optional[float]
+    DataCollection_slitGapHorizontal: Optional[float]
+    DataCollection_transmission: Optional[float]
+    DataCollection_synchrotronMode: Optional[str]
+    DataCollection_xtalSnapshotFullPath1: Optional[str]
+    DataCollection_xtalSnapshotFullPath2: Optional[str]
+    DataCollection_xtalSnapshotFullPath3: Optional[str]
+    DataCollection_xtalSnapshotFullPath4: Optional[str]
+    DataCollection_rotationAxis: Optional[str]
+    DataCollection_phiStart: Optional[float]
+    DataCollection_kappaStart: Optional[float]
+    DataCollection_omegaStart: Optional[float]
+    DataCollection_resolutionAtCorner: Optional[float]
+    DataCollection_detector2Theta: Optional[float]
+    DataCollection_undulatorGap1: Optional[float]
+    DataCollection_undulatorGap2: Optional[float]
+    DataCollection_undulatorGap3: Optional[float]
+    DataCollection_beamSizeAtSampleX: Optional[float]
+    DataCollection_beamSizeAtSampleY: Optional[float]
+    DataCollection_centeringMethod: Optional[str]
+    DataCollection_averageTemperature: Optional[float]
+    DataCollection_actualCenteringPosition: Optional[str]
+    DataCollection_beamShape: Optional[str]
+    DataCollection_flux: Optional[decimal.Decimal]
+    DataCollection_flux_end: Optional[decimal.Decimal]
+    DataCollection_totalAbsorbedDose: Optional[decimal.Decimal]
+    DataCollection_bestWilsonPlotPath: Optional[str]
+    DataCollection_imageQualityIndicatorsPlotPath: Optional[str]
+    DataCollection_imageQualityIndicatorsCSVPath: Optional[str]
+    PhasingProgramRun_phasingProgramRunId: Optional[int]
+    PhasingProgramRun_phasingCommandLine: Optional[str]
+    PhasingProgramRun_phasingPrograms: Optional[str]
+    PhasingProgramRun_phasingStatus: Optional[int]
+    PhasingProgramRun_phasingMessage: Optional[str]
+    PhasingProgramRun_phasingStartTime: Optional[datetime.datetime]
+    PhasingProgramRun_phasingEndTime: Optional[datetime.datetime]
+    PhasingProgramRun_phasingEnvironment: Optional[str]
+    PhasingProgramRun_phasingDirectory: Optional[str]
+    PhasingProgramRun_recordTimeStamp: Optional[datetime.datetime]
+    Protein_proteinId: Optional[int]
+    BLSession_sessionId: Optional[int]
+    BLSession_proposalId: Optional[int]
+    PhasingStatistics_phasingStatisticsId: Optional[int]
+    PhasingStatistics_metric: Optional[str]
+    PhasingStatistics_statisticsValue: Optional[decimal.Decimal]
+
+
+class VSample(NamedTuple):
+    """A row of v_sample"""
+
+    proposalId: Optional[int]
+    shippingId: Optional[int]
+    dewarId: Optional[int]
+    containerId: Optional[int]
+    blSampleId: Optional[int]
+    proposalCode: Optional[str]
+    proposalNumber: Optional[str]
+    creationDate: Optional[datetime.datetime]
+    shippingType: Optional[str]
+    barCode: Optional[str]
+    shippingStatus: Optional[str]
+
+
+class VSampleByWeek(NamedTuple):
+    """A row of v_sampleByWeek"""
+
+    Week: Optional[str]
+    Samples: Optional[int]
+
+
+class VSaxsDatacollection(NamedTuple):
+    """A row of v_saxs_datacollection"""
+
+    Subtraction_subtractionId: Optional[int]
+    MeasurementToDataCollection_dataCollectionId: Optional[int]
+    MeasurementToDataCollection_dataCollectionOrder: Optional[int]
+    MeasurementToDataCollection_measurementToDataCollectionId: Optional[int]
+    Specimen_specimenId: Optional[int]
+    Measurement_code: Optional[str]
+    Measurement_measurementId: Optional[int]
+    Buffer_bufferId: Optional[int]
+    Buffer_proposalId: Optional[int]
+    Buffer_safetyLevelId: Optional[int]
+    Buffer_name: Optional[str]
+    Buffer_acronym: Optional[str]
+    Buffer_pH: Optional[str]
+    Buffer_composition: Optional[str]
+    Buffer_comments: Optional[str]
+    Macromolecule_macromoleculeId: Optional[int]
+    Macromolecule_proposalId: Optional[int]
+    Macromolecule_safetyLevelId: Optional[int]
+    Macromolecule_name: Optional[str]
+    Macromolecule_acronym: Optional[str]
+    Macromolecule_extintionCoefficient: Optional[str]
+    Macromolecule_molecularMass: Optional[str]
+    Macromolecule_sequence: Optional[str]
+    Macromolecule_contactsDescriptionFilePath: Optional[str]
+    Macromolecule_symmetry: Optional[str]
+    Macromolecule_comments: Optional[str]
+    Macromolecule_refractiveIndex: Optional[str]
+    Macromolecule_solventViscosity: Optional[str]
+    Macromolecule_creationDate: Optional[datetime.datetime]
+    Specimen_experimentId: Optional[int]
+    Specimen_bufferId: Optional[int]
+    Specimen_samplePlatePositionId: Optional[int]
+    Specimen_safetyLevelId: Optional[int]
+    Specimen_stockSolutionId: Optional[int]
+    Specimen_code: Optional[str]
+    Specimen_concentration: Optional[str]
+    Specimen_volume: Optional[str]
+    Specimen_comments: Optional[str]
+    SamplePlatePosition_samplePlatePositionId: Optional[int]
+    SamplePlatePosition_samplePlateId: Optional[int]
+    SamplePlatePosition_rowNumber: Optional[int]
+    SamplePlatePosition_columnNumber: Optional[int]
+    SamplePlatePosition_volume: Optional[str]
+    samplePlateId: Optional[int]
+    experimentId: Optional[int]
+    plateGroupId: Optional[int]
+    plateTypeId: Optional[int]
+    instructionSetId: Optional[int]
+    SamplePlate_boxId: Optional[int]
+    SamplePlate_name: Optional[str]
+    SamplePlate_slotPositionRow: Optional[str]
+    SamplePlate_slotPositionColumn: Optional[str]
+    SamplePlate_storageTemperature: Optional[str]
+    Experiment_experimentId: Optional[int]
+    Experiment_sessionId: Optional[int]
+    Experiment_proposalId: Optional[int]
+    Experiment_name: Optional[str]
+    Experiment_creationDate: Optional[datetime.datetime]
+    Experiment_experimentType: Optional[str]
+    Experiment_sourceFilePath: Optional[str]
+    Experiment_dataAcquisitionFilePath: Optional[str]
+    Experiment_status: Optional[str]
+    Experiment_comments: Optional[str]
+    Measurement_priorityLevelId: Optional[int]
+    Measurement_exposureTemperature: Optional[str]
+    Measurement_viscosity: Optional[str]
+    Measurement_flow: Optional[int]
+    Measurement_extraFlowTime: Optional[str]
+    Measurement_volumeToLoad: Optional[str]
+    Measurement_waitTime: Optional[str]
+    Measurement_transmission: Optional[str]
+    Measurement_comments: Optional[str]
+    Measurement_imageDirectory: Optional[str]
+    Run_runId: Optional[int]
+    Run_timePerFrame: Optional[str]
+    Run_timeStart: Optional[str]
+    Run_timeEnd: Optional[str]
+    Run_storageTemperature: Optional[str]
+    Run_exposureTemperature: Optional[str]
+    Run_spectrophotometer: Optional[str]
+    Run_energy: Optional[str]
+    Run_creationDate: Optional[datetime.datetime]
+    Run_frameAverage: Optional[str]
+    Run_frameCount: Optional[str]
+    Run_transmission: Optional[str]
+    Run_beamCenterX: Optional[str]
+    Run_beamCenterY: Optional[str]
+    Run_pixelSizeX: Optional[str]
+    Run_pixelSizeY: Optional[str]
+    Run_radiationRelative: Optional[str]
+    Run_radiationAbsolute: Optional[str]
+    Run_normalization: Optional[str]
+    Merge_mergeId: Optional[int]
+    Merge_measurementId: Optional[int]
+    Merge_frameListId: Optional[int]
+    Merge_discardedFrameNameList: Optional[str]
+    Merge_averageFilePath: Optional[str]
+    Merge_framesCount: Optional[str]
+    Merge_framesMerge: Optional[str]
+    Merge_creationDate: Optional[datetime.datetime]
+    Subtraction_dataCollectionId: Optional[int]
+    Subtraction_rg: Optional[str]
+    Subtraction_rgStdev: Optional[str]
+    Subtraction_I0: Optional[str]
+    Subtraction_I0Stdev: Optional[str]
+    Subtraction_firstPointUsed: Optional[str]
+    Subtraction_lastPointUsed: Optional[str]
+    Subtraction_quality: Optional[str]
+    Subtraction_isagregated: Optional[str]
+    Subtraction_concentration: Optional[str]
+    Subtraction_gnomFilePath: Optional[str]
+    Subtraction_rgGuinier: Optional[str]
+    Subtraction_rgGnom: Optional[str]
+    Subtraction_dmax: Optional[str]
+    Subtraction_total: Optional[str]
+    Subtraction_volume: Optional[str]
+    Subtraction_creationTime: Optional[datetime.datetime]
+    Subtraction_kratkyFilePath: Optional[str]
+    Subtraction_scatteringFilePath: Optional[str]
+    Subtraction_guinierFilePath: Optional[str]
+    Subtraction_substractedFilePath: Optional[str]
+    Subtraction_gnomFilePathOutput: Optional[str]
+    Subtraction_sampleOneDimensionalFiles: Optional[int]
+    Subtraction_bufferOnedimensionalFiles: Optional[int]
+    Subtraction_sampleAverageFilePath: Optional[str]
+    Subtraction_bufferAverageFilePath: Optional[str]
+
+
+class VSession(NamedTuple):
+    """A row of v_session"""
+
+    sessionId: Optional[int]
+    expSessionPk: Optional[int]
+    beamLineSetupId: Optional[int]
+    proposalId: Optional[int]
+    projectCode: Optional[str]
+    BLSession_startDate: Optional[datetime.datetime]
+    BLSession_endDate: Optional[datetime.datetime]
+    beamLineName: Optional[str]
+    scheduled: Optional[int]
+    nbShifts: Optional[int]
+    comments: Optional[str]
+    beamLineOperator: Optional[str]
+    visit_number: Optional[int]
+    bltimeStamp: Optional[datetime.datetime]
+    usedFlag: Optional[int]
+    sessionTitle: Optional[str]
+    structureDeterminations: Optional[float]
+    dewarTransport: Optional[float]
+    databackupFrance: Optional[float]
+    databackupEurope: Optional[float]
+    operatorSiteNumber: Optional[str]
+    BLSession_lastUpdate: Optional[datetime.datetime]
+    BLSession_protectedData: Optional[str]
+    Proposal_title: Optional[str]
+    Proposal_proposalCode: Optional[str]
+    Proposal_ProposalNumber: Optional[str]
+    Proposal_ProposalType: Optional[str]
+    Person_personId: Optional[int]
+    Person_familyName: Optional[str]
+    Person_givenName: Optional[str]
+    Person_emailAddress: Optional[str]
+
+
+class VTrackingShipmentHistory(NamedTuple):
+    """A row of v_tracking_shipment_history"""
+
+    Dewar_dewarId: Optional[int]
+    Dewar_code: Optional[str]
+    Dewar_comments: Optional[str]
+    Dewar_dewarStatus: Optional[str]
+    Dewar_barCode: Optional[str]
+    Dewar_firstExperimentId: Optional[int]
+    Dewar_trackingNumberToSynchrotron: Optional[str]
+    Dewar_trackingNumberFromSynchrotron: Optional[str]
+    Dewar_type: Optional[str]
+    Shipping_shippingId: Optional[int]
+    Shipping_proposalId: Optional[int]
+    Shipping_shippingName: Optional[str]
+    deliveryAgent_agentName: Optional[str]
+    Shipping_deliveryAgent_shippingDate: Optional[datetime.date]
+    Shipping_deliveryAgent_deliveryDate: Optional[datetime.date]
+    Shipping_shippingStatus: Optional[str]
+    Shipping_returnCourier: Optional[str]
+    Shipping_dateOfShippingToUser: Optional[datetime.datetime]
+    DewarTransportHistory_DewarTransportHistoryId: Optional[int]
+    DewarTransportHistory_dewarStatus: Optional[str]
+    DewarTransportHistory_storageLocation: Optional[str]
+    DewarTransportHistory_arrivalDate: Optional[datetime.datetime]
+
+
+class VWeek(NamedTuple):
+    """A row of v_week"""
+
+    num: Optional[str]
+
+
+class VWeekDay(NamedTuple):
+    """A row of v_weekDay"""
+
+    day: Optional[str]
+
+
+class VXfeFluorescenceSpectrum(NamedTuple):
+    """A row of v_xfeFluorescenceSpectrum"""
+
+    xfeFluorescenceSpectrumId: Optional[int]
+    sessionId: Optional[int]
+    blSampleId: Optional[int]
+    fittedDataFileFullPath: Optional[str]
+    scanFileFullPath: Optional[str]
+    jpegScanFileFullPath: Optional[str]
+    startTime: Optional[datetime.datetime]
+    endTime: Optional[datetime.datetime]
+    filename: Optional[str]
+    energy: Optional[float]
+    exposureTime: Optional[float]
+    beamTransmission: Optional[float]
+    annotatedPymcaXfeSpectrum: Optional[str]
+    beamSizeVertical: Optional[float]
+    beamSizeHorizontal: Optional[float]
+    crystalClass: Optional[str]
+    comments: Optional[str]
+    flux: Optional[decimal.Decimal]
+    flux_end: Optional[decimal.Decimal]
+    workingDirectory: Optional[str]
+    BLSample_sampleId: Optional[int]
+    BLSession_proposalId: Optional[int]
+
+
+ROW_CLASSES = {
+    "V_AnalysisInfo": VAnalysisInfo,
+    "v_Log4Stat": VLog4Stat,
+    "v_datacollection": VDatacollection,
+    "v_datacollection_autoprocintegration": VDatacollectionAutoprocintegration,
+    "v_datacollection_phasing": VDatacollectionPhasing,
+    "v_datacollection_phasing_program_run": VDatacollectionPhasingProgramRun,
+    "v_datacollection_summary": VDatacollectionSummary,
+    "v_datacollection_summary_autoprocintegration": VDatacollectionSummaryAutoprocintegration,
+    "v_datacollection_summary_datacollectiongroup": VDatacollectionSummaryDatacollectiongroup,
+    "v_datacollection_summary_phasing": VDatacollectionSummaryPhasing,
+    "v_datacollection_summary_screening": VDatacollectionSummaryScreening,
+    "v_dewar": VDewar,
+    "v_dewarBeamline": VDewarBeamline,
+    "v_dewarBeamlineByWeek": VDewarBeamlineByWeek,
+    "v_dewarByWeek": VDewarByWeek,
+    "v_dewarByWeekTotal": VDewarByWeekTotal,
+    "v_dewarList": VDewarList,
+    "v_dewarProposalCode": VDewarProposalCode,
+    "v_dewarProposalCodeByWeek": VDewarProposalCodeByWeek,
+    "v_dewar_summary": VDewarSummary,
+    "v_em_2dclassification": VEm2dclassification,
+    "v_em_classification": VEmClassification,
+    "v_em_movie": VEmMovie,
+    "v_em_stats": VEmStats,
+    "v_energyScan": VEnergyScan,
+    "v_hour": VHour,
+    "v_logonByHour": VLogonByHour,
+    "v_logonByMonthDay": VLogonByMonthDay,
+    "v_logonByWeek": VLogonByWeek,
+    "v_logonByWeekDay": VLogonByWeekDay,
+    "v_monthDay": VMonthDay,
+    "v_mx_autoprocessing_stats": VMxAutoprocessingStats,
+    "v_mx_experiment_stats": VMxExperimentStats,
+    "v_mx_sample": VMxSample,
+    "v_phasing": VPhasing,
+    "v_sample": VSample,
+    "v_sampleByWeek": VSampleByWeek,
+    "v_saxs_datacollection": VSaxsDatacollection,
+    "v_session": VSession,
+    "v_tracking_shipment_history": VTrackingShipmentHistory,
+    "v_week": VWeek,
+    "v_weekDay": VWeekDay,
+    "v_xfeFluorescenceSpectrum": VXfeFluorescenceSpectrum,
+}
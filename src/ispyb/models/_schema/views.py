@@ -0,0 +1,1852 @@
+# coding: utf-8
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    String,
+    TIMESTAMP,
+    Table,
+    text,
+)
+from sqlalchemy.dialects.mysql import (
+    BIGINT,
+    INTEGER,
+    TINYINT,
+    TINYTEXT,
+)
+
+from . import metadata
+
+
+t_V_AnalysisInfo = Table(
+    "V_AnalysisInfo",
+    metadata,
+    Column("experimentCreationDate", DateTime),
+    Column("timeStart", String(45)),
+    Column("dataCollectionId", INTEGER(11), server_default=text("'0'")),
+    Column("measurementId", INTEGER(11), server_default=text("'0'")),
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("proposalCode", String(45)),
+    Column("proposalNumber", String(45)),
+    Column("priorityLevelId", INTEGER(11)),
+    Column("code", String(100)),
+    Column("exposureTemperature", String(45)),
+    Column("transmission", String(45)),
+    Column("measurementComments", String(512)),
+    Column("experimentComments", String(512)),
+    Column("experimentId", INTEGER(11), server_default=text("'0'")),
+    Column("experimentType", String(128)),
+    Column("conc", String(45)),
+    Column("bufferAcronym", String(45)),
+    Column("macromoleculeAcronym", String(45)),
+    Column("bufferId", INTEGER(11), server_default=text("'0'")),
+    Column("macromoleculeId", INTEGER(11), server_default=text("'0'")),
+    Column("subtractedFilePath", String(255)),
+    Column("rgGuinier", String(45)),
+    Column("firstPointUsed", String(45)),
+    Column("lastPointUsed", String(45)),
+    Column("I0", String(45)),
+    Column("isagregated", String(45)),
+    Column("subtractionId", INTEGER(11)),
+    Column("rgGnom", String(45)),
+    Column("total", String(45)),
+    Column("dmax", String(45)),
+    Column("volume", String(45)),
+    Column("i0stdev", String(45)),
+    Column("quality", String(45)),
+    Column("substractionCreationTime", DateTime),
+    Column("bufferBeforeMeasurementId", INTEGER(11)),
+    Column("bufferAfterMeasurementId", INTEGER(11)),
+    Column("bufferBeforeFramesMerged", String(45)),
+    Column("bufferBeforeMergeId", INTEGER(11)),
+    Column("bufferBeforeAverageFilePath", String(255)),
+    Column("sampleMeasurementId", INTEGER(11)),
+    Column("sampleMergeId", INTEGER(11)),
+    Column("averageFilePath", String(255)),
+    Column("framesMerge", String(45)),
+    Column("framesCount", String(45)),
+    Column("bufferAfterFramesMerged", String(45)),
+    Column("bufferAfterMergeId", INTEGER(11)),
+    Column("bufferAfterAverageFilePath", String(255)),
+    Column("modelListId1", INTEGER(11)),
+    Column("nsdFilePath", String(255)),
+    Column("modelListId2", INTEGER(11)),
+    Column("chi2RgFilePath", String(255)),
+    Column("averagedModel", String(255)),
+    Column("averagedModelId", INTEGER(11)),
+    Column("rapidShapeDeterminationModel", String(255)),
+    Column("rapidShapeDeterminationModelId", INTEGER(11)),
+    Column("shapeDeterminationModel", String(255)),
+    Column("shapeDeterminationModelId", INTEGER(11)),
+    Column("abInitioModelId", INTEGER(11)),
+    Column("comments", String(512)),
+)
+
+
+t_v_Log4Stat = Table(
+    "v_Log4Stat",
+    metadata,
+    Column("id", INTEGER(11), server_default=text("'0'")),
+    Column("priority", String(15)),
+    Column("timestamp", DateTime),
+    Column("msg", String(255)),
+    Column("detail", String(255)),
+    Column("value", String(255)),
+)
+
+
+t_v_datacollection = Table(
+    "v_datacollection",
+    metadata,
+    Column("dataCollectionId", INTEGER(10), server_default=text("'0'")),
+    Column("dataCollectionGroupId", INTEGER(11)),
+    Column("strategySubWedgeOrigId", INTEGER(10)),
+    Column("detectorId", INTEGER(11)),
+    Column("blSubSampleId", INTEGER(10)),
+    Column("dataCollectionNumber", INTEGER(10)),
+    Column("startTime", DateTime),
+    Column("endTime", DateTime),
+    Column("runStatus", String(45)),
+    Column("axisStart", Float),
+    Column("axisEnd", Float),
+    Column("axisRange", Float),
+    Column("overlap", Float),
+    Column("numberOfImages", INTEGER(10)),
+    Column("startImageNumber", INTEGER(10)),
+    Column("numberOfPasses", INTEGER(10)),
+    Column("exposureTime", Float),
+    Column("imageDirectory", String(255)),
+    Column("imagePrefix", String(100)),
+    Column("imageSuffix", String(45)),
+    Column("fileTemplate", String(255)),
+    Column("wavelength", Float),
+    Column("resolution", Float),
+    Column("detectorDistance", Float),
+    Column("xBeam", Float),
+    Column("yBeam", Float),
+    Column("xBeamPix", Float),
+    Column("yBeamPix", Float),
+    Column("comments", String(1024)),
+    Column("printableForReport", TINYINT(3), server_default=text("'1'")),
+    Column("slitGapVertical", Float),
+    Column("slitGapHorizontal", Float),
+    Column("transmission", Float),
+    Column("synchrotronMode", String(20)),
+    Column("xtalSnapshotFullPath1", String(255)),
+    Column("xtalSnapshotFullPath2", String(255)),
+    Column("xtalSnapshotFullPath3", String(255)),
+    Column("xtalSnapshotFullPath4", String(255)),
+    Column("rotationAxis", Enum("Omega", "Kappa", "Phi")),
+    Column("phiStart", Float),
+    Column("kappaStart", Float),
+    Column("omegaStart", Float),
+    Column("resolutionAtCorner", Float),
+    Column("detector2Theta", Float),
+    Column("undulatorGap1", Float),
+    Column("undulatorGap2", Float),
+    Column("undulatorGap3", Float),
+    Column("beamSizeAtSampleX", Float),
+    Column("beamSizeAtSampleY", Float),
+    Column("centeringMethod", String(255)),
+    Column("averageTemperature", Float),
+    Column("actualCenteringPosition", String(255)),
+    Column("beamShape", String(45)),
+    Column("flux", Float(asdecimal=True)),
+    Column("flux_end", Float(asdecimal=True)),
+    Column("totalAbsorbedDose", Float(asdecimal=True)),
+    Column("bestWilsonPlotPath", String(255)),
+    Column("imageQualityIndicatorsPlotPath", String(512)),
+    Column("imageQualityIndicatorsCSVPath", String(512)),
+    Column("sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("workflowId", INTEGER(10)),
+    Column("AutoProcIntegration_dataCollectionId", INTEGER(10)),
+    Column("autoProcScalingId", INTEGER(10), server_default=text("'0'")),
+    Column("cell_a", Float),
+    Column("cell_b", Float),
+    Column("cell_c", Float),
+    Column("cell_alpha", Float),
+    Column("cell_beta", Float),
+    Column("cell_gamma", Float),
+    Column("anomalous", TINYINT(1), server_default=text("'0'")),
+    Column(
+        "scalingStatisticsType",
+        Enum("overall", "innerShell", "outerShell"),
+        server_default=text("'overall'"),
+    ),
+    Column("resolutionLimitHigh", Float),
+    Column("resolutionLimitLow", Float),
+    Column("completeness", Float),
+    Column("AutoProc_spaceGroup", String(45)),
+    Column("autoProcId", INTEGER(10), server_default=text("'0'")),
+    Column("rMerge", Float),
+    Column("ccHalf", Float),
+    Column("meanIOverSigI", Float),
+    Column(
+        "AutoProcIntegration_autoProcIntegrationId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column("AutoProcProgram_processingPrograms", String(255)),
+    Column(
+        "AutoProcProgram_processingStatus",
+        Enum("RUNNING", "FAILED", "SUCCESS", "0", "1"),
+    ),
+    Column(
+        "AutoProcProgram_autoProcProgramId", INTEGER(10), server_default=text("'0'")
+    ),
+    Column("ScreeningOutput_rankingResolution", Float(asdecimal=True)),
+)
+
+
+t_v_datacollection_autoprocintegration = Table(
+    "v_datacollection_autoprocintegration",
+    metadata,
+    Column(
+        "v_datacollection_summary_phasing_autoProcIntegrationId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column("v_datacollection_summary_phasing_dataCollectionId", INTEGER(10)),
+    Column("v_datacollection_summary_phasing_cell_a", Float),
+    Column("v_datacollection_summary_phasing_cell_b", Float),
+    Column("v_datacollection_summary_phasing_cell_c", Float),
+    Column("v_datacollection_summary_phasing_cell_alpha", Float),
+    Column("v_datacollection_summary_phasing_cell_beta", Float),
+    Column("v_datacollection_summary_phasing_cell_gamma", Float),
+    Column(
+        "v_datacollection_summary_phasing_anomalous",
+        TINYINT(1),
+        server_default=text("'0'"),
+    ),
+    Column("v_datacollection_summary_phasing_autoproc_space_group", String(45)),
+    Column(
+        "v_datacollection_summary_phasing_autoproc_autoprocId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column(
+        "v_datacollection_summary_phasing_autoProcScalingId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column("v_datacollection_processingPrograms", String(255)),
+    Column(
+        "v_datacollection_summary_phasing_autoProcProgramId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column(
+        "v_datacollection_processingStatus",
+        Enum("RUNNING", "FAILED", "SUCCESS", "0", "1"),
+    ),
+    Column("v_datacollection_processingStartTime", DateTime),
+    Column("v_datacollection_processingEndTime", DateTime),
+    Column(
+        "v_datacollection_summary_session_sessionId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column(
+        "v_datacollection_summary_session_proposalId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column("AutoProcIntegration_dataCollectionId", INTEGER(10)),
+    Column(
+        "AutoProcIntegration_autoProcIntegrationId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column(
+        "PhasingStep_phasing_phasingStepType",
+        Enum(
+            "PREPARE",
+            "SUBSTRUCTUREDETERMINATION",
+            "PHASING",
+            "MODELBUILDING",
+            "REFINEMENT",
+            "LIGAND_FIT",
+        ),
+    ),
+    Column("SpaceGroup_spaceGroupShortName", String(45)),
+    Column("Protein_proteinId", INTEGER(10), server_default=text("'0'")),
+    Column("Protein_acronym", String(45)),
+    Column("BLSample_name", String(100)),
+    Column("DataCollection_dataCollectionNumber", INTEGER(10)),
+    Column("DataCollection_imagePrefix", String(100)),
+)
+
+
+t_v_datacollection_phasing = Table(
+    "v_datacollection_phasing",
+    metadata,
+    Column("phasingStepId", INTEGER(10), server_default=text("'0'")),
+    Column("previousPhasingStepId", INTEGER(10)),
+    Column("phasingAnalysisId", INTEGER(10)),
+    Column("autoProcIntegrationId", INTEGER(10), server_default=text("'0'")),
+    Column("dataCollectionId", INTEGER(10)),
+    Column("anomalous", TINYINT(1), server_default=text("'0'")),
+    Column("spaceGroup", String(45)),
+    Column("autoProcId", INTEGER(10), server_default=text("'0'")),
+    Column(
+        "phasingStepType",
+        Enum(
+            "PREPARE",
+            "SUBSTRUCTUREDETERMINATION",
+            "PHASING",
+            "MODELBUILDING",
+            "REFINEMENT",
+            "LIGAND_FIT",
+        ),
+    ),
+    Column("method", String(45)),
+    Column("solventContent", String(45)),
+    Column("enantiomorph", String(45)),
+    Column("lowRes", String(45)),
+    Column("highRes", String(45)),
+    Column("autoProcScalingId", INTEGER(10), server_default=text("'0'")),
+    Column("spaceGroupShortName", String(45)),
+    Column("processingPrograms", String(255)),
+    Column("processingStatus", Enum("RUNNING", "FAILED", "SUCCESS", "0", "1")),
+    Column("phasingPrograms", String(255)),
+    Column("phasingStatus", TINYINT(1)),
+    Column("phasingStartTime", DateTime),
+    Column("phasingEndTime", DateTime),
+    Column("sessionId", INTEGER(10)),
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("blSampleId", INTEGER(10), server_default=text("'0'")),
+    Column("name", String(100)),
+    Column("code", String(45)),
+    Column("acronym", String(45)),
+    Column("proteinId", INTEGER(10), server_default=text("'0'")),
+)
+
+
+t_v_datacollection_phasing_program_run = Table(
+    "v_datacollection_phasing_program_run",
+    metadata,
+    Column("phasingStepId", INTEGER(10), server_default=text("'0'")),
+    Column("previousPhasingStepId", INTEGER(10)),
+    Column("phasingAnalysisId", INTEGER(10)),
+    Column("autoProcIntegrationId", INTEGER(10), server_default=text("'0'")),
+    Column("dataCollectionId", INTEGER(10)),
+    Column("autoProcId", INTEGER(10), server_default=text("'0'")),
+    Column(
+        "phasingStepType",
+        Enum(
+            "PREPARE",
+            "SUBSTRUCTUREDETERMINATION",
+            "PHASING",
+            "MODELBUILDING",
+            "REFINEMENT",
+            "LIGAND_FIT",
+        ),
+    ),
+    Column("method", String(45)),
+    Column("autoProcScalingId", INTEGER(10), server_default=text("'0'")),
+    Column("spaceGroupShortName", String(45)),
+    Column("phasingPrograms", String(255)),
+    Column("phasingStatus", TINYINT(1)),
+    Column("sessionId", INTEGER(10)),
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("blSampleId", INTEGER(10), server_default=text("'0'")),
+    Column("name", String(100)),
+    Column("code", String(45)),
+    Column("acronym", String(45)),
+    Column("proteinId", INTEGER(10), server_default=text("'0'")),
+    Column("phasingProgramAttachmentId", INTEGER(10), server_default=text("'0'")),
+    Column(
+        "fileType",
+        Enum(
+            "DSIGMA_RESOLUTION",
+            "OCCUPANCY_SITENUMBER",
+            "CONTRAST_CYCLE",
+            "CCALL_CCWEAK",
+            "IMAGE",
+            "Map",
+            "Logfile",
+            "PDB",
+            "CSV",
+            "INS",
+            "RES",
+            "TXT",
+        ),
+    ),
+    Column("fileName", String(45)),
+    Column("filePath", String(255)),
+)
+
+
+t_v_datacollection_summary = Table(
+    "v_datacollection_summary",
+    metadata,
+    Column(
+        "DataCollectionGroup_dataCollectionGroupId",
+        INTEGER(11),
+        server_default=text("'0'"),
+    ),
+    Column("DataCollectionGroup_blSampleId", INTEGER(10)),
+    Column("DataCollectionGroup_sessionId", INTEGER(10)),
+    Column("DataCollectionGroup_workflowId", INTEGER(10)),
+    Column(
+        "DataCollectionGroup_experimentType",
+        Enum(
+            "EM",
+            "SAD",
+            "SAD - Inverse Beam",
+            "OSC",
+            "Collect - Multiwedge",
+            "MAD",
+            "Helical",
+            "Multi-positional",
+            "Mesh",
+            "Burn",
+            "MAD - Inverse Beam",
+            "Characterization",
+            "Dehydration",
+            "Still",
+            "SSX-Chip",
+            "SSX-Jet",
+        ),
+    ),
+    Column("DataCollectionGroup_startTime", DateTime),
+    Column("DataCollectionGroup_endTime", DateTime),
+    Column("DataCollectionGroup_comments", String(1024)),
+    Column("DataCollectionGroup_actualSampleBarcode", String(45)),
+    Column("DataCollectionGroup_xtalSnapshotFullPath", String(255)),
+    Column("DataCollectionGroup_crystalClass", String(20)),
+    Column("BLSample_blSampleId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSample_crystalId", INTEGER(10)),
+    Column("BLSample_name", String(100)),
+    Column("BLSample_code", String(45)),
+    Column("BLSample_location", String(45)),
+    Column("BLSample_blSampleStatus", String(20)),
+    Column("BLSample_comments", String(1024)),
+    Column("Container_containerId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_protectedData", String(1024)),
+    Column("Dewar_dewarId", INTEGER(10), server_default=text("'0'")),
+    Column("Dewar_code", String(45)),
+    Column("Dewar_storageLocation", String(45)),
+    Column("Container_containerType", String(20)),
+    Column("Container_code", String(45)),
+    Column("Container_capacity", INTEGER(10)),
+    Column("Container_beamlineLocation", String(20)),
+    Column("Container_sampleChangerLocation", String(20)),
+    Column("Protein_proteinId", INTEGER(10), server_default=text("'0'")),
+    Column("Protein_name", String(255)),
+    Column("Protein_acronym", String(45)),
+    Column("DataCollection_dataCollectionId", INTEGER(10), server_default=text("'0'")),
+    Column("DataCollection_dataCollectionGroupId", INTEGER(11)),
+    Column("DataCollection_startTime", DateTime),
+    Column("DataCollection_endTime", DateTime),
+    Column("DataCollection_runStatus", String(45)),
+    Column("DataCollection_numberOfImages", INTEGER(10)),
+    Column("DataCollection_startImageNumber", INTEGER(10)),
+    Column("DataCollection_numberOfPasses", INTEGER(10)),
+    Column("DataCollection_exposureTime", Float),
+    Column("DataCollection_imageDirectory", String(255)),
+    Column("DataCollection_wavelength", Float),
+    Column("DataCollection_resolution", Float),
+    Column("DataCollection_detectorDistance", Float),
+    Column("DataCollection_xBeam", Float),
+    Column("transmission", Float),
+    Column("DataCollection_yBeam", Float),
+    Column("DataCollection_imagePrefix", String(100)),
+    Column("DataCollection_comments", String(1024)),
+    Column("DataCollection_xtalSnapshotFullPath1", String(255)),
+    Column("DataCollection_xtalSnapshotFullPath2", String(255)),
+    Column("DataCollection_xtalSnapshotFullPath3", String(255)),
+    Column("DataCollection_xtalSnapshotFullPath4", String(255)),
+    Column("DataCollection_phiStart", Float),
+    Column("DataCollection_kappaStart", Float),
+    Column("DataCollection_omegaStart", Float),
+    Column("DataCollection_flux", Float(asdecimal=True)),
+    Column("DataCollection_flux_end", Float(asdecimal=True)),
+    Column("DataCollection_resolutionAtCorner", Float),
+    Column("DataCollection_bestWilsonPlotPath", String(255)),
+    Column("DataCollection_dataCollectionNumber", INTEGER(10)),
+    Column("DataCollection_axisRange", Float),
+    Column("DataCollection_axisStart", Float),
+    Column("DataCollection_axisEnd", Float),
+    Column("DataCollection_rotationAxis", Enum("Omega", "Kappa", "Phi")),
+    Column("DataCollection_undulatorGap1", Float),
+    Column("DataCollection_undulatorGap2", Float),
+    Column("DataCollection_undulatorGap3", Float),
+    Column("beamSizeAtSampleX", Float),
+    Column("beamSizeAtSampleY", Float),
+    Column("DataCollection_slitGapVertical", Float),
+    Column("DataCollection_slitGapHorizontal", Float),
+    Column("DataCollection_beamShape", String(45)),
+    Column("DataCollection_voltage", Float),
+    Column("DataCollection_xBeamPix", Float),
+    Column("Workflow_workflowTitle", String(255)),
+    Column(
+        "Workflow_workflowType",
+        Enum(
+            "Characterisation",
+            "Undefined",
+            "BioSAXS Post Processing",
+            "EnhancedCharacterisation",
+            "LineScan",
+            "MeshScan",
+            "Dehydration",
+            "KappaReorientation",
+            "BurnStrategy",
+            "XrayCentering",
+            "DiffractionTomography",
+            "TroubleShooting",
+            "VisualReorientation",
+            "HelicalCharacterisation",
+            "GroupedProcessing",
+            "MXPressE",
+            "MXPressO",
+            "MXPressL",
+            "MXScore",
+            "MXPressI",
+            "MXPressM",
+            "MXPressA",
+            "CollectAndSpectra",
+            "LowDoseDC",
+            "EnergyInterleavedMAD",
+            "MXPressF",
+            "MXPressH",
+            "MXPressP",
+            "MXPressP_SAD",
+            "MXPressR",
+            "MXPressR_180",
+            "MXPressR_dehydration",
+            "MeshAndCollect",
+            "MeshAndCollectFromFile",
+        ),
+    ),
+    Column("Workflow_status", String(255)),
+    Column("Workflow_workflowId", INTEGER(10), server_default=text("'0'")),
+    Column("AutoProcIntegration_dataCollectionId", INTEGER(10)),
+    Column("autoProcScalingId", INTEGER(10), server_default=text("'0'")),
+    Column("cell_a", Float),
+    Column("cell_b", Float),
+    Column("cell_c", Float),
+    Column("cell_alpha", Float),
+    Column("cell_beta", Float),
+    Column("cell_gamma", Float),
+    Column("anomalous", TINYINT(1), server_default=text("'0'")),
+    Column(
+        "scalingStatisticsType",
+        Enum("overall", "innerShell", "outerShell"),
+        server_default=text("'overall'"),
+    ),
+    Column("resolutionLimitHigh", Float),
+    Column("resolutionLimitLow", Float),
+    Column("completeness", Float),
+    Column("AutoProc_spaceGroup", String(45)),
+    Column("autoProcId", INTEGER(10), server_default=text("'0'")),
+    Column("rMerge", Float),
+    Column(
+        "AutoProcIntegration_autoProcIntegrationId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column("AutoProcProgram_processingPrograms", String(255)),
+    Column(
+        "AutoProcProgram_processingStatus",
+        Enum("RUNNING", "FAILED", "SUCCESS", "0", "1"),
+    ),
+    Column(
+        "AutoProcProgram_autoProcProgramId", INTEGER(10), server_default=text("'0'")
+    ),
+    Column("Screening_screeningId", INTEGER(10), server_default=text("'0'")),
+    Column("Screening_dataCollectionId", INTEGER(10)),
+    Column("Screening_dataCollectionGroupId", INTEGER(11)),
+    Column("ScreeningOutput_strategySuccess", TINYINT(1), server_default=text("'0'")),
+    Column("ScreeningOutput_indexingSuccess", TINYINT(1), server_default=text("'0'")),
+    Column("ScreeningOutput_rankingResolution", Float(asdecimal=True)),
+    Column("ScreeningOutput_mosaicity", Float),
+    Column("ScreeningOutputLattice_spaceGroup", String(45)),
+    Column("ScreeningOutputLattice_unitCell_a", Float),
+    Column("ScreeningOutputLattice_unitCell_b", Float),
+    Column("ScreeningOutputLattice_unitCell_c", Float),
+    Column("ScreeningOutputLattice_unitCell_alpha", Float),
+    Column("ScreeningOutputLattice_unitCell_beta", Float),
+    Column("ScreeningOutputLattice_unitCell_gamma", Float),
+    Column("ScreeningOutput_totalExposureTime", Float(asdecimal=True)),
+    Column("ScreeningOutput_totalRotationRange", Float(asdecimal=True)),
+    Column("ScreeningOutput_totalNumberOfImages", INTEGER(11)),
+    Column("ScreeningStrategySubWedge_exposureTime", Float),
+    Column("ScreeningStrategySubWedge_transmission", Float),
+    Column("ScreeningStrategySubWedge_oscillationRange", Float),
+    Column("ScreeningStrategySubWedge_numberOfImages", INTEGER(10)),
+    Column("ScreeningStrategySubWedge_multiplicity", Float),
+    Column("ScreeningStrategySubWedge_completeness", Float),
+    Column("ScreeningStrategySubWedge_axisStart", Float),
+    Column("Shipping_shippingId", INTEGER(10), server_default=text("'0'")),
+    Column("Shipping_shippingName", String(45)),
+    Column("Shipping_shippingStatus", String(45)),
+    Column("diffractionPlanId", INTEGER(10), server_default=text("'0'")),
+    Column(
+        "experimentKind",
+        Enum(
+            "Default",
+            "MXPressE",
+            "MXPressF",
+            "MXPressO",
+            "MXPressP",
+            "MXPressP_SAD",
+            "MXPressI",
+            "MXPressE_SAD",
+            "MXScore",
+            "MXPressM",
+            "MAD",
+            "SAD",
+            "Fixed",
+            "Ligand binding",
+            "Refinement",
+            "OSC",
+            "MAD - Inverse Beam",
+            "SAD - Inverse Beam",
+        ),
+    ),
+    Column("observedResolution", Float),
+    Column("minimalResolution", Float),
+    Column("exposureTime", Float),
+    Column("oscillationRange", Float),
+    Column("maximalResolution", Float),
+    Column("screeningResolution", Float),
+    Column("radiationSensitivity", Float),
+    Column("anomalousScatterer", String(255)),
+    Column("preferredBeamSizeX", Float),
+    Column("preferredBeamSizeY", Float),
+    Column("preferredBeamDiameter", Float),
+    Column("DiffractipnPlan_comments", String(1024)),
+    Column("aimedCompleteness", Float(asdecimal=True)),
+    Column("aimedIOverSigmaAtHighestRes", Float(asdecimal=True)),
+    Column("aimedMultiplicity", Float(asdecimal=True)),
+    Column("aimedResolution", Float(asdecimal=True)),
+    Column("anomalousData", TINYINT(1), server_default=text("'0'")),
+    Column("complexity", String(45)),
+    Column("estimateRadiationDamage", TINYINT(1), server_default=text("'0'")),
+    Column("forcedSpaceGroup", String(45)),
+    Column("requiredCompleteness", Float(asdecimal=True)),
+    Column("requiredMultiplicity", Float(asdecimal=True)),
+    Column("requiredResolution", Float(asdecimal=True)),
+    Column("strategyOption", String(45)),
+    Column("kappaStrategyOption", String(45)),
+    Column("numberOfPositions", INTEGER(11)),
+    Column("minDimAccrossSpindleAxis", Float(asdecimal=True)),
+    Column("maxDimAccrossSpindleAxis", Float(asdecimal=True)),
+    Column("radiationSensitivityBeta", Float(asdecimal=True)),
+    Column("radiationSensitivityGamma", Float(asdecimal=True)),
+    Column("minOscWidth", Float),
+    Column("Detector_detectorType", String(255)),
+    Column("Detector_detectorManufacturer", String(255)),
+    Column("Detector_detectorModel", String(255)),
+    Column("Detector_detectorPixelSizeHorizontal", Float),
+    Column("Detector_detectorPixelSizeVertical", Float),
+    Column("Detector_detectorSerialNumber", String(30)),
+    Column("Detector_detectorDistanceMin", Float(asdecimal=True)),
+    Column("Detector_detectorDistanceMax", Float(asdecimal=True)),
+    Column("Detector_trustedPixelValueRangeLower", Float(asdecimal=True)),
+    Column("Detector_trustedPixelValueRangeUpper", Float(asdecimal=True)),
+    Column("Detector_sensorThickness", Float),
+    Column("Detector_overload", Float),
+    Column("Detector_XGeoCorr", String(255)),
+    Column("Detector_YGeoCorr", String(255)),
+    Column("Detector_detectorMode", String(255)),
+    Column("BeamLineSetup_undulatorType1", String(45)),
+    Column("BeamLineSetup_undulatorType2", String(45)),
+    Column("BeamLineSetup_undulatorType3", String(45)),
+    Column("BeamLineSetup_synchrotronName", String(255)),
+    Column("BeamLineSetup_synchrotronMode", String(255)),
+    Column("BeamLineSetup_polarisation", Float),
+    Column("BeamLineSetup_focusingOptic", String(255)),
+    Column("BeamLineSetup_beamDivergenceHorizontal", Float),
+    Column("BeamLineSetup_beamDivergenceVertical", Float),
+    Column("BeamLineSetup_monochromatorType", String(255)),
+)
+
+
+t_v_datacollection_summary_autoprocintegration = Table(
+    "v_datacollection_summary_autoprocintegration",
+    metadata,
+    Column("AutoProcIntegration_dataCollectionId", INTEGER(10)),
+    Column("cell_a", Float),
+    Column("cell_b", Float),
+    Column("cell_c", Float),
+    Column("cell_alpha", Float),
+    Column("cell_beta", Float),
+    Column("cell_gamma", Float),
+    Column("anomalous", TINYINT(1), server_default=text("'0'")),
+    Column(
+        "AutoProcIntegration_autoProcIntegrationId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column(
+        "v_datacollection_summary_autoprocintegration_processingPrograms", String(255)
+    ),
+    Column(
+        "AutoProcProgram_autoProcProgramId", INTEGER(10), server_default=text("'0'")
+    ),
+    Column(
+        "v_datacollection_summary_autoprocintegration_processingStatus",
+        Enum("RUNNING", "FAILED", "SUCCESS", "0", "1"),
+    ),
+    Column("AutoProcIntegration_phasing_dataCollectionId", INTEGER(10)),
+    Column(
+        "PhasingStep_phasing_phasingStepType",
+        Enum(
+            "PREPARE",
+            "SUBSTRUCTUREDETERMINATION",
+            "PHASING",
+            "MODELBUILDING",
+            "REFINEMENT",
+            "LIGAND_FIT",
+        ),
+    ),
+    Column("SpaceGroup_spaceGroupShortName", String(45)),
+    Column("autoProcId", INTEGER(10), server_default=text("'0'")),
+    Column("AutoProc_spaceGroup", String(45)),
+    Column(
+        "scalingStatisticsType",
+        Enum("overall", "innerShell", "outerShell"),
+        server_default=text("'overall'"),
+    ),
+    Column("resolutionLimitHigh", Float),
+    Column("resolutionLimitLow", Float),
+    Column("rMerge", Float),
+    Column("meanIOverSigI", Float),
+    Column("ccHalf", Float),
+    Column("completeness", Float),
+    Column("autoProcScalingId", INTEGER(10), server_default=text("'0'")),
+)
+
+
+t_v_datacollection_summary_datacollectiongroup = Table(
+    "v_datacollection_summary_datacollectiongroup",
+    metadata,
+    Column(
+        "DataCollectionGroup_dataCollectionGroupId",
+        INTEGER(11),
+        server_default=text("'0'"),
+    ),
+    Column("DataCollectionGroup_blSampleId", INTEGER(10)),
+    Column("DataCollectionGroup_sessionId", INTEGER(10)),
+    Column("DataCollectionGroup_workflowId", INTEGER(10)),
+    Column(
+        "DataCollectionGroup_experimentType",
+        Enum(
+            "EM",
+            "SAD",
+            "SAD - Inverse Beam",
+            "OSC",
+            "Collect - Multiwedge",
+            "MAD",
+            "Helical",
+            "Multi-positional",
+            "Mesh",
+            "Burn",
+            "MAD - Inverse Beam",
+            "Characterization",
+            "Dehydration",
+            "Still",
+            "SSX-Chip",
+            "SSX-Jet",
+        ),
+    ),
+    Column("DataCollectionGroup_startTime", DateTime),
+    Column("DataCollectionGroup_endTime", DateTime),
+    Column("DataCollectionGroup_comments", String(1024)),
+    Column("DataCollectionGroup_actualSampleBarcode", String(45)),
+    Column("DataCollectionGroup_xtalSnapshotFullPath", String(255)),
+    Column("BLSample_blSampleId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSample_crystalId", INTEGER(10)),
+    Column("BLSample_name", String(100)),
+    Column("BLSample_code", String(45)),
+    Column("BLSession_sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_protectedData", String(1024)),
+    Column("Protein_proteinId", INTEGER(10), server_default=text("'0'")),
+    Column("Protein_name", String(255)),
+    Column("Protein_acronym", String(45)),
+    Column("DataCollection_dataCollectionId", INTEGER(10), server_default=text("'0'")),
+    Column("DataCollection_dataCollectionGroupId", INTEGER(11)),
+    Column("DataCollection_startTime", DateTime),
+    Column("DataCollection_endTime", DateTime),
+    Column("DataCollection_runStatus", String(45)),
+    Column("DataCollection_numberOfImages", INTEGER(10)),
+    Column("DataCollection_startImageNumber", INTEGER(10)),
+    Column("DataCollection_numberOfPasses", INTEGER(10)),
+    Column("DataCollection_exposureTime", Float),
+    Column("DataCollection_imageDirectory", String(255)),
+    Column("DataCollection_wavelength", Float),
+    Column("DataCollection_resolution", Float),
+    Column("DataCollection_detectorDistance", Float),
+    Column("DataCollection_xBeam", Float),
+    Column("DataCollection_yBeam", Float),
+    Column("DataCollection_comments", String(1024)),
+    Column("DataCollection_xtalSnapshotFullPath1", String(255)),
+    Column("DataCollection_xtalSnapshotFullPath2", String(255)),
+    Column("DataCollection_xtalSnapshotFullPath3", String(255)),
+    Column("DataCollection_xtalSnapshotFullPath4", String(255)),
+    Column("DataCollection_phiStart", Float),
+    Column("DataCollection_kappaStart", Float),
+    Column("DataCollection_omegaStart", Float),
+    Column("DataCollection_resolutionAtCorner", Float),
+    Column("DataCollection_bestWilsonPlotPath", String(255)),
+    Column("DataCollection_dataCollectionNumber", INTEGER(10)),
+    Column("DataCollection_axisRange", Float),
+    Column("DataCollection_axisStart", Float),
+    Column("DataCollection_axisEnd", Float),
+    Column("Workflow_workflowTitle", String(255)),
+    Column(
+        "Workflow_workflowType",
+        Enum(
+            "Characterisation",
+            "Undefined",
+            "BioSAXS Post Processing",
+            "EnhancedCharacterisation",
+            "LineScan",
+            "MeshScan",
+            "Dehydration",
+            "KappaReorientation",
+            "BurnStrategy",
+            "XrayCentering",
+            "DiffractionTomography",
+            "TroubleShooting",
+            "VisualReorientation",
+            "HelicalCharacterisation",
+            "GroupedProcessing",
+            "MXPressE",
+            "MXPressO",
+            "MXPressL",
+            "MXScore",
+            "MXPressI",
+            "MXPressM",
+            "MXPressA",
+            "CollectAndSpectra",
+            "LowDoseDC",
+            "EnergyInterleavedMAD",
+            "MXPressF",
+            "MXPressH",
+            "MXPressP",
+            "MXPressP_SAD",
+            "MXPressR",
+            "MXPressR_180",
+            "MXPressR_dehydration",
+            "MeshAndCollect",
+            "MeshAndCollectFromFile",
+        ),
+    ),
+    Column("Workflow_status", String(255)),
+)
+
+
+t_v_datacollection_summary_phasing = Table(
+    "v_datacollection_summary_phasing",
+    metadata,
+    Column(
+        "v_datacollection_summary_phasing_autoProcIntegrationId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column("v_datacollection_summary_phasing_dataCollectionId", INTEGER(10)),
+    Column("v_datacollection_summary_phasing_cell_a", Float),
+    Column("v_datacollection_summary_phasing_cell_b", Float),
+    Column("v_datacollection_summary_phasing_cell_c", Float),
+    Column("v_datacollection_summary_phasing_cell_alpha", Float),
+    Column("v_datacollection_summary_phasing_cell_beta", Float),
+    Column("v_datacollection_summary_phasing_cell_gamma", Float),
+    Column(
+        "v_datacollection_summary_phasing_anomalous",
+        TINYINT(1),
+        server_default=text("'0'"),
+    ),
+    Column("v_datacollection_summary_phasing_autoproc_space_group", String(45)),
+    Column(
+        "v_datacollection_summary_phasing_autoproc_autoprocId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column(
+        "v_datacollection_summary_phasing_autoProcScalingId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column("v_datacollection_summary_phasing_processingPrograms", String(255)),
+    Column(
+        "v_datacollection_summary_phasing_autoProcProgramId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column(
+        "v_datacollection_summary_phasing_processingStatus",
+        Enum("RUNNING", "FAILED", "SUCCESS", "0", "1"),
+    ),
+    Column(
+        "v_datacollection_summary_session_sessionId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column(
+        "v_datacollection_summary_session_proposalId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+)
+
+
+t_v_datacollection_summary_screening = Table(
+    "v_datacollection_summary_screening",
+    metadata,
+    Column("Screening_screeningId", INTEGER(10), server_default=text("'0'")),
+    Column("Screening_dataCollectionId", INTEGER(10)),
+    Column("Screening_dataCollectionGroupId", INTEGER(11)),
+    Column("ScreeningOutput_strategySuccess", TINYINT(1), server_default=text("'0'")),
+    Column("ScreeningOutput_indexingSuccess", TINYINT(1), server_default=text("'0'")),
+    Column("ScreeningOutput_rankingResolution", Float(asdecimal=True)),
+    Column(
+        "ScreeningOutput_mosaicityEstimated", TINYINT(1), server_default=text("'0'")
+    ),
+    Column("ScreeningOutput_mosaicity", Float),
+    Column("ScreeningOutput_totalExposureTime", Float(asdecimal=True)),
+    Column("ScreeningOutput_totalRotationRange", Float(asdecimal=True)),
+    Column("ScreeningOutput_totalNumberOfImages", INTEGER(11)),
+    Column("ScreeningOutputLattice_spaceGroup", String(45)),
+    Column("ScreeningOutputLattice_unitCell_a", Float),
+    Column("ScreeningOutputLattice_unitCell_b", Float),
+    Column("ScreeningOutputLattice_unitCell_c", Float),
+    Column("ScreeningOutputLattice_unitCell_alpha", Float),
+    Column("ScreeningOutputLattice_unitCell_beta", Float),
+    Column("ScreeningOutputLattice_unitCell_gamma", Float),
+    Column("ScreeningStrategySubWedge_exposureTime", Float),
+    Column("ScreeningStrategySubWedge_transmission", Float),
+    Column("ScreeningStrategySubWedge_oscillationRange", Float),
+    Column("ScreeningStrategySubWedge_numberOfImages", INTEGER(10)),
+    Column("ScreeningStrategySubWedge_multiplicity", Float),
+    Column("ScreeningStrategySubWedge_completeness", Float),
+    Column("ScreeningStrategySubWedge_axisStart", Float),
+    Column("ScreeningStrategySubWedge_axisEnd", Float),
+    Column("ScreeningStrategySubWedge_rotationAxis", String(45)),
+)
+
+
+t_v_dewar = Table(
+    "v_dewar",
+    metadata,
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("shippingId", INTEGER(10), server_default=text("'0'")),
+    Column("shippingName", String(45)),
+    Column("dewarId", INTEGER(10), server_default=text("'0'")),
+    Column("dewarName", String(45)),
+    Column("dewarStatus", String(45)),
+    Column("proposalCode", String(45)),
+    Column("proposalNumber", String(45)),
+    Column("creationDate", DateTime),
+    Column("shippingType", String(45)),
+    Column("barCode", String(45)),
+    Column("shippingStatus", String(45)),
+    Column("beamLineName", String(45)),
+    Column("nbEvents", BIGINT(21), server_default=text("'0'")),
+    Column("storesin", BIGINT(21), server_default=text("'0'")),
+    Column("nbSamples", BIGINT(21), server_default=text("'0'")),
+)
+
+
+t_v_dewarBeamline = Table(
+    "v_dewarBeamline",
+    metadata,
+    Column("beamLineName", String(45)),
+    Column("COUNT(*)", BIGINT(21), server_default=text("'0'")),
+)
+
+
+t_v_dewarBeamlineByWeek = Table(
+    "v_dewarBeamlineByWeek",
+    metadata,
+    Column("Week", String(23)),
+    Column("ID14", BIGINT(21), server_default=text("'0'")),
+    Column("ID23", BIGINT(21), server_default=text("'0'")),
+    Column("ID29", BIGINT(21), server_default=text("'0'")),
+    Column("BM14", BIGINT(21), server_default=text("'0'")),
+)
+
+
+t_v_dewarByWeek = Table(
+    "v_dewarByWeek",
+    metadata,
+    Column("Week", String(23)),
+    Column("Dewars Tracked", BIGINT(21), server_default=text("'0'")),
+    Column("Dewars Non-Tracked", BIGINT(21), server_default=text("'0'")),
+)
+
+
+t_v_dewarByWeekTotal = Table(
+    "v_dewarByWeekTotal",
+    metadata,
+    Column("Week", String(23)),
+    Column("Dewars Tracked", BIGINT(21), server_default=text("'0'")),
+    Column("Dewars Non-Tracked", BIGINT(21), server_default=text("'0'")),
+    Column("Total", BIGINT(21), server_default=text("'0'")),
+)
+
+
+t_v_dewarList = Table(
+    "v_dewarList",
+    metadata,
+    Column("proposal", String(90)),
+    Column("shippingName", String(45)),
+    Column("dewarName", String(45)),
+    Column("barCode", String(45)),
+    Column("creationDate", String(10)),
+    Column("shippingType", String(45)),
+    Column("nbEvents", BIGINT(21), server_default=text("'0'")),
+    Column("dewarStatus", String(45)),
+    Column("shippingStatus", String(45)),
+    Column("nbSamples", BIGINT(21), server_default=text("'0'")),
+)
+
+
+t_v_dewarProposalCode = Table(
+    "v_dewarProposalCode",
+    metadata,
+    Column("proposalCode", String(45)),
+    Column("COUNT(*)", BIGINT(21), server_default=text("'0'")),
+)
+
+
+t_v_dewarProposalCodeByWeek = Table(
+    "v_dewarProposalCodeByWeek",
+    metadata,
+    Column("Week", String(23)),
+    Column("MX", BIGINT(21), server_default=text("'0'")),
+    Column("FX", BIGINT(21), server_default=text("'0'")),
+    Column("BM14U", BIGINT(21), server_default=text("'0'")),
+    Column("BM161", BIGINT(21), server_default=text("'0'")),
+    Column("BM162", BIGINT(21), server_default=text("'0'")),
+    Column("Others", BIGINT(21), server_default=text("'0'")),
+)
+
+
+t_v_dewar_summary = Table(
+    "v_dewar_summary",
+    metadata,
+    Column("shippingName", String(45)),
+    Column("deliveryAgent_agentName", String(45)),
+    Column("deliveryAgent_shippingDate", Date),
+    Column("deliveryAgent_deliveryDate", Date),
+    Column("deliveryAgent_agentCode", String(45)),
+    Column("deliveryAgent_flightCode", String(45)),
+    Column("shippingStatus", String(45)),
+    Column("bltimeStamp", DateTime),
+    Column("laboratoryId", INTEGER(10)),
+    Column("isStorageShipping", TINYINT(1), server_default=text("'0'")),
+    Column("creationDate", DateTime),
+    Column("Shipping_comments", String(255)),
+    Column("sendingLabContactId", INTEGER(10)),
+    Column("returnLabContactId", INTEGER(10)),
+    Column("returnCourier", String(45)),
+    Column("dateOfShippingToUser", DateTime),
+    Column("shippingType", String(45)),
+    Column("dewarId", INTEGER(10), server_default=text("'0'")),
+    Column("shippingId", INTEGER(10)),
+    Column("dewarCode", String(45)),
+    Column("comments", TINYTEXT),
+    Column("storageLocation", String(45)),
+    Column("dewarStatus", String(45)),
+    Column("isStorageDewar", TINYINT(1), server_default=text("'0'")),
+    Column("barCode", String(45)),
+    Column("firstExperimentId", INTEGER(10)),
+    Column("customsValue", INTEGER(10)),
+    Column("transportValue", INTEGER(10)),
+    Column("trackingNumberToSynchrotron", String(30)),
+    Column("trackingNumberFromSynchrotron", String(30)),
+    Column("type", Enum("Dewar", "Toolbox"), server_default=text("'Dewar'")),
+    Column("isReimbursed", TINYINT(1), server_default=text("'0'")),
+    Column("sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("beamlineName", String(45)),
+    Column("sessionStartDate", DateTime),
+    Column("sessionEndDate", DateTime),
+    Column("beamLineOperator", String(255)),
+    Column("nbReimbDewars", INTEGER(11)),
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("containerId", INTEGER(10), server_default=text("'0'")),
+    Column("containerType", String(20)),
+    Column("capacity", INTEGER(10)),
+    Column("beamlineLocation", String(20)),
+    Column("sampleChangerLocation", String(20)),
+    Column("containerStatus", String(45)),
+    Column("containerCode", String(45)),
+)
+
+
+t_v_em_2dclassification = Table(
+    "v_em_2dclassification",
+    metadata,
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("imageDirectory", String(255)),
+    Column("particlePickerId", INTEGER(10), server_default=text("'0'")),
+    Column("particleClassificationGroupId", INTEGER(10), server_default=text("'0'")),
+    Column("particleClassificationId", INTEGER(10), server_default=text("'0'")),
+    Column("classNumber", INTEGER(10)),
+    Column("classImageFullPath", String(255)),
+)
+
+
+t_v_em_classification = Table(
+    "v_em_classification",
+    metadata,
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("imageDirectory", String(255)),
+    Column("particlePickerId", INTEGER(10), server_default=text("'0'")),
+    Column("numberOfParticles", INTEGER(10)),
+    Column("particleClassificationGroupId", INTEGER(10), server_default=text("'0'")),
+    Column("particleClassificationId", INTEGER(10), server_default=text("'0'")),
+    Column("classNumber", INTEGER(10)),
+    Column("classImageFullPath", String(255)),
+    Column("particlesPerClass", INTEGER(10)),
+    Column("classDistribution", Float),
+    Column("rotationAccuracy", Float),
+    Column("translationAccuracy", Float),
+    Column("estimatedResolution", Float),
+    Column("overallFourierCompleteness", Float),
+)
+
+
+t_v_em_movie = Table(
+    "v_em_movie",
+    metadata,
+    Column("Movie_movieId", INTEGER(11), server_default=text("'0'")),
+    Column("Movie_dataCollectionId", INTEGER(10)),
+    Column("Movie_movieNumber", INTEGER(11)),
+    Column("Movie_movieFullPath", String(255)),
+    Column("Movie_positionX", String(45)),
+    Column("Movie_positionY", String(45)),
+    Column("Movie_micrographFullPath", String(255)),
+    Column("Movie_micrographSnapshotFullPath", String(255)),
+    Column("Movie_xmlMetaDataFullPath", String(255)),
+    Column("Movie_dosePerImage", String(45)),
+    Column(
+        "Movie_createdTimeStamp",
+        TIMESTAMP,
+        server_default=text("'current_timestamp()'"),
+    ),
+    Column(
+        "MotionCorrection_motionCorrectionId", INTEGER(11), server_default=text("'0'")
+    ),
+    Column("MotionCorrection_movieId", INTEGER(11)),
+    Column("MotionCorrection_firstFrame", String(45)),
+    Column("MotionCorrection_lastFrame", String(45)),
+    Column("MotionCorrection_dosePerFrame", String(45)),
+    Column("MotionCorrection_doseWeight", String(45)),
+    Column("MotionCorrection_totalMotion", String(45)),
+    Column("MotionCorrection_averageMotionPerFrame", String(45)),
+    Column("MotionCorrection_driftPlotFullPath", String(512)),
+    Column("MotionCorrection_micrographFullPath", String(512)),
+    Column("MotionCorrection_micrographSnapshotFullPath", String(512)),
+    Column("MotionCorrection_correctedDoseMicrographFullPath", String(512)),
+    Column("MotionCorrection_patchesUsed", String(45)),
+    Column("MotionCorrection_logFileFullPath", String(512)),
+    Column("CTF_CTFid", INTEGER(11), server_default=text("'0'")),
+    Column("CTF_motionCorrectionId", INTEGER(11)),
+    Column("CTF_spectraImageThumbnailFullPath", String(512)),
+    Column("CTF_spectraImageFullPath", String(512)),
+    Column("CTF_defocusU", String(45)),
+    Column("CTF_defocusV", String(45)),
+    Column("CTF_angle", String(45)),
+    Column("CTF_crossCorrelationCoefficient", String(45)),
+    Column("CTF_resolutionLimit", String(45)),
+    Column("CTF_estimatedBfactor", String(45)),
+    Column("CTF_logFilePath", String(512)),
+    Column(
+        "CTF_createdTimeStamp", TIMESTAMP, server_default=text("'current_timestamp()'")
+    ),
+    Column("Proposal_proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_sessionId", INTEGER(10), server_default=text("'0'")),
+)
+
+
+t_v_em_stats = Table(
+    "v_em_stats",
+    metadata,
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("imageDirectory", String(255)),
+    Column("movieId", INTEGER(11), server_default=text("'0'")),
+    Column("movieNumber", INTEGER(11)),
+    Column("createdTimeStamp", TIMESTAMP, server_default=text("'current_timestamp()'")),
+    Column("motionCorrectionId", INTEGER(11), server_default=text("'0'")),
+    Column("dataCollectionId", INTEGER(10), server_default=text("'0'")),
+    Column("totalMotion", String(45)),
+    Column("averageMotionPerFrame", String(45)),
+    Column("lastFrame", String(45)),
+    Column("dosePerFrame", String(45)),
+    Column("defocusU", String(45)),
+    Column("defocusV", String(45)),
+    Column("resolutionLimit", String(45)),
+    Column("estimatedBfactor", String(45)),
+    Column("angle", String(45)),
+)
+
+
+t_v_energyScan = Table(
+    "v_energyScan",
+    metadata,
+    Column("energyScanId", INTEGER(10), server_default=text("'0'")),
+    Column("sessionId", INTEGER(10)),
+    Column("blSampleId", INTEGER(10)),
+    Column("fluorescenceDetector", String(255)),
+    Column("scanFileFullPath", String(255)),
+    Column("choochFileFullPath", String(255)),
+    Column("jpegChoochFileFullPath", String(255)),
+    Column("element", String(45)),
+    Column("startEnergy", Float),
+    Column("endEnergy", Float),
+    Column("transmissionFactor", Float),
+    Column("exposureTime", Float),
+    Column("synchrotronCurrent", Float),
+    Column("temperature", Float),
+    Column("peakEnergy", Float),
+    Column("peakFPrime", Float),
+    Column("peakFDoublePrime", Float),
+    Column("inflectionEnergy", Float),
+    Column("inflectionFPrime", Float),
+    Column("inflectionFDoublePrime", Float),
+    Column("xrayDose", Float),
+    Column("startTime", DateTime),
+    Column("endTime", DateTime),
+    Column("edgeEnergy", String(255)),
+    Column("filename", String(255)),
+    Column("beamSizeVertical", Float),
+    Column("beamSizeHorizontal", Float),
+    Column("crystalClass", String(20)),
+    Column("comments", String(1024)),
+    Column("flux", Float(asdecimal=True)),
+    Column("flux_end", Float(asdecimal=True)),
+    Column("remoteEnergy", Float),
+    Column("remoteFPrime", Float),
+    Column("remoteFDoublePrime", Float),
+    Column("BLSample_sampleId", INTEGER(10), server_default=text("'0'")),
+    Column("name", String(100)),
+    Column("code", String(45)),
+    Column("acronym", String(45)),
+    Column("BLSession_proposalId", INTEGER(10), server_default=text("'0'")),
+)
+
+
+t_v_hour = Table("v_hour", metadata, Column("num", String(18)))
+
+
+t_v_logonByHour = Table(
+    "v_logonByHour",
+    metadata,
+    Column("Hour", String(7)),
+    Column("Distinct logins", BIGINT(21), server_default=text("'0'")),
+    Column("Total logins", BIGINT(22), server_default=text("'0'")),
+)
+
+
+t_v_logonByMonthDay = Table(
+    "v_logonByMonthDay",
+    metadata,
+    Column("Day", String(5)),
+    Column("Distinct logins", BIGINT(21), server_default=text("'0'")),
+    Column("Total logins", BIGINT(22), server_default=text("'0'")),
+)
+
+
+t_v_logonByWeek = Table(
+    "v_logonByWeek",
+    metadata,
+    Column("Week", String(23)),
+    Column("Distinct logins", BIGINT(21), server_default=text("'0'")),
+    Column("Total logins", BIGINT(22), server_default=text("'0'")),
+)
+
+
+t_v_logonByWeekDay = Table(
+    "v_logonByWeekDay",
+    metadata,
+    Column("Day", String(64)),
+    Column("Distinct logins", BIGINT(21), server_default=text("'0'")),
+    Column("Total logins", BIGINT(22), server_default=text("'0'")),
+)
+
+
+t_v_monthDay = Table("v_monthDay", metadata, Column("num", String(10)))
+
+
+t_v_mx_autoprocessing_stats = Table(
+    "v_mx_autoprocessing_stats",
+    metadata,
+    Column("autoProcScalingStatisticsId", INTEGER(10), server_default=text("'0'")),
+    Column("autoProcScalingId", INTEGER(10)),
+    Column(
+        "scalingStatisticsType",
+        Enum("overall", "innerShell", "outerShell"),
+        server_default=text("'overall'"),
+    ),
+    Column("resolutionLimitLow", Float),
+    Column("resolutionLimitHigh", Float),
+    Column("rMerge", Float),
+    Column("rMeasWithinIPlusIMinus", Float),
+    Column("rMeasAllIPlusIMinus", Float),
+    Column("rPimWithinIPlusIMinus", Float),
+    Column("rPimAllIPlusIMinus", Float),
+    Column("fractionalPartialBias", Float),
+    Column("nTotalObservations", INTEGER(11)),
+    Column("nTotalUniqueObservations", INTEGER(11)),
+    Column("meanIOverSigI", Float),
+    Column("completeness", Float),
+    Column("multiplicity", Float),
+    Column("anomalousCompleteness", Float),
+    Column("anomalousMultiplicity", Float),
+    Column("recordTimeStamp", DateTime),
+    Column("anomalous", TINYINT(1), server_default=text("'0'")),
+    Column("ccHalf", Float),
+    Column("ccAno", Float),
+    Column("sigAno", String(45)),
+    Column("ISA", String(45)),
+    Column("dataCollectionId", INTEGER(10), server_default=text("'0'")),
+    Column("strategySubWedgeOrigId", INTEGER(10)),
+    Column("detectorId", INTEGER(11)),
+    Column("blSubSampleId", INTEGER(10)),
+    Column("dataCollectionNumber", INTEGER(10)),
+    Column("startTime", DateTime),
+    Column("endTime", DateTime),
+    Column("sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("beamLineName", String(45)),
+)
+
+
+t_v_mx_experiment_stats = Table(
+    "v_mx_experiment_stats",
+    metadata,
+    Column("startTime", DateTime),
+    Column("Images", INTEGER(10)),
+    Column("Transmission", Float),
+    Column("Res. (corner)", Float),
+    Column("En. (Wave.)", Float),
+    Column("Omega start (total)", Float),
+    Column("Exposure Time", Float),
+    Column("Flux", Float(asdecimal=True)),
+    Column("Flux End", Float(asdecimal=True)),
+    Column("Detector Distance", Float),
+    Column("X Beam", Float),
+    Column("Y Beam", Float),
+    Column("Kappa", Float),
+    Column("Phi", Float),
+    Column("Axis Start", Float),
+    Column("Axis End", Float),
+    Column("Axis Range", Float),
+    Column("Beam Size X", Float),
+    Column("Beam Size Y", Float),
+    Column("beamLineName", String(45)),
+    Column("comments", String(1024)),
+    Column("proposalNumber", String(45)),
+)
+
+
+t_v_mx_sample = Table(
+    "v_mx_sample",
+    metadata,
+    Column("BLSample_blSampleId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSample_diffractionPlanId", INTEGER(10)),
+    Column("BLSample_crystalId", INTEGER(10)),
+    Column("BLSample_containerId", INTEGER(10)),
+    Column("BLSample_name", String(100)),
+    Column("BLSample_code", String(45)),
+    Column("BLSample_location", String(45)),
+    Column("BLSample_holderLength", Float(asdecimal=True)),
+    Column("BLSample_loopLength", Float(asdecimal=True)),
+    Column("BLSample_loopType", String(45)),
+    Column("BLSample_wireWidth", Float(asdecimal=True)),
+    Column("BLSample_comments", String(1024)),
+    Column("BLSample_completionStage", String(45)),
+    Column("BLSample_structureStage", String(45)),
+    Column("BLSample_publicationStage", String(45)),
+    Column("BLSample_publicationComments", String(255)),
+    Column("BLSample_blSampleStatus", String(20)),
+    Column("BLSample_isInSampleChanger", TINYINT(1)),
+    Column("BLSample_lastKnownCenteringPosition", String(255)),
+    Column(
+        "BLSample_recordTimeStamp",
+        TIMESTAMP,
+        server_default=text("'current_timestamp()'"),
+    ),
+    Column("BLSample_SMILES", String(400)),
+    Column("Protein_proteinId", INTEGER(10), server_default=text("'0'")),
+    Column("Protein_name", String(255)),
+    Column("Protein_acronym", String(45)),
+    Column("Protein_proteinType", String(45)),
+    Column("Protein_proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("Person_personId", INTEGER(10), server_default=text("'0'")),
+    Column("Person_familyName", String(100)),
+    Column("Person_givenName", String(45)),
+    Column("Person_emailAddress", String(60)),
+    Column("Container_containerId", INTEGER(10), server_default=text("'0'")),
+    Column("Container_code", String(45)),
+    Column("Container_containerType", String(20)),
+    Column("Container_containerStatus", String(45)),
+    Column("Container_beamlineLocation", String(20)),
+    Column("Container_sampleChangerLocation", String(20)),
+    Column("Dewar_code", String(45)),
+    Column("Dewar_dewarId", INTEGER(10), server_default=text("'0'")),
+    Column("Dewar_storageLocation", String(45)),
+    Column("Dewar_dewarStatus", String(45)),
+    Column("Dewar_barCode", String(45)),
+    Column("Shipping_shippingId", INTEGER(10), server_default=text("'0'")),
+    Column("sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_startDate", DateTime),
+    Column("BLSession_beamLineName", String(45)),
+)
+
+
+t_v_phasing = Table(
+    "v_phasing",
+    metadata,
+    Column("BLSample_blSampleId", INTEGER(10), server_default=text("'0'")),
+    Column(
+        "AutoProcIntegration_autoProcIntegrationId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column("AutoProcIntegration_dataCollectionId", INTEGER(10)),
+    Column("AutoProcIntegration_autoProcProgramId", INTEGER(10)),
+    Column("AutoProcIntegration_startImageNumber", INTEGER(10)),
+    Column("AutoProcIntegration_endImageNumber", INTEGER(10)),
+    Column("AutoProcIntegration_refinedDetectorDistance", Float),
+    Column("AutoProcIntegration_refinedXBeam", Float),
+    Column("AutoProcIntegration_refinedYBeam", Float),
+    Column("AutoProcIntegration_rotationAxisX", Float),
+    Column("AutoProcIntegration_rotationAxisY", Float),
+    Column("AutoProcIntegration_rotationAxisZ", Float),
+    Column("AutoProcIntegration_beamVectorX", Float),
+    Column("AutoProcIntegration_beamVectorY", Float),
+    Column("AutoProcIntegration_beamVectorZ", Float),
+    Column("AutoProcIntegration_cell_a", Float),
+    Column("AutoProcIntegration_cell_b", Float),
+    Column("AutoProcIntegration_cell_c", Float),
+    Column("AutoProcIntegration_cell_alpha", Float),
+    Column("AutoProcIntegration_cell_beta", Float),
+    Column("AutoProcIntegration_cell_gamma", Float),
+    Column("AutoProcIntegration_recordTimeStamp", DateTime),
+    Column("AutoProcIntegration_anomalous", TINYINT(1), server_default=text("'0'")),
+    Column("SpaceGroup_spaceGroupId", INTEGER(10), server_default=text("'0'")),
+    Column("SpaceGroup_geometryClassnameId", INTEGER(10)),
+    Column("SpaceGroup_spaceGroupNumber", INTEGER(10)),
+    Column("SpaceGroup_spaceGroupShortName", String(45)),
+    Column("SpaceGroup_spaceGroupName", String(45)),
+    Column("SpaceGroup_bravaisLattice", String(45)),
+    Column("SpaceGroup_bravaisLatticeName", String(45)),
+    Column("SpaceGroup_pointGroup", String(45)),
+    Column("SpaceGroup_MX_used", TINYINT(1), server_default=text("'0'")),
+    Column("PhasingStep_phasingStepId", INTEGER(10), server_default=text("'0'")),
+    Column("PhasingStep_previousPhasingStepId", INTEGER(10)),
+    Column("PhasingStep_programRunId", INTEGER(10)),
+    Column("PhasingStep_spaceGroupId", INTEGER(10)),
+    Column("PhasingStep_autoProcScalingId", INTEGER(10)),
+    Column("PhasingStep_phasingAnalysisId", INTEGER(10)),
+    Column(
+        "PhasingStep_phasingStepType",
+        Enum(
+            "PREPARE",
+            "SUBSTRUCTUREDETERMINATION",
+            "PHASING",
+            "MODELBUILDING",
+            "REFINEMENT",
+            "LIGAND_FIT",
+        ),
+    ),
+    Column("PhasingStep_method", String(45)),
+    Column("PhasingStep_solventContent", String(45)),
+    Column("PhasingStep_enantiomorph", String(45)),
+    Column("PhasingStep_lowRes", String(45)),
+    Column("PhasingStep_highRes", String(45)),
+    Column(
+        "PhasingStep_recordTimeStamp",
+        TIMESTAMP,
+        server_default=text("'current_timestamp()'"),
+    ),
+    Column("DataCollection_dataCollectionId", INTEGER(10), server_default=text("'0'")),
+    Column("DataCollection_dataCollectionGroupId", INTEGER(11)),
+    Column("DataCollection_strategySubWedgeOrigId", INTEGER(10)),
+    Column("DataCollection_detectorId", INTEGER(11)),
+    Column("DataCollection_blSubSampleId", INTEGER(10)),
+    Column("DataCollection_dataCollectionNumber", INTEGER(10)),
+    Column("DataCollection_startTime", DateTime),
+    Column("DataCollection_endTime", DateTime),
+    Column("DataCollection_runStatus", String(45)),
+    Column("DataCollection_axisStart", Float),
+    Column("DataCollection_axisEnd", Float),
+    Column("DataCollection_axisRange", Float),
+    Column("DataCollection_overlap", Float),
+    Column("DataCollection_numberOfImages", INTEGER(10)),
+    Column("DataCollection_startImageNumber", INTEGER(10)),
+    Column("DataCollection_numberOfPasses", INTEGER(10)),
+    Column("DataCollection_exposureTime", Float),
+    Column("DataCollection_imageDirectory", String(255)),
+    Column("DataCollection_imagePrefix", String(100)),
+    Column("DataCollection_imageSuffix", String(45)),
+    Column("DataCollection_fileTemplate", String(255)),
+    Column("DataCollection_wavelength", Float),
+    Column("DataCollection_resolution", Float),
+    Column("DataCollection_detectorDistance", Float),
+    Column("DataCollection_xBeam", Float),
+    Column("DataCollection_yBeam", Float),
+    Column("DataCollection_xBeamPix", Float),
+    Column("DataCollection_yBeamPix", Float),
+    Column("DataCollection_comments", String(1024)),
+    Column("DataCollection_printableForReport", TINYINT(3), server_default=text("'1'")),
+    Column("DataCollection_slitGapVertical", Float),
+    Column("DataCollection_slitGapHorizontal", Float),
+    Column("DataCollection_transmission", Float),
+    Column("DataCollection_synchrotronMode", String(20)),
+    Column("DataCollection_xtalSnapshotFullPath1", String(255)),
+    Column("DataCollection_xtalSnapshotFullPath2", String(255)),
+    Column("DataCollection_xtalSnapshotFullPath3", String(255)),
+    Column("DataCollection_xtalSnapshotFullPath4", String(255)),
+    Column("DataCollection_rotationAxis", Enum("Omega", "Kappa", "Phi")),
+    Column("DataCollection_phiStart", Float),
+    Column("DataCollection_kappaStart", Float),
+    Column("DataCollection_omegaStart", Float),
+    Column("DataCollection_resolutionAtCorner", Float),
+    Column("DataCollection_detector2Theta", Float),
+    Column("DataCollection_undulatorGap1", Float),
+    Column("DataCollection_undulatorGap2", Float),
+    Column("DataCollection_undulatorGap3", Float),
+    Column("DataCollection_beamSizeAtSampleX", Float),
+    Column("DataCollection_beamSizeAtSampleY", Float),
+    Column("DataCollection_centeringMethod", String(255)),
+    Column("DataCollection_averageTemperature", Float),
+    Column("DataCollection_actualCenteringPosition", String(255)),
+    Column("DataCollection_beamShape", String(45)),
+    Column("DataCollection_flux", Float(asdecimal=True)),
+    Column("DataCollection_flux_end", Float(asdecimal=True)),
+    Column("DataCollection_totalAbsorbedDose", Float(asdecimal=True)),
+    Column("DataCollection_bestWilsonPlotPath", String(255)),
+    Column("DataCollection_imageQualityIndicatorsPlotPath", String(512)),
+    Column("DataCollection_imageQualityIndicatorsCSVPath", String(512)),
+    Column(
+        "PhasingProgramRun_phasingProgramRunId", INTEGER(10), server_default=text("'0'")
+    ),
+    Column("PhasingProgramRun_phasingCommandLine", String(255)),
+    Column("PhasingProgramRun_phasingPrograms", String(255)),
+    Column("PhasingProgramRun_phasingStatus", TINYINT(1)),
+    Column("PhasingProgramRun_phasingMessage", String(255)),
+    Column("PhasingProgramRun_phasingStartTime", DateTime),
+    Column("PhasingProgramRun_phasingEndTime", DateTime),
+    Column("PhasingProgramRun_phasingEnvironment", String(255)),
+    Column("PhasingProgramRun_phasingDirectory", String(255)),
+    Column(
+        "PhasingProgramRun_recordTimeStamp",
+        TIMESTAMP,
+        server_default=text("'current_timestamp()'"),
+    ),
+    Column("Protein_proteinId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_proposalId", INTEGER(10), server_default=text("'0'")),
+    Column(
+        "PhasingStatistics_phasingStatisticsId", INTEGER(10), server_default=text("'0'")
+    ),
+    Column(
+        "PhasingStatistics_metric",
+        Enum(
+            "Rcullis",
+            "Average Fragment Length",
+            "Chain Count",
+            "Residues Count",
+            "CC",
+            "PhasingPower",
+            "FOM",
+            '<d"/sig>',
+            "Best CC",
+            "CC(1/2)",
+            "Weak CC",
+            "CFOM",
+            "Pseudo_free_CC",
+            "CC of partial model",
+            "Start R-work",
+            "Start R-free",
+            "Final R-work",
+            "Final R-free",
+        ),
+    ),
+    Column("PhasingStatistics_statisticsValue", Float(asdecimal=True)),
+)
+
+
+t_v_sample = Table(
+    "v_sample",
+    metadata,
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("shippingId", INTEGER(10), server_default=text("'0'")),
+    Column("dewarId", INTEGER(10), server_default=text("'0'")),
+    Column("containerId", INTEGER(10), server_default=text("'0'")),
+    Column("blSampleId", INTEGER(10), server_default=text("'0'")),
+    Column("proposalCode", String(45)),
+    Column("proposalNumber", String(45)),
+    Column("creationDate", DateTime),
+    Column("shippingType", String(45)),
+    Column("barCode", String(45)),
+    Column("shippingStatus", String(45)),
+)
+
+
+t_v_sampleByWeek = Table(
+    "v_sampleByWeek",
+    metadata,
+    Column("Week", String(23)),
+    Column("Samples", BIGINT(21)),
+)
+
+
+t_v_saxs_datacollection = Table(
+    "v_saxs_datacollection",
+    metadata,
+    Column("Subtraction_subtractionId", INTEGER(11), server_default=text("'0'")),
+    Column("MeasurementToDataCollection_dataCollectionId", INTEGER(11)),
+    Column("MeasurementToDataCollection_dataCollectionOrder", INTEGER(11)),
+    Column(
+        "MeasurementToDataCollection_measurementToDataCollectionId",
+        INTEGER(11),
+        server_default=text("'0'"),
+    ),
+    Column("Specimen_specimenId", INTEGER(11), server_default=text("'0'")),
+    Column("Measurement_code", String(100)),
+    Column("Measurement_measurementId", INTEGER(11), server_default=text("'0'")),
+    Column("Buffer_bufferId", INTEGER(11), server_default=text("'0'")),
+    Column("Buffer_proposalId", INTEGER(11), server_default=text("'-1'")),
+    Column("Buffer_safetyLevelId", INTEGER(11)),
+    Column("Buffer_name", String(45)),
+    Column("Buffer_acronym", String(45)),
+    Column("Buffer_pH", String(45)),
+    Column("Buffer_composition", String(45)),
+    Column("Buffer_comments", String(512)),
+    Column("Macromolecule_macromoleculeId", INTEGER(11), server_default=text("'0'")),
+    Column("Macromolecule_proposalId", INTEGER(10)),
+    Column("Macromolecule_safetyLevelId", INTEGER(11)),
+    Column("Macromolecule_name", String(45)),
+    Column("Macromolecule_acronym", String(45)),
+    Column("Macromolecule_extintionCoefficient", String(45)),
+    Column("Macromolecule_molecularMass", String(45)),
+    Column("Macromolecule_sequence", String(1000)),
+    Column("Macromolecule_contactsDescriptionFilePath", String(255)),
+    Column("Macromolecule_symmetry", String(45)),
+    Column("Macromolecule_comments", String(1024)),
+    Column("Macromolecule_refractiveIndex", String(45)),
+    Column("Macromolecule_solventViscosity", String(45)),
+    Column("Macromolecule_creationDate", DateTime),
+    Column("Specimen_experimentId", INTEGER(11)),
+    Column("Specimen_bufferId", INTEGER(11)),
+    Column("Specimen_samplePlatePositionId", INTEGER(11)),
+    Column("Specimen_safetyLevelId", INTEGER(11)),
+    Column("Specimen_stockSolutionId", INTEGER(11)),
+    Column("Specimen_code", String(255)),
+    Column("Specimen_concentration", String(45)),
+    Column("Specimen_volume", String(45)),
+    Column("Specimen_comments", String(5120)),
+    Column(
+        "SamplePlatePosition_samplePlatePositionId",
+        INTEGER(11),
+        server_default=text("'0'"),
+    ),
+    Column("SamplePlatePosition_samplePlateId", INTEGER(11)),
+    Column("SamplePlatePosition_rowNumber", INTEGER(11)),
+    Column("SamplePlatePosition_columnNumber", INTEGER(11)),
+    Column("SamplePlatePosition_volume", String(45)),
+    Column("samplePlateId", INTEGER(11), server_default=text("'0'")),
+    Column("experimentId", INTEGER(11)),
+    Column("plateGroupId", INTEGER(11)),
+    Column("plateTypeId", INTEGER(11)),
+    Column("instructionSetId", INTEGER(11)),
+    Column("SamplePlate_boxId", INTEGER(10)),
+    Column("SamplePlate_name", String(45)),
+    Column("SamplePlate_slotPositionRow", String(45)),
+    Column("SamplePlate_slotPositionColumn", String(45)),
+    Column("SamplePlate_storageTemperature", String(45)),
+    Column("Experiment_experimentId", INTEGER(11), server_default=text("'0'")),
+    Column("Experiment_sessionId", INTEGER(10)),
+    Column("Experiment_proposalId", INTEGER(11)),
+    Column("Experiment_name", String(255)),
+    Column("Experiment_creationDate", DateTime),
+    Column("Experiment_experimentType", String(128)),
+    Column("Experiment_sourceFilePath", String(256)),
+    Column("Experiment_dataAcquisitionFilePath", String(256)),
+    Column("Experiment_status", String(45)),
+    Column("Experiment_comments", String(512)),
+    Column("Measurement_priorityLevelId", INTEGER(11)),
+    Column("Measurement_exposureTemperature", String(45)),
+    Column("Measurement_viscosity", String(45)),
+    Column("Measurement_flow", TINYINT(1)),
+    Column("Measurement_extraFlowTime", String(45)),
+    Column("Measurement_volumeToLoad", String(45)),
+    Column("Measurement_waitTime", String(45)),
+    Column("Measurement_transmission", String(45)),
+    Column("Measurement_comments", String(512)),
+    Column("Measurement_imageDirectory", String(512)),
+    Column("Run_runId", INTEGER(11), server_default=text("'0'")),
+    Column("Run_timePerFrame", String(45)),
+    Column("Run_timeStart", String(45)),
+    Column("Run_timeEnd", String(45)),
+    Column("Run_storageTemperature", String(45)),
+    Column("Run_exposureTemperature", String(45)),
+    Column("Run_spectrophotometer", String(45)),
+    Column("Run_energy", String(45)),
+    Column("Run_creationDate", DateTime),
+    Column("Run_frameAverage", String(45)),
+    Column("Run_frameCount", String(45)),
+    Column("Run_transmission", String(45)),
+    Column("Run_beamCenterX", String(45)),
+    Column("Run_beamCenterY", String(45)),
+    Column("Run_pixelSizeX", String(45)),
+    Column("Run_pixelSizeY", String(45)),
+    Column("Run_radiationRelative", String(45)),
+    Column("Run_radiationAbsolute", String(45)),
+    Column("Run_normalization", String(45)),
+    Column("Merge_mergeId", INTEGER(11), server_default=text("'0'")),
+    Column("Merge_measurementId", INTEGER(11)),
+    Column("Merge_frameListId", INTEGER(11)),
+    Column("Merge_discardedFrameNameList", String(1024)),
+    Column("Merge_averageFilePath", String(255)),
+    Column("Merge_framesCount", String(45)),
+    Column("Merge_framesMerge", String(45)),
+    Column("Merge_creationDate", DateTime),
+    Column("Subtraction_dataCollectionId", INTEGER(11)),
+    Column("Subtraction_rg", String(45)),
+    Column("Subtraction_rgStdev", String(45)),
+    Column("Subtraction_I0", String(45)),
+    Column("Subtraction_I0Stdev", String(45)),
+    Column("Subtraction_firstPointUsed", String(45)),
+    Column("Subtraction_lastPointUsed", String(45)),
+    Column("Subtraction_quality", String(45)),
+    Column("Subtraction_isagregated", String(45)),
+    Column("Subtraction_concentration", String(45)),
+    Column("Subtraction_gnomFilePath", String(255)),
+    Column("Subtraction_rgGuinier", String(45)),
+    Column("Subtraction_rgGnom", String(45)),
+    Column("Subtraction_dmax", String(45)),
+    Column("Subtraction_total", String(45)),
+    Column("Subtraction_volume", String(45)),
+    Column("Subtraction_creationTime", DateTime),
+    Column("Subtraction_kratkyFilePath", String(255)),
+    Column("Subtraction_scatteringFilePath", String(255)),
+    Column("Subtraction_guinierFilePath", String(255)),
+    Column("Subtraction_substractedFilePath", String(255)),
+    Column("Subtraction_gnomFilePathOutput", String(255)),
+    Column("Subtraction_sampleOneDimensionalFiles", INTEGER(11)),
+    Column("Subtraction_bufferOnedimensionalFiles", INTEGER(11)),
+    Column("Subtraction_sampleAverageFilePath", String(255)),
+    Column("Subtraction_bufferAverageFilePath", String(255)),
+)
+
+
+t_v_session = Table(
+    "v_session",
+    metadata,
+    Column("sessionId", INTEGER(10), server_default=text("'0'")),
+    Column("expSessionPk", INTEGER(10)),
+    Column("beamLineSetupId", INTEGER(10)),
+    Column("proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("projectCode", String(45)),
+    Column("BLSession_startDate", DateTime),
+    Column("BLSession_endDate", DateTime),
+    Column("beamLineName", String(45)),
+    Column("scheduled", TINYINT(1)),
+    Column("nbShifts", INTEGER(10)),
+    Column("comments", String(2000)),
+    Column("beamLineOperator", String(255)),
+    Column("visit_number", INTEGER(10), server_default=text("'0'")),
+    Column("bltimeStamp", TIMESTAMP, server_default=text("'current_timestamp()'")),
+    Column("usedFlag", TINYINT(1)),
+    Column("sessionTitle", String(255)),
+    Column("structureDeterminations", Float),
+    Column("dewarTransport", Float),
+    Column("databackupFrance", Float),
+    Column("databackupEurope", Float),
+    Column("operatorSiteNumber", String(10)),
+    Column(
+        "BLSession_lastUpdate", TIMESTAMP, server_default=text("'0000-00-00 00:00:00'")
+    ),
+    Column("BLSession_protectedData", String(1024)),
+    Column("Proposal_title", String(200)),
+    Column("Proposal_proposalCode", String(45)),
+    Column("Proposal_ProposalNumber", String(45)),
+    Column("Proposal_ProposalType", String(2)),
+    Column("Person_personId", INTEGER(10), server_default=text("'0'")),
+    Column("Person_familyName", String(100)),
+    Column("Person_givenName", String(45)),
+    Column("Person_emailAddress", String(60)),
+)
+
+
+t_v_tracking_shipment_history = Table(
+    "v_tracking_shipment_history",
+    metadata,
+    Column("Dewar_dewarId", INTEGER(10), server_default=text("'0'")),
+    Column("Dewar_code", String(45)),
+    Column("Dewar_comments", TINYTEXT),
+    Column("Dewar_dewarStatus", String(45)),
+    Column("Dewar_barCode", String(45)),
+    Column("Dewar_firstExperimentId", INTEGER(10)),
+    Column("Dewar_trackingNumberToSynchrotron", String(30)),
+    Column("Dewar_trackingNumberFromSynchrotron", String(30)),
+    Column("Dewar_type", Enum("Dewar", "Toolbox"), server_default=text("'Dewar'")),
+    Column("Shipping_shippingId", INTEGER(10), server_default=text("'0'")),
+    Column("Shipping_proposalId", INTEGER(10), server_default=text("'0'")),
+    Column("Shipping_shippingName", String(45)),
+    Column("deliveryAgent_agentName", String(45)),
+    Column("Shipping_deliveryAgent_shippingDate", Date),
+    Column("Shipping_deliveryAgent_deliveryDate", Date),
+    Column("Shipping_shippingStatus", String(45)),
+    Column("Shipping_returnCourier", String(45)),
+    Column("Shipping_dateOfShippingToUser", DateTime),
+    Column(
+        "DewarTransportHistory_DewarTransportHistoryId",
+        INTEGER(10),
+        server_default=text("'0'"),
+    ),
+    Column("DewarTransportHistory_dewarStatus", String(45)),
+    Column("DewarTransportHistory_storageLocation", String(45)),
+    Column("DewarTransportHistory_arrivalDate", DateTime),
+)
+
+
+t_v_week = Table("v_week", metadata, Column("num", String(7)))
+
+
+t_v_weekDay = Table("v_weekDay", metadata, Column("day", String(10)))
+
+
+t_v_xfeFluorescenceSpectrum = Table(
+    "v_xfeFluorescenceSpectrum",
+    metadata,
+    Column("xfeFluorescenceSpectrumId", INTEGER(10), server_default=text("'0'")),
+    Column("sessionId", INTEGER(10)),
+    Column("blSampleId", INTEGER(10)),
+    Column("fittedDataFileFullPath", String(255)),
+    Column("scanFileFullPath", String(255)),
+    Column("jpegScanFileFullPath", String(255)),
+    Column("startTime", DateTime),
+    Column("endTime", DateTime),
+    Column("filename", String(255)),
+    Column("energy", Float),
+    Column("exposureTime", Float),
+    Column("beamTransmission", Float),
+    Column("annotatedPymcaXfeSpectrum", String(255)),
+    Column("beamSizeVertical", Float),
+    Column("beamSizeHorizontal", Float),
+    Column("crystalClass", String(20)),
+    Column("comments", String(1024)),
+    Column("flux", Float(asdecimal=True)),
+    Column("flux_end", Float(asdecimal=True)),
+    Column("workingDirectory", String(512)),
+    Column("BLSample_sampleId", INTEGER(10), server_default=text("'0'")),
+    Column("BLSession_proposalId", INTEGER(10), server_default=text("'0'")),
+)
@@ -0,0 +1,43 @@
+from sqlalchemy.orm import relationship
+
+from ._schema.shipping import *  # noqa F403
+from ._schema.shipping import (
+    BLSubSample,
+    Protein,
+    CrystalComposition,
+    Crystal,
+    SampleComposition,
+    BLSample,
+)
+
+Protein.ConcentrationType = relationship(
+    "ConcentrationType",
+    foreign_keys=[Protein.concentrationTypeId],
+    primaryjoin="Protein.concentrationTypeId == ConcentrationType.concentrationTypeId",
+)
+
+BLSubSample.Position1 = relationship("Position", foreign_keys=[BLSubSample.positionId])
+
+BLSubSample.Position2 = relationship("Position", foreign_keys=[BLSubSample.position2Id])
+
+CrystalComposition.Crystal = relationship(
+    "Crystal",
+    back_populates="crystal_compositions",
+)
+
+Crystal.crystal_compositions = relationship(
+    "CrystalComposition",
+    back_populates="Crystal",
+    cascade="all, delete-orphan",
+)
+
+SampleComposition.BLSample = relationship(
+    "BLSample",
+    back_populates="sample_compositions",
+)
+
+BLSample.sample_compositions = relationship(
+    "SampleComposition",
+    back_populates="BLSample",
+    cascade="all, delete-orphan",
+)
@@ -1,9 +1,103 @@
-from typing import Dict, Any
+import base64
+import decimal
+from typing import Dict, Any, Callable, Mapping, Type, TypeVar
+
+from sqlalchemy import inspect
+
+T = TypeVar("T", bound="CustomBase")
+
+
+def _python_type(prop) -> Any:
+    try:
+        return prop.columns[0].type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _json_value(value: Any) -> Any:
+    # orjson serialises datetimes natively but not Decimal or bytes
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    return value
+
+
+def _compile_to_dict(cls) -> Callable[[Any, bool], Dict[str, Any]]:
+    props = inspect(cls).column_attrs
+    keys = tuple(prop.key for prop in props)
+    # Columns whose values need converting for orjson
+    converted = tuple(
+        prop.key
+        for prop in props
+        if _python_type(prop) in (decimal.Decimal, bytes, None)
+    )
+
+    def to_dict(obj, json: bool = False) -> Dict[str, Any]:
+        # Read the instance dict, unloaded attributes are missing from it
+        values = obj.__dict__
+        result = {key: values[key] for key in keys if key in values}
+        if json:
+            for key in converted:
+                if key in result:
+                    result[key] = _json_value(result[key])
+        return result
+
+    return to_dict
+
+
+def _compile_from_row(cls) -> Callable[[Mapping[str, Any]], Any]:
+    # Imported here, _configure imports the models built on this module
+    from ._configure import _check_configured
+
+    mapper = inspect(cls)
+    keys = frozenset(prop.key for prop in mapper.column_attrs)
+    new_instance = mapper.class_manager.new_instance
+
+    def from_row(mapping: Mapping[str, Any]) -> Any:
+        if not keys.issuperset(mapping):
+            unknown = sorted(set(mapping) - keys)
+            raise TypeError(f"{unknown!r} are not column attributes of {cls.__name__}")
+        # As the init event of the constructor, which new_instance does not fire
+        _check_configured(mapper)
+        obj = new_instance()
+        obj.__dict__.update(mapping)
+        return obj
+
+    return from_row
+
+
+def _compiled(cls, name: str, compile: Callable) -> Callable:
+    # Compiled once per class, not inherited by the subclasses
+    function = cls.__dict__.get(name)
+    if function is None:
+        function = compile(cls)
+        setattr(cls, name, staticmethod(function))
+    return function
 
 
 class CustomBase:
     @property
     def _metadata(self) -> Dict[str, Any]:
-        if not hasattr(self, "_additional_metadata"):
-            self._additional_metadata: Dict[str, Any] = {}
-        return self._additional_metadata
+        return self.__dict__.setdefault("_additional_metadata", {})
+
+    def to_dict(self, json: bool = False) -> Dict[str, Any]:
+        """The loaded column attributes of the instance by attribute name
+
+        Deferred or expired columns which are not loaded are left out rather
+        than loaded. With json=True, Decimal values are converted to float and
+        bytes to base64 so that the result can be passed to orjson.dumps.
+        """
+        return _compiled(type(self), "_to_dict", _compile_to_dict)(self, json)
+
+    @classmethod
+    def from_row(cls: Type[T], mapping: Mapping[str, Any]) -> T:
+        """A new transient instance with the column values of the mapping
+
+        Faster than the constructor for bulk creation: the keys are checked
+        against a column set compiled once per model and the values stored
+        without attribute events. Relationships cannot be set. The instance
+        is otherwise the same as one from the constructor, it is added to
+        the identity map when flushed.
+        """
+        return _compiled(cls, "_from_row", _compile_from_row)(mapping)
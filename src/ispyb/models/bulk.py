@@ -0,0 +1,263 @@
+"""Bulk writers and readers for tables with one row per image or item.
+Writers take columns as arrays (NumPy arrays or plain sequences) and write
+them with batched executemany, readers return a NumPy array per column, both
+without constructing ORM objects
+
+    bulk.insert_image_quality(
+        session,
+        autoProcProgramId,
+        dataCollectionId,
+        {"imageNumber": numbers, "spotTotal": spots, "method1Res": resolutions},
+    )
+    arrays = bulk.read_image_quality(session, dataCollectionId, min_image=101)
+    grid = bulk.read_xrf_map(session, dataCollectionId, xrfFluorescenceMappingROIId)
+    bulk.insert_particles(session, dataCollectionId, coordinates)  # (N, 2)
+
+Readers returning arrays need NumPy (`pip install ispyb-models[numpy]`).
+"""
+
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence
+
+from sqlalchemy import Float, Integer, Row, insert, select, type_coerce
+from sqlalchemy.orm import Session
+
+from . import (
+    DataCollection,
+    GridInfo,
+    ImageQualityIndicators,
+    Particle,
+    XRFFluorescenceMapping,
+)
+
+# Number of rows per executemany
+BATCH_SIZE = 10_000
+
+# Number of rows per chunk of the streaming readers
+CHUNK_SIZE = 10_000
+
+IMAGE_QUALITY_COLUMNS = (
+    "imageNumber",
+    "spotTotal",
+    "inResTotal",
+    "goodBraggCandidates",
+    "iceRings",
+    "method1Res",
+    "method2Res",
+    "maxUnitCell",
+    "totalIntegratedSignal",
+    "dozor_score",
+)
+
+
+def _tolist(array: Sequence) -> list:
+    # NumPy scalars are not understood by the database drivers
+    return array.tolist() if hasattr(array, "tolist") else list(array)
+
+
+def _null_nan(values: list) -> list:
+    # NaN, which the readers return for NULL, cannot be stored by the database
+    return [None if value != value else value for value in values]
+
+
+def _insert_columns(
+    session: Session, table, arrays: Mapping[str, Sequence], constants: dict
+) -> int:
+    unknown = (set(arrays) - set(table.c.keys())) | (set(arrays) & set(constants))
+    if unknown:
+        raise ValueError(f"Unknown or fixed columns {sorted(unknown)} for {table}")
+    names = list(arrays)
+    columns = [_null_nan(_tolist(arrays[name])) for name in names]
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns of different lengths {sorted(lengths)}")
+    rows = [dict(constants, **dict(zip(names, row))) for row in zip(*columns)]
+
+    statement = insert(table)
+    # Bound by the statement, so that a RoutingSession uses the primary
+    connection = session.connection(bind_arguments={"clause": statement})
+    for start in range(0, len(rows), BATCH_SIZE):
+        connection.execute(statement, rows[start : start + BATCH_SIZE])
+    return len(rows)
+
+
+def insert_image_quality(
+    session: Session,
+    autoProcProgramId: int,
+    dataCollectionId: int,
+    arrays: Mapping[str, Sequence],
+) -> int:
+    """Insert one ImageQualityIndicators row per element of the arrays, keyed
+    by column name (imageNumber, spotTotal, method1Res, dozor_score, ...).
+    Returns the number of rows inserted."""
+    return _insert_columns(
+        session,
+        ImageQualityIndicators.__table__,
+        arrays,
+        {"autoProcProgramId": autoProcProgramId, "dataCollectionId": dataCollectionId},
+    )
+
+
+def _read_columns(session: Session, statement) -> dict:
+    import numpy
+
+    rows = session.connection().execute(statement).all()
+    columns = list(zip(*rows)) or [()] * len(statement.selected_columns)
+    arrays = {}
+    for column, values in zip(statement.selected_columns, columns):
+        # The dtype only depends on the schema, nullable columns are read as
+        # floats with NaN for NULL
+        integer = isinstance(column.type, Integer) and not getattr(
+            column, "nullable", True
+        )
+        arrays[column.key] = numpy.array(
+            values, dtype="int64" if integer else "float64"
+        )
+    return arrays
+
+
+def read_image_quality(
+    session: Session,
+    dataCollectionId: int,
+    columns: Sequence[str] = IMAGE_QUALITY_COLUMNS,
+    min_image: Optional[int] = None,
+    max_image: Optional[int] = None,
+) -> Dict[str, "numpy.ndarray"]:  # noqa F821
+    """The ImageQualityIndicators of a data collection as one NumPy array per
+    column, ordered by imageNumber, with imageNumber between min_image and
+    max_image (inclusive) if given"""
+    table = ImageQualityIndicators.__table__
+    unknown = set(columns) - set(table.c.keys())
+    if unknown:
+        raise ValueError(f"Unknown columns {sorted(unknown)} for {table}")
+    # Read floats as float rather than Decimal
+    statement = (
+        select(
+            *(
+                table.c[name]
+                if isinstance(table.c[name].type, Integer)
+                else type_coerce(table.c[name], Float()).label(name)
+                for name in columns
+            )
+        )
+        .where(table.c.dataCollectionId == dataCollectionId)
+        .order_by(table.c.imageNumber)
+    )
+    if min_image is not None:
+        statement = statement.where(table.c.imageNumber >= min_image)
+    if max_image is not None:
+        statement = statement.where(table.c.imageNumber <= max_image)
+    return _read_columns(session, statement)
+
+
+def iter_xrf_mapping(
+    session: Session,
+    dataCollectionId: int,
+    xrfFluorescenceMappingROIId: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[List[Row]]:
+    """Stream the (xrfFluorescenceMappingROIId, imageNumber, counts) rows of a
+    data collection, optionally of one ROI, in lists of at most chunk_size
+    rows ordered by ROI and imageNumber.
+
+    Uses a server-side cursor where the driver supports it, otherwise the
+    rows are fetched from the DBAPI cursor chunk by chunk."""
+    table = XRFFluorescenceMapping.__table__
+    statement = (
+        select(table.c.xrfFluorescenceMappingROIId, table.c.imageNumber, table.c.counts)
+        .where(table.c.dataCollectionId == dataCollectionId)
+        .order_by(table.c.xrfFluorescenceMappingROIId, table.c.imageNumber)
+    )
+    if xrfFluorescenceMappingROIId is not None:
+        statement = statement.where(
+            table.c.xrfFluorescenceMappingROIId == xrfFluorescenceMappingROIId
+        )
+    result = session.connection().execute(
+        statement,
+        execution_options={"stream_results": True, "yield_per": chunk_size},
+    )
+    try:
+        for partition in result.partitions():
+            yield partition
+    finally:
+        result.close()
+
+
+def read_xrf_map(
+    session: Session,
+    dataCollectionId: int,
+    xrfFluorescenceMappingROIId: int,
+    chunk_size: int = CHUNK_SIZE,
+) -> "numpy.ndarray":  # noqa F821
+    """The counts of one ROI of a grid scan as a (steps_y, steps_x) array,
+    NaN where there is no count, sized from the GridInfo of the data
+    collection group. Image n is at position n - 1 of the grid, along x for
+    "horizontal" grids and along y for "vertical" ones.
+
+    The counts are streamed into the preallocated array, so the peak memory
+    use is the grid plus one chunk."""
+    import numpy
+
+    grid = session.execute(
+        select(GridInfo.steps_x, GridInfo.steps_y, GridInfo.orientation)
+        .join(
+            DataCollection,
+            DataCollection.dataCollectionGroupId == GridInfo.dataCollectionGroupId,
+        )
+        .where(DataCollection.dataCollectionId == dataCollectionId)
+        .limit(1)
+    ).first()
+    if grid is None or not grid.steps_x or not grid.steps_y:
+        raise ValueError(f"No grid for data collection {dataCollectionId}")
+    steps_x, steps_y = int(grid.steps_x), int(grid.steps_y)
+    counts = numpy.full((steps_y, steps_x), numpy.nan)
+    for chunk in iter_xrf_mapping(
+        session, dataCollectionId, xrfFluorescenceMappingROIId, chunk_size
+    ):
+        _, images, values = zip(*chunk)
+        positions = numpy.array(images, dtype="int64") - 1
+        inside = (positions >= 0) & (positions < counts.size)
+        positions = positions[inside]
+        if grid.orientation == "vertical":
+            x, y = numpy.divmod(positions, steps_y)
+        else:
+            y, x = numpy.divmod(positions, steps_x)
+        counts[y, x] = numpy.array(values, dtype="float64")[inside]
+    return counts
+
+
+def insert_particles(
+    session: Session, dataCollectionId: int, coordinates: Sequence
+) -> int:
+    """Insert one Particle per (x, y) row of an (N, 2) array or sequence of
+    pairs, with an executemany per BATCH_SIZE rows in the transaction of the
+    session. Returns the number of rows inserted."""
+    shape = getattr(coordinates, "shape", None)
+    if shape is not None and (len(shape) != 2 or shape[1] != 2):
+        raise ValueError(f"Expected an (N, 2) array, got {shape}")
+    rows = [
+        {"dataCollectionId": dataCollectionId, "x": x, "y": y}
+        for x, y in map(_null_nan, _tolist(coordinates))
+    ]
+    statement = insert(Particle.__table__)
+    connection = session.connection(bind_arguments={"clause": statement})
+    for start in range(0, len(rows), BATCH_SIZE):
+        connection.execute(statement, rows[start : start + BATCH_SIZE])
+    return len(rows)
+
+
+def read_particles(
+    session: Session, dataCollectionId: int
+) -> "numpy.ndarray":  # noqa F821
+    """The (x, y) of the Particles of a data collection as an (N, 2) array,
+    in insertion order, NaN for a missing coordinate"""
+    import numpy
+
+    table = Particle.__table__
+    result = session.connection().execute(
+        select(table.c.x, table.c.y)
+        .where(table.c.dataCollectionId == dataCollectionId)
+        .order_by(table.c.particleId)
+    )
+    # Much faster than converting the Row objects directly
+    rows = [tuple(row) for row in result]
+    return numpy.array(rows, dtype="float64").reshape(-1, 2)
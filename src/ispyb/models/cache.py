@@ -0,0 +1,445 @@
+"""Process-wide caches of frequently resolved values
+
+    resolver = SessionResolver(sessionmaker(engine))
+    resolver.sessionId("cm31111-2")  # 27464088
+    resolver.sessionIds(["cm31111-2", "cm31111-3"])  # one query for the misses
+    resolver.visit(27464088)  # "cm31111-2"
+
+    reference = ReferenceCache(sessionmaker(engine)).install()
+    reference.lookup(models.SpaceGroup, "P212121")
+    datacollection.Detector  # from memory
+
+    permissions = PermissionIndex(sessionmaker(engine))
+    permissions.has_permission("boaty", "manage_groups")
+"""
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Union
+
+from sqlalchemy import event, inspect, select, tuple_
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.orm.interfaces import MANYTOONE
+
+from . import BLSession, Permission, Person, Proposal, undefer_large
+from .. import models as ispyb_models
+from ._admin import _split
+from ._schema.admin import t_UserGroup_has_Permission, t_UserGroup_has_Person
+
+# Number of values per IN (...) of a bulk lookup
+CHUNK_SIZE = 500
+
+# Small, rarely changing tables, by model name, with the column looked up by name
+REFERENCE_MODELS = {
+    "SpaceGroup": "spaceGroupShortName",
+    "GeometryClassname": "geometryClassname",
+    "Detector": "detectorSerialNumber",
+    "BeamLineSetup": None,
+    "ComponentType": "name",
+    "ComponentSubType": "name",
+    "ConcentrationType": "name",
+    "EventType": "name",
+    "InspectionType": "name",
+    "Permission": "type",
+}
+
+
+class SessionResolver:
+    """Resolve visit strings to BLSession.sessionId and back
+
+    Entries are kept in a bounded LRU for at most `ttl` seconds. Every
+    `check_interval` seconds, a lookup first re-reads the cached sessions and
+    evicts those whose visit or BLSession.lastUpdate changed, or which were
+    deleted. Visits are cached as they were looked up, matched to the database
+    rows without regard to case, and unknown visits are not cached.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: Callable[[], Session],
+        maxsize: int = 4096,
+        ttl: float = 600.0,
+        check_interval: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._sessionmaker = sessionmaker
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.RLock()
+        # visit → (sessionId, expiry, lastUpdate) and
+        # sessionId → (visit, expiry, lastUpdate)
+        self._sessionIds = collections.OrderedDict()
+        self._visits = collections.OrderedDict()
+        self._next_check = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def sessionId(self, visit: str) -> Optional[int]:
+        return self.sessionIds([visit]).get(visit)
+
+    def visit(self, sessionId: int) -> Optional[str]:
+        return self.visits([sessionId]).get(sessionId)
+
+    def sessionIds(self, visits: Iterable[str]) -> Dict[str, int]:
+        """sessionId of each known visit, in one query per CHUNK_SIZE misses"""
+        return self._resolve(visits, self._sessionIds, by_visit=True)
+
+    def visits(self, sessionIds: Iterable[int]) -> Dict[int, str]:
+        """Visit string of each known sessionId"""
+        return self._resolve(sessionIds, self._visits, by_visit=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessionIds.clear()
+            self._visits.clear()
+            self._next_check = 0.0
+
+    def _resolve(self, keys, entries, by_visit: bool) -> dict:
+        now = self._clock()
+        found, missing = {}, set()
+        self._evict_updated(now)
+        with self._lock:
+            for key in keys:
+                entry = entries.get(key)
+                if entry and entry[1] > now:
+                    entries.move_to_end(key)
+                    found[key] = entry[0]
+                elif key not in missing:
+                    missing.add(key)
+            self.hits += len(found)
+            self.misses += len(missing)
+        if not missing:
+            return found
+        missing = list(missing)
+        query = self._query_visits if by_visit else self._query_sessionIds
+        with self._sessionmaker() as session:
+            rows = [
+                row
+                for start in range(0, len(missing), CHUNK_SIZE)
+                for row in session.execute(query(missing[start : start + CHUNK_SIZE]))
+            ]
+        if by_visit:
+            # The database may match visits in another case than they are stored
+            requested = collections.defaultdict(list)
+            for key in missing:
+                requested[key.lower()].append(key)
+        expiry = now + self.ttl
+        with self._lock:
+            for sessionId, code, number, visit_number, lastUpdate in rows:
+                visit = f"{code}{number}-{visit_number}"
+                self._store(self._visits, sessionId, visit, expiry, lastUpdate)
+                if not by_visit:
+                    self._store(self._sessionIds, visit, sessionId, expiry, lastUpdate)
+                    found[sessionId] = visit
+                    continue
+                for key in requested.get(visit.lower(), ()):
+                    if key == visit or key not in found:
+                        self._store(
+                            self._sessionIds, key, sessionId, expiry, lastUpdate
+                        )
+                        found[key] = sessionId
+        return found
+
+    def _store(self, entries, key, value, expiry: float, lastUpdate) -> None:
+        entries[key] = (value, expiry, lastUpdate)
+        entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def _evict_updated(self, now: float) -> None:
+        # Only the snapshot and the eviction hold the lock, not the queries
+        with self._lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + self.check_interval
+            cached = {entry[0] for entry in self._sessionIds.values()}
+            cached.update(self._visits)
+        if not cached:
+            return
+        ids = list(cached)
+        with self._sessionmaker() as session:
+            current = {
+                sessionId: (f"{code}{number}-{visit_number}".lower(), lastUpdate)
+                for start in range(0, len(ids), CHUNK_SIZE)
+                for sessionId, code, number, visit_number, lastUpdate in (
+                    session.execute(
+                        self._query_sessionIds(ids[start : start + CHUNK_SIZE])
+                    )
+                )
+            }
+
+        def stale(sessionId, visit, lastUpdate) -> bool:
+            # Sessions cached since the snapshot are left alone
+            return sessionId in cached and current.get(sessionId) != (
+                visit.lower(),
+                lastUpdate,
+            )
+
+        with self._lock:
+            for visit, (sessionId, _, lastUpdate) in list(self._sessionIds.items()):
+                if stale(sessionId, visit, lastUpdate):
+                    del self._sessionIds[visit]
+            for sessionId, (visit, _, lastUpdate) in list(self._visits.items()):
+                if stale(sessionId, visit, lastUpdate):
+                    del self._visits[sessionId]
+
+    @staticmethod
+    def _columns():
+        return select(
+            BLSession.sessionId,
+            Proposal.proposalCode,
+            Proposal.proposalNumber,
+            BLSession.visit_number,
+            BLSession.lastUpdate,
+        ).join(Proposal, Proposal.proposalId == BLSession.proposalId)
+
+    def _query_visits(self, visits):
+        keys = [
+            parts for parts in map(_split, visits) if parts and parts[2] is not None
+        ]
+        return self._columns().where(
+            tuple_(
+                Proposal.proposalCode, Proposal.proposalNumber, BLSession.visit_number
+            ).in_(keys)
+        )
+
+    def _query_sessionIds(self, sessionIds):
+        return self._columns().where(BLSession.sessionId.in_(sessionIds))
+
+
+class ReferenceCache:
+    """All the rows of small reference tables, loaded once per process
+
+    The rows are loaded on first use and again after `ttl` seconds or an
+    explicit refresh. Objects are returned detached, or merged into a session
+    without a SELECT. Once installed on a Session, sessionmaker or, by
+    default, every Session, many-to-one relationships to the cached models
+    (DataCollection.Detector, Phasing.SpaceGroup, ...) are lazy loaded from
+    the cache, also under the "raise" lazy policy.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: Callable[[], Session],
+        models: Optional[Dict[str, Optional[str]]] = None,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._sessionmaker = sessionmaker
+        self.models = dict(REFERENCE_MODELS if models is None else models)
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._target = None
+        # model → {primary key: object} and model → {name: object}
+        self._objects: Dict[type, Dict[Any, Any]] = {}
+        self._names: Dict[type, Dict[Any, Any]] = {}
+        self._expiry = None
+        self.hits = 0
+
+    def refresh(self) -> None:
+        """Load all the rows of the cached models"""
+        objects, names = {}, {}
+        with self._sessionmaker() as session:
+            for name, name_key in self.models.items():
+                model = getattr(ispyb_models, name)
+                rows = session.scalars(
+                    select(model).options(undefer_large(model))
+                ).all()
+                objects[model] = {inspect(row).identity[0]: row for row in rows}
+                if name_key:
+                    names[model] = {getattr(row, name_key): row for row in rows}
+            session.expunge_all()
+        with self._lock:
+            self._objects, self._names = objects, names
+            self._expiry = self._clock() + self.ttl
+
+    def _cached(self) -> None:
+        with self._lock:
+            if self._expiry is None or self._clock() >= self._expiry:
+                self.refresh()
+
+    def _merge(self, obj, session: Optional[Session]):
+        if obj is None or session is None:
+            return obj
+        return session.merge(obj, load=False)
+
+    def get(self, model, key, session: Optional[Session] = None):
+        """The object of a model by primary key, None if there is none"""
+        self._cached()
+        return self._merge(self._objects[model].get(key), session)
+
+    def lookup(self, model, name, session: Optional[Session] = None):
+        """The object of a model by its name column (REFERENCE_MODELS)"""
+        self._cached()
+        if model not in self._names:
+            raise ValueError(f"{model.__name__} is not cached by name")
+        return self._merge(self._names[model].get(name), session)
+
+    def all(self, model, session: Optional[Session] = None) -> List[Any]:
+        self._cached()
+        return [self._merge(obj, session) for obj in self._objects[model].values()]
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState):
+        state = orm_execute_state.lazy_loaded_from
+        if state is None:
+            return None
+        relationship = orm_execute_state.loader_strategy_path.prop
+        model = relationship.mapper.class_
+        if model.__name__ not in self.models or relationship.direction is not MANYTOONE:
+            return None
+        (local, remote), *others = relationship.local_remote_pairs
+        if others or remote not in relationship.mapper.primary_key:
+            return None
+        key = state.dict.get(state.mapper.get_property_by_column(local).key)
+        self._cached()
+        obj = self._objects[model].get(key)
+        if obj is None:
+            return None
+        with self._lock:
+            self.hits += 1
+        return IteratorResult(
+            SimpleResultMetaData([model.__name__]),
+            iter([(orm_execute_state.session.merge(obj, load=False),)]),
+        )
+
+    def install(self, target=Session) -> "ReferenceCache":
+        """Serve the lazy loads of a Session, sessionmaker or every Session"""
+        if isinstance(target, Session):
+            # The listeners of an instance run after the lazy policy of the
+            # class, which calls its lazy_loaders first
+            target.info.setdefault("lazy_loaders", []).append(self._on_execute)
+        else:
+            # Before the other listeners, so that the lazy policy does not apply
+            event.listen(target, "do_orm_execute", self._on_execute, insert=True)
+        self._target = target
+        return self
+
+    def remove(self) -> None:
+        if isinstance(self._target, Session):
+            self._target.info["lazy_loaders"].remove(self._on_execute)
+        else:
+            event.remove(self._target, "do_orm_execute", self._on_execute)
+        self._target = None
+
+
+class PermissionIndex:
+    """Permission.type values of each Person through their UserGroups, by
+    personId and login
+
+    Built with two queries, one for the permissions of the groups and one
+    for the groups of the persons, and rebuilt after `ttl` seconds or an
+    explicit refresh. A person not in the index, or refreshed with
+    refresh_person after their groups changed, is loaded with one query.
+    Logins are compared without regard to case, as by MySQL.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: Callable[[], Session],
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._sessionmaker = sessionmaker
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.RLock()
+        # userGroupId → types, personId → types, lower case login → types,
+        # personId → login
+        self._groups: Dict[int, FrozenSet[str]] = {}
+        self._persons: Dict[int, FrozenSet[str]] = {}
+        self._logins: Dict[str, FrozenSet[str]] = {}
+        self._login_of: Dict[int, str] = {}
+        self._expiry = None
+
+    def has_permission(self, person: Union[int, str], permission: str) -> bool:
+        """Whether a person, by personId or login, has a Permission.type"""
+        return permission in self.permissions(person)
+
+    def permissions(self, person: Union[int, str]) -> FrozenSet[str]:
+        """Permission.type values of a person by personId or login"""
+        if self._expiry is None or self._clock() >= self._expiry:
+            self.refresh()
+        if isinstance(person, str):
+            found = self._logins.get(person.lower())
+        else:
+            found = self._persons.get(person)
+        if found is None:
+            found = self.refresh_person(person)
+        return found
+
+    def refresh(self) -> None:
+        """Rebuild the index"""
+        with self._sessionmaker() as session:
+            groups = self._query_groups(session)
+            members = session.execute(
+                select(
+                    Person.personId, Person.login, t_UserGroup_has_Person.c.userGroupId
+                ).join(t_UserGroup_has_Person)
+            ).all()
+        persons, logins, login_of = self._index(groups, members)
+        with self._lock:
+            self._groups = groups
+            self._persons, self._logins, self._login_of = persons, logins, login_of
+            self._expiry = self._clock() + self.ttl
+
+    def refresh_person(self, person: Union[int, str]) -> FrozenSet[str]:
+        """Reload the groups of a person by personId or login, and return
+        their permissions"""
+        if self._expiry is None:
+            self.refresh()
+        column = Person.login if isinstance(person, str) else Person.personId
+        with self._sessionmaker() as session:
+            members = session.execute(
+                select(
+                    Person.personId, Person.login, t_UserGroup_has_Person.c.userGroupId
+                )
+                .outerjoin(t_UserGroup_has_Person)
+                .where(column == person)
+            ).all()
+        with self._lock:
+            persons, logins, login_of = self._index(self._groups, members)
+            for personId in persons:
+                login = self._login_of.pop(personId, None)
+                if login is not None:
+                    self._logins.pop(login.lower(), None)
+            self._persons.update(persons)
+            self._logins.update(logins)
+            self._login_of.update(login_of)
+            if isinstance(person, str):
+                entries, key = self._logins, person.lower()
+            else:
+                entries, key = self._persons, person
+            # Also remember persons which do not exist
+            if not members:
+                entries[key] = frozenset()
+            return entries.get(key, frozenset())
+
+    @staticmethod
+    def _query_groups(session: Session) -> Dict[int, FrozenSet[str]]:
+        groups = collections.defaultdict(set)
+        for userGroupId, permission in session.execute(
+            select(t_UserGroup_has_Permission.c.userGroupId, Permission.type).join(
+                Permission
+            )
+        ):
+            groups[userGroupId].add(permission)
+        return {userGroupId: frozenset(types) for userGroupId, types in groups.items()}
+
+    @staticmethod
+    def _index(groups, members):
+        types = collections.defaultdict(set)
+        login_of = {}
+        for personId, login, userGroupId in members:
+            types[personId] |= groups.get(userGroupId, frozenset())
+            if login is not None:
+                login_of[personId] = login
+        persons = {personId: frozenset(values) for personId, values in types.items()}
+        logins = {
+            login.lower(): persons[personId] for personId, login in login_of.items()
+        }
+        return persons, logins, login_of
@@ -0,0 +1,157 @@
+"""Incremental change feed over the timestamped tables
+
+    feed = changes.ChangeFeed()
+    while True:
+        for movie in feed.poll(session, models.Movie, batch=1000):
+            index(movie)
+
+Each poll selects the rows after a (timestamp, primary key) watermark in that
+order, so that rows sharing a timestamp are neither skipped nor repeated, and
+returns at most `batch` of them. The timestamp column of a model is found in
+its columns (lastUpdate, then the ...TimeStamp columns, then the creation
+dates), or can be given explicitly.
+
+Only columns with ON UPDATE CURRENT_TIMESTAMP report updated rows. With any
+other column (recordTimeStamp, createdTimeStamp, ...) a row is reported when
+it is inserted, and again only if the application moves its timestamp
+forward. BLSession.lastUpdate defaults to the end of the session: rows with a
+timestamp after the database's now() are left for a later poll, so that the
+watermark never passes the current time.
+
+A poll only reads the new rows with an index on (timestamp, primary key),
+which the ISPyB schema does not have for most tables. Without one the whole
+table is scanned. Rows with a NULL timestamp, or committed with a timestamp
+before the watermark, are not seen.
+"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import DateTime, func, inspect, or_, select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+# Default maximum number of rows returned by a poll
+BATCH_SIZE = 1000
+
+# Timestamp column names by preference, compared in lower case
+_TIMESTAMP_NAMES = (
+    "lastupdate",
+    "modifiedtimestamp",
+    "recordtimestamp",
+    "bltimestamp",
+    "createdtimestamp",
+    "createtime",
+    "creationdate",
+    "creationtime",
+    "timestamp",
+)
+_ON_UPDATE = re.compile(r"on update", re.IGNORECASE)
+
+_timestamp_columns: Dict[type, InstrumentedAttribute] = {}
+
+
+class Watermark(NamedTuple):
+    """Timestamp and primary key of the last row returned by a poll"""
+
+    timestamp: Any
+    key: Any
+
+
+class Changes(NamedTuple):
+    rows: List[Any]
+    watermark: Optional[Watermark]
+
+
+def _rank(column) -> Optional[tuple]:
+    """Sort key of a candidate timestamp column, the columns updated by the
+    database first, None if it is not one"""
+    if not isinstance(column.type, DateTime):
+        return None
+    name = column.name.lower()
+    default = column.server_default
+    on_update = default is not None and bool(_ON_UPDATE.search(str(default.arg)))
+    if name in _TIMESTAMP_NAMES:
+        return (not on_update, _TIMESTAMP_NAMES.index(name))
+    if on_update:
+        return (False, len(_TIMESTAMP_NAMES))
+    return None
+
+
+def timestamp_column(model) -> InstrumentedAttribute:
+    """The column recording when the rows of a model were updated, or else
+    created: the columns with ON UPDATE CURRENT_TIMESTAMP first"""
+    column = _timestamp_columns.get(model)
+    if column is None:
+        ranked = sorted(
+            (rank, prop.key)
+            for rank, prop in (
+                (_rank(prop.columns[0]), prop) for prop in inspect(model).column_attrs
+            )
+            if rank is not None
+        )
+        if not ranked:
+            raise ValueError(
+                f"{model.__name__} has no timestamp column, pass one as column="
+            )
+        column = _timestamp_columns[model] = getattr(model, ranked[0][1])
+    return column
+
+
+def poll(
+    session: Session,
+    model,
+    since: Optional[Watermark] = None,
+    batch: int = BATCH_SIZE,
+    column: Optional[InstrumentedAttribute] = None,
+) -> Changes:
+    """The rows of a model after the watermark and up to now, oldest first,
+    and the watermark of the last one (`since` when there are none)"""
+    primary_key = inspect(model).primary_key
+    if len(primary_key) != 1:
+        raise ValueError(f"{model.__name__} has a composite primary key")
+    key = getattr(model, inspect(model).get_property_by_column(primary_key[0]).key)
+    if column is None:
+        column = timestamp_column(model)
+    query = select(model).where(column.is_not(None), column <= func.now())
+    if since is not None:
+        # column >= :timestamp first, for a range scan of an index on it
+        query = query.where(
+            column >= since.timestamp,
+            or_(column > since.timestamp, key > since.key),
+        )
+    rows = session.scalars(query.order_by(column, key).limit(batch)).all()
+    if not rows:
+        return Changes(rows, since)
+    last = rows[-1]
+    return Changes(rows, Watermark(getattr(last, column.key), getattr(last, key.key)))
+
+
+class ChangeFeed:
+    """Watermarks of the models being followed, by model name
+
+    The watermarks can be saved and given back to resume the feed.
+    """
+
+    def __init__(self, watermarks: Optional[Dict[str, Watermark]] = None):
+        self.watermarks = dict(watermarks or {})
+
+    def poll(
+        self,
+        session: Session,
+        model,
+        batch: int = BATCH_SIZE,
+        column: Optional[InstrumentedAttribute] = None,
+    ) -> List[Any]:
+        """The rows changed since the previous poll of the model, advancing
+        its watermark"""
+        rows, watermark = poll(
+            session,
+            model,
+            since=self.watermarks.get(model.__name__),
+            batch=batch,
+            column=column,
+        )
+        if watermark is not None:
+            self.watermarks[model.__name__] = watermark
+        return rows
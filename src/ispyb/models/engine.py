@@ -0,0 +1,140 @@
+"""Engines with connection pools tuned for the ways the models are used
+
+    engine = models.engine.create(url, profile="api")
+    models.engine.metrics(engine)
+    # {"checkouts": 1520, "wait_mean": 0.0002, "wait_max": 0.031, "exhausted": 0, ...}
+
+"api": many concurrent short requests, a large pool with overflow and a
+short checkout timeout. "worker": a processing job with a few connections.
+"batch": one long running job on a single connection. Keyword arguments
+override the settings of the profile and are passed on to create_engine.
+
+With mysql-connector, the C extension is used when it is installed.
+"""
+
+import importlib.util
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import QueuePool
+
+PROFILES = {
+    "api": {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 5,
+        "pool_recycle": 3600,
+        "pool_pre_ping": True,
+        "query_cache_size": 1200,
+    },
+    "worker": {
+        "pool_size": 2,
+        "max_overflow": 4,
+        "pool_timeout": 30,
+        "pool_recycle": 3600,
+        "pool_pre_ping": True,
+        "query_cache_size": 500,
+    },
+    "batch": {
+        "pool_size": 1,
+        "max_overflow": 1,
+        "pool_timeout": 60,
+        "pool_recycle": 7200,
+        "pool_pre_ping": True,
+        "query_cache_size": 500,
+    },
+}
+
+# Only understood by QueuePool
+_QUEUE_POOL_ARGUMENTS = ("pool_size", "max_overflow", "pool_timeout")
+
+
+class PoolMetrics:
+    """Checkout latency, including pre-ping and connecting, and the number of
+    checkouts which opened an overflow connection or timed out because the
+    pool was exhausted"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.overflow = 0
+        self.exhausted = 0
+
+    def record(self, wait: float, overflow: bool = False, exhausted: bool = False):
+        with self._lock:
+            if exhausted:
+                self.exhausted += 1
+            else:
+                self.checkouts += 1
+                self.overflow += overflow
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "wait_total": self.wait_total,
+                "wait_mean": self.wait_total / (self.checkouts + self.exhausted or 1),
+                "wait_max": self.wait_max,
+                "overflow": self.overflow,
+                "exhausted": self.exhausted,
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool recording PoolMetrics in its `metrics` attribute"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except TimeoutError:
+            self.metrics.record(time.perf_counter() - start, exhausted=True)
+            raise
+        self.metrics.record(
+            time.perf_counter() - start, overflow=self.checkedout() > self.size()
+        )
+        return connection
+
+    def recreate(self) -> "MeteredQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def create(url, profile: str = "api", **kwargs) -> Engine:
+    """An engine with the pool settings of a profile ("api", "worker" or
+    "batch") and a MeteredQueuePool where the dialect uses a QueuePool"""
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown profile {profile!r}, expected one of {list(PROFILES)}"
+        )
+    url = make_url(url)
+    options = dict(PROFILES[profile], **kwargs)
+    if "poolclass" not in options:
+        if issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+            options["poolclass"] = MeteredQueuePool
+        else:
+            for argument in _QUEUE_POOL_ARGUMENTS:
+                options.pop(argument, None)
+    if url.get_driver_name() == "mysqlconnector" and importlib.util.find_spec(
+        "_mysql_connector"
+    ):
+        options["connect_args"] = {"use_pure": False, **options.get("connect_args", {})}
+    return create_engine(url, **options)
+
+
+def metrics(engine: Engine) -> dict:
+    """The PoolMetrics of an engine made by create, empty for other pools"""
+    pool_metrics = getattr(engine.pool, "metrics", None)
+    return pool_metrics.as_dict() if pool_metrics else {}
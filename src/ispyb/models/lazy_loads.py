@@ -0,0 +1,98 @@
+"""Count the lazy loads of each relationship of the models, and report
+relationships lazy loaded in a loop (N+1 queries)
+
+    with LazyLoadCounter(threshold=10) as counter:
+        for dc in session.query(models.DataCollection):
+            dc.DataCollectionGroup
+    counter.counts  # {"DataCollection.DataCollectionGroup": 120}
+    counter.log()
+
+A relationship lazy loaded more than `threshold` times within one Session is
+reported once per Session with a warning on the "ispyb.models" logger,
+including the stack of the offending load.
+"""
+
+import collections
+import logging
+import threading
+import weakref
+from typing import Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ._lazy_policy import lazy_loaded_relationship, logger
+
+
+class LazyLoadCounter:
+    """Count lazy loads emitted by a Session, sessionmaker or, by default,
+    every Session"""
+
+    def __init__(self, threshold: int = 10, target=Session):
+        self.threshold = threshold
+        self.target = target
+        self.counts = collections.Counter()
+        self.suspects: Dict[str, int] = {}
+        self._sessions = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        relationship = lazy_loaded_relationship(orm_execute_state)
+        if relationship is None:
+            return
+        with self._lock:
+            self.counts[relationship] += 1
+            counts = self._sessions.setdefault(
+                orm_execute_state.session, collections.Counter()
+            )
+            counts[relationship] += 1
+            count = counts[relationship]
+            if count > self.threshold:
+                self.suspects[relationship] = max(
+                    count, self.suspects.get(relationship, 0)
+                )
+        if count == self.threshold + 1:
+            logger.warning(
+                "Possible N+1 query: '%s' lazy loaded %d times in one session",
+                relationship,
+                count,
+                stack_info=True,
+            )
+
+    def start(self) -> "LazyLoadCounter":
+        event.listen(self.target, "do_orm_execute", self._on_execute)
+        return self
+
+    def stop(self) -> None:
+        event.remove(self.target, "do_orm_execute", self._on_execute)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+            self.suspects.clear()
+            self._sessions.clear()
+
+    def __enter__(self) -> "LazyLoadCounter":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def as_dict(self) -> dict:
+        """Lazy loads per relationship, and the highest count within one
+        Session of the relationships over the threshold"""
+        with self._lock:
+            return {"counts": dict(self.counts), "suspects": dict(self.suspects)}
+
+    def lines(self) -> List[str]:
+        """One line per relationship, most lazy loaded first"""
+        with self._lock:
+            return [
+                f"{relationship} {count}"
+                + (" N+1" if relationship in self.suspects else "")
+                for relationship, count in self.counts.most_common()
+            ]
+
+    def log(self, level: int = logging.INFO) -> None:
+        for line in self.lines():
+            logger.log(level, "Lazy loads: %s", line)
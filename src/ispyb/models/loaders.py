@@ -0,0 +1,72 @@
+"""Loader option presets fetching a tree of related models with a fixed
+number of queries, instead of one lazy load per object
+
+    session.query(models.DataCollection).options(loaders.autoproc_tree())
+
+Collections are loaded with selectinload (one query per level), many-to-one
+relationships with joinedload.
+"""
+
+from sqlalchemy.orm import Load, joinedload, selectinload
+
+from . import (
+    AutoProcIntegration,
+    AutoProcProgram,
+    AutoProcScaling,
+    AutoProcScalingHasInt,
+    DataCollection,
+    DataCollectionGroup,
+    Screening,
+    ScreeningOutput,
+    ScreeningStrategy,
+    ScreeningStrategyWedge,
+)
+
+# Relationships to BLSession target the generated class, not ModifiedBLSession
+from ._schema.admin import BLSession
+
+
+def _autoproc_program(attachments: bool) -> list:
+    options = [
+        selectinload(AutoProcProgram.AutoProcIntegration)
+        .selectinload(AutoProcIntegration.AutoProcScalingHasInt)
+        .joinedload(AutoProcScalingHasInt.AutoProcScaling)
+        .selectinload(AutoProcScaling.AutoProcScalingStatistics)
+    ]
+    if attachments:
+        options.append(selectinload(AutoProcProgram.AutoProcProgramAttachments))
+    return options
+
+
+def autoproc_tree(attachments: bool = False):
+    """For DataCollection queries: AutoProcProgram → AutoProcIntegration →
+    AutoProcScalingHasInt → AutoProcScaling → AutoProcScalingStatistics,
+    and optionally the AutoProcProgramAttachments"""
+    return selectinload(DataCollection.AutoProcProgram).options(
+        *_autoproc_program(attachments)
+    )
+
+
+def autoproc_program_tree(attachments: bool = False) -> Load:
+    """The same tree as autoproc_tree for AutoProcProgram queries"""
+    return Load(AutoProcProgram).options(*_autoproc_program(attachments))
+
+
+def session_tree():
+    """For DataCollection queries: DataCollectionGroup → BLSession → Proposal"""
+    return (
+        joinedload(DataCollection.DataCollectionGroup)
+        .joinedload(DataCollectionGroup.BLSession)
+        .joinedload(BLSession.Proposal)
+    )
+
+
+def screening_tree():
+    """For Screening queries: ScreeningOutput → ScreeningOutputLattice and
+    ScreeningStrategy → ScreeningStrategyWedge → ScreeningStrategySubWedge"""
+    return selectinload(Screening.ScreeningOutput).options(
+        selectinload(ScreeningOutput.ScreeningOutputLattice),
+        selectinload(ScreeningOutput.ScreeningStrategy)
+        .selectinload(ScreeningStrategy.ScreeningStrategyWedge)
+        .selectinload(ScreeningStrategyWedge.ScreeningStrategySubWedge),
+    )
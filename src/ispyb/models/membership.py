@@ -0,0 +1,195 @@
+"""Proposals and sessions a person is a member of, and filters restricting
+queries to them
+
+    index = MembershipIndex(sessionmaker(engine))
+    index.load(personIds)  # two queries per CHUNK_SIZE persons
+    index.sessionIds(personId)  # array("I", [27464088, ...])
+    session.query(models.DataCollection).filter(
+        index.filter(models.DataCollection, personId)
+    )
+
+A person is a member of the proposals they own (Proposal.personId) or are
+in (ProposalHasPerson), and of the sessions of those proposals and the
+sessions they are in (SessionHasPerson). member_filter expresses the same
+membership as a semi-join on these tables, without an index.
+"""
+
+import array
+import bisect
+import collections
+import threading
+import time
+from typing import Callable, Dict, Iterable, Tuple
+
+from sqlalchemy import select, union
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+
+from . import (
+    BLSample,
+    BLSession,
+    Crystal,
+    DataCollection,
+    DataCollectionGroup,
+    Protein,
+    Proposal,
+    ProposalHasPerson,
+    SessionHasPerson,
+)
+
+# Number of persons per IN (...) of a bulk load
+CHUNK_SIZE = 500
+
+# Whether a model is filtered on the proposals or the sessions, and the
+# criterion on the model given the ids
+_FILTERS = {
+    Proposal: ("proposals", lambda ids: Proposal.proposalId.in_(ids)),
+    BLSession: ("sessions", lambda ids: BLSession.sessionId.in_(ids)),
+    DataCollectionGroup: (
+        "sessions",
+        lambda ids: DataCollectionGroup.sessionId.in_(ids),
+    ),
+    DataCollection: (
+        "sessions",
+        lambda ids: DataCollection.dataCollectionGroupId.in_(
+            select(DataCollectionGroup.dataCollectionGroupId).where(
+                DataCollectionGroup.sessionId.in_(ids)
+            )
+        ),
+    ),
+    Protein: ("proposals", lambda ids: Protein.proposalId.in_(ids)),
+    BLSample: (
+        "proposals",
+        lambda ids: BLSample.crystalId.in_(
+            select(Crystal.crystalId)
+            .join(Protein, Protein.proteinId == Crystal.proteinId)
+            .where(Protein.proposalId.in_(ids))
+        ),
+    ),
+}
+
+
+def _proposal_members(personIds) -> Select:
+    """(personId, proposalId) of the proposals of the persons"""
+    return union(
+        select(ProposalHasPerson.personId, ProposalHasPerson.proposalId).where(
+            ProposalHasPerson.personId.in_(personIds)
+        ),
+        select(Proposal.personId, Proposal.proposalId).where(
+            Proposal.personId.in_(personIds)
+        ),
+    )
+
+
+def _session_members(personIds) -> Select:
+    """(personId, sessionId) of the sessions of the persons"""
+    proposals = _proposal_members(personIds).subquery()
+    return union(
+        select(SessionHasPerson.personId, SessionHasPerson.sessionId).where(
+            SessionHasPerson.personId.in_(personIds)
+        ),
+        select(proposals.c.personId, BLSession.sessionId).join(
+            proposals, BLSession.proposalId == proposals.c.proposalId
+        ),
+    )
+
+
+def _filter(model) -> Tuple[str, Callable]:
+    try:
+        return _FILTERS[model]
+    except KeyError:
+        names = ", ".join(sorted(model.__name__ for model in _FILTERS))
+        raise ValueError(f"Cannot filter {model.__name__}, only {names}") from None
+
+
+def member_filter(model, personId: int) -> ColumnElement:
+    """Criterion restricting a query of a model to the proposals or sessions
+    of a person, as a semi-join on the membership tables"""
+    kind, criterion = _filter(model)
+    members = (_proposal_members if kind == "proposals" else _session_members)(
+        [personId]
+    ).subquery()
+    return criterion(select(members.c[1]))
+
+
+class MembershipIndex:
+    """Sorted arrays of the proposalIds and sessionIds of each person
+
+    Persons are loaded in bulk by load, or one at a time on first use, and
+    kept for `ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: Callable[[], Session],
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._sessionmaker = sessionmaker
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # personId → (proposalIds, sessionIds, expiry)
+        self._members: Dict[int, Tuple[array.array, array.array, float]] = {}
+
+    def load(self, personIds: Iterable[int]) -> None:
+        """Load the memberships of persons, two queries per CHUNK_SIZE persons"""
+        personIds = list(personIds)
+        for start in range(0, len(personIds), CHUNK_SIZE):
+            chunk = personIds[start : start + CHUNK_SIZE]
+            proposals = collections.defaultdict(set)
+            sessions = collections.defaultdict(set)
+            with self._sessionmaker() as session:
+                for members, query in (
+                    (proposals, _proposal_members(chunk)),
+                    (sessions, _session_members(chunk)),
+                ):
+                    for personId, id in session.execute(query):
+                        members[personId].add(id)
+            expiry = self._clock() + self.ttl
+            with self._lock:
+                for personId in chunk:
+                    self._members[personId] = (
+                        array.array("I", sorted(proposals[personId])),
+                        array.array("I", sorted(sessions[personId])),
+                        expiry,
+                    )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._members.clear()
+
+    def _get(self, personId: int) -> Tuple[array.array, array.array, float]:
+        members = self._members.get(personId)
+        if members is None or members[2] <= self._clock():
+            self.load([personId])
+            members = self._members[personId]
+        return members
+
+    def proposalIds(self, personId: int) -> array.array:
+        return self._get(personId)[0]
+
+    def sessionIds(self, personId: int) -> array.array:
+        return self._get(personId)[1]
+
+    def has_proposal(self, personId: int, proposalId: int) -> bool:
+        return _contains(self.proposalIds(personId), proposalId)
+
+    def has_session(self, personId: int, sessionId: int) -> bool:
+        return _contains(self.sessionIds(personId), sessionId)
+
+    def filter(self, model, personId: int) -> ColumnElement:
+        """Criterion restricting a query of a model to the proposals or
+        sessions of a person, as an IN (...) of the ids in the index"""
+        kind, criterion = _filter(model)
+        ids = (
+            self.proposalIds(personId)
+            if kind == "proposals"
+            else self.sessionIds(personId)
+        )
+        return criterion(list(ids))
+
+
+def _contains(ids: array.array, id: int) -> bool:
+    index = bisect.bisect_left(ids, id)
+    return index < len(ids) and ids[index] == id
@@ -0,0 +1,66 @@
+"""Session sending reads to replicas and writes to the primary database
+
+    Session = sessionmaker(class_=RoutingSession, primary=primary, replicas=[replica])
+    with Session() as session:
+        session.get(models.DataCollection, 1)  # replica
+        session.add(models.Protein(...))
+        session.flush()  # primary
+        session.query(models.Protein).all()  # primary, read your writes
+
+SELECTs (without FOR UPDATE), including those on the view tables, go to one
+of the replicas. Flushes and any other statement go to the primary, after
+which the session sticks to the primary until it is closed, so that it reads
+its own writes despite the replication lag.
+
+session.connection() without a statement is taken as a read, as by the view
+and bulk readers. To write through it, give the statement to bind by:
+session.connection(bind_arguments={"clause": statement}).
+"""
+
+import random
+from typing import Optional, Sequence
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+class RoutingSession(Session):
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Sequence[Engine] = (),
+        sticky: bool = True,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.sticky = sticky
+        self._use_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        if (
+            self.replicas
+            and not self._use_primary
+            and not self._flushing
+            and (clause is None or _is_read(clause))
+        ):
+            return random.choice(self.replicas)
+        if self.sticky:
+            self._use_primary = True
+        return self.primary
+
+    def using_primary(self) -> bool:
+        """Whether the session sticks to the primary"""
+        return self._use_primary
+
+    def close(self) -> None:
+        super().close()
+        self._use_primary = False
+
+
+def _is_read(clause: Optional[object]) -> bool:
+    return bool(
+        getattr(clause, "is_select", False)
+        and getattr(clause, "_for_update_arg", None) is None
+    )
@@ -0,0 +1,80 @@
+"""Read-only row classes for the views, and a loader building them straight
+from the cursor tuples
+
+    from ispyb.models import t_v_datacollection_summary, views
+
+    for row in views.iter_rows(session, t_v_datacollection_summary, criteria):
+        row.dataCollectionId
+
+Each view has an immutable NamedTuple with a typed field per column, in
+column order (generated by generate_view_rows.py). Column names which are
+not identifiers are turned into ones, e.g. "Res. (corner)" → Res_corner.
+"""
+
+import functools
+from typing import Iterator, List, Type
+
+from sqlalchemy import Table, select
+from sqlalchemy.orm import Session
+
+from ._schema.view_rows import *  # noqa F401,F403
+from ._schema.view_rows import ROW_CLASSES
+
+# Number of rows fetched from the cursor at once
+CHUNK_SIZE = 10_000
+
+
+def row_class(table: Table) -> Type[tuple]:
+    """The row class of a view"""
+    try:
+        return ROW_CLASSES[table.name]
+    except KeyError:
+        raise ValueError(f"{table.name} is not a view") from None
+
+
+def iter_rows(
+    session: Session,
+    table: Table,
+    *criteria,
+    order_by=(),
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple]:
+    """Select the rows of a view matching the criteria as row class instances,
+    fetching chunk_size rows at a time"""
+    new = functools.partial(tuple.__new__, row_class(table))
+    connection = session.connection()
+    dialect = connection.dialect
+    # Only the columns whose type converts the values the driver returns
+    processors = [
+        (index, processor)
+        for index, processor in enumerate(
+            column.type.dialect_impl(dialect).result_processor(dialect, None)
+            for column in table.columns
+        )
+        if processor
+    ]
+    # The rows are read from the DBAPI cursor, which is only complete if the
+    # result has not buffered any, as it does when streaming
+    result = connection.execute(
+        select(table).where(*criteria).order_by(*order_by),
+        execution_options={"stream_results": False, "yield_per": None},
+    )
+    cursor = result.cursor
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            if processors:
+                rows = [list(row) for row in rows]
+                for row in rows:
+                    for index, processor in processors:
+                        row[index] = processor(row[index])
+            yield from map(new, rows)
+    finally:
+        result.close()
+
+
+def load_rows(session: Session, table: Table, *criteria, order_by=()) -> List[tuple]:
+    """All the rows of a view matching the criteria as row class instances"""
+    return list(iter_rows(session, table, *criteria, order_by=order_by))
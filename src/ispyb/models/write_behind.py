@@ -0,0 +1,144 @@
+"""Write-behind buffer batching high-rate inserts into few transactions
+
+    with WriteBehindBuffer(sessionmaker(engine), max_size=100, max_delay=1.0) as buffer:
+        movie = buffer.add(models.Movie(dataCollectionId=1, movieNumber=1))
+        motion = buffer.add(models.MotionCorrection(Movie=movie, ...))
+        buffer.add(models.CTF(...), motionCorrectionId=motion)
+
+Objects are written by a background thread, in one transaction per batch of
+at most `max_size` objects or `max_delay` seconds. Foreign keys are resolved
+by the flush of the batch: through relationships (MotionCorrection.Movie), or
+for columns without a relationship (CTF.motionCorrectionId) by passing the
+referenced object as a keyword argument of `add`. The queue holds at most
+`max_queue` objects, `add` blocks while it is full.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("ispyb.models")
+
+_FLUSH = object()
+_STOP = object()
+
+
+def _primary_key(obj):
+    identity = inspect(obj).identity
+    return identity[0] if identity else None
+
+
+class WriteBehindBuffer:
+    """Queue ORM objects and insert them in batches from a background thread"""
+
+    def __init__(
+        self,
+        sessionmaker: Callable[[], Session],
+        max_size: int = 100,
+        max_delay: float = 1.0,
+        max_queue: int = 1000,
+        timeout: Optional[float] = None,
+    ):
+        self._sessionmaker = sessionmaker
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.written = 0
+        self.error: Optional[Exception] = None
+        self._closed = False
+        self._queue = queue.Queue(max_queue)
+        self._thread = threading.Thread(
+            target=self._run, name="ispyb-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def add(self, obj, **references):
+        """Queue an object for insertion and return it. Blocks while the queue
+        is full, raises queue.Full if that lasts longer than `timeout`.
+
+        `references` maps columns to queued objects whose primary key is
+        copied into the column once they are written."""
+        if self._closed:
+            raise RuntimeError("The write-behind buffer is closed")
+        self._raise_error()
+        self._queue.put((obj, references), timeout=self.timeout)
+        return obj
+
+    def flush(self) -> None:
+        """Write everything queued so far and wait for it"""
+        self._queue.put(_FLUSH)
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._raise_error()
+
+    def __enter__(self) -> "WriteBehindBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _raise_error(self) -> None:
+        error, self.error = self.error, None
+        if error:
+            raise error
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            while len(items) < self.max_size and items[-1] not in (_FLUSH, _STOP):
+                try:
+                    items.append(
+                        self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                    )
+                except queue.Empty:
+                    break
+            batch = [item for item in items if item not in (_FLUSH, _STOP)]
+            try:
+                if batch:
+                    self._write(batch)
+                    self.written += len(batch)
+            except Exception as e:
+                logger.exception("Could not write %d objects", len(batch))
+                self.error = e
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if items[-1] is _STOP:
+                return
+
+    def _write(self, batch: list) -> None:
+        with self._sessionmaker() as session, session.begin():
+            # Objects referencing objects of the same batch wait for their flush
+            while batch:
+                ready = [
+                    (obj, references)
+                    for obj, references in batch
+                    if all(
+                        _primary_key(reference) is not None
+                        for reference in references.values()
+                    )
+                ]
+                if not ready:
+                    raise ValueError("References to objects which were never queued")
+                for obj, references in ready:
+                    for column, reference in references.items():
+                        setattr(obj, column, _primary_key(reference))
+                    session.add(obj)
+                session.flush()
+                written = {id(obj) for obj, _ in ready}
+                batch = [item for item in batch if id(item[0]) not in written]
+            # Keep the written objects and their primary keys usable afterwards
+            session.expunge_all()
@@ -0,0 +1,63 @@
+import asyncio
+import os
+
+import pytest
+import sqlalchemy
+
+from ispyb import models
+
+pytestmark = pytest.mark.skipif(
+    "SQLALCHEMY_ASYNC_DATABASE_URI" not in os.environ,
+    reason="SQLALCHEMY_ASYNC_DATABASE_URI is not set",
+)
+
+
+def run(coroutine):
+    async def main():
+        from ispyb.models import aio
+
+        engine = aio.create_engine(os.environ["SQLALCHEMY_ASYNC_DATABASE_URI"])
+        try:
+            async with aio.sessionmaker(engine)() as session:
+                return await coroutine(aio, session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_get_datacollection():
+    async def get(aio, session):
+        datacollection = await aio.get_datacollection(session, 1)
+        # Raised by the lazy policy, not as MissingGreenlet by the driver
+        with pytest.raises(
+            sqlalchemy.exc.InvalidRequestError, match="lazy policy 'raise'"
+        ) as raised:
+            datacollection.AutoProcProgram
+        assert not isinstance(raised.value, sqlalchemy.exc.MissingGreenlet)
+        return datacollection
+
+    datacollection = run(get)
+
+    assert datacollection.dataCollectionId == 1
+    assert datacollection.DataCollectionGroup.BLSession.Proposal
+
+
+def test_sessions_for_proposal():
+    async def sessions(aio, session):
+        blsession = (
+            await session.execute(
+                sqlalchemy.select(models.BLSession).options(
+                    sqlalchemy.orm.joinedload(models.BLSession.Proposal)
+                )
+            )
+        ).scalar()
+        by_string = await aio.sessions_for_proposal(session, blsession.proposal)
+        by_id = await aio.sessions_for_proposal(session, blsession.proposalId)
+        return blsession, by_string, by_id
+
+    blsession, by_string, by_id = run(sessions)
+
+    assert blsession.sessionId in [s.sessionId for s in by_string]
+    assert [s.sessionId for s in by_string] == [s.sessionId for s in by_id]
+    assert by_string[0].session.startswith(by_string[0].proposal)
@@ -0,0 +1,153 @@
+import pytest
+
+from ispyb import models
+from ispyb.models import bulk
+
+
+def test_insert_image_quality(session):
+    program = models.AutoProcProgram()
+    session.add(program)
+    session.flush()
+
+    rows = bulk.insert_image_quality(
+        session,
+        program.autoProcProgramId,
+        1,
+        {"imageNumber": [1, 2, 3], "spotTotal": [10, 20, 30]},
+    )
+
+    assert rows == 3
+    assert session.query(models.ImageQualityIndicators.spotTotal).filter(
+        models.ImageQualityIndicators.autoProcProgramId == program.autoProcProgramId
+    ).order_by(models.ImageQualityIndicators.imageNumber).all() == [
+        (10,),
+        (20,),
+        (30,),
+    ]
+    with pytest.raises(ValueError):
+        bulk.insert_image_quality(
+            session, program.autoProcProgramId, 1, {"imageNumber": [1], "spots": [1]}
+        )
+    session.rollback()
+
+
+def test_read_image_quality(session):
+    numpy = pytest.importorskip("numpy")
+    group = session.query(models.DataCollectionGroup).first()
+    datacollection = models.DataCollection(DataCollectionGroup=group)
+    program = models.AutoProcProgram()
+    session.add_all([datacollection, program])
+    session.flush()
+    dataCollectionId = datacollection.dataCollectionId
+    bulk.insert_image_quality(
+        session,
+        program.autoProcProgramId,
+        dataCollectionId,
+        {
+            "imageNumber": numpy.arange(1, 5),
+            "spotTotal": numpy.array([10, 20, 30, 40]),
+            "dozor_score": [0.5, None, 1.5, 2.5],
+        },
+    )
+
+    arrays = bulk.read_image_quality(
+        session,
+        dataCollectionId,
+        columns=["imageNumber", "spotTotal", "dozor_score"],
+        min_image=2,
+    )
+
+    assert arrays["imageNumber"].tolist() == [2, 3, 4]
+    # Nullable integer columns are read as floats, whether there is a NULL or not
+    assert arrays["spotTotal"].dtype == numpy.float64
+    assert arrays["spotTotal"].tolist() == [20, 30, 40]
+    assert numpy.isnan(arrays["dozor_score"][0])
+    assert arrays["dozor_score"][1:].tolist() == [1.5, 2.5]
+    arrays = bulk.read_image_quality(session, dataCollectionId, max_image=0)
+    assert arrays["imageNumber"].size == 0
+
+    # Written back, the NaN are NULL again
+    arrays = bulk.read_image_quality(session, dataCollectionId)
+    arrays["imageNumber"] = arrays["imageNumber"] + 100
+    bulk.insert_image_quality(
+        session, program.autoProcProgramId, dataCollectionId, arrays
+    )
+    assert session.query(models.ImageQualityIndicators.dozor_score).filter(
+        models.ImageQualityIndicators.dataCollectionId == dataCollectionId,
+        models.ImageQualityIndicators.imageNumber > 100,
+    ).order_by(models.ImageQualityIndicators.imageNumber).all() == [
+        (0.5,),
+        (None,),
+        (1.5,),
+        (2.5,),
+    ]
+    session.rollback()
+
+
+def test_read_xrf_map(session):
+    numpy = pytest.importorskip("numpy")
+    blsession = session.query(models.BLSession).first()
+    group = models.DataCollectionGroup(sessionId=blsession.sessionId)
+    datacollection = models.DataCollection(DataCollectionGroup=group)
+    roi = models.XRFFluorescenceMappingROI(startEnergy=7.0, endEnergy=7.2)
+    session.add_all(
+        [models.GridInfo(DataCollectionGroup=group, steps_x=3, steps_y=2), roi]
+    )
+    session.add_all(
+        models.XRFFluorescenceMapping(
+            DataCollection=datacollection,
+            XRFFluorescenceMappingROI=roi,
+            imageNumber=image,
+            counts=image * 10,
+        )
+        for image in range(1, 6)
+    )
+    session.flush()
+
+    chunks = list(
+        bulk.iter_xrf_mapping(session, datacollection.dataCollectionId, chunk_size=2)
+    )
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    # Streaming is an option of the statement, not of the session's connection
+    assert "stream_results" not in session.connection().get_execution_options()
+
+    grid = bulk.read_xrf_map(
+        session, datacollection.dataCollectionId, roi.xrfFluorescenceMappingROIId
+    )
+    assert grid.shape == (2, 3)
+    assert grid[0].tolist() == [10, 20, 30]
+    assert grid[1, :2].tolist() == [40, 50]
+    assert numpy.isnan(grid[1, 2])
+    session.rollback()
+
+
+def test_particles(session):
+    numpy = pytest.importorskip("numpy")
+    group = session.query(models.DataCollectionGroup).first()
+    datacollection = models.DataCollection(DataCollectionGroup=group)
+    session.add(datacollection)
+    session.flush()
+    coordinates = numpy.array([[1.5, 2.5], [3.0, 4.0], [5.0, 6.0]])
+
+    rows = bulk.insert_particles(session, datacollection.dataCollectionId, coordinates)
+
+    assert rows == 3
+    particles = bulk.read_particles(session, datacollection.dataCollectionId)
+    assert particles.shape == (3, 2)
+    assert particles.tolist() == coordinates.tolist()
+
+    # Round trip of a missing coordinate, NaN read from NULL and written back
+    other = models.DataCollection(DataCollectionGroup=group)
+    session.add(other)
+    session.flush()
+    bulk.insert_particles(session, other.dataCollectionId, [[7.0, None]])
+    particles = bulk.read_particles(session, other.dataCollectionId)
+    assert numpy.isnan(particles[0, 1])
+    bulk.insert_particles(session, datacollection.dataCollectionId, particles)
+    assert session.query(models.Particle.x, models.Particle.y).filter(
+        models.Particle.dataCollectionId == datacollection.dataCollectionId,
+        models.Particle.x == 7.0,
+    ).all() == [(7.0, None)]
+    with pytest.raises(ValueError):
+        bulk.insert_particles(session, 1, numpy.zeros((2, 3)))
+    session.rollback()
@@ -0,0 +1,174 @@
+import datetime
+import threading
+
+import pytest
+import sqlalchemy.exc
+import sqlalchemy.orm
+
+from ispyb import models
+from ispyb.models.cache import PermissionIndex, ReferenceCache, SessionResolver
+
+
+def test_session_resolver(session):
+    blsession = session.query(models.BLSession).first()
+    resolver = SessionResolver(sqlalchemy.orm.sessionmaker(bind=session.get_bind()))
+
+    assert resolver.sessionIds([blsession.session, "xx0-1", "invalid"]) == {
+        blsession.session: blsession.sessionId
+    }
+    assert resolver.sessionId(blsession.session) == blsession.sessionId
+    assert resolver.visit(blsession.sessionId) == blsession.session
+    assert resolver.hits == 2
+    assert resolver.misses == 3
+
+
+def test_session_resolver_updates(session):
+    blsession = session.query(models.BLSession).first()
+    visit, lastUpdate = blsession.session, blsession.lastUpdate
+    now = [0.0]
+    resolver = SessionResolver(
+        sqlalchemy.orm.sessionmaker(bind=session.get_bind()),
+        check_interval=10,
+        clock=lambda: now[0],
+    )
+    assert resolver.sessionId(visit) == blsession.sessionId
+
+    try:
+        # A session ending in the future does not hide its later updates
+        blsession.lastUpdate = datetime.datetime(2100, 1, 1)
+        session.commit()
+        now[0] = 20
+        assert resolver.sessionId(visit) == blsession.sessionId
+        blsession.visit_number += 1000
+        session.commit()
+        now[0] = 40
+        assert resolver.sessionId(visit) is None
+        assert resolver.visit(blsession.sessionId) == blsession.session
+    finally:
+        blsession.visit_number -= 1000
+        blsession.lastUpdate = lastUpdate
+        session.commit()
+
+
+def test_session_resolver_unlocked_check(session):
+    blsession = session.query(models.BLSession).first()
+    sessionmaker = sqlalchemy.orm.sessionmaker(bind=session.get_bind())
+    locked = []
+
+    def try_lock():
+        if resolver._lock.acquire(blocking=False):
+            resolver._lock.release()
+            locked.append(False)
+        else:
+            locked.append(True)
+
+    def check_lock():
+        # Whether a lookup in another thread would wait for the query
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+        return sessionmaker()
+
+    now = [0.0]
+    resolver = SessionResolver(check_lock, clock=lambda: now[0])
+    resolver.sessionId(blsession.session)
+    now[0] = 20
+    resolver.sessionId(blsession.session)
+    assert locked == [False, False]
+
+
+def test_session_resolver_case(session):
+    if session.get_bind().dialect.name != "mysql":
+        pytest.skip("visits are only matched without regard to case by MySQL")
+    blsession = session.query(models.BLSession).first()
+    resolver = SessionResolver(sqlalchemy.orm.sessionmaker(bind=session.get_bind()))
+
+    visit = blsession.session.upper()
+    assert resolver.sessionIds([visit, blsession.session]) == {
+        visit: blsession.sessionId,
+        blsession.session: blsession.sessionId,
+    }
+    assert resolver.sessionId(visit) == blsession.sessionId
+    assert resolver.hits == 1
+
+
+def test_reference_cache(session):
+    detector = models.Detector(detectorSerialNumber="test_reference_cache")
+    session.add(detector)
+    session.flush()
+    datacollection = models.DataCollection(
+        dataCollectionGroupId=session.get(
+            models.DataCollection, 1
+        ).dataCollectionGroupId,
+        detectorId=detector.detectorId,
+    )
+    session.add(datacollection)
+    session.commit()
+
+    now = [0.0]
+    cache = ReferenceCache(
+        sqlalchemy.orm.sessionmaker(bind=session.get_bind()),
+        models={"Detector": "detectorSerialNumber"},
+        ttl=60,
+        clock=lambda: now[0],
+    )
+    try:
+        with sqlalchemy.orm.Session(session.get_bind()) as other:
+            cache.install(other)
+            loaded = other.get(models.DataCollection, datacollection.dataCollectionId)
+            assert loaded.Detector.detectorId == detector.detectorId
+            assert loaded.Detector in other
+            assert cache.hits == 1
+            other.expunge_all()
+
+            # Also under the raise policy, before which the listeners of the
+            # session would run
+            other.info["lazy_policy"] = "raise"
+            loaded = other.get(models.DataCollection, datacollection.dataCollectionId)
+            assert loaded.Detector.detectorId == detector.detectorId
+            assert cache.hits == 2
+            cache.remove()
+            other.expunge_all()
+            loaded = other.get(models.DataCollection, datacollection.dataCollectionId)
+            with pytest.raises(sqlalchemy.exc.InvalidRequestError):
+                loaded.Detector
+
+        found = cache.lookup(models.Detector, "test_reference_cache")
+        assert found.detectorId == detector.detectorId
+        assert cache.get(models.Detector, detector.detectorId) is found
+        now[0] = 120
+        assert cache.get(models.Detector, detector.detectorId) is not found
+    finally:
+        session.delete(datacollection)
+        session.delete(detector)
+        session.commit()
+
+
+def test_permission_index(session):
+    person = models.Person(login="test_permission_index")
+    group = models.UserGroup(name="test_permission_index")
+    permission = models.Permission(type="test_permission")
+    group.Person.append(person)
+    group.Permission.append(permission)
+    session.add(group)
+    session.commit()
+
+    index = PermissionIndex(sqlalchemy.orm.sessionmaker(bind=session.get_bind()))
+    try:
+        assert index.has_permission("test_permission_index", "test_permission")
+        assert index.has_permission(person.personId, "test_permission")
+        assert not index.has_permission("test_permission_index", "other")
+        assert not index.has_permission("unknown_login", "test_permission")
+        assert index.has_permission("TEST_Permission_Index", "test_permission")
+
+        group.Person.remove(person)
+        session.commit()
+        assert index.has_permission("test_permission_index", "test_permission")
+        assert index.refresh_person("test_permission_index") == frozenset()
+        assert not index.has_permission(person.personId, "test_permission")
+        assert not index.has_permission("TEST_Permission_Index", "test_permission")
+    finally:
+        session.delete(group)
+        session.delete(permission)
+        session.delete(person)
+        session.commit()
@@ -0,0 +1,37 @@
+import datetime
+
+import pytest
+
+from ispyb import models
+from ispyb.models import changes
+
+
+def test_timestamp_column():
+    assert changes.timestamp_column(models.BLSession) is models.BLSession.lastUpdate
+    assert changes.timestamp_column(models.Movie) is models.Movie.createdTimeStamp
+    with pytest.raises(ValueError):
+        changes.timestamp_column(models.DataCollectionGroup)
+
+
+def test_poll(session):
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    timestamp = (now - datetime.timedelta(days=1)).replace(microsecond=0)
+    proteins = [
+        models.Protein(proposalId=1, name=f"changes{i}", bltimeStamp=timestamp)
+        for i in range(3)
+    ]
+    # Dated in the future, not returned yet and not moving the watermark
+    future = models.Protein(
+        proposalId=1, name="changes_future", bltimeStamp=datetime.datetime(2100, 1, 1)
+    )
+    session.add_all(proteins + [future])
+    session.flush()
+
+    feed = changes.ChangeFeed(
+        {"Protein": changes.Watermark(timestamp - datetime.timedelta(seconds=1), 0)}
+    )
+    assert feed.poll(session, models.Protein, batch=2) == proteins[:2]
+    assert feed.poll(session, models.Protein, batch=2) == proteins[2:]
+    assert feed.poll(session, models.Protein, batch=2) == []
+    assert feed.watermarks["Protein"] == (timestamp, proteins[-1].proteinId)
+    session.rollback()
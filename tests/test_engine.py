@@ -0,0 +1,26 @@
+import os
+
+import pytest
+import sqlalchemy
+
+from ispyb.models import engine
+
+
+def test_create_metrics():
+    url = os.environ["SQLALCHEMY_DATABASE_URI"]
+    db = engine.create(url, profile="batch", max_overflow=0, pool_timeout=0.1)
+
+    with db.connect() as connection:
+        connection.execute(sqlalchemy.text("SELECT 1"))
+        with pytest.raises(sqlalchemy.exc.TimeoutError):
+            db.connect()
+
+    metrics = engine.metrics(db)
+    assert metrics["checkouts"] == 1
+    assert metrics["exhausted"] == 1
+    assert metrics["wait_max"] >= 0.1
+    db.dispose()
+    assert engine.metrics(db) == metrics
+
+    with pytest.raises(ValueError):
+        engine.create(url, profile="web")
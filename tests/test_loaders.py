@@ -0,0 +1,53 @@
+import pytest
+import sqlalchemy
+
+from ispyb import models
+from ispyb.models import loaders
+from ispyb.models.lazy_loads import LazyLoadCounter
+
+
+def test_autoproc_tree(session):
+    datacollection = (
+        session.query(models.DataCollection)
+        .filter(models.DataCollection.dataCollectionId == 1)
+        .options(loaders.autoproc_tree(attachments=True), loaders.session_tree())
+        .one()
+    )
+
+    assert "AutoProcProgram" in datacollection.__dict__
+    for program in datacollection.AutoProcProgram:
+        assert "AutoProcIntegration" in program.__dict__
+        assert "AutoProcProgramAttachments" in program.__dict__
+    assert "BLSession" in datacollection.DataCollectionGroup.__dict__
+
+
+def test_screening_tree(session):
+    screenings = session.query(models.Screening).options(loaders.screening_tree())
+
+    for screening in screenings:
+        assert "ScreeningOutput" in screening.__dict__
+
+
+def test_lazy_policy_raise(session):
+    datacollection = session.query(models.DataCollection).first()
+
+    models.set_lazy_policy("raise")
+    try:
+        with pytest.raises(sqlalchemy.exc.InvalidRequestError):
+            datacollection.AutoProcProgram
+    finally:
+        models.set_lazy_policy("select")
+    assert datacollection.AutoProcProgram is not None
+
+
+def test_lazy_load_counter(session, caplog):
+    with LazyLoadCounter(threshold=0) as counter:
+        datacollection = session.query(models.DataCollection).first()
+        datacollection.AutoProcProgram
+
+    assert counter.as_dict() == {
+        "counts": {"DataCollection.AutoProcProgram": 1},
+        "suspects": {"DataCollection.AutoProcProgram": 1},
+    }
+    assert counter.lines() == ["DataCollection.AutoProcProgram 1 N+1"]
+    assert "Possible N+1 query" in caplog.text
@@ -0,0 +1,50 @@
+import sqlalchemy.orm
+
+from ispyb import models
+from ispyb.models.membership import MembershipIndex, member_filter
+
+
+def test_membership(session):
+    blsession = session.query(models.BLSession).first()
+    person = models.Person(login="test_membership")
+    session.add(person)
+    session.flush()
+    session.add(
+        models.SessionHasPerson(sessionId=blsession.sessionId, personId=person.personId)
+    )
+    session.commit()
+
+    index = MembershipIndex(sqlalchemy.orm.sessionmaker(bind=session.get_bind()))
+    try:
+        index.load([person.personId])
+        assert list(index.sessionIds(person.personId)) == [blsession.sessionId]
+        assert list(index.proposalIds(person.personId)) == []
+        assert index.has_session(person.personId, blsession.sessionId)
+        assert not index.has_proposal(person.personId, blsession.proposalId)
+
+        for criterion in (
+            index.filter(models.DataCollection, person.personId),
+            member_filter(models.DataCollection, person.personId),
+        ):
+            query = session.query(models.DataCollection.dataCollectionId).filter(
+                criterion
+            )
+            assert set(query.all()) == set(
+                session.query(models.DataCollection.dataCollectionId)
+                .join(models.DataCollectionGroup)
+                .filter(models.DataCollectionGroup.sessionId == blsession.sessionId)
+                .all()
+            )
+        assert (
+            not session.query(models.BLSample)
+            .filter(member_filter(models.BLSample, person.personId))
+            .all()
+        )
+    finally:
+        session.execute(
+            sqlalchemy.delete(models.SessionHasPerson).where(
+                models.SessionHasPerson.personId == person.personId
+            )
+        )
+        session.delete(person)
+        session.commit()
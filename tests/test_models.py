@@ -1,3 +1,10 @@
+import os
+import subprocess
+import sys
+
+import pytest
+import sqlalchemy
+
 from ispyb import models
 
 
@@ -18,3 +25,116 @@ def test_model_insert(session):
     session.commit()
 
     assert protein.proteinId
+
+
+def test_lazy_import():
+    code = (
+        "from ispyb import models; "
+        "assert models.DataCollection.GridInfo; "
+        "assert models.Proposal is models.ModifiedProposal; "
+        "assert 'em' not in models._loaded"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        env=dict(os.environ, ISPYB_MODELS_LAZY="1"),
+        check=True,
+    )
+
+
+def test_configure_subset():
+    code = (
+        "from ispyb import models; "
+        "models.configure(subset=['DataCollection']); "
+        "assert models.DataCollection.__mapper__.configured; "
+        "assert not models.Movie.__mapper__.configured; "
+        "import pytest, sqlalchemy, sqlalchemy.orm; "
+        "session = sqlalchemy.orm.Session(); "
+        "pytest.raises(sqlalchemy.exc.InvalidRequestError, models.Movie); "
+        "pytest.raises(sqlalchemy.exc.InvalidRequestError, "
+        "models.Movie.from_row, {'movieNumber': 1}); "
+        "pytest.raises(sqlalchemy.exc.InvalidRequestError, "
+        "session.execute, sqlalchemy.select(models.Movie)); "
+        "models.configure(); "
+        "assert models.Movie.__mapper__.configured"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_large_columns_deferred():
+    query = sqlalchemy.select(models.DataCollection)
+    assert ".comments" not in str(query)
+    query = query.options(models.undefer_large(models.DataCollection))
+    assert ".comments" in str(query)
+
+
+def test_session_filter(session):
+    blsession = session.query(models.BLSession).first()
+
+    query = session.query(models.BLSession.sessionId).filter(
+        models.BLSession.session == blsession.session
+    )
+    assert "concat" not in str(query).lower()
+    assert blsession.sessionId in [sessionId for sessionId, in query]
+
+    query = session.query(models.Proposal.proposalId).filter(
+        models.Proposal.proposal == blsession.proposal
+    )
+    assert query.all() == [(blsession.proposalId,)]
+
+
+def test_to_dict(session):
+    datacollection = session.get(models.DataCollection, 1)
+
+    values = datacollection.to_dict()
+    assert values["dataCollectionId"] == 1
+    assert "comments" not in values
+    assert datacollection.to_dict(json=True).keys() == values.keys()
+
+    datacollection.comments
+    assert "comments" in datacollection.to_dict()
+
+
+def test_from_row(session):
+    protein = models.Protein.from_row(
+        {"proposalId": 1, "name": "from_row", "acronym": "from_row"}
+    )
+    session.add(protein)
+    session.flush()
+
+    assert session.get(models.Protein, protein.proteinId) is protein
+    protein.name = "updated"
+    session.flush()
+    session.expire(protein)
+    assert protein.name == "updated"
+    session.rollback()
+
+    with pytest.raises(TypeError):
+        models.Protein.from_row({"Proposal": None})
+
+
+def test_session_filter_aliased(session):
+    blsession = session.query(models.BLSession).first()
+
+    alias = sqlalchemy.orm.aliased(models.BLSession)
+    query = session.query(alias.sessionId).filter(alias.session == blsession.session)
+    assert "concat" not in str(query).lower()
+    assert set(query.all()) == set(
+        session.query(models.BLSession.sessionId)
+        .filter(models.BLSession.session == blsession.session)
+        .all()
+    )
+
+    alias = sqlalchemy.orm.aliased(models.Proposal)
+    query = session.query(alias.proposalId).filter(alias.proposal == blsession.proposal)
+    assert query.all() == [(blsession.proposalId,)]
+
+
+def test_session_filter_bindparam(session):
+    blsession = session.query(models.BLSession).first()
+
+    query = (
+        session.query(models.BLSession.sessionId)
+        .join(models.Proposal)
+        .filter(models.BLSession.session == sqlalchemy.bindparam("visit"))
+    )
+    assert (blsession.sessionId,) in query.params(visit=blsession.session).all()
@@ -0,0 +1,37 @@
+import sqlalchemy
+import sqlalchemy.orm
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateTable
+
+from ispyb import models
+
+
+def test_create_all_sqlite():
+    engine = sqlalchemy.create_engine("sqlite://")
+    models.metadata.create_all(engine)
+    assert set(sqlalchemy.inspect(engine).get_table_names()) == set(
+        models.metadata.tables
+    )
+
+    with sqlalchemy.orm.Session(engine) as session:
+        person = models.Person(login="test_portable")
+        session.add(person)
+        session.flush()
+        proposal = models.Proposal(personId=person.personId)
+        session.add(proposal)
+        session.flush()
+        blsession = models.BLSession(proposalId=proposal.proposalId)
+        session.add(blsession)
+        session.flush()
+        session.expire_all()
+        assert blsession.sessionId == 1
+        assert blsession.bltimeStamp
+        assert blsession.lastUpdate.year == 1970
+
+
+def test_mysql_ddl_unchanged():
+    ddl = str(
+        CreateTable(models.RobotAction.__table__).compile(dialect=mysql.dialect())
+    )
+    assert "DEFAULT current_timestamp() ON UPDATE current_timestamp()" in ddl
+    assert "DEFAULT '0000-00-00 00:00:00'" in ddl
@@ -0,0 +1,72 @@
+import collections
+import os
+
+import sqlalchemy
+import sqlalchemy.orm
+
+from ispyb import models
+from ispyb.models.routing import RoutingSession
+
+
+def test_routing_session():
+    url = os.environ["SQLALCHEMY_DATABASE_URI"]
+    engines = {name: sqlalchemy.create_engine(url) for name in ("primary", "replica")}
+    statements = collections.Counter()
+    for name, engine in engines.items():
+        sqlalchemy.event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda *args, name=name: statements.update([name]),
+        )
+    Session = sqlalchemy.orm.sessionmaker(
+        class_=RoutingSession,
+        primary=engines["primary"],
+        replicas=[engines["replica"]],
+    )
+
+    with Session() as session:
+        session.query(models.DataCollection).first()
+        assert statements == {"replica": 1}
+        assert not session.using_primary()
+
+        session.add(models.Protein(proposalId=1, name="test", acronym="test"))
+        session.flush()
+        writes = statements["primary"]
+        assert writes
+        session.query(models.Protein).first()
+        assert statements == {"replica": 1, "primary": writes + 1}
+        assert session.using_primary()
+        session.rollback()
+
+
+def test_routing_session_files(tmp_path):
+    # Two separate databases, to see which one served each read
+    engines = {
+        name: sqlalchemy.create_engine(f"sqlite:///{tmp_path / name}.db")
+        for name in ("primary", "replica")
+    }
+    for name, engine in engines.items():
+        models.Person.__table__.create(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                sqlalchemy.insert(models.Person.__table__),
+                {"personId": 1, "login": name},
+            )
+    Session = sqlalchemy.orm.sessionmaker(
+        class_=RoutingSession,
+        primary=engines["primary"],
+        replicas=[engines["replica"]],
+    )
+
+    with Session() as session:
+        assert session.connection().engine is engines["replica"]
+        assert session.get(models.Person, 1).login == "replica"
+        assert not session.using_primary()
+
+        statement = sqlalchemy.insert(models.Person.__table__)
+        connection = session.connection(bind_arguments={"clause": statement})
+        assert connection.engine is engines["primary"]
+        connection.execute(statement, {"personId": 2, "login": "written"})
+        assert session.using_primary()
+        assert session.connection().engine is engines["primary"]
+        assert session.get(models.Person, 2).login == "written"
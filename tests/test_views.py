@@ -0,0 +1,34 @@
+import datetime
+
+import pytest
+
+from ispyb import models
+from ispyb.models import views
+
+
+def test_view_rows(session):
+    blsession = session.query(models.BLSession).first()
+    view = models.t_v_session
+
+    rows = views.load_rows(session, view, view.c.sessionId == blsession.sessionId)
+
+    assert len(rows) == 1
+    assert isinstance(rows[0], views.VSession)
+    assert rows[0].sessionId == blsession.sessionId
+    assert rows[0].visit_number == blsession.visit_number
+    assert isinstance(rows[0].BLSession_startDate, (datetime.datetime, type(None)))
+    with pytest.raises(AttributeError):
+        rows[0].sessionId = 0
+    with pytest.raises(ValueError):
+        views.row_class(models.BLSession.__table__)
+
+
+def test_view_rows_streaming(session):
+    view = models.t_v_session
+    expected = views.load_rows(session, view, order_by=[view.c.sessionId])
+
+    session.connection().execution_options(stream_results=True, yield_per=2)
+    rows = views.load_rows(session, view, order_by=[view.c.sessionId])
+
+    assert rows == expected
+    session.rollback()
@@ -0,0 +1,52 @@
+import sqlalchemy.orm
+
+from ispyb import models
+from ispyb.models.write_behind import WriteBehindBuffer
+
+
+def test_write_behind(session):
+    datacollection = session.query(models.DataCollection).first()
+    sessionmaker = sqlalchemy.orm.sessionmaker(bind=session.get_bind())
+    movies, motions, ctfs = [], [], []
+
+    try:
+        with WriteBehindBuffer(sessionmaker, max_size=4, max_delay=0.1) as buffer:
+            for number in range(3):
+                movie = buffer.add(
+                    models.Movie(
+                        dataCollectionId=datacollection.dataCollectionId,
+                        movieNumber=number,
+                    )
+                )
+                motion = buffer.add(models.MotionCorrection(Movie=movie))
+                ctf = buffer.add(models.CTF(), motionCorrectionId=motion)
+                movies.append(movie)
+                motions.append(motion)
+                ctfs.append(ctf)
+            buffer.flush()
+            assert buffer.written == 9
+
+        assert ctf.motionCorrectionId == motion.motionCorrectionId
+        assert motion.movieId == movie.movieId
+        assert (
+            session.query(models.MotionCorrection.movieId)
+            .filter(
+                models.MotionCorrection.motionCorrectionId == ctf.motionCorrectionId
+            )
+            .scalar()
+            == movie.movieId
+        )
+    finally:
+        for model, key, objects in (
+            (models.CTF, "CTFid", ctfs),
+            (models.MotionCorrection, "motionCorrectionId", motions),
+            (models.Movie, "movieId", movies),
+        ):
+            session.execute(
+                sqlalchemy.delete(model).where(
+                    getattr(model, key).in_(
+                        [getattr(obj, key) for obj in objects if getattr(obj, key)]
+                    )
+                )
+            )
+        session.commit()